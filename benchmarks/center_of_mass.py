@@ -0,0 +1,69 @@
+"""
+Time to find center of mass of N particles with symbolic and array forms of the law.
+
+Symbolic form (lists of Quantity and QuantityVector) is only measured for small N, as it takes
+more than 10 milliseconds per particle. Array form is measured for the whole arrays in memory and for
+the same particles generated and reduced in chunks.
+
+Usage: python -m benchmarks.center_of_mass [--sizes 1000 100000 10000000] [--chunk 1000000]
+"""
+
+import argparse
+import time
+from typing import Iterator
+import numpy as np
+from symplyphysics import units, QuantityArray, QuantityVector, VectorArray, quantity_scope
+from symplyphysics.laws.kinematic.vector import center_of_mass_for_system_of_particles as com_law
+
+# Largest number of particles for symbolic form of the law
+SYMBOLIC_LIMIT = 1000
+
+
+def _particles(count: int, seed: int) -> tuple[QuantityArray, VectorArray]:
+    rng = np.random.default_rng(seed)
+    masses = QuantityArray(rng.uniform(1, 2, count), units.kilogram)
+    positions = VectorArray(rng.uniform(-1, 1, (count, 3)), units.meter)
+    return (masses, positions)
+
+
+def _chunks(count: int, chunk: int) -> Iterator[tuple[QuantityArray, VectorArray]]:
+    for (idx, start) in enumerate(range(0, count, chunk)):
+        yield _particles(min(chunk, count - start), idx)
+
+
+def _symbolic(masses: QuantityArray, positions: VectorArray) -> QuantityVector:
+    mass_quantities = masses.to_quantities()
+    position_vectors = positions.to_quantity_vectors()
+    start = time.perf_counter()
+    result = com_law.calculate_center_of_mass(mass_quantities, position_vectors)
+    print(f"{len(masses):>10} symbolic  {time.perf_counter() - start:10.4f} s")
+    return result
+
+
+def run(sizes: list[int], chunk: int) -> None:
+    print(f"{'particles':>10} {'form':<9} {'time':>12}")
+    for size in sizes:
+        (masses, positions) = _particles(size, 0)
+        start = time.perf_counter()
+        result = com_law.calculate_center_of_mass(masses, positions)
+        print(f"{size:>10} array     {time.perf_counter() - start:10.4f} s")
+        if size <= SYMBOLIC_LIMIT:
+            expected = _symbolic(masses, positions)
+            for (actual, correct) in zip(result.components, expected.components):
+                assert np.isclose(float(actual.scale_factor), float(correct.scale_factor))
+        del masses, positions
+        # chunks are generated during the reduction, which is included in time
+        start = time.perf_counter()
+        com_law.center_of_mass_array(_chunks(size, chunk))
+        print(f"{size:>10} chunked   {time.perf_counter() - start:10.4f} s "
+            "(including generation)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100_000, 10_000_000])
+    parser.add_argument("--chunk", type=int, default=1_000_000)
+    args = parser.parse_args()
+    with quantity_scope():
+        run(args.sizes, args.chunk)
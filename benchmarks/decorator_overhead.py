@@ -0,0 +1,87 @@
+"""
+Overhead of validate_input(), validate_output() and validate_output_same() decorators per call.
+
+Overhead is the difference between the time of decorated 'calculate_*' function call and the
+time of the same call of undecorated function. Hit rates of dimension caches and number of
+validated calls are reported at the end.
+
+Usage: python -m benchmarks.decorator_overhead [--repeat 2000] [--policy full]
+"""
+
+import argparse
+import timeit
+from typing import Any, Callable
+from symplyphysics import units, Quantity, QuantityVector, quantity_scope, validation_policy
+from symplyphysics.core.dimensions import dimension_cache_info
+from symplyphysics.core.validation import validation_stats
+from symplyphysics.laws.dynamics import period_of_ideal_pendulum_from_length as pendulum_period
+from symplyphysics.laws.dynamics import acceleration_from_force
+from symplyphysics.laws.gravity import gravity_force_from_mass_and_distance as gravity_law
+from symplyphysics.laws.kinematic import planar_projection_is_cosine as projection_law
+from symplyphysics.definitions import density_from_mass_volume
+from symplyphysics.definitions import mechanical_energy_is_kinetic_and_potential as energy_def
+from symplyphysics.laws.dynamics.vector import acceleration_from_force as vector_acceleration
+
+
+def _undecorated(func: Callable[..., Any]) -> Callable[..., Any]:
+    while hasattr(func, "__wrapped__"):
+        func = func.__wrapped__
+    return func
+
+
+def _cases() -> list[tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]]:
+    length = Quantity(1 * units.meter)
+    mass = Quantity(2 * units.kilogram)
+    force = Quantity(3 * units.newton)
+    volume = Quantity(5 * units.liter)
+    energy = Quantity(6 * units.joule)
+    force_vector = QuantityVector([force, force, 0])
+    return [
+        (pendulum_period.calculate_period, (length,), {}),
+        (acceleration_from_force.calculate_force, (mass, Quantity(force / mass)), {}),
+        (gravity_law.calculate_force, (mass, mass, length), {}),
+        (density_from_mass_volume.calculate_density, (), {
+        "mass_": mass,
+        "volume_": volume
+        }),
+        (energy_def.calculate_mechanical_energy, (energy, energy), {}),
+        (projection_law.calculate_projection, (length, 0.5), {}),
+        (vector_acceleration.calculate_acceleration, (mass, force_vector), {}),
+    ]
+
+
+def _time_per_call(func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any],
+    repeat: int) -> float:
+    return min(timeit.repeat(lambda: func(*args, **kwargs), number=repeat, repeat=3)) / repeat
+
+
+def run(repeat: int) -> None:
+    cases = _cases()
+    names = [f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}" for (func, _, _) in cases]
+    width = max(len(n) for n in names)
+    print(f"{'function':<{width}} {'decorated, us':>14} {'undecorated, us':>16} "
+        f"{'overhead, us':>13}")
+    for (name, (func, args, kwargs)) in zip(names, cases):
+        decorated_time = _time_per_call(func, args, kwargs, repeat)
+        undecorated_time = _time_per_call(_undecorated(func), args, kwargs, repeat)
+        print(f"{name:<{width}} {decorated_time * 1e6:>14.1f} {undecorated_time * 1e6:>16.1f} "
+            f"{(decorated_time - undecorated_time) * 1e6:>13.1f}")
+    print()
+    for (cache_name, info) in dimension_cache_info().items():
+        calls = info.hits + info.misses
+        hit_rate = info.hits / calls if calls > 0 else 0
+        print(f"{cache_name:<20} hits: {info.hits:>9}  misses: {info.misses:>6}  "
+            f"hit rate: {hit_rate:.2%}")
+    print(validation_stats())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--policy",
+        default="full",
+        help="validation policy: full, first-call, sampled(p) or off")
+    cli_args = parser.parse_args()
+    with quantity_scope(), validation_policy(cli_args.policy):
+        run(cli_args.repeat)
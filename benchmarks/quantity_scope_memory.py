@@ -0,0 +1,51 @@
+"""
+Memory usage of many 'calculate_*' calls with and without quantity_scope().
+
+Quantities, created outside of quantity_scope(), are registered in the global SI unit system and
+are never released, so memory usage grows with the number of calls. Within quantity_scope()
+memory usage should stay flat.
+
+Usage: python -m benchmarks.quantity_scope_memory [--calls 1000000] [--no-scope]
+"""
+
+import argparse
+import contextlib
+import gc
+import resource
+import time
+from symplyphysics import units, Quantity, convert_to, quantity_scope, SI
+from symplyphysics.laws.dynamics import period_of_ideal_pendulum_from_length as pendulum_period
+
+# Number of reports during the benchmark
+REPORTS = 10
+
+
+def _max_rss_megabytes() -> float:
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run(calls: int, use_scope: bool) -> None:
+    scope = quantity_scope() if use_scope else contextlib.nullcontext()
+    report_every = max(calls // REPORTS, 1)
+    start = time.perf_counter()
+    with scope:
+        for i in range(1, calls + 1):
+            length = Quantity((1 + i % 100) * units.centimeter)
+            convert_to(pendulum_period.calculate_period(length), units.second)
+            if i % report_every == 0:
+                gc.collect()
+                # pylint: disable-next=protected-access
+                registered = len(SI._quantity_scale_factors)
+                print(f"calls: {i:>9}  max RSS: {_max_rss_megabytes():8.1f} MB  "
+                    f"registered quantities: {registered:>9}  "
+                    f"elapsed: {time.perf_counter() - start:8.1f} s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=1_000_000)
+    parser.add_argument("--no-scope", action="store_true")
+    args = parser.parse_args()
+    run(args.calls, not args.no_scope)
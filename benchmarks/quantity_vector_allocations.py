@@ -0,0 +1,69 @@
+"""
+Number of Quantity objects, that are created by QuantityVector operations.
+
+Each Quantity gets a new name and is registered in the global SI unit system, so its creation is
+expensive. Created quantities are counted as the growth of SI unit system registry, therefore the
+benchmark runs outside of quantity_scope().
+
+Usage: python -m benchmarks.quantity_vector_allocations [--repeat 100]
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable
+from symplyphysics import units, Quantity, QuantityVector, SI
+from symplyphysics.core.vectors.arithmetics import (add_cartesian_quantity_vectors,
+    cross_cartesian_quantity_vectors, dot_quantity_vectors, quantity_vector_magnitude,
+    scale_quantity_vector)
+from symplyphysics.laws.kinematic.vector import center_of_mass_for_system_of_particles as com_law
+
+
+def _registered_quantities() -> int:
+    # pylint: disable-next=protected-access
+    return len(SI._quantity_scale_factors)
+
+
+def _cases() -> list[tuple[str, Callable[[], Any]]]:
+    first = QuantityVector([1 * units.meter, 2 * units.meter, 3 * units.meter])
+    second = QuantityVector([4 * units.meter, 5 * units.meter, 6 * units.meter])
+    mass = Quantity(2 * units.kilogram)
+    masses = [mass] * 10
+    positions = [first, second] * 5
+    return [
+        ("components x10", lambda: [first.components for _ in range(10)]),
+        ("add", lambda: add_cartesian_quantity_vectors(first, second)),
+        ("scale", lambda: scale_quantity_vector(mass, first)),
+        ("dot", lambda: dot_quantity_vectors(first, second)),
+        ("cross", lambda: cross_cartesian_quantity_vectors(first, second)),
+        ("magnitude", lambda: quantity_vector_magnitude(first)),
+        ("center of mass, 10 particles",
+        lambda: com_law.calculate_center_of_mass(masses, positions)),
+    ]
+
+
+def run(repeat: int) -> None:
+    cases = _cases()
+    width = max(len(name) for (name, _) in cases)
+    print(f"{'operation':<{width}} {'quantities':>10} {'peak memory, KB':>16} {'time, us':>10}")
+    for (name, operation) in cases:
+        operation()
+        registered_before = _registered_quantities()
+        tracemalloc.start()
+        operation()
+        (_, peak) = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        quantities = _registered_quantities() - registered_before
+        start = time.perf_counter()
+        for _ in range(repeat):
+            operation()
+        elapsed = (time.perf_counter() - start) / repeat
+        print(f"{name:<{width}} {quantities:>10} {peak / 1024:>16.1f} {elapsed * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+    run(args.repeat)
@@ -2,19 +2,26 @@ from sympy.physics import units
 from sympy.physics.units.systems import SI
 from sympy.physics.units.definitions.dimension_definitions import angle as angle_type
 from .core import errors
+from .core import proofs
+from .core import validation
 from .core.dimensions import dimensionless
-from .core.symbols.quantities import Quantity, list_of_quantities
+from .core.symbols.quantities import Quantity, list_of_quantities, quantity_scope
+from .core.symbols.quantity_array import QuantityArray
 from .core.convert import convert_to
 from .core.symbols.symbols import Function, Symbol, print_expression
 from .core.symbols.prefixes import prefixes
 from .core.quantity_decorator import validate_input, validate_output
+from .core.validation import validation_policy, set_validation_policy
 from .core.vectors.vectors import Vector, QuantityVector
+from .core.vectors.vector_array import VectorArray
 from .core.vectors.arithmetics import scale_vector, add_cartesian_vectors, dot_vectors, cross_cartesian_vectors, vector_unit, vector_magnitude
 from .core.coordinate_systems.coordinate_systems import CoordinateSystem, coordinates_transform
 
 __all__ = [
     # errors
     "errors",
+    # proofs
+    "proofs",
     # units
     "units",
     "angle_type",
@@ -23,18 +30,25 @@ __all__ = [
     # symbols
     "Function",
     "Quantity",
+    "QuantityArray",
     "Symbol",
     "prefixes",
     "print_expression",
     "list_of_quantities",
+    "quantity_scope",
     # convert
     "convert_to",
     # decorators
     "validate_input",
     "validate_output",
+    # validation policy
+    "validation",
+    "validation_policy",
+    "set_validation_policy",
     # vectors
     "Vector",
     "QuantityVector",
+    "VectorArray",
     "scale_vector",
     "add_cartesian_vectors",
     "dot_vectors",
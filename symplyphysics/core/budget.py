@@ -0,0 +1,332 @@
+"""
+Time and complexity budgets of symbolic calls, eg solve(), integrate(), dsolve() and simplify().
+
+Symbolic algorithms may run for a very long time on unlucky inputs. Budget policy sets hard
+limits for each budgeted call:
+- time: wall-clock time of the call in seconds;
+- operations: maximum count_ops() of the call arguments, so that calls with huge expressions
+  fail fast without being started;
+- on_expiry: 'raise' to raise BudgetExceededError, or 'fallback' to use numeric path, eg nsolve()
+  or quadrature, if the call has one. Calls without numeric path always raise.
+
+Policy is unlimited by default. It is set globally with set_budget_policy() or
+SYMPLYPHYSICS_BUDGET environment variable, eg SYMPLYPHYSICS_BUDGET=time=2.5,operations=5000,
+on_expiry=fallback. It can be changed for a block of code with budget_policy() context manager.
+
+Time limit is enforced with SIGALRM timer in the main thread, unless application uses its own
+timer. Other threads use profile hook, that checks the deadline on each Python function call, so
+that calls are slower there. Nested budgets keep the earliest deadline.
+
+Example:
+# with budget_policy("time=1,on_expiry=fallback"):
+#     flux = flux_across_surface(field, surface, limits1, limits2)
+# print(budget_stats())
+"""
+
+import os
+import signal
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum, unique
+from typing import Any, Callable, Iterator, Optional, TypeVar
+from sympy import Basic, Eq, Expr, count_ops, dsolve, integrate, nsolve, simplify, solve, sympify
+from sympy.physics.units import Quantity as SymQuantity
+
+from .errors import BudgetExceededError
+
+BUDGET_ENV = "SYMPLYPHYSICS_BUDGET"
+
+T = TypeVar("T")
+
+
+@unique
+class ExpiryAction(Enum):
+    RAISE = "raise"
+    FALLBACK = "fallback"
+
+
+class BudgetPolicy:
+    # Wall-clock time of each call in seconds, or None if time is not limited
+    time_limit: Optional[float]
+    # Maximum count_ops() of call arguments, or None if it is not limited
+    operation_limit: Optional[int]
+    on_expiry: ExpiryAction
+
+    def __init__(self,
+        time_limit: Optional[float] = None,
+        operation_limit: Optional[int] = None,
+        on_expiry: ExpiryAction = ExpiryAction.RAISE):
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError(f"Time limit should be positive, got {time_limit}")
+        if operation_limit is not None and operation_limit <= 0:
+            raise ValueError(f"Operation limit should be positive, got {operation_limit}")
+        self.time_limit = time_limit
+        self.operation_limit = operation_limit
+        self.on_expiry = on_expiry
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BudgetPolicy):
+            return NotImplemented
+        return ((self.time_limit, self.operation_limit, self.on_expiry) == (other.time_limit,
+            other.operation_limit, other.on_expiry))
+
+    def __hash__(self) -> int:
+        return hash((self.time_limit, self.operation_limit, self.on_expiry))
+
+    def __repr__(self) -> str:
+        if self.time_limit is None and self.operation_limit is None:
+            return "unlimited"
+        limits = []
+        if self.time_limit is not None:
+            limits.append(f"time={self.time_limit}")
+        if self.operation_limit is not None:
+            limits.append(f"operations={self.operation_limit}")
+        return ",".join(limits + [f"on_expiry={self.on_expiry.value}"])
+
+
+UNLIMITED = BudgetPolicy()
+
+
+# Converts policy description, eg "time=2.5,operations=5000,on_expiry=fallback" or "unlimited",
+# to policy.
+def parse_budget_policy(policy: str | BudgetPolicy) -> BudgetPolicy:
+    if isinstance(policy, BudgetPolicy):
+        return policy
+    description = policy.strip().lower()
+    if description == "unlimited":
+        return UNLIMITED
+    settings: dict[str, str] = {}
+    for setting in description.split(","):
+        (name, separator, value) = setting.partition("=")
+        if separator == "" or name.strip() not in ("time", "operations", "on_expiry"):
+            raise ValueError(f"Unknown budget policy: '{policy}'")
+        settings[name.strip()] = value.strip()
+    time_limit = settings.get("time")
+    operation_limit = settings.get("operations")
+    return BudgetPolicy(None if time_limit is None else float(time_limit),
+        None if operation_limit is None else int(operation_limit),
+        ExpiryAction(settings.get("on_expiry", ExpiryAction.RAISE.value)))
+
+
+_global_policy = parse_budget_policy(os.environ.get(BUDGET_ENV, "") or UNLIMITED)
+_scoped_policy: ContextVar[Optional[BudgetPolicy]] = ContextVar("scoped_budget_policy",
+    default=None)
+
+# Number of budgeted calls, calls that exceeded their budget and calls that were completed with
+# numeric fallback. Counters are approximate when calls are made from multiple threads.
+_call_counts = {"calls": 0, "expired": 0, "fallbacks": 0}
+
+
+def current_budget_policy() -> BudgetPolicy:
+    scoped = _scoped_policy.get()
+    return _global_policy if scoped is None else scoped
+
+
+def set_budget_policy(policy: str | BudgetPolicy) -> None:
+    global _global_policy  # pylint: disable=global-statement
+    _global_policy = parse_budget_policy(policy)
+
+
+@contextmanager
+def budget_policy(policy: str | BudgetPolicy) -> Iterator[None]:
+    token = _scoped_policy.set(parse_budget_policy(policy))
+    try:
+        yield
+    finally:
+        _scoped_policy.reset(token)
+
+
+def budget_stats() -> dict[str, Any]:
+    return {
+        "policy": repr(current_budget_policy()),
+        "calls": _call_counts["calls"],
+        "expired": _call_counts["expired"],
+        "fallbacks": _call_counts["fallbacks"],
+    }
+
+
+def reset_budget_stats() -> None:
+    for name in _call_counts:
+        _call_counts[name] = 0
+
+
+class _Expired(BaseException):
+    """
+    Raised from timer handler or profile hook. It is not an Exception, so that it is not caught by
+    'except Exception' blocks in SymPy, and is converted to BudgetExceededError by run_with_budget().
+    """
+
+
+class _ThreadDeadline(threading.local):  # pylint: disable=too-few-public-methods
+    """
+    Deadline of the innermost budgeted call in the current thread, and whether it is enforced with
+    SIGALRM timer or with profile hook.
+    """
+
+    deadline: Optional[float] = None
+    uses_timer: bool = False
+
+
+_thread_deadline = _ThreadDeadline()
+
+
+def _alarm_handler(_signum: int, _frame: Any) -> None:
+    raise _Expired()
+
+
+def _profile_hook(_frame: Any, event: str, _arg: Any) -> None:
+    deadline = _thread_deadline.deadline
+    if event == "call" and deadline is not None and time.monotonic() > deadline:
+        raise _Expired()
+
+
+# SIGALRM can only be handled in the main thread. Timer is not used if application has its own
+# handler or timer, so that they are not changed.
+def _can_use_timer() -> bool:
+    if not hasattr(signal, "setitimer"):
+        return False
+    if threading.current_thread() is not threading.main_thread():
+        return False
+    handler = signal.getsignal(signal.SIGALRM)
+    return handler == signal.SIG_DFL and signal.getitimer(signal.ITIMER_REAL)[0] == 0
+
+
+def _arm_timer(deadline: float) -> None:
+    # zero interval disables the timer, so expired deadline fires as soon as possible
+    signal.setitimer(signal.ITIMER_REAL, max(deadline - time.monotonic(), 1e-6))
+
+
+@contextmanager
+def _time_limit(seconds: Optional[float]) -> Iterator[None]:
+    outer_deadline = _thread_deadline.deadline
+    deadline = None if seconds is None else time.monotonic() + seconds
+    if deadline is None or (outer_deadline is not None and outer_deadline <= deadline):
+        # outer deadline is earlier and is already enforced
+        yield
+        return
+    if outer_deadline is not None:
+        _thread_deadline.deadline = deadline
+        if _thread_deadline.uses_timer:
+            _arm_timer(deadline)
+        try:
+            yield
+        finally:
+            _thread_deadline.deadline = outer_deadline
+            if _thread_deadline.uses_timer:
+                _arm_timer(outer_deadline)
+        return
+    _thread_deadline.deadline = deadline
+    _thread_deadline.uses_timer = _can_use_timer()
+    if _thread_deadline.uses_timer:
+        signal.signal(signal.SIGALRM, _alarm_handler)
+        _arm_timer(deadline)
+        try:
+            yield
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, signal.SIG_DFL)
+            _thread_deadline.deadline = None
+        return
+    previous_hook = sys.getprofile()
+    sys.setprofile(_profile_hook)
+    try:
+        yield
+    finally:
+        sys.setprofile(previous_hook)
+        _thread_deadline.deadline = None
+
+
+def _count_operations(args: tuple[Any, ...]) -> int:
+    operations = 0
+    for arg in args:
+        if isinstance(arg, Basic):
+            operations += int(count_ops(arg))
+        elif isinstance(arg, (list, tuple)):
+            operations += _count_operations(tuple(arg))
+    return operations
+
+
+# Calls 'function' with 'args' within the current budget. 'operation' is the name of the call for
+# error messages. If budget is exceeded and policy is 'fallback', result of 'fallback' is
+# returned instead. Fallback should raise BudgetExceededError if it cannot be used for the
+# arguments. Fallback is not used if deadline of the outer budgeted call has passed, so that the
+# outer call is not continued without a limit.
+def run_with_budget(operation: str,
+    function: Callable[..., T],
+    *args: Any,
+    fallback: Optional[Callable[[], T]] = None,
+    **kwargs: Any) -> T:
+    policy = current_budget_policy()
+    outer_deadline = _thread_deadline.deadline
+    _call_counts["calls"] += 1
+    try:
+        if policy.operation_limit is not None:
+            operations = _count_operations(args)
+            if operations > policy.operation_limit:
+                raise BudgetExceededError(
+                    f"{operation}() arguments have {operations} operations, the limit is "
+                    f"{policy.operation_limit}")
+        try:
+            with _time_limit(policy.time_limit):
+                return function(*args, **kwargs)
+        except _Expired as e:
+            raise BudgetExceededError(
+                f"{operation}() did not finish in {policy.time_limit} seconds") from e
+    except BudgetExceededError:
+        _call_counts["expired"] += 1
+        if policy.on_expiry != ExpiryAction.FALLBACK or fallback is None:
+            raise
+        # SIGALRM timer of the outer call fires only once, and it might have been handled here
+        if outer_deadline is not None and time.monotonic() >= outer_deadline:
+            raise
+        result = fallback()
+        _call_counts["fallbacks"] += 1
+        return result
+
+
+# Finds single root of the equation with nsolve(), if equation only depends on 'symbol'.
+# Result has the same format as the result of solve().
+def _numeric_root(equation: Any, symbol: Any, dict_result: bool) -> list[Any]:
+    expression = sympify(equation)
+    if isinstance(expression, Eq):
+        expression = expression.lhs - expression.rhs
+    if (not isinstance(symbol, Expr) or expression.free_symbols != {symbol} or
+            len(expression.atoms(SymQuantity)) > 0):
+        raise BudgetExceededError(f"solve() for {symbol} has no numeric fallback")
+    try:
+        root = nsolve(expression, symbol, 1)
+    except (ValueError, ZeroDivisionError) as e:
+        raise BudgetExceededError(f"nsolve() did not find root for {symbol}") from e
+    return [{symbol: root}] if dict_result else [root]
+
+
+## Same as solve(equation, symbol), but within the current budget. Falls back to nsolve(), if
+## equation only depends on 'symbol'.
+def budgeted_solve(equation: Any, symbol: Any, **kwargs: Any) -> Any:
+    return run_with_budget("solve",
+        solve,
+        equation,
+        symbol,
+        fallback=lambda: _numeric_root(equation, symbol, kwargs.get("dict", False)),
+        **kwargs)
+
+
+## Same as integrate(), but within the current budget. Definite integrals can provide
+## 'fallback', eg numeric quadrature. It is not used by default, as it requires numeric limits.
+def budgeted_integrate(integrand: Any, *limits: Any,
+    fallback: Optional[Callable[[], Any]] = None) -> Any:
+    return run_with_budget("integrate", integrate, integrand, *limits, fallback=fallback)
+
+
+## Same as dsolve(), but within the current budget. There is no numeric fallback, because
+## numeric solution requires initial conditions and values of all parameters.
+def budgeted_dsolve(equation: Any, function: Any = None, **kwargs: Any) -> Any:
+    return run_with_budget("dsolve", dsolve, equation, function, **kwargs)
+
+
+## Same as simplify(), but within the current budget. Expression is returned as is on fallback.
+def budgeted_simplify(expression: Any, **kwargs: Any) -> Any:
+    return run_with_budget("simplify", simplify, expression, fallback=lambda: expression, **kwargs)
@@ -1,15 +1,42 @@
-from sympy import Expr, sympify
+from typing import overload
+import numpy as np
+from sympy import Basic, Expr, sympify
 from sympy.physics.units import Quantity as SymQuantity
 
-from .dimensions import assert_equivalent_dimension
+from .dimensions import assert_equivalent_dimension, si_scale_factor
 from .symbols.quantities import Quantity
+from .symbols.quantity_array import QuantityArray
 
 
+@overload
 def convert_to(value: Quantity, target_unit: SymQuantity) -> Expr:
+    ...
+
+
+@overload
+def convert_to(value: QuantityArray, target_unit: SymQuantity) -> np.ndarray:
+    ...
+
+
+def convert_to(value: Quantity | QuantityArray, target_unit: SymQuantity) -> Expr | np.ndarray:
     """
     Convert ``value`` to its scale factor with ``value`` unit represented as ``target_unit``.
+    QuantityArray is converted to array of scale factors.
     """
+    if isinstance(value, QuantityArray):
+        (target_scale, target_dimension) = si_scale_factor(target_unit)
+        assert_equivalent_dimension(value.dimension, value.dimension.name, "convert_to",
+            target_dimension)
+        return value.values / float(target_scale)
     target_quantity = Quantity(target_unit)
     assert_equivalent_dimension(value, value.dimension.name, "convert_to",
         target_quantity.dimension)
     return sympify(value.scale_factor) * (1 / sympify(target_quantity.scale_factor))
+
+
+def convert_to_si(value: Basic) -> Expr:
+    """
+    Convert ``value`` to its scale factor in SI base units.
+    """
+    (scale, _) = si_scale_factor(value)
+    return scale
@@ -1,10 +1,34 @@
+from __future__ import annotations
+import threading
 from enum import Enum, unique
-from typing import Optional
+from typing import Any, Callable, Hashable, Optional
+from weakref import WeakValueDictionary
 from sympy import acos, atan2, cos, sin, sqrt, Expr
-from sympy.vector import CoordSys3D, Vector as SymVector
+from sympy.vector import BaseScalar, BaseVector, CoordSys3D, Vector as SymVector
 from ..symbols.symbols import next_name
 
+# Interned coordinate systems, keyed by (type, parent, transformation). Parent is CoordSys3D for
+# wrapped systems and CoordinateSystem for derived ones, see _interned(). Systems are removed from
+# registry when they are no longer used.
+_registry: WeakValueDictionary[tuple[Any, ...], CoordinateSystem] = WeakValueDictionary()
+_registry_lock = threading.RLock()
 
+
+# Returns coordinate system, registered with the key, or registers the one made by 'create'
+def _interned(key: tuple[Any, ...], create: Callable[[], CoordinateSystem]) -> CoordinateSystem:
+    with _registry_lock:
+        existing = _registry.get(key)
+        if existing is not None:
+            return existing
+        created = create()
+        _registry[key] = created
+        return created
+
+
+# Coordinate systems are interned: the same system is returned for the same CoordSys3D, or when
+# it is derived from the same parent with the same transformation, eg rotated by the same angle.
+# Each root system, ie CoordinateSystem() without CoordSys3D, is a new frame of reference.
+# Therefore coordinate systems are compared by identity and are never copied.
 class CoordinateSystem:
 
     @unique
@@ -15,6 +39,8 @@ class CoordinateSystem:
 
     _coord_system: CoordSys3D
     _coord_system_type: System
+    _base_scalars: tuple[BaseScalar, BaseScalar, BaseScalar]
+    _base_vectors: tuple[BaseVector, BaseVector, BaseVector]
 
     @staticmethod
     def system_to_transformation_name(coord_system_type: System) -> str:
@@ -36,15 +62,38 @@ class CoordinateSystem:
             return ["r", "theta", "phi"]
         return ["x", "y", "z"]
 
+    def __new__(cls,
+        coord_system_type: System = System.CARTESIAN,
+        inner: Optional[CoordSys3D] = None) -> CoordinateSystem:
+        # each root system is a new frame of reference, that is not related to other systems
+        if inner is None:
+            variable_names = CoordinateSystem.system_to_base_scalars(coord_system_type)
+            root = CoordSys3D(next_name("SYS"), variable_names=variable_names)
+            return cls._create(coord_system_type, root)
+        wrapped = inner
+        return _interned((coord_system_type, inner, None),
+            lambda: cls._create(coord_system_type, wrapped))
+
+    @classmethod
+    def _create(cls, coord_system_type: System, coord_system: CoordSys3D) -> CoordinateSystem:
+        created = object.__new__(cls)
+        created._coord_system_type = coord_system_type
+        created._coord_system = coord_system
+        created._base_scalars = coord_system.base_scalars()
+        created._base_vectors = coord_system.base_vectors()
+        return created
+
+    # Coordinate system is initialized in __new__, as it might be already interned
     def __init__(self,
         coord_system_type: System = System.CARTESIAN,
         inner: Optional[CoordSys3D] = None):
-        self._coord_system_type = coord_system_type
-        if inner is None:
-            self._coord_system = CoordSys3D(next_name("SYS"),
-                variable_names=CoordinateSystem.system_to_base_scalars(coord_system_type))
-            return
-        self._coord_system = inner
+        pass
+
+    def __copy__(self) -> CoordinateSystem:
+        return self
+
+    def __deepcopy__(self, _memo: dict[int, Any]) -> CoordinateSystem:
+        return self
 
     @property
     def coord_system(self) -> CoordSys3D:
@@ -54,9 +103,17 @@ class CoordinateSystem:
     def coord_system_type(self) -> System:
         return self._coord_system_type
 
+    # Same as coord_system.base_scalars(), eg (x, y, z) or (r, theta, phi)
+    def base_scalars(self) -> tuple[BaseScalar, BaseScalar, BaseScalar]:
+        return self._base_scalars
+
+    # Same as coord_system.base_vectors(), eg (i, j, k)
+    def base_vectors(self) -> tuple[BaseVector, BaseVector, BaseVector]:
+        return self._base_vectors
+
     def transformation_to_system(self, coord_system_type: System):
         if self._coord_system_type == self.System.CYLINDRICAL:
-            r, theta, z = self._coord_system.base_scalars()
+            r, theta, z = self._base_scalars
             cylindrical_conversions = {
                 self.System.CARTESIAN: (r * cos(theta), r * sin(theta), z),
                 self.System.CYLINDRICAL: (r, theta, z)
@@ -66,7 +123,7 @@ class CoordinateSystem:
                 return transformation
 
         if self._coord_system_type == self.System.SPHERICAL:
-            r, theta, phi = self._coord_system.base_scalars()
+            r, theta, phi = self._base_scalars
             spherical_conversions = {
                 self.System.CARTESIAN:
                 (r * cos(theta) * sin(phi), r * sin(theta) * sin(phi), r * cos(phi)),
@@ -77,7 +134,7 @@ class CoordinateSystem:
                 return transformation
 
         if self._coord_system_type == self.System.CARTESIAN:
-            x, y, z = self._coord_system.base_scalars()
+            x, y, z = self._base_scalars
             cartesian_conversions = {
                 self.System.CYLINDRICAL: (sqrt(x**2 + y**2), atan2(y, x), z),
                 self.System.SPHERICAL: (sqrt(x**2 + y**2 + z**2), atan2(y,
@@ -94,15 +151,27 @@ class CoordinateSystem:
             f"Transformation is not supported: from {coord_name_from} to {coord_name_to}")
 
 
+# Returns coordinate system, derived from 'parent' with 'transformation'. 'create' makes new
+# CoordSys3D, if such system is not interned yet.
+def _derived_system(coord_system_type: CoordinateSystem.System, parent: CoordinateSystem,
+    transformation: Hashable, create: Callable[[], CoordSys3D]) -> CoordinateSystem:
+    return _interned((coord_system_type, parent, transformation),
+        lambda: CoordinateSystem(coord_system_type, create()))
+
+
 # Change coordinate system type, eg from cartesian to cylindrical
 def coordinates_transform(
     from_system: CoordinateSystem,
     coord_system_type: CoordinateSystem.System = CoordinateSystem.System.CARTESIAN
 ) -> CoordinateSystem:
-    new_coord_system = from_system.coord_system.create_new(next_name("SYS"),
-        variable_names=CoordinateSystem.system_to_base_scalars(coord_system_type),
-        transformation=None)
-    return CoordinateSystem(coord_system_type, new_coord_system)
+    variable_names = CoordinateSystem.system_to_base_scalars(coord_system_type)
+
+    def _create() -> CoordSys3D:
+        return from_system.coord_system.create_new(next_name("SYS"),
+            variable_names=variable_names,
+            transformation=None)
+
+    return _derived_system(coord_system_type, from_system, None, _create)
 
 
 def coordinates_rotate(self: CoordinateSystem, angle: Expr, axis: SymVector) -> CoordinateSystem:
@@ -110,5 +179,5 @@ def coordinates_rotate(self: CoordinateSystem, angle: Expr, axis: SymVector) ->
         coord_name_from = CoordinateSystem.system_to_transformation_name(self.coord_system_type)
         raise ValueError(
             f"Rotation only supported for cartesian coordinates: got {coord_name_from}")
-    return CoordinateSystem(self.coord_system_type,
-        self.coord_system.orient_new_axis(next_name("C"), angle, axis))
+    return _derived_system(self.coord_system_type, self, ("rotate", angle, axis),
+        lambda: self.coord_system.orient_new_axis(next_name("C"), angle, axis))
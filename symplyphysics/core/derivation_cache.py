@@ -0,0 +1,290 @@
+"""
+Persistent cache of derived expressions.
+
+Law derivations call solve(), dsolve() and other costly SymPy routines. Results of these calls
+are the same in every interpreter, so they are stored on disk and reused by later processes.
+Cache is kept per law module and is keyed by a hash of the module source and SymPy version -
+when any of them changes, the cache of the module is rebuilt.
+
+Symbols and functions of this package have generated names that depend on the import order,
+hence they are stored under their display names and restored to the objects, passed as
+arguments to the cached call.
+
+Cache is disabled by default. It is enabled with SYMPLYPHYSICS_CACHE_DIR environment variable or
+with set_cache_directory(). Cache directory should only be writable by the user.
+
+Cached results are stored as SymPy representation (srepr) and are restored with a restricted
+parser, that only constructs SymPy objects and never evaluates the file contents as code.
+
+Example:
+# dsolved = cached_call(__name__, "dsolved", dsolve, equation, function(time))
+"""
+
+import ast
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from functools import cache
+from typing import Any, Callable, Optional, TypeVar
+import sympy
+from sympy import Basic, Function as SymFunction, Symbol as SymSymbol, srepr
+from sympy import __version__ as sympy_version
+from sympy.core.function import AppliedUndef, UndefinedFunction
+from sympy.functions.elementary.piecewise import ExprCondPair
+from sympy.physics.units import Quantity as SymQuantity
+from .symbols.symbols import DimensionSymbol, Function, Symbol
+
+CACHE_DIR_ENV = "SYMPLYPHYSICS_CACHE_DIR"
+
+_CACHE_FORMAT_VERSION = 1
+_PLACEHOLDER_PREFIX = "_cached_"
+# SymPy classes, that accept names and numbers as strings. Other classes sympify string
+# arguments, ie evaluate them, so strings are not accepted there.
+_STRING_CONSTRUCTORS = ("Symbol", "Dummy", "Function", "Float")
+
+Result = TypeVar("Result")
+
+# Mapping from module name to the loaded cache entries of this module
+_modules: dict[str, dict[str, dict[str, str]]] = {}
+
+_cache_directory = os.environ.get(CACHE_DIR_ENV) or None
+
+
+def cache_directory() -> Optional[str]:
+    return _cache_directory
+
+
+# Sets directory for the cache files. None disables the cache.
+def set_cache_directory(directory: Optional[str]) -> None:
+    global _cache_directory  # pylint: disable=global-statement
+    _cache_directory = directory
+    _modules.clear()
+
+
+# Removes cache files of all modules, or of the given module only.
+def clear_cache(module_name: Optional[str] = None) -> None:
+    if module_name is None:
+        _modules.clear()
+    else:
+        _modules.pop(module_name, None)
+    if _cache_directory is None or not os.path.isdir(_cache_directory):
+        return
+    for file_name in os.listdir(_cache_directory):
+        if not file_name.endswith(".json"):
+            continue
+        if module_name is None or file_name == f"{module_name}.json":
+            os.remove(os.path.join(_cache_directory, file_name))
+
+
+# Calls 'func' with given arguments or returns its result from the cache.
+# 'module_name' is the name of the law module, that performs the call - cache is invalidated
+# when source of this module changes. 'name' should be unique within the module.
+# Results, that cannot be restored from their SymPy representation, are not cached.
+def cached_call(module_name: str, name: str, func: Callable[..., Result], *args: Any,
+    **kwargs: Any) -> Result:
+    if _cache_directory is None:
+        return func(*args, **kwargs)
+    mapping = _collect_symbols((args, kwargs))
+    if mapping is None:
+        return func(*args, **kwargs)
+    to_placeholder = {v: k for k, v in mapping.items()}
+    arguments_repr = srepr(_replace((args, sorted(kwargs.items())), to_placeholder))
+    entries = _load_entries(module_name)
+    entry = entries.get(name)
+    if entry is not None and entry["arguments"] == arguments_repr:
+        try:
+            return _replace(_parse_repr(entry["result"]), mapping)
+        except (TypeError, ValueError, AttributeError):
+            pass
+    result = func(*args, **kwargs)
+    result_repr = _serialize(result, to_placeholder, mapping)
+    if result_repr is not None:
+        entries[name] = {"arguments": arguments_repr, "result": result_repr}
+        _store_entries(module_name, entries)
+    return result
+
+
+def _serialize(result: Any, to_placeholder: dict[Any, Any], mapping: dict[Any,
+    Any]) -> Optional[str]:
+    try:
+        result_repr = srepr(_replace(result, to_placeholder))
+        restored = _replace(_parse_repr(result_repr), mapping)
+    except (TypeError, ValueError, AttributeError):
+        return None
+    return result_repr if restored == result else None
+
+
+@cache
+def _repr_namespace() -> dict[str, Any]:
+    namespace = {
+        name: value
+        for (name, value) in vars(sympy).items()
+        if isinstance(value, Basic) or (isinstance(value, type) and issubclass(value, Basic))
+    }
+    namespace["ExprCondPair"] = ExprCondPair
+    return namespace
+
+
+# Restores object from its srepr(). Only SymPy classes and constants, literals and containers
+# are allowed, so that contents of the cache file are never executed. Raises ValueError for
+# anything else.
+def _parse_repr(text: str) -> Any:
+    try:
+        tree = ast.parse(text, mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Cannot parse cached expression: {e}") from e
+    return _parse_node(tree.body, False)
+
+
+def _parse_node(node: ast.expr, allow_strings: bool) -> Any:
+    if isinstance(node, ast.Constant):
+        if isinstance(node.value, str) and not allow_strings:
+            raise ValueError(f"String '{node.value}' is not allowed in cached expression")
+        if node.value is None or isinstance(node.value, (bool, int, float, str)):
+            return node.value
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        value = _parse_node(node.operand, False)
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return -value
+    if isinstance(node, (ast.Tuple, ast.List)):
+        elements = [_parse_node(e, False) for e in node.elts]
+        return tuple(elements) if isinstance(node, ast.Tuple) else elements
+    if isinstance(node, ast.Dict):
+        # None key is dictionary unpacking
+        keys = [k for k in node.keys if k is not None]
+        if len(keys) == len(node.values):
+            return {
+                _parse_node(k, False): _parse_node(v, False) for (k, v) in zip(keys, node.values)
+            }
+    if isinstance(node, ast.Name) and node.id in _repr_namespace():
+        return _repr_namespace()[node.id]
+    if isinstance(node, ast.Call):
+        return _parse_call(node)
+    raise ValueError(f"Unsupported cached expression: {ast.dump(node)}")
+
+
+def _parse_call(node: ast.Call) -> Any:
+    if any(isinstance(a, ast.Starred) for a in node.args) or any(
+            k.arg is None for k in node.keywords):
+        raise ValueError(f"Unsupported cached expression: {ast.dump(node)}")
+    strings = isinstance(node.func, ast.Name) and node.func.id in _STRING_CONSTRUCTORS
+    func = _parse_node(node.func, False)
+    args = [_parse_node(a, strings) for a in node.args]
+    kwargs = {str(k.arg): _parse_node(k.value, False) for k in node.keywords}
+    return func(*args, **kwargs)
+
+
+# Returns mapping from placeholder to the symbol or function of this package, found in arguments.
+# Returns None if arguments cannot be cached.
+def _collect_symbols(arguments: Any) -> Optional[dict[Any, Any]]:
+    mapping: dict[Any, Any] = {}
+    for expr in _expressions(arguments):
+        atoms = set(expr.atoms(SymSymbol, SymQuantity))
+        atoms.update(f.func for f in expr.atoms(AppliedUndef))
+        for atom in atoms:
+            if isinstance(atom, SymQuantity):
+                # Quantities of this package have generated names and are not cached
+                if isinstance(atom, DimensionSymbol):
+                    return None
+                # SymPy units and constants have fixed names, but are not restored from srepr
+                placeholder = SymSymbol(_PLACEHOLDER_PREFIX + "unit_" + str(atom.name))
+            elif isinstance(atom, Function):
+                placeholder = SymFunction(_PLACEHOLDER_PREFIX + atom.display_name)
+            elif isinstance(atom, Symbol):
+                placeholder = SymSymbol(_PLACEHOLDER_PREFIX + atom.display_name,
+                    **atom.assumptions0)
+            else:
+                continue
+            existing = mapping.setdefault(placeholder, atom)
+            # Ambiguous display names, eg two 'time' symbols from different modules
+            if existing != atom:
+                return None
+    return mapping
+
+
+def _expressions(obj: Any) -> list[Basic]:
+    if isinstance(obj, Basic):
+        return [obj]
+    if isinstance(obj, dict):
+        return _expressions(list(obj.keys())) + _expressions(list(obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return [e for o in obj for e in _expressions(o)]
+    return []
+
+
+def _replace(obj: Any, mapping: dict[Any, Any]) -> Any:
+    if isinstance(obj, Basic):
+        symbols = {k: v for k, v in mapping.items() if isinstance(k, Basic)}
+        result = obj.xreplace(symbols)
+        for from_, to_ in mapping.items():
+            if isinstance(from_, UndefinedFunction):
+                result = result.replace(from_, to_)
+        return result
+    if isinstance(obj, dict):
+        return {_replace(k, mapping): _replace(v, mapping) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_replace(o, mapping) for o in obj]
+    if isinstance(obj, tuple):
+        return tuple(_replace(o, mapping) for o in obj)
+    return obj
+
+
+def _source_hash(module_name: str) -> Optional[str]:
+    module = sys.modules.get(module_name)
+    file_name = getattr(module, "__file__", None)
+    if file_name is None:
+        return None
+    try:
+        with open(file_name, "rb") as file:
+            return hashlib.sha256(file.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _cache_key(module_name: str) -> dict[str, Any]:
+    return {
+        "format": _CACHE_FORMAT_VERSION,
+        "source": _source_hash(module_name),
+        "sympy": sympy_version,
+    }
+
+
+def _cache_file(module_name: str) -> str:
+    assert _cache_directory is not None
+    return os.path.join(_cache_directory, f"{module_name}.json")
+
+
+def _load_entries(module_name: str) -> dict[str, dict[str, str]]:
+    entries = _modules.get(module_name)
+    if entries is not None:
+        return entries
+    entries = {}
+    try:
+        with open(_cache_file(module_name), "r", encoding="utf-8") as file:
+            content = json.load(file)
+        # Stale cache is dropped and rebuilt
+        if content.get("key") == _cache_key(module_name):
+            entries = content["entries"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    _modules[module_name] = entries
+    return entries
+
+
+def _store_entries(module_name: str, entries: dict[str, dict[str, str]]) -> None:
+    key = _cache_key(module_name)
+    # Do not persist results for modules without known source
+    if key["source"] is None:
+        return
+    content = {"key": key, "entries": entries}
+    try:
+        os.makedirs(_cache_directory or "", exist_ok=True)
+        # Write to temporary file first, so that concurrent processes never read partial file
+        (handle, temp_name) = tempfile.mkstemp(dir=_cache_directory, suffix=".tmp")
+        with os.fdopen(handle, "w", encoding="utf-8") as file:
+            json.dump(content, file)
+        os.replace(temp_name, _cache_file(module_name))
+    except OSError:
+        pass
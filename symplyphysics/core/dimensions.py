@@ -1,15 +1,89 @@
-from typing import Any, Callable, TypeAlias
-from sympy import Expr, S, Derivative, Function as SymFunction, Basic
+from fractions import Fraction
+from functools import lru_cache
+from typing import Any, Callable, Optional, TypeAlias
+from sympy import Expr, S, Derivative, Function as SymFunction, Basic, Float, Rational, sympify
 from sympy.core.add import Add
 from sympy.core.mul import Mul
 from sympy.core.power import Pow
+from sympy.physics import units
 from sympy.physics.units import Dimension, Quantity as SymQuantity
-from sympy.physics.units.systems.si import SI
+from sympy.physics.units.systems.si import SI, dimsys_SI
+from sympy.physics.units.definitions.dimension_definitions import angle as angle_type
 
 from .errors import UnitsError
 
 ScalarValue: TypeAlias = Expr | float
 
+# Units, that are used to represent quantities as plain numbers. Angle is a base dimension in
+# SymPy SI system, hence radian is also included.
+_SI_BASE_UNITS: dict[Dimension, SymQuantity] = {
+    units.length: units.meter,
+    units.mass: units.kilogram,
+    units.time: units.second,
+    units.current: units.ampere,
+    units.temperature: units.kelvin,
+    units.amount_of_substance: units.mole,
+    units.luminous_intensity: units.candela,
+    angle_type: units.radian,
+}
+
+# Dimension is represented as a tuple of rational exponents of SI base dimensions, in the
+# order of _SI_BASE_UNITS keys, so that dimensions can be compared without symbolic
+# manipulation. Angle is the last exponent.
+DimensionVector: TypeAlias = tuple[Fraction, ...]
+
+_BASE_DIMENSION_INDICES = {d: i for (i, d) in enumerate(_SI_BASE_UNITS)}
+_ANGLE_INDEX = _BASE_DIMENSION_INDICES[angle_type]
+
+# Maximum number of cached dimension vectors. Only a few hundred distinct dimensions are
+# usually in use.
+DIMENSION_CACHE_SIZE = 4096
+
+
+def _fraction(power: Any) -> Optional[Fraction]:
+    if isinstance(power, int):
+        return Fraction(power)
+    if isinstance(power, Rational):
+        return Fraction(int(power.p), int(power.q))
+    if isinstance(power, Float):
+        return Fraction(float(power))
+    return None
+
+
+@lru_cache(maxsize=DIMENSION_CACHE_SIZE)
+def dimension_vector(dimension: Dimension) -> Optional[DimensionVector]:
+    """
+    Return exponents of SI base dimensions in ``dimension``, or None if ``dimension`` cannot be
+    represented this way, eg it contains symbolic exponents or unknown base dimensions.
+    """
+    exponents = [Fraction(0)] * len(_BASE_DIMENSION_INDICES)
+    try:
+        dependencies = dimsys_SI.get_dimensional_dependencies(dimension)
+    except (TypeError, ValueError):
+        return None
+    for (base_dimension, power) in dependencies.items():
+        index = _BASE_DIMENSION_INDICES.get(base_dimension)
+        exponent = _fraction(power)
+        if index is None or exponent is None:
+            return None
+        exponents[index] = exponent
+    return tuple(exponents)
+
+
+def _equivalent_dims(first: Dimension, second: Dimension) -> bool:
+    first_vector = dimension_vector(first)
+    second_vector = dimension_vector(second)
+    if first_vector is None or second_vector is None:
+        return SI.get_dimension_system().equivalent_dims(first, second)
+    return first_vector == second_vector
+
+
+def _is_dimensionless(dimension: Dimension) -> bool:
+    vector = dimension_vector(dimension)
+    if vector is None:
+        return SI.get_dimension_system().is_dimensionless(dimension)
+    return not any(vector)
+
 
 def collect_factor_and_dimension(expr: Basic) -> tuple[Basic, Dimension]:
     """
@@ -33,7 +107,7 @@ def collect_factor_and_dimension(expr: Basic) -> tuple[Basic, Dimension]:
         (factor, dim) = collect_factor_and_dimension(expr.base)
         pow_expr *= factor
         (exp_factor, exp_dim) = collect_factor_and_dimension(expr.exp)
-        if not SI.get_dimension_system().is_dimensionless(exp_dim):
+        if not _is_dimensionless(exp_dim):
             raise ValueError(
                 f"Dimension of '{expr.exp}' is {exp_dim}, but it should be dimensionless")
         exp_dim = S.One
@@ -46,12 +120,12 @@ def collect_factor_and_dimension(expr: Basic) -> tuple[Basic, Dimension]:
         for addend in expr.args[1:]:
             (addend_factor, addend_dim) = collect_factor_and_dimension(addend)
             # automatically convert zero to the dimension of it's additives
-            if dim != addend_dim and not SI.get_dimension_system().equivalent_dims(dim, addend_dim):
+            if dim != addend_dim and not _equivalent_dims(dim, addend_dim):
                 if factor == S.Zero:
                     dim = addend_dim
                 elif addend_factor == S.Zero:
                     addend_dim = dim
-            if dim != addend_dim and not SI.get_dimension_system().equivalent_dims(dim, addend_dim):
+            if dim != addend_dim and not _equivalent_dims(dim, addend_dim):
                 raise ValueError(f"Dimension of '{addend}' is {addend_dim}, but it should be {dim}")
             sum_expr += addend_factor
         return (sum_expr, dim)
@@ -64,7 +138,7 @@ def collect_factor_and_dimension(expr: Basic) -> tuple[Basic, Dimension]:
         for arg in expr.args:
             (f, d) = collect_factor_and_dimension(arg)
             # only functions with dimensionless arguments are supported
-            if not SI.get_dimension_system().is_dimensionless(d):
+            if not _is_dimensionless(d):
                 raise ValueError(f"Dimension of '{arg}' is {d}, but it should be dimensionless")
             factors.append(f)
         ret = expr.func(*(f for f in factors))
@@ -89,28 +163,100 @@ def collect_factor_and_dimension(expr: Basic) -> tuple[Basic, Dimension]:
     return (expr, dimensionless)
 
 
+def si_base_unit(dimension: Dimension) -> Expr:
+    """
+    Return product of SI base units, that has given ``dimension``.
+    """
+    result = S.One
+    for (base_dimension, power) in dimsys_SI.get_dimensional_dependencies(dimension).items():
+        result *= _SI_BASE_UNITS[base_dimension]**power
+    return result
+
+
+def si_scale_factor(expr: Basic) -> tuple[Expr, Dimension]:
+    """
+    Return tuple with scale factor of ``expr`` in SI base units and its dimension.
+    """
+    (factor, dimension) = collect_factor_and_dimension(sympify(expr))
+    (base_factor, _) = collect_factor_and_dimension(si_base_unit(dimension))
+    return (factor / base_factor, dimension)
+
+
+#HACK: this allows to treat angle type as dimensionless. SymPy treats angle as a separate
+# dimension, so it is removed from dimensions before they are compared.
+@lru_cache(maxsize=DIMENSION_CACHE_SIZE)
+def angle_stripped(dimension: Dimension) -> Dimension:
+    """
+    Return ``dimension`` with angle replaced by 1.
+    """
+    return dimension.subs("angle", S.One)
+
+
+# Verdicts of dimension checks
+_NOT_EQUIVALENT = 0
+_EQUIVALENT = 1
+# Both dimensions are dimensionless, so argument is allowed to contain free symbols, eg
+# coordinates
+_DIMENSIONLESS = 2
+
+
+# Set of dimensions used in the code is small, so verdicts are memoized, and validation does
+# not depend on the complexity of dimensions.
+@lru_cache(maxsize=DIMENSION_CACHE_SIZE)
+def _check_dimension(dimension: Dimension, expected_dimension: Dimension) -> int:
+    vector = dimension_vector(dimension)
+    expected_vector = dimension_vector(expected_dimension)
+    if vector is not None and expected_vector is not None:
+        vector = vector[:_ANGLE_INDEX]
+        expected_vector = expected_vector[:_ANGLE_INDEX]
+        if not any(vector) and not any(expected_vector):
+            return _DIMENSIONLESS
+        return _EQUIVALENT if vector == expected_vector else _NOT_EQUIVALENT
+    dimension = angle_stripped(dimension)
+    expected_dimension = angle_stripped(expected_dimension)
+    # angle is dimensionless but equivalent_dims() fails to compare it
+    if _is_dimensionless(dimension) and _is_dimensionless(expected_dimension):
+        return _DIMENSIONLESS
+    return _EQUIVALENT if _equivalent_dims(dimension, expected_dimension) else _NOT_EQUIVALENT
+
+
+def dimension_cache_info() -> dict[str, Any]:
+    """
+    Return statistics of dimension caches, eg to find hit rate of dimension checks.
+    """
+    return {
+        "dimension_vector": dimension_vector.cache_info(),
+        "angle_stripped": angle_stripped.cache_info(),
+        # pylint: disable-next=no-value-for-parameter
+        "dimension_checks": _check_dimension.cache_info(),
+    }
+
+
+def clear_dimension_caches() -> None:
+    dimension_vector.cache_clear()
+    angle_stripped.cache_clear()
+    _check_dimension.cache_clear()
+
+
 def assert_equivalent_dimension(arg: SymQuantity | ScalarValue | Dimension, param_name: str,
     func_name: str, expected_unit: Dimension):
-    #HACK: this allows to treat angle type as dimensionless
-    expected_dimension = expected_unit.subs("angle", S.One)
     if isinstance(arg, (float | int)):
-        if SI.get_dimension_system().is_dimensionless(expected_dimension):
+        if _check_dimension(dimensionless, expected_unit) != _NOT_EQUIVALENT:
             return
         raise TypeError(f"Argument '{param_name}' to function '{func_name}'"
-            f" is Number but '{expected_dimension}' is not dimensionless")
-    (scale_factor, dimension) = collect_factor_and_dimension(arg)
+            f" is Number but '{angle_stripped(expected_unit)}' is not dimensionless")
+    # quantity is the most common argument, so there is no need to walk the expression
+    (scale_factor, dimension) = (arg.scale_factor,
+        arg.dimension) if isinstance(arg, SymQuantity) else collect_factor_and_dimension(arg)
     # zero can be of any dimension
     if scale_factor == S.Zero:
         return
-    #HACK: this allows to treat angle type as dimensionless
-    arg_dimension = dimension.subs("angle", S.One)
-    # angle is dimensionless but equivalent_dims() fails to compare it
-    if SI.get_dimension_system().is_dimensionless(
-            expected_dimension) and SI.get_dimension_system().is_dimensionless(arg_dimension):
+    verdict = _check_dimension(dimension, expected_unit)
+    if verdict == _DIMENSIONLESS:
         return
-    if not SI.get_dimension_system().equivalent_dims(arg_dimension, expected_dimension):
+    if verdict == _NOT_EQUIVALENT:
         raise UnitsError(f"Argument '{param_name}' to function '{func_name}' must "
-            f"be in units equivalent to '{expected_dimension.name}'")
+            f"be in units equivalent to '{angle_stripped(expected_unit).name}'")
     if scale_factor.free_symbols:
         raise UnitsError(f"Argument '{param_name}' to function '{func_name}' should "
             f"not contain free symbols")
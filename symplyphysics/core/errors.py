@@ -2,3 +2,15 @@ class UnitsError(ValueError):
     """
     Raised if units are missing or invalid.
     """
+
+
+class IntegrationWarning(UserWarning):
+    """
+    Issued if numeric integral is not within the requested tolerance.
+    """
+
+
+class BudgetExceededError(TimeoutError):
+    """
+    Raised if symbolic call exceeds its time or operation budget, see 'budget' module.
+    """
@@ -1,12 +1,186 @@
-from typing import SupportsAbs, Any
-from sympy import simplify
+"""
+Equality check of SymPy expressions.
+
+simplify() is the most expensive SymPy operation, so expressions are compared in tiers, and each
+tier is only used if the previous one is inconclusive:
+- structural: expressions are the same, or their difference is zero after automatic evaluation;
+- numeric: expressions are evaluated with high precision at several random points, that respect
+  assumptions of the symbols, eg positive symbols only get positive values. Expressions are
+  different if they are different at any of the points, and are equal with high probability if
+  they are the same at all points. Tier is inconclusive if expressions cannot be evaluated to
+  numbers, eg they contain undefined functions, or symbols with assumptions that are not
+  supported, eg prime. Quantities are replaced with their SI scale factors multiplied by random
+  values of their base dimensions, so that kilometer equals 1000 meters, but meter differs from
+  second;
+- simplify: difference of expressions is simplified within the current budget, see 'budget'
+  module, and compared with zero. There is no sound fallback for the comparison, so
+  BudgetExceededError is raised if budget is exceeded, whatever the expiry policy is.
+
+Example:
+# assert expr_equals(sin(2 * x), 2 * sin(x) * cos(x))
+# print(expr_equals_stats())
+"""
+
+import random
+from typing import SupportsAbs, Any, Optional
+from sympy import Dummy, Expr, Float, I, Integer, Rational, S, simplify, sympify
+from sympy.physics.units import Dimension, Quantity as SymQuantity
+from sympy.physics.units.systems.si import dimsys_SI
 from sympy.vector import Vector
 
+from .budget import run_with_budget
+from .dimensions import si_scale_factor
+
+# Number of random points, where expressions are evaluated
+NUMERIC_CHECK_POINTS = 4
+# Number of significant digits of numeric evaluation
+NUMERIC_CHECK_PRECISION = 30
+# Relative difference of values, that are considered to be equal
+NUMERIC_CHECK_TOLERANCE = Rational(1, 10**20)
+# Random values are within this range by magnitude
+_SAMPLE_RANGE = (Rational(1, 10), 3)
+# Random integer values are within this range by magnitude
+_INTEGER_SAMPLE_RANGE = (1, 20)
+
+# Number of comparisons, that were decided by each tier. Counters are approximate when
+# expressions are compared from multiple threads.
+_tier_counts = {"structural": 0, "numeric": 0, "simplify": 0}
+
+
+def expr_equals_stats() -> dict[str, int]:
+    return dict(_tier_counts)
+
+
+def reset_expr_equals_stats() -> None:
+    for name in _tier_counts:
+        _tier_counts[name] = 0
+
+
+def _random_magnitude() -> Expr:
+    (low, high) = _SAMPLE_RANGE
+    # exact rational value, so that precision of evaluation is not limited by the sample
+    return low + (high - low) * Rational(random.getrandbits(32), 2**32)
+
+
+# Returns random value, that respects assumptions of 'symbol', or None if assumptions are not
+# supported. Sign of symbols without sign assumptions alternates with 'point_index', so that
+# expressions, that are only equal for positive values, eg sqrt(x**2) and x, are always
+# distinguished.
+def _random_value(symbol: Expr, point_index: int) -> Optional[Expr]:
+    if symbol.is_zero:
+        return S.Zero
+    if symbol.is_positive or symbol.is_nonnegative:
+        sign = 1
+    elif symbol.is_negative or symbol.is_nonpositive:
+        sign = -1
+    else:
+        sign = -1 if point_index % 2 else 1
+    value: Expr
+    if symbol.is_integer:
+        value = Integer(sign * random.randint(*_INTEGER_SAMPLE_RANGE))
+        if symbol.is_even and value.is_odd or symbol.is_odd and value.is_even:
+            value = value + sign
+    elif symbol.is_extended_real:
+        value = sign * _random_magnitude()
+    elif symbol.is_imaginary:
+        value = sign * _random_magnitude() * I
+    else:
+        value = sign * _random_magnitude() + random.choice((-1, 1)) * _random_magnitude() * I
+    # assumptions without special handling, eg prime, should also hold for the value
+    for (name, expected) in symbol.assumptions0.items():
+        if getattr(value, f"is_{name}") != expected:
+            return None
+    return value
+
+
+# Returns quantities, replaced with their SI scale factors multiplied by positive symbols of their
+# base dimensions, eg kilometer with 1000 * L.
+def _si_quantities(quantities: set[SymQuantity]) -> dict[SymQuantity, Expr]:
+    base_symbols: dict[Dimension, Dummy] = {}
+    result = {}
+    for quantity in quantities:
+        (scale, dimension) = si_scale_factor(quantity)
+        value = scale
+        for (base_dimension, power) in dimsys_SI.get_dimensional_dependencies(dimension).items():
+            if base_dimension not in base_symbols:
+                base_symbols[base_dimension] = Dummy(str(base_dimension), positive=True)
+            value *= base_symbols[base_dimension]**power
+        result[quantity] = value
+    return result
+
+
+# evalf() returns value without significant digits, eg -0.e-166, when it cannot be distinguished
+# from zero, eg for sin(x)**2 + cos(x)**2 - 1.
+def _is_zero_value(value: Expr) -> bool:
+    # pylint: disable-next=protected-access
+    return all(p.is_zero or isinstance(p, Float) and p._prec <= 1 for p in value.as_real_imag())
+
+
+# Returns True or False if values of the expressions are equal or different, or None if it is not
+# known. Values are compared at 'points', that do not include singular points of the expressions.
+def _numeric_equals(lhs: Expr, rhs: Expr) -> Optional[bool]:
+    quantities = _si_quantities(lhs.atoms(SymQuantity) | rhs.atoms(SymQuantity))
+    (lhs, rhs) = (lhs.xreplace(quantities), rhs.xreplace(quantities))
+    symbols = sorted(lhs.free_symbols | rhs.free_symbols, key=str)
+    compared = 0
+    # some points might be singular, eg zero for 1 / x
+    for point_index in range(2 * NUMERIC_CHECK_POINTS):
+        point = {}
+        for symbol in symbols:
+            value = _random_value(symbol, point_index)
+            if value is None:
+                return None
+            point[symbol] = value
+        lhs_value = lhs.evalf(NUMERIC_CHECK_PRECISION, subs=point)
+        rhs_value = rhs.evalf(NUMERIC_CHECK_PRECISION, subs=point)
+        if not lhs_value.is_number or not rhs_value.is_number:
+            return None
+        if not lhs_value.is_finite or not rhs_value.is_finite:
+            continue
+        # tolerance is relative, so that small values, eg physical constants, are still compared
+        if not (_is_zero_value(lhs_value) and _is_zero_value(rhs_value)):
+            magnitude = max(abs(lhs_value), abs(rhs_value))
+            if abs(lhs_value - rhs_value) > NUMERIC_CHECK_TOLERANCE * magnitude:
+                return False
+        compared += 1
+        if compared >= NUMERIC_CHECK_POINTS:
+            return True
+    return None
+
+
+def _vector_components(vector: Vector) -> Optional[list[Expr]]:
+    # components in different coordinate systems can cancel out after conversion
+    systems = vector.separate()
+    if len(systems) > 1:
+        return None
+    return list(vector.components.values())
+
 
 ## Do not try to limit type of the input parameters. Allow any object to
 ## be compared, if it can.
 def expr_equals(lhs: Any, rhs: Any) -> bool:
-    val = simplify(lhs - rhs)
+    difference = lhs - rhs
+    if difference in (0, Vector.zero):
+        _tier_counts["structural"] += 1
+        return True
+    numeric_result: Optional[bool] = None
+    if isinstance(difference, Vector):
+        components = _vector_components(difference)
+        if components is not None:
+            results = [_numeric_equals(c, S.Zero) for c in components]
+            if False in results:
+                numeric_result = False
+            elif None not in results:
+                numeric_result = True
+    else:
+        (lhs_expr, rhs_expr) = (sympify(lhs), sympify(rhs))
+        if isinstance(lhs_expr, Expr) and isinstance(rhs_expr, Expr):
+            numeric_result = _numeric_equals(lhs_expr, rhs_expr)
+    if numeric_result is not None:
+        _tier_counts["numeric"] += 1
+        return numeric_result
+    _tier_counts["simplify"] += 1
+    val = run_with_budget("simplify", simplify, difference)
     if val == 0:
         return True
     if val == Vector.zero:
@@ -0,0 +1,219 @@
+"""
+Numeric gradient, divergence, curl and Laplacian of fields, sampled on structured grids.
+
+Symbolic operators in 'operators' module differentiate field expressions, which is slow for
+large expressions and is not possible for fields, that are only known at some points, eg
+measured or simulated data. Numeric operators use second-order finite differences along each
+axis of the grid and the same metric factors as symbolic operators, eg 1/r and 1/(r*sin(phi)) in
+spherical coordinates.
+
+Boundary points use one-sided second-order differences, unless axis is periodic, eg azimuthal
+angle covering the full circle. Laplacian applies differences twice, so it is only first-order
+accurate within two points from non-periodic boundaries. Axes with single point are treated as if
+field does not change along them. Operators are not defined where metric factors are singular, eg
+at r = 0, and contain infinity or NaN there.
+
+Example:
+# grid = FieldGrid(rs, thetas, zs, cylindrical, periods=(None, 2 * pi, None))
+# values = field.evaluate_grid(*grid.axes)
+# gradient = numeric_gradient(values, grid)
+"""
+
+from typing import Optional, Sequence
+import numpy as np
+from numpy.typing import ArrayLike
+
+from ..coordinate_systems.coordinate_systems import CoordinateSystem
+
+# Number of grid points along an axis, that is required for second-order differences
+MIN_AXIS_POINTS = 3
+
+
+class FieldGrid:
+    """
+    Structured grid of points, set by coordinates along each axis of the coordinate system, eg
+    (r, theta, z) in cylindrical coordinate system. Axes may be non-uniform. Field values on the
+    grid are arrays of (len(axes[0]), len(axes[1]), len(axes[2])) shape, with 'ij' indexing as in
+    ScalarField.evaluate_grid().
+    """
+
+    coordinate_system: CoordinateSystem
+    axes: tuple[np.ndarray, np.ndarray, np.ndarray]
+    # Period of each axis, or None if axis is not periodic. Periodic axis should not contain
+    # the end point, eg theta in [0, 2 * pi).
+    periods: tuple[Optional[float], Optional[float], Optional[float]]
+
+    def __init__(self,
+        xs: ArrayLike,
+        ys: ArrayLike,
+        zs: ArrayLike,
+        coordinate_system: CoordinateSystem = CoordinateSystem(CoordinateSystem.System.CARTESIAN),
+        *,
+        periods: Sequence[Optional[float]] = (None, None, None)):
+        axes = [np.asarray(a, dtype=np.float64) for a in (xs, ys, zs)]
+        if len(periods) != 3:
+            raise ValueError(f"Expected period for each of 3 axes, got {len(periods)}")
+        for (idx, axis) in enumerate(axes):
+            if axis.ndim != 1 or len(axis) == 0:
+                raise ValueError(f"Grid axis {idx} should be non-empty 1-D array, got {axis.shape}")
+            if len(axis) > 1 and len(axis) < MIN_AXIS_POINTS:
+                raise ValueError(
+                    f"Grid axis {idx} should have 1 or at least {MIN_AXIS_POINTS} points, got {len(axis)}"
+                )
+            if np.any(np.diff(axis) <= 0):
+                raise ValueError(f"Grid axis {idx} should be strictly increasing")
+            period = periods[idx]
+            if period is not None and axis[-1] - axis[0] >= period:
+                raise ValueError(
+                    f"Periodic grid axis {idx} should be shorter than its period {period}")
+        self.coordinate_system = coordinate_system
+        self.axes = (axes[0], axes[1], axes[2])
+        self.periods = (periods[0], periods[1], periods[2])
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return (len(self.axes[0]), len(self.axes[1]), len(self.axes[2]))
+
+    # Coordinates of grid points as 3 arrays, that are broadcast to the grid shape
+    def coordinates(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        grids = np.ix_(*self.axes)
+        return (grids[0], grids[1], grids[2])
+
+
+def _scalar_values(values: ArrayLike, grid: FieldGrid) -> np.ndarray:
+    result = np.asarray(values, dtype=np.float64)
+    if result.shape != grid.shape:
+        raise ValueError(f"Scalar field values should have {grid.shape} shape, got {result.shape}")
+    return result
+
+
+def _vector_values(values: ArrayLike, grid: FieldGrid) -> np.ndarray:
+    result = np.asarray(values, dtype=np.float64)
+    if result.shape != grid.shape + (3,):
+        raise ValueError(
+            f"Vector field values should have {grid.shape + (3,)} shape, got {result.shape}")
+    return result
+
+
+# First derivative of scalar values along grid axis
+def _derivative(values: np.ndarray, grid: FieldGrid, axis: int) -> np.ndarray:
+    coordinates = grid.axes[axis]
+    if len(coordinates) == 1:
+        return np.zeros(values.shape)
+    period = grid.periods[axis]
+    if period is None:
+        return np.gradient(values, coordinates, axis=axis, edge_order=2)
+    # wrap values around, so that boundary points use central differences
+    padded = np.concatenate(
+        [np.take(values, [-1], axis=axis), values,
+        np.take(values, [0], axis=axis)], axis=axis)
+    padded_coordinates = np.concatenate([[coordinates[-1] - period], coordinates,
+        [coordinates[0] + period]])
+    derivative = np.gradient(padded, padded_coordinates, axis=axis, edge_order=2)
+    return np.take(derivative, range(1, len(coordinates) + 1), axis=axis)
+
+
+def _second_derivative(values: np.ndarray, grid: FieldGrid, axis: int) -> np.ndarray:
+    return _derivative(_derivative(values, grid, axis), grid, axis)
+
+
+def _unsupported(grid: FieldGrid) -> ValueError:
+    return ValueError(f"Unsupported coordinate system: {grid.coordinate_system}")
+
+
+# Returns values of gradient vectors, of grid shape + (3,)
+def numeric_gradient(values: ArrayLike, grid: FieldGrid) -> np.ndarray:
+    field = _scalar_values(values, grid)
+    derivatives = [_derivative(field, grid, axis) for axis in range(3)]
+    (r, _, third) = grid.coordinates()
+    coord_system_type = grid.coordinate_system.coord_system_type
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if coord_system_type == CoordinateSystem.System.CARTESIAN:
+            components = derivatives
+        elif coord_system_type == CoordinateSystem.System.CYLINDRICAL:
+            components = [derivatives[0], derivatives[1] / r, derivatives[2]]
+        elif coord_system_type == CoordinateSystem.System.SPHERICAL:
+            phi = third
+            components = [derivatives[0], derivatives[1] / (r * np.sin(phi)), derivatives[2] / r]
+        else:
+            raise _unsupported(grid)
+    return np.stack(components, axis=-1)
+
+
+# Returns values of divergence, of grid shape
+def numeric_divergence(values: ArrayLike, grid: FieldGrid) -> np.ndarray:
+    field = _vector_values(values, grid)
+    components = [field[..., i] for i in range(3)]
+    (r, _, third) = grid.coordinates()
+    coord_system_type = grid.coordinate_system.coord_system_type
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if coord_system_type == CoordinateSystem.System.CARTESIAN:
+            return (_derivative(components[0], grid, 0) + _derivative(components[1], grid, 1) +
+                _derivative(components[2], grid, 2))
+        if coord_system_type == CoordinateSystem.System.CYLINDRICAL:
+            (field_r, field_theta, field_z) = components
+            return (_derivative(field_r, grid, 0) + field_r / r +
+                _derivative(field_theta, grid, 1) / r + _derivative(field_z, grid, 2))
+        if coord_system_type == CoordinateSystem.System.SPHERICAL:
+            (field_r, field_theta, field_phi) = components
+            phi = third
+            return (_derivative(field_r, grid, 0) + 2 * field_r / r +
+                _derivative(field_theta, grid, 1) / (r * np.sin(phi)) +
+                _derivative(field_phi, grid, 2) / r + field_phi / (r * np.tan(phi)))
+    raise _unsupported(grid)
+
+
+# Returns values of curl vectors, of grid shape + (3,)
+def numeric_curl(values: ArrayLike, grid: FieldGrid) -> np.ndarray:
+    field = _vector_values(values, grid)
+    components = [field[..., i] for i in range(3)]
+    (r, _, third) = grid.coordinates()
+    coord_system_type = grid.coordinate_system.coord_system_type
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if coord_system_type == CoordinateSystem.System.CARTESIAN:
+            (field_x, field_y, field_z) = components
+            curl = [
+                _derivative(field_z, grid, 1) - _derivative(field_y, grid, 2),
+                _derivative(field_x, grid, 2) - _derivative(field_z, grid, 0),
+                _derivative(field_y, grid, 0) - _derivative(field_x, grid, 1)
+            ]
+        elif coord_system_type == CoordinateSystem.System.CYLINDRICAL:
+            (field_r, field_theta, field_z) = components
+            curl = [
+                _derivative(field_z, grid, 1) / r - _derivative(field_theta, grid, 2),
+                _derivative(field_r, grid, 2) - _derivative(field_z, grid, 0),
+                (_derivative(r * field_theta, grid, 0) - _derivative(field_r, grid, 1)) / r
+            ]
+        elif coord_system_type == CoordinateSystem.System.SPHERICAL:
+            (field_r, field_theta, field_phi) = components
+            phi = third
+            curl = [
+                (_derivative(np.sin(phi) * field_theta, grid, 2) - _derivative(field_phi, grid, 1))
+                / (r * np.sin(phi)),
+                (_derivative(r * field_phi, grid, 0) - _derivative(field_r, grid, 2)) / r,
+                (_derivative(field_r, grid, 1) / np.sin(phi) -
+                _derivative(r * field_theta, grid, 0)) / r
+            ]
+        else:
+            raise _unsupported(grid)
+    return np.stack(curl, axis=-1)
+
+
+# Returns values of Laplacian, ie divergence of gradient, of grid shape. Second derivatives are
+# found by applying first-order differences twice.
+def numeric_laplacian(values: ArrayLike, grid: FieldGrid) -> np.ndarray:
+    field = _scalar_values(values, grid)
+    second = [_second_derivative(field, grid, axis) for axis in range(3)]
+    (r, _, third) = grid.coordinates()
+    coord_system_type = grid.coordinate_system.coord_system_type
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if coord_system_type == CoordinateSystem.System.CARTESIAN:
+            return second[0] + second[1] + second[2]
+        if coord_system_type == CoordinateSystem.System.CYLINDRICAL:
+            return second[0] + _derivative(field, grid, 0) / r + second[1] / r**2 + second[2]
+        if coord_system_type == CoordinateSystem.System.SPHERICAL:
+            phi = third
+            return (second[0] + 2 * _derivative(field, grid, 0) / r + second[1] /
+                (r * np.sin(phi))**2 + second[2] / r**2 + _derivative(field, grid, 2) /
+                (r**2 * np.tan(phi)))
+    raise _unsupported(grid)
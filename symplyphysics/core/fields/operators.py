@@ -1,77 +1,99 @@
-from sympy import diff, sin, tan
+from functools import lru_cache
+from typing import Any
+from sympy import Expr, diff, sin, sympify, tan
 
 from ..dimensions import ScalarValue
 from ..fields.vector_field import VectorField
 from ..fields.scalar_field import ScalarField
 from ..coordinate_systems.coordinate_systems import CoordinateSystem
 from ..vectors.vectors import Vector
+from .scalar_field import clear_rebase_cache, rebase_cache_info
+
+# Maximum number of memoized results of each operator. Results are keyed by the field expression,
+# that is the field applied to the coordinate system basis, and by the coordinate system. SymPy
+# keeps expressions in canonical form, so that equal fields, eg defined with different point
+# functions, share the results. Repeated analysis of the same field does not differentiate it again.
+FIELD_OPERATOR_CACHE_SIZE = 1024
+
+
+# Converts field applied to basis to hashable key of the operator caches
+def _field_components(field_space: Vector) -> tuple[Expr, ...]:
+    # extend missing components with zeroes
+    components = list(field_space.components) + [0] * (3 - len(field_space.components))
+    return tuple(sympify(c) for c in components)
 
 
 def gradient_operator(field: ScalarField) -> Vector:
-    field_space = field.apply_to_basis()
-    if field.coordinate_system.coord_system_type == CoordinateSystem.System.CARTESIAN:
-        x = field.coordinate_system.coord_system.base_scalars()[0]
-        y = field.coordinate_system.coord_system.base_scalars()[1]
-        z = field.coordinate_system.coord_system.base_scalars()[2]
-        gradient = Vector([
+    gradient = _gradient(sympify(field.apply_to_basis()), field.coordinate_system)
+    # result is copied, so that cached components cannot be changed
+    return Vector(gradient, field.coordinate_system)
+
+
+@lru_cache(maxsize=FIELD_OPERATOR_CACHE_SIZE)
+def _gradient(field_space: Expr, coordinate_system: CoordinateSystem) -> tuple[Expr, ...]:
+    if coordinate_system.coord_system_type == CoordinateSystem.System.CARTESIAN:
+        x = coordinate_system.base_scalars()[0]
+        y = coordinate_system.base_scalars()[1]
+        z = coordinate_system.base_scalars()[2]
+        return (
             diff(field_space, x),
             diff(field_space, y),
             diff(field_space, z),
-        ], field.coordinate_system)
-        return gradient
-    if field.coordinate_system.coord_system_type == CoordinateSystem.System.CYLINDRICAL:
-        r = field.coordinate_system.coord_system.base_scalars()[0]
-        theta = field.coordinate_system.coord_system.base_scalars()[1]
-        z = field.coordinate_system.coord_system.base_scalars()[2]
-        gradient = Vector([
+        )
+    if coordinate_system.coord_system_type == CoordinateSystem.System.CYLINDRICAL:
+        r = coordinate_system.base_scalars()[0]
+        theta = coordinate_system.base_scalars()[1]
+        z = coordinate_system.base_scalars()[2]
+        return (
             diff(field_space, r),
             diff(field_space, theta) / r,
             diff(field_space, z),
-        ], field.coordinate_system)
-        return gradient
-    if field.coordinate_system.coord_system_type == CoordinateSystem.System.SPHERICAL:
-        r = field.coordinate_system.coord_system.base_scalars()[0]
-        theta = field.coordinate_system.coord_system.base_scalars()[1]
-        phi = field.coordinate_system.coord_system.base_scalars()[2]
-        gradient = Vector([
+        )
+    if coordinate_system.coord_system_type == CoordinateSystem.System.SPHERICAL:
+        r = coordinate_system.base_scalars()[0]
+        theta = coordinate_system.base_scalars()[1]
+        phi = coordinate_system.base_scalars()[2]
+        return (
             diff(field_space, r),
             diff(field_space, theta) / (r * sin(phi)),
             diff(field_space, phi) / r,
-        ], field.coordinate_system)
-        return gradient
-    raise ValueError(f"Unsupported coordinate system: {field.coordinate_system}")
+        )
+    raise ValueError(f"Unsupported coordinate system: {coordinate_system}")
 
 
 def divergence_operator(field: VectorField) -> ScalarValue:
-    field_space = field.apply_to_basis()
-    # extend missing components with zeroes
-    field_components = list(field_space.components) + [0] * (3 - len(field_space.components))
-    if field.coordinate_system.coord_system_type == CoordinateSystem.System.CARTESIAN:
-        x = field_space.coordinate_system.coord_system.base_scalars()[0]
-        y = field_space.coordinate_system.coord_system.base_scalars()[1]
-        z = field_space.coordinate_system.coord_system.base_scalars()[2]
+    return _divergence(_field_components(field.apply_to_basis()), field.coordinate_system)
+
+
+@lru_cache(maxsize=FIELD_OPERATOR_CACHE_SIZE)
+def _divergence(field_components: tuple[Expr, ...],
+    coordinate_system: CoordinateSystem) -> ScalarValue:
+    if coordinate_system.coord_system_type == CoordinateSystem.System.CARTESIAN:
+        x = coordinate_system.base_scalars()[0]
+        y = coordinate_system.base_scalars()[1]
+        z = coordinate_system.base_scalars()[2]
         field_x = field_components[0]
         field_y = field_components[1]
         field_z = field_components[2]
         return diff(field_x, x) + diff(field_y, y) + diff(field_z, z)
-    if field.coordinate_system.coord_system_type == CoordinateSystem.System.CYLINDRICAL:
-        r = field_space.coordinate_system.coord_system.base_scalars()[0]
-        theta = field_space.coordinate_system.coord_system.base_scalars()[1]
-        z = field_space.coordinate_system.coord_system.base_scalars()[2]
+    if coordinate_system.coord_system_type == CoordinateSystem.System.CYLINDRICAL:
+        r = coordinate_system.base_scalars()[0]
+        theta = coordinate_system.base_scalars()[1]
+        z = coordinate_system.base_scalars()[2]
         field_r = field_components[0]
         field_theta = field_components[1]
         field_z = field_components[2]
         return diff(field_r, r) + field_r / r + diff(field_theta, theta) / r + diff(field_z, z)
-    if field.coordinate_system.coord_system_type == CoordinateSystem.System.SPHERICAL:
-        r = field_space.coordinate_system.coord_system.base_scalars()[0]
-        theta = field_space.coordinate_system.coord_system.base_scalars()[1]
-        phi = field_space.coordinate_system.coord_system.base_scalars()[2]
+    if coordinate_system.coord_system_type == CoordinateSystem.System.SPHERICAL:
+        r = coordinate_system.base_scalars()[0]
+        theta = coordinate_system.base_scalars()[1]
+        phi = coordinate_system.base_scalars()[2]
         field_r = field_components[0]
         field_theta = field_components[1]
         field_phi = field_components[2]
         return diff(field_r, r) + 2 * field_r / r + diff(field_theta,
             theta) / (r * sin(phi)) + diff(field_phi, phi) / r + field_phi / (r * tan(phi))
-    raise ValueError(f"Unsupported coordinate system: {field.coordinate_system}")
+    raise ValueError(f"Unsupported coordinate system: {coordinate_system}")
 
 
 # Calculate Curl of the field, which is Cross(Nabla, Field)
@@ -81,12 +103,15 @@ def curl_operator(field: VectorField) -> VectorField:
     if len(field_space.components) > dimensions:
         raise ValueError(
             f"Curl is only defined for {dimensions} dimensions. Got: {len(field_space.components)}")
-    # extend missing components with zeroes
-    field_components = list(field_space.components) + [0] * (3 - len(field_space.components))
-    if field.coordinate_system.coord_system_type == CoordinateSystem.System.CARTESIAN:
-        x = field_space.coordinate_system.coord_system.base_scalars()[0]
-        y = field_space.coordinate_system.coord_system.base_scalars()[1]
-        z = field_space.coordinate_system.coord_system.base_scalars()[2]
+    return _curl(_field_components(field_space), field.coordinate_system)
+
+
+@lru_cache(maxsize=FIELD_OPERATOR_CACHE_SIZE)
+def _curl(field_components: tuple[Expr, ...], coordinate_system: CoordinateSystem) -> VectorField:
+    if coordinate_system.coord_system_type == CoordinateSystem.System.CARTESIAN:
+        x = coordinate_system.base_scalars()[0]
+        y = coordinate_system.base_scalars()[1]
+        z = coordinate_system.base_scalars()[2]
         field_x = field_components[0]
         field_y = field_components[1]
         field_z = field_components[2]
@@ -94,12 +119,12 @@ def curl_operator(field: VectorField) -> VectorField:
             diff(field_z, y) - diff(field_y, z),
             diff(field_x, z) - diff(field_z, x),
             diff(field_y, x) - diff(field_x, y)
-        ], field_space.coordinate_system)
+        ], coordinate_system)
         return VectorField.from_vector(field_rotor_vector)
-    if field.coordinate_system.coord_system_type == CoordinateSystem.System.CYLINDRICAL:
-        r = field_space.coordinate_system.coord_system.base_scalars()[0]
-        theta = field_space.coordinate_system.coord_system.base_scalars()[1]
-        z = field_space.coordinate_system.coord_system.base_scalars()[2]
+    if coordinate_system.coord_system_type == CoordinateSystem.System.CYLINDRICAL:
+        r = coordinate_system.base_scalars()[0]
+        theta = coordinate_system.base_scalars()[1]
+        z = coordinate_system.base_scalars()[2]
         field_r = field_components[0]
         field_theta = field_components[1]
         field_z = field_components[2]
@@ -107,18 +132,39 @@ def curl_operator(field: VectorField) -> VectorField:
             diff(field_z, theta) / r - diff(field_theta, z),
             diff(field_r, z) - diff(field_z, r),
             (diff(r * field_theta, r) - diff(field_r, theta)) / r
-        ], field_space.coordinate_system)
+        ], coordinate_system)
         return VectorField.from_vector(field_rotor_vector)
-    if field.coordinate_system.coord_system_type == CoordinateSystem.System.SPHERICAL:
-        r = field_space.coordinate_system.coord_system.base_scalars()[0]
-        theta = field_space.coordinate_system.coord_system.base_scalars()[1]
-        phi = field_space.coordinate_system.coord_system.base_scalars()[2]
+    if coordinate_system.coord_system_type == CoordinateSystem.System.SPHERICAL:
+        r = coordinate_system.base_scalars()[0]
+        theta = coordinate_system.base_scalars()[1]
+        phi = coordinate_system.base_scalars()[2]
         field_r = field_components[0]
         field_theta = field_components[1]
         field_phi = field_components[2]
         field_rotor_vector = Vector([(diff(sin(phi) * field_theta, phi) - diff(field_phi, theta)) /
             (r * sin(phi)), (diff(r * field_phi, r) - diff(field_r, phi)) / r,
-            (diff(field_r, theta) / sin(phi) - diff(r * field_theta, r)) / r],
-            field_space.coordinate_system)
+            (diff(field_r, theta) / sin(phi) - diff(r * field_theta, r)) / r], coordinate_system)
         return VectorField.from_vector(field_rotor_vector)
-    raise ValueError(f"Unsupported coordinate system: {field.coordinate_system}")
+    raise ValueError(f"Unsupported coordinate system: {coordinate_system}")
+
+
+def field_operator_cache_info() -> dict[str, Any]:
+    """
+    Return statistics of field operator caches, including the cache of ScalarField.rebase().
+    """
+    return {
+        # pylint: disable-next=no-value-for-parameter
+        "gradient": _gradient.cache_info(),
+        # pylint: disable-next=no-value-for-parameter
+        "divergence": _divergence.cache_info(),
+        # pylint: disable-next=no-value-for-parameter
+        "curl": _curl.cache_info(),
+        "rebase": rebase_cache_info(),
+    }
+
+
+def clear_field_operator_caches() -> None:
+    _gradient.cache_clear()
+    _divergence.cache_clear()
+    _curl.cache_clear()
+    clear_rebase_cache()
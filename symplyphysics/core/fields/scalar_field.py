@@ -1,7 +1,9 @@
 from __future__ import annotations
-from functools import partial
-from typing import Callable, Sequence, TypeAlias
-from sympy import Expr, sympify
+from functools import lru_cache, partial
+from typing import Any, Callable, Optional, Sequence, TypeAlias
+import numpy as np
+from numpy.typing import ArrayLike
+from sympy import Expr, lambdify, sympify
 from sympy.vector import express
 
 from ..points.point import Point
@@ -10,14 +12,78 @@ from ..points.sphere_point import SpherePoint
 from ..points.cylinder_point import CylinderPoint
 from ..coordinate_systems.coordinate_systems import CoordinateSystem
 from ...core.dimensions import ScalarValue
+from ...core.numeric import NUMERIC_MODULES, compile_expression
 
 AnyPoint: TypeAlias = Point | CartesianPoint | SpherePoint | CylinderPoint
 FieldFunction: TypeAlias = Callable[[AnyPoint], ScalarValue] | ScalarValue
 
+# Maximum number of memoized results of ScalarField.rebase()
+REBASE_CACHE_SIZE = 1024
+
+
+# Checks that point of 'point_type' can be used with field in 'coordinate_system'.
+# Point with general Point type is not checked against coordinate system.
+# It's up to user to make sure that field function works with general Point type.
+def check_point_type(coordinate_system: CoordinateSystem, point_type: type[Point]) -> None:
+    system_type = coordinate_system.coord_system_type
+    if issubclass(point_type, CartesianPoint) and system_type != CoordinateSystem.System.CARTESIAN:
+        raise ValueError(f"Unsupported coordinate system for CartesianPoint: {coordinate_system}")
+    if issubclass(point_type, SpherePoint) and system_type != CoordinateSystem.System.SPHERICAL:
+        raise ValueError(f"Unsupported coordinate system for SpherePoint: {coordinate_system}")
+    if issubclass(point_type, CylinderPoint) and system_type != CoordinateSystem.System.CYLINDRICAL:
+        raise ValueError(f"Unsupported coordinate system for CylinderPoint: {coordinate_system}")
+
+
+# Compiles field expressions with lambdify(), so that they can be evaluated for arrays of
+# 'arguments', eg base scalars of the coordinate system. Quantities in expressions are converted to
+# SI base units. Common subexpressions of all expressions are evaluated once.
+def compile_field(expressions: Sequence[ScalarValue],
+    arguments: Sequence[Expr]) -> Callable[..., list[Any]]:
+    compiled: list[Expr] = []
+    for e in expressions:
+        (expression, parameters) = compile_expression(sympify(e))
+        unknown = set(parameters) - set(arguments)
+        if len(unknown) > 0:
+            raise ValueError(f"Field depends on symbols {unknown}, that are not coordinates")
+        compiled.append(expression)
+    return lambdify(list(arguments), compiled, modules=NUMERIC_MODULES, cse=True)
+
+
+# Returns value of the constant field in SI base units, eg for Quantity, or None if it is not a real
+# number and should be compiled with compile_field(), eg when it depends on coordinates.
+def constant_field_value(value: ScalarValue) -> Optional[float]:
+    (expression, parameters) = compile_expression(sympify(value))
+    if len(parameters) > 0 or not expression.is_real:
+        return None
+    return float(expression)
+
+
+# Converts (N, 3) array of point coordinates to 3 arrays of coordinates. Missing coordinates are
+# zero, as in Point.
+def point_coordinates(points: ArrayLike) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    coordinates = np.array(points, dtype=np.float64, ndmin=2)
+    if coordinates.ndim != 2 or coordinates.shape[1] > 3:
+        raise ValueError(f"Points should have (N, 3) shape, got {coordinates.shape}")
+    padded = np.zeros((len(coordinates), 3))
+    padded[:, :coordinates.shape[1]] = coordinates
+    return (padded[:, 0], padded[:, 1], padded[:, 2])
+
+
+# Converts coordinates along each axis to 3 arrays, that are broadcast to grid with 'ij' indexing
+# as in numpy.meshgrid(). Grid is not materialized.
+def grid_coordinates(xs: ArrayLike, ys: ArrayLike,
+    zs: ArrayLike) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    axes = [np.asarray(a, dtype=np.float64) for a in (xs, ys, zs)]
+    for axis in axes:
+        if axis.ndim != 1:
+            raise ValueError(f"Grid coordinates should be 1-D arrays, got {axis.shape}")
+    return (axes[0][:, np.newaxis, np.newaxis], axes[1][np.newaxis, :, np.newaxis],
+        axes[2][np.newaxis, np.newaxis, :])
+
 
 def _subs_with_point(expr: ScalarValue, coordinate_system: CoordinateSystem,
     point_: Point) -> ScalarValue:
-    base_scalars = coordinate_system.coord_system.base_scalars()
+    base_scalars = coordinate_system.base_scalars()
     # convert ScalarValue to Expr
     expression = sympify(expr)
     for i, scalar in enumerate(base_scalars):
@@ -37,6 +103,8 @@ class ScalarField:
     #NOTE: 4 and higher dimensional fields are not supported cause of using CoordSys3D
     #      to maintain ScalarField invariant.
     _coordinate_system: CoordinateSystem
+    # Field expression compiled with lambdify(), see evaluate_points()
+    _numeric_function: Optional[Callable[..., Any]] = None
 
     def __init__(self,
         point_function: FieldFunction = 0,
@@ -47,28 +115,43 @@ class ScalarField:
     def __call__(self, point_: AnyPoint) -> ScalarValue:
         if not callable(self._point_function):
             return self._point_function
-        # Point with general Point type is not checked against coordinate system.
-        # It's up to user to make sure that field function works with general Point type.
-        if isinstance(
-                point_, CartesianPoint
-        ) and self._coordinate_system.coord_system_type != CoordinateSystem.System.CARTESIAN:
-            raise ValueError(
-                f"Unsupported coordinate system for CartesianPoint: {self._coordinate_system}")
-        if isinstance(
-                point_, SpherePoint
-        ) and self._coordinate_system.coord_system_type != CoordinateSystem.System.SPHERICAL:
-            raise ValueError(
-                f"Unsupported coordinate system for SpherePoint: {self._coordinate_system}")
-        if isinstance(
-                point_, CylinderPoint
-        ) and self._coordinate_system.coord_system_type != CoordinateSystem.System.CYLINDRICAL:
-            raise ValueError(
-                f"Unsupported coordinate system for CylinderPoint: {self._coordinate_system}")
+        check_point_type(self._coordinate_system, type(point_))
         return self._point_function(point_)
 
+    # Evaluates field at N points, given as (N, 3) array of their coordinates in the field coordinate
+    # system. Field expression is compiled once and evaluated for all points at once. Quantities
+    # in the field expression are converted to SI base units.
+    # 'point_type' is checked against field coordinate system, as in __call__.
+    def evaluate_points(self, points: ArrayLike, point_type: type[Point] = Point) -> np.ndarray:
+        check_point_type(self._coordinate_system, point_type)
+        return self._evaluate(*point_coordinates(points))
+
+    # Evaluates field on the grid of points, set by coordinates along each axis of the field
+    # coordinate system. Returns array of (len(xs), len(ys), len(zs)) shape, with 'ij' indexing
+    # as in numpy.meshgrid().
+    def evaluate_grid(self,
+        xs: ArrayLike,
+        ys: ArrayLike,
+        zs: ArrayLike,
+        point_type: type[Point] = Point) -> np.ndarray:
+        check_point_type(self._coordinate_system, point_type)
+        return self._evaluate(*grid_coordinates(xs, ys, zs))
+
+    def _evaluate(self, *coordinates: np.ndarray) -> np.ndarray:
+        shape = np.broadcast_shapes(*(c.shape for c in coordinates))
+        if not callable(self._point_function):
+            value = constant_field_value(self._point_function)
+            if value is not None:
+                return np.full(shape, value)
+        if self._numeric_function is None:
+            self._numeric_function = compile_field([self.to_expression()], self.basis)
+        (result,) = self._numeric_function(*coordinates)
+        # result does not depend on some of the coordinates, eg when field is constant
+        return np.array(np.broadcast_to(result, shape))
+
     @property
     def basis(self) -> Sequence[Expr]:
-        return list(self.coordinate_system.coord_system.base_scalars())
+        return list(self.coordinate_system.base_scalars())
 
     @property
     def coordinate_system(self) -> CoordinateSystem:
@@ -118,19 +201,33 @@ class ScalarField:
         # Got a scalar value after applying to basis - use this value as field function
         if not isinstance(field_space_sympy, Expr):
             return ScalarField(field_space_sympy, coordinate_system)
-        # Make linter happy
-        field_space_expr: Expr = field_space_sympy
-        if self.coordinate_system.coord_system_type != coordinate_system.coord_system_type:
-            # This is a reverse transformation, if compared with Vector._extended_express()
-            new_scalars = list(
-                coordinate_system.transformation_to_system(
-                self.coordinate_system.coord_system_type))
-            for i, scalar in enumerate(self.coordinate_system.coord_system.base_scalars()):
-                field_space_expr = field_space_expr.subs(scalar, new_scalars[i])
-        # We do not want to maintain own field transformation functions, so
-        # we convert our field to SymPy format, transform it and convert back to ScalarField.
-        transformed_expr = express(field_space_expr,
-            coordinate_system.coord_system,
-            None,
-            variables=True)
-        return ScalarField.from_expression(transformed_expr, coordinate_system)
+        return _rebased_field(field_space_sympy, self.coordinate_system, coordinate_system)
+
+
+# Rebased fields are memoized, as operator results in 'operators' module, so that the same field
+# is not transformed again. Fields are not changed after construction and can be shared.
+@lru_cache(maxsize=REBASE_CACHE_SIZE)
+def _rebased_field(field_space_expr: Expr, field_coordinate_system: CoordinateSystem,
+    coordinate_system: CoordinateSystem) -> ScalarField:
+    if field_coordinate_system.coord_system_type != coordinate_system.coord_system_type:
+        # This is a reverse transformation, if compared with Vector._extended_express()
+        new_scalars = list(
+            coordinate_system.transformation_to_system(field_coordinate_system.coord_system_type))
+        for i, scalar in enumerate(field_coordinate_system.base_scalars()):
+            field_space_expr = field_space_expr.subs(scalar, new_scalars[i])
+    # We do not want to maintain own field transformation functions, so
+    # we convert our field to SymPy format, transform it and convert back to ScalarField.
+    transformed_expr = express(field_space_expr,
+        coordinate_system.coord_system,
+        None,
+        variables=True)
+    return ScalarField.from_expression(transformed_expr, coordinate_system)
+
+
+def rebase_cache_info() -> Any:
+    # pylint: disable-next=no-value-for-parameter
+    return _rebased_field.cache_info()
+
+
+def clear_rebase_cache() -> None:
+    _rebased_field.cache_clear()
@@ -1,10 +1,13 @@
 from __future__ import annotations
 from functools import partial
-from typing import Callable, Sequence, TypeAlias
+from typing import Any, Callable, Optional, Sequence, TypeAlias
+import numpy as np
+from numpy.typing import ArrayLike
 from sympy import Expr, sympify
 from sympy.vector import Vector as SymVector
 
-from .scalar_field import AnyPoint
+from .scalar_field import (AnyPoint, check_point_type, compile_field, constant_field_value,
+    grid_coordinates, point_coordinates)
 from ..points.point import Point
 from ..points.cartesian_point import CartesianPoint
 from ..points.sphere_point import SpherePoint
@@ -18,7 +21,7 @@ FieldFunction: TypeAlias = Callable[[AnyPoint], Sequence[ScalarValue]] | Sequenc
 
 def _subs_with_point(expr: Sequence[ScalarValue], coordinate_system: CoordinateSystem,
     point_: Point) -> Sequence[Expr]:
-    base_scalars = coordinate_system.coord_system.base_scalars()
+    base_scalars = coordinate_system.base_scalars()
     result: list[Expr] = []
     for e in expr:
         expression = sympify(e)
@@ -37,6 +40,8 @@ class VectorField:
     #NOTE: 4 and higher dimensional fields are not supported cause of using CoordSys3D
     #      that allows rebasing vector field to different coordinate systems.
     _coordinate_system: CoordinateSystem
+    # Field components compiled with lambdify(), see evaluate_points()
+    _numeric_function: Optional[Callable[..., list[Any]]] = None
 
     def __init__(self,
         point_function: FieldFunction,
@@ -47,29 +52,65 @@ class VectorField:
     def __call__(self, point_: Point) -> Vector:
         if not callable(self._point_function):
             return Vector(self._point_function, self._coordinate_system)
-        # Point with general Point type is not checked against coordinate system.
-        # It's up to user to make sure that field function works with general Point type.
-        if isinstance(
-                point_, CartesianPoint
-        ) and self._coordinate_system.coord_system_type != CoordinateSystem.System.CARTESIAN:
-            raise ValueError(
-                f"Unsupported coordinate system for CartesianPoint: {self._coordinate_system}")
-        if isinstance(
-                point_, SpherePoint
-        ) and self._coordinate_system.coord_system_type != CoordinateSystem.System.SPHERICAL:
-            raise ValueError(
-                f"Unsupported coordinate system for SpherePoint: {self._coordinate_system}")
-        if isinstance(
-                point_, CylinderPoint
-        ) and self._coordinate_system.coord_system_type != CoordinateSystem.System.CYLINDRICAL:
-            raise ValueError(
-                f"Unsupported coordinate system for CylinderPoint: {self._coordinate_system}")
+        check_point_type(self._coordinate_system, type(point_))
         result = self._point_function(point_)
         return Vector(result, self._coordinate_system)
 
+    # Evaluates field at N points, given as (N, 3) array of their coordinates in the field coordinate
+    # system, and returns (N, 3) array of field vectors. All components are compiled together,
+    # so that their common subexpressions are evaluated once. Quantities in the field are converted
+    # to SI base units.
+    # 'point_type' is checked against field coordinate system, as in __call__.
+    def evaluate_points(self, points: ArrayLike, point_type: type[Point] = Point) -> np.ndarray:
+        check_point_type(self._coordinate_system, point_type)
+        return self._evaluate(*point_coordinates(points))
+
+    # Evaluates field on the grid of points, set by coordinates along each axis of the field
+    # coordinate system. Returns array of (len(xs), len(ys), len(zs), 3) shape, with 'ij' indexing
+    # as in numpy.meshgrid().
+    def evaluate_grid(self,
+        xs: ArrayLike,
+        ys: ArrayLike,
+        zs: ArrayLike,
+        point_type: type[Point] = Point) -> np.ndarray:
+        check_point_type(self._coordinate_system, point_type)
+        return self._evaluate(*grid_coordinates(xs, ys, zs))
+
+    # Evaluates field along the trajectory at each of 'parameter_values' and returns (N, 3) array
+    # of field vectors. Trajectory is a list of expressions of 'parameter', as in apply().
+    def evaluate_trajectory(self, trajectory_: Sequence[Expr], parameter: Expr,
+        parameter_values: ArrayLike) -> np.ndarray:
+        values = np.asarray(parameter_values, dtype=np.float64)
+        components = self._padded_components(self.apply(trajectory_).components)
+        results = compile_field(components, [parameter])(values)
+        return np.stack([np.broadcast_to(r, values.shape) for r in results], axis=-1)
+
+    def _evaluate(self, *coordinates: np.ndarray) -> np.ndarray:
+        shape = np.broadcast_shapes(*(c.shape for c in coordinates))
+        if not callable(self._point_function):
+            values = [
+                constant_field_value(c) for c in self._padded_components(self._point_function)
+            ]
+            constants = [v for v in values if v is not None]
+            if len(constants) == len(values):
+                return np.array(np.broadcast_to(constants, shape + (3,)))
+        if self._numeric_function is None:
+            components = self._padded_components(self.apply_to_basis().components)
+            self._numeric_function = compile_field(components, self.basis)
+        results = self._numeric_function(*coordinates)
+        # components might not depend on some of the coordinates, eg when they are constant
+        return np.stack([np.broadcast_to(r, shape) for r in results], axis=-1)
+
+    @staticmethod
+    def _padded_components(components: Sequence[ScalarValue]) -> list[ScalarValue]:
+        if len(components) > 3:
+            raise ValueError(
+                f"Only 3 dimensional fields can be evaluated, got {len(components)} components")
+        return list(components) + [0] * (3 - len(components))
+
     @property
     def basis(self) -> list[Expr]:
-        return list(self._coordinate_system.coord_system.base_scalars())
+        return list(self._coordinate_system.base_scalars())
 
     @property
     def coordinate_system(self) -> CoordinateSystem:
@@ -20,10 +20,10 @@ def volume_element_magnitude(coordinate_system: CoordinateSystem) -> ScalarValue
     if coordinate_system.coord_system_type == CoordinateSystem.System.CARTESIAN:
         return 1
     if coordinate_system.coord_system_type == CoordinateSystem.System.CYLINDRICAL:
-        r = coordinate_system.coord_system.base_scalars()[0]
+        r = coordinate_system.base_scalars()[0]
         return r
     if coordinate_system.coord_system_type == CoordinateSystem.System.SPHERICAL:
-        r = coordinate_system.coord_system.base_scalars()[0]
-        phi = coordinate_system.coord_system.base_scalars()[2]
+        r = coordinate_system.base_scalars()[0]
+        phi = coordinate_system.base_scalars()[2]
         return r**2 * sin(phi)
     raise ValueError(f"Unsupported coordinate system: {coordinate_system}")
@@ -0,0 +1,81 @@
+"""
+Lazy access to law and definition modules.
+
+Law packages do not import their modules eagerly. Instead they define module level __getattr__,
+that imports requested law module on first access:
+# from symplyphysics.laws import dynamics
+# dynamics.period_of_ideal_pendulum_from_length.print_law()
+
+List of modules of each package is taken from prebuilt manifest. Manifest should be regenerated
+after adding new law module with:
+# python -m symplyphysics.core.lazy_modules
+"""
+
+import importlib
+import os
+import pkgutil
+import sys
+from typing import Any, Callable
+from .modules_manifest import MANIFEST
+
+# Packages, that are scanned for the manifest
+LAZY_PACKAGES = ("symplyphysics.laws", "symplyphysics.definitions")
+
+_MANIFEST_FILE = os.path.join(os.path.dirname(__file__), "modules_manifest.py")
+
+
+# Returns module level __getattr__ and __dir__ functions for the package.
+# Example:
+# __getattr__, __dir__ = lazy_package(__name__)
+def lazy_package(package_name: str) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    submodules = frozenset(MANIFEST.get(package_name, ()))
+
+    def getattr_(name: str) -> Any:
+        if name not in submodules:
+            raise AttributeError(f"module '{package_name}' has no attribute '{name}'")
+        return importlib.import_module(f"{package_name}.{name}")
+
+    def dir_() -> list[str]:
+        return sorted(set(vars(sys.modules[package_name])) | submodules)
+
+    return (getattr_, dir_)
+
+
+def _package_path(package_name: str) -> str:
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(root, *package_name.split("."))
+
+
+# Scans law and definition packages and returns mapping from package name to the names
+# of its modules and subpackages.
+def build_manifest() -> dict[str, tuple[str, ...]]:
+    manifest: dict[str, tuple[str, ...]] = {}
+    packages = list(LAZY_PACKAGES)
+    while len(packages) > 0:
+        package_name = packages.pop(0)
+        names = []
+        for module_info in pkgutil.iter_modules([_package_path(package_name)]):
+            names.append(module_info.name)
+            if module_info.ispkg:
+                packages.append(f"{package_name}.{module_info.name}")
+        manifest[package_name] = tuple(sorted(names))
+    return dict(sorted(manifest.items()))
+
+
+def write_manifest() -> None:
+    lines = [
+        "# Generated with 'python -m symplyphysics.core.lazy_modules', do not edit manually.",
+        "",
+        "MANIFEST: dict[str, tuple[str, ...]] = {",
+    ]
+    for package_name, names in build_manifest().items():
+        lines.append(f"    \"{package_name}\": (")
+        lines.extend(f"        \"{name}\"," for name in names)
+        lines.append("    ),")
+    lines.append("}")
+    with open(_MANIFEST_FILE, "w", encoding="utf-8") as file:
+        file.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    write_manifest()
@@ -0,0 +1,360 @@
+# Generated with 'python -m symplyphysics.core.lazy_modules', do not edit manually.
+
+MANIFEST: dict[str, tuple[str, ...]] = {
+    "symplyphysics.definitions": (
+        "acceleration_is_velocity_derivative",
+        "admittance_is_inversed_impedance",
+        "angular_acceleration_is_angular_velocity_derivative",
+        "angular_velocity_is_angle_derivative",
+        "capacitance_from_charge_and_voltage",
+        "current_is_charge_derivative",
+        "density_from_mass_volume",
+        "electrical_conductivity_is_inversed_resistance",
+        "harmonic_oscillator_is_second_derivative_equation",
+        "impedance_is_resistance_and_reactance",
+        "linear_charge_density_from_charge_and_length",
+        "mass_flow_rate",
+        "mass_fraction",
+        "mechanical_energy_is_kinetic_and_potential",
+        "moment_of_inertia_is_mass_times_squared_radius",
+        "momentum_is_mass_times_velocity",
+        "power_is_energy_derivative",
+        "quality_factor_is_energies_ratio",
+        "refractive_index_is_wave_speeds_ratio",
+        "superposition_of_forces_is_sum",
+        "surface_charge_density_from_charge_and_area",
+        "temporal_frequency_is_events_per_time",
+        "vector",
+        "velocity_is_movement_derivative",
+        "volume_number_density",
+    ),
+    "symplyphysics.definitions.vector": (
+        "superposition_of_forces_is_sum",
+    ),
+    "symplyphysics.laws": (
+        "chemistry",
+        "condensed_matter",
+        "conservation",
+        "dynamics",
+        "electricity",
+        "fields",
+        "gravity",
+        "hydro",
+        "kinematic",
+        "nuclear",
+        "optics",
+        "relativistic",
+        "thermodynamics",
+        "waves",
+    ),
+    "symplyphysics.laws.chemistry": (
+        "atomic_number_density_from_material_density_atomic_weight",
+        "atomic_weight_from_mass_mole_count",
+        "avogadro_number_from_mole_count",
+        "potential_energy_models",
+    ),
+    "symplyphysics.laws.chemistry.potential_energy_models": (
+        "lennard_jones_potential",
+    ),
+    "symplyphysics.laws.condensed_matter": (
+        "concentration_of_intrinsic_charge_carriers",
+        "current_density_from_concentration_and_velocity_of_charge_carriers",
+        "current_density_from_mobility",
+        "drift_velocity_of_charge_carriers",
+        "effective_mass_of_the_electron_from_the_energy",
+        "height_of_the_pn_transition_barrier",
+        "resistance_from_temperature",
+        "thermionic_emission_current",
+    ),
+    "symplyphysics.laws.conservation": (
+        "abbe_invariant_of_two_optical_environments_is_constant",
+        "charge_is_constant",
+        "mass_after_equals_to_mass_before",
+        "mass_is_constant",
+        "mechanical_energy_after_equals_to_mechanical_energy_before",
+        "mechanical_energy_is_constant",
+        "mixture_mass_equal_sum_of_components_masses",
+        "mixture_moles_amount_is_components_moles_amounts_sum",
+        "momentum_after_collision_equals_to_momentum_before",
+        "momentum_of_colliding_objects_is_constant",
+    ),
+    "symplyphysics.laws.dynamics": (
+        "acceleration_from_force",
+        "braking_path",
+        "buoyant_force_from_density_and_volume",
+        "fields",
+        "force_reaction_from_force_action",
+        "friction_force_from_normal_force",
+        "kinetic_energy_from_mass_and_velocity",
+        "kinetic_energy_from_moment_of_inertia_and_angular_velocity",
+        "maximum_height_from_velocity",
+        "mechanical_work_during_rotation",
+        "mechanical_work_from_force_and_move",
+        "moment_of_force_from_moment_of_inertia_and_angular_acceleration",
+        "period_of_ideal_pendulum_from_length",
+        "period_of_spring_from_mass",
+        "potential_energy_from_deformation",
+        "potential_energy_from_mass_and_height",
+        "rocket_thrust_is_rocket_mass_times_acceleration",
+        "torque_due_to_twisting_force",
+        "total_work_equals_change_in_kinetic_energy",
+        "vector",
+        "work_done_by_general_force_in_one_dimension",
+    ),
+    "symplyphysics.laws.dynamics.fields": (
+        "conservative_force_is_gradient_of_potential_energy",
+    ),
+    "symplyphysics.laws.dynamics.vector": (
+        "acceleration_from_force",
+        "force_is_derivative_of_momentum",
+        "instantaneous_power_is_force_dot_velocity",
+        "mechanical_work_from_force_and_move",
+        "spring_reaction_from_deformation",
+        "torque_vector_of_twisting_force",
+    ),
+    "symplyphysics.laws.electricity": (
+        "amount_energy_from_voltage_time_resistance",
+        "ampere_law",
+        "capacitance_is_proportional_to_plates_area",
+        "capacitor_impedance_from_capacitance_and_frequency",
+        "capacity_of_spherical_capacitor",
+        "charge_is_quantized",
+        "circuits",
+        "coil_impedance_from_inductivity_and_frequency",
+        "current_is_proportional_to_voltage",
+        "dissipated_heat_power_is_proportional_to_current_square",
+        "electric_charge_is_constant_in_isolated_system",
+        "electric_dipole_moment",
+        "electric_field_due_to_dipole",
+        "electric_field_due_to_point_charge",
+        "electric_field_of_infinite_charged_plane",
+        "electric_field_outside_charged_sphere",
+        "electric_field_value_is_force_over_test_charge",
+        "electrochemical_equivalent_from_molar_mass_and_valence",
+        "energy_accumulated_in_capacitor_from_capacitance_and_voltage",
+        "energy_accumulated_in_inductor_from_inductance_and_current",
+        "energy_density_of_electric_field_depends_on_strength_and_permittivity",
+        "energy_of_an_electron_in_a_hydrogen_atom",
+        "energy_of_magnetic_field_of_solenoid",
+        "energy_two_charges_from_distance_and_relative_permittivity",
+        "force_between_parallel_wires",
+        "force_from_charge_and_distance",
+        "force_from_charge_velocity_magnetic_induction",
+        "inductance_is_proportional_to_turns_squared",
+        "inductance_of_solenoid_depends_on_permeability_number_of_turns_volume",
+        "magnetic_field_intensity_of_infinite_wire",
+        "magnetic_flux_from_induction_and_area",
+        "magnetic_induction_from_magnetic_field_intensity",
+        "magnetic_induction_of_linear_conductor_of_finite_length",
+        "magnetic_induction_of_solenoid",
+        "magnetic_induction_of_wire",
+        "mass_of_the_substance_deposited_on_electrode",
+        "maximum_moment_of_magnetic_field",
+        "period_of_a_charged_particle_in_a_magnetic_field",
+        "potential_of_electrostatic_field",
+        "potential_of_field_of_point_charge",
+        "power_factor_from_active_and_full_power",
+        "power_from_energy_time",
+        "power_is_proportional_voltage_and_current",
+        "radius_of_a_charged_particle_in_a_magnetic_field",
+        "resistance_is_proportional_to_length",
+        "self_induction_voltage_from_current_derivative",
+        "vector",
+        "voltage_from_current_and_resistance",
+        "volume_charge_density_from_charge_and_volume",
+        "work_of_charge_transfer_from_charge_and_voltage",
+    ),
+    "symplyphysics.laws.electricity.circuits": (
+        "admittance_of_parallel_dipoles",
+        "capacity_of_parallel_capacitors",
+        "conductivity_of_parallel_resistors",
+        "conductivity_of_two_parallel_resistors",
+        "inductivity_of_serial_inductors",
+        "oscillation_period_for_capacitor_inductor_node",
+        "resistivity_of_parallel_resistors",
+        "resistivity_of_serial_resistors",
+        "resistor_and_capacitor_as_integrator_node",
+        "sum_of_all_currents_through_an_electrical_node_is_zero",
+        "sum_of_all_voltages_in_loop_is_zero",
+    ),
+    "symplyphysics.laws.electricity.vector": (
+        "electric_field_is_force_over_test_charge",
+        "vector_of_electric_dipole_moment",
+    ),
+    "symplyphysics.laws.fields": (
+        "circulation_is_integral_along_curve",
+        "circulation_is_integral_of_curl_over_surface",
+        "flux_is_integral_across_curve",
+        "flux_is_integral_across_surface",
+    ),
+    "symplyphysics.laws.gravity": (
+        "escape_velocity",
+        "free_fall_acceleration_from_height",
+        "gravity_force_from_mass_and_distance",
+        "maximum_height_of_a_body_thrown_at_an_angle_to_horizon",
+        "maximum_movement_time_of_a_body_thrown_at_an_angle_to_horizon",
+        "maximum_movement_time_of_a_body_thrown_horizontally",
+        "range_of_flight_of_a_body_thrown_at_an_angle_to_horizon",
+    ),
+    "symplyphysics.laws.hydro": (
+        "body_weight_in_liquid",
+        "dynamic_pressure_from_velocity",
+        "efficiency_of_the_hydraulic_press_from_force_and_height",
+        "froude_number",
+        "hagen_poiseuille_equation",
+        "hydrostatic_pressure_from_density_and_depth",
+        "inner_pressure_of_fluid",
+        "inner_pressure_of_fluid_is_constant",
+        "input_force_to_area_ratio_equals_to_output",
+        "pressure_from_force_and_area",
+        "reynolds_number",
+        "shear_stress_is_proportional_to_velocity_gradient",
+        "shear_stress_is_shear_force_over_area",
+        "surface_tension_force_of_liquid",
+        "velocity_from_height",
+        "velocity_of_liquid_flowing_out_of_pipe_from_pressure_and_density",
+        "volume_flux_is_constant",
+        "volume_of_the_submerged_body_part_from_body_density_and_liquid_density",
+    ),
+    "symplyphysics.laws.kinematic": (
+        "accelerated_velocity_from_time",
+        "angular_frequency_from_radians_per_time",
+        "angular_position_from_constant_angular_velocity",
+        "angular_position_is_arc_length_over_radius",
+        "angular_velocity_from_constant_angular_acceleration",
+        "centripetal_acceleration_is_squared_velocity_by_radius",
+        "constant_acceleration_movement_is_parabolic",
+        "constant_angular_acceleration_rotation_is_parabolic",
+        "distance_from_constant_velocity",
+        "linear_velocity_from_angular_velocity_and_radius",
+        "period_from_angular_frequency",
+        "planar_projection_is_cosine",
+        "rotational_inertia",
+        "rotational_inertia_about_axis_and_through_center_of_mass",
+        "tangential_acceleration_of_rotating_body",
+        "temporal_frequency_from_period",
+        "vector",
+    ),
+    "symplyphysics.laws.kinematic.rotational_inertia": (
+        "geometries",
+        "rotational_inertia_cartesian_integral",
+        "rotational_inertia_cylindrical_integral",
+        "rotational_inertia_is_additive",
+        "rotational_inertia_of_particle",
+    ),
+    "symplyphysics.laws.kinematic.rotational_inertia.geometries": (
+        "slab_about_perpendicular_axis_through_center",
+        "solid_disk_about_central_axis",
+        "thin_rod_about_axis_through_center_perpendicular_to_length",
+    ),
+    "symplyphysics.laws.kinematic.vector": (
+        "acceleration_of_rotating_body",
+        "center_of_mass_for_system_of_particles",
+        "linear_displacement_is_angular_displacement_cross_radius",
+        "linear_velocity_is_angular_velocity_cross_radius",
+    ),
+    "symplyphysics.laws.nuclear": (
+        "buckling",
+        "diffusion_area_from_diffusion_coefficient",
+        "diffusion_equation_from_neutron_flux",
+        "effective_multiplication_factor",
+        "fast_fission_factor_from_resonance_escape_probability",
+        "fast_non_leakage_probability_from_fermi_age",
+        "infinite_multiplication_factor",
+        "infinite_multiplication_factor_from_macroscopic_fission_cross_section",
+        "law_of_half_life",
+        "macroscopic_cross_section_from_free_mean_path",
+        "macroscopic_cross_section_from_microscopic_cross_section",
+        "macroscopic_transport_cross_section",
+        "migration_area_from_diffusion_length",
+        "most_neutron_energies_scattering_angle_average_cosine",
+        "neutron_diffusion_coefficient_from_scattering_cross_section",
+        "reproduction_factor_from_macroscopic_fission_cross_section",
+        "resonance_escape_probability_from_resonance_absorption_integral",
+        "thermal_non_leakage_probability_from_diffusion_length",
+        "thermal_utilisation_factor_from_macroscopic_absorption_cross_sections",
+    ),
+    "symplyphysics.laws.nuclear.buckling": (
+        "geometric_buckling_for_uniform_cylinder",
+        "geometric_buckling_for_uniform_parallelepiped",
+        "geometric_buckling_for_uniform_slab",
+        "geometric_buckling_for_uniform_sphere",
+        "geometric_buckling_from_infinite_multiplication_factor_diffusion_area",
+        "geometric_buckling_from_macroscopic_fission_cross_section_diffusion_coefficient",
+        "geometric_buckling_from_neutron_flux",
+        "material_buckling_from_macroscopic_fission_cross_section_diffusion_coefficient",
+        "neutron_flux_for_uniform_cylinder",
+        "neutron_flux_for_uniform_parallelepiped",
+        "neutron_flux_for_uniform_slab",
+        "neutron_flux_for_uniform_sphere",
+    ),
+    "symplyphysics.laws.optics": (
+        "angle_of_light_deflection_in_prism",
+        "bragg_diffraction_from_angle_diffraction_order_wavelength",
+        "interference_minimum",
+        "irradiance_of_light_after_polarizer",
+        "lens_focus_from_object_and_image",
+        "light_pressure",
+        "linear_magnification_from_distance_to_object_and_distance_to_image",
+        "linear_magnification_from_object_height_and_image_height",
+        "optical_distance_difference_from_optical_distances",
+        "optical_power_from_thin_lens_radius",
+        "optical_strength_of_spherical_lens_from_refractive_indices_of_environment_and_lens_and_focal_distances",
+        "radiation_intensity_from_energy_area_time",
+        "refraction_angle_from_environments",
+    ),
+    "symplyphysics.laws.relativistic": (
+        "coordinate_conversion_velocity_constant",
+        "energy_is_mass",
+        "relativistic_length",
+        "relativistic_mass",
+        "relativistic_momentum",
+        "relativistic_sum_of_velocities",
+        "relativistic_time_dilation",
+        "waves",
+    ),
+    "symplyphysics.laws.relativistic.waves": (
+        "frequency_shift_from_velocity_and_angle",
+        "longitudinal_frequency_shift_from_absolute_velocities",
+        "longitudinal_frequency_shift_from_velocity",
+    ),
+    "symplyphysics.laws.thermodynamics": (
+        "average_kinetic_energy_of_molecules_from_temperature",
+        "average_square_of_velocity",
+        "efficiency_factor",
+        "energy_from_combustion",
+        "energy_to_melt_from_mass",
+        "energy_to_vaporization_from_mass",
+        "gas_mixture_pressure_from_partial_pressures",
+        "inner_energy_from_temperature",
+        "laplas_pressure",
+        "pressure_from_temperature_and_volume",
+        "pressure_from_the_concentration_of_molecules_and_kinetic_energy",
+        "pressure_is_constant",
+        "radiance_of_black_body_from_temperature",
+        "speed_of_sound",
+        "sum_of_heat_transfer_is_zero",
+        "temperature_is_constant",
+        "thermal_energy_from_mass_and_temperature",
+        "volume_is_constant",
+        "volume_of_heated_body_from_initial_volume_and_heating_temperature",
+        "work_done_by_gas_at_constant_pressure",
+        "zero_heat_transfer",
+    ),
+    "symplyphysics.laws.waves": (
+        "frequency_of_the_electron_transition_in_hydrogen",
+        "frequency_shift_from_velocity",
+        "frequency_shift_from_velocity_and_angle",
+        "optical_path_length_from_geometric_path_length_and_refractive_index",
+        "photoelectron_energy_from_frequency",
+        "photon_energy_is_proportional_to_frequency",
+        "photon_momentum_is_proportional_to_frequency",
+        "photon_momentum_is_proportional_to_propagation_vec",
+        "refraction_factor_from_media",
+        "speed_of_light_from_fundamentals",
+        "wavelength_from_temperature",
+        "wavelength_from_wave_speed_and_period",
+        "wavespeed_from_medium",
+        "wavespeed_from_medium_permittivity_permeability",
+    ),
+}
@@ -0,0 +1,225 @@
+"""
+Compiled numeric form of laws.
+
+Calculating law with Quantity arguments requires substitution into SymPy expression and dimension
+analysis. It is not suitable for evaluating laws many times, eg for plots or simulations. Numeric
+form of the law is solved for the target symbol once, compiled with lambdify() and accepts plain
+numbers or NumPy arrays. Arguments are passed by keyword, named after display names of the law
+symbols. All arguments and the result are in SI base units.
+
+Numeric form is the law itself, so it should only be added to functions that return the law
+solved for the target as is. Functions that check their arguments or post-process the result,
+eg with abs() or int(), should not have numeric form.
+
+Functions with numeric form can also be called with QuantityArray arguments. Dimension of each
+array is checked once by validate_input(), then law is evaluated for all values at once and
+QuantityArray is returned and checked by validate_output(). Functions without numeric form are
+called for each value of the arrays, unless they accept QuantityArray themselves.
+
+Example:
+# @validate_input(pendulum_length_=pendulum_length)
+# @validate_output(oscillation_period)
+# @numeric(law, oscillation_period)
+# def calculate_period(pendulum_length_: Quantity) -> Quantity:
+#     ...
+# calculate_period.numeric(pendulum_length=numpy.array([1.0, 2.0]))
+# calculate_period(QuantityArray([1.0, 2.0], units.meter))
+"""
+
+import functools
+import inspect
+import threading
+from typing import Any, Callable, Mapping, Optional, Sequence
+import numpy as np
+from sympy import Basic, Expr, lambdify
+from sympy.core.function import AppliedUndef
+from sympy.physics.units import Quantity as SymQuantity
+
+from .convert import convert_to_si
+from .dimensions import dimensionless
+from .solvers import solved_for
+from .symbols.quantity_array import QuantityArray
+from .symbols.symbols import DimensionSymbol
+
+NUMERIC_MODULES = ["numpy"]
+
+
+def _parameter_name(symbol: Basic) -> str:
+    return symbol.display_name if isinstance(symbol, DimensionSymbol) else str(symbol)
+
+
+class NumericFunction:
+    """
+    Numeric function, compiled from the law solved for the target symbol. Function is compiled
+    on first call. Parameters are keyword-only and named after display names of the law symbols.
+    """
+
+    _law: Basic
+    _target: Expr
+    _expression: Optional[Expr] = None
+    _parameters: Optional[tuple[Basic, ...]] = None
+    _function: Optional[Callable[..., Any]] = None
+    # Law symbols for parameters of the decorated function, see validate_input()
+    _input_symbols: Mapping[str, Any]
+
+    def __init__(self, law: Basic, target: Expr):
+        self._law = law
+        self._target = target
+        self._input_symbols = {}
+        self._lock = threading.Lock()
+
+    @property
+    def target(self) -> Expr:
+        return self._target
+
+    @property
+    def expression(self) -> Expr:
+        self._compile()
+        assert self._expression is not None
+        return self._expression
+
+    @property
+    def input_symbols(self) -> Mapping[str, Any]:
+        return self._input_symbols
+
+    @property
+    def parameters(self) -> tuple[str, ...]:
+        self._compile()
+        assert self._parameters is not None
+        return tuple(_parameter_name(s) for s in self._parameters)
+
+    # Order of parameters does not follow the decorated function, so they can only be passed
+    # by keyword.
+    def __call__(self, **kwargs: Any) -> Any:
+        function = self._compile()
+        values = []
+        for name in self.parameters:
+            if name not in kwargs:
+                raise TypeError(f"Missing argument '{name}' for numeric function")
+            values.append(kwargs.pop(name))
+        if len(kwargs) > 0:
+            raise TypeError(f"Unexpected arguments {tuple(kwargs)} for numeric function")
+        return function(*values)
+
+    # Sets law symbols for parameters of the decorated function, as passed to validate_input().
+    def bind_parameters(self, input_symbols: Mapping[str, Any]) -> None:
+        self._input_symbols = input_symbols
+
+    # Converts arguments of the decorated function to arguments of the numeric function, eg
+    # {"pendulum_length_": Quantity(2 * units.meter)} to {"pendulum_length": 2.0}.
+    def arguments(self, arguments: Mapping[str, Any]) -> dict[str, Any]:
+        values: dict[str, Any] = {}
+        for (name, value) in arguments.items():
+            values.update(_numeric_arguments(name, value, self._input_symbols.get(name)))
+        return values
+
+    def _compile(self) -> Callable[..., Any]:
+        if self._function is not None:
+            return self._function
+        with self._lock:
+            if self._function is None:
+                expression = solved_for(self._law, self._target)
+                (self._expression, self._parameters) = compile_expression(expression)
+                self._function = lambdify(self._parameters,
+                    self._expression,
+                    modules=NUMERIC_MODULES)
+        return self._function
+
+
+# Replaces quantities in the expression with their values in SI base units and returns
+# expression together with its free symbols, sorted by their parameter names.
+def compile_expression(expression: Expr) -> tuple[Expr, tuple[Basic, ...]]:
+    if len(expression.atoms(AppliedUndef)) > 0:
+        raise ValueError(f"Expression '{expression}' with functions cannot be compiled")
+    quantities = expression.atoms(SymQuantity)
+    expression = expression.xreplace({q: convert_to_si(q) for q in quantities})
+    symbols = sorted(expression.free_symbols, key=_parameter_name)
+    names = [_parameter_name(s) for s in symbols]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Expression '{expression}' has symbols with the same name: {names}")
+    return (expression, tuple(symbols))
+
+
+# Adds numeric form of the law to the decorated function as 'numeric' attribute. Numeric form
+# solves 'law' for 'target'. Decorated function is evaluated with numeric form when called with
+# QuantityArray arguments. Parameters of the function are mapped to law symbols by
+# validate_input(), that should be applied after this decorator.
+# Example:
+# @numeric(law, oscillation_period)
+def numeric(law: Basic, target: Expr) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+
+    def numeric_func(func: Callable[..., Any]) -> Callable[..., Any]:
+        numeric_function = NumericFunction(law, target)
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper_numeric(*args: Any, **kwargs: Any) -> Any:
+            if has_quantity_array(args, kwargs):
+                bound_args = signature.bind(*args, **kwargs)
+                return call_batched(numeric_function, bound_args.arguments)
+            return func(*args, **kwargs)
+
+        setattr(wrapper_numeric, "numeric", numeric_function)
+        return wrapper_numeric
+
+    return numeric_func
+
+
+def has_quantity_array(args: tuple[Any, ...], kwargs: Mapping[str, Any]) -> bool:
+    return any(isinstance(a, QuantityArray) for a in args) or any(
+        isinstance(a, QuantityArray) for a in kwargs.values())
+
+
+def _numeric_value(value: Any) -> Any:
+    if isinstance(value, QuantityArray):
+        return value.values
+    if isinstance(value, SymQuantity):
+        return float(convert_to_si(value))
+    return float(value)
+
+
+def _numeric_arguments(name: str, value: Any, symbol: Any) -> dict[str, Any]:
+    if isinstance(symbol, DimensionSymbol):
+        return {symbol.display_name: _numeric_value(value)}
+    if isinstance(symbol, Sequence) and isinstance(value, Sequence):
+        result: dict[str, Any] = {}
+        for (item_symbol, item) in zip(symbol, value):
+            result.update(_numeric_arguments(name, item, item_symbol))
+        return result
+    raise TypeError(f"Parameter '{name}' is not mapped to the law symbol with validate_input()")
+
+
+# Evaluates numeric form of the law for QuantityArray arguments. 'arguments' are bound
+# arguments of the decorated function.
+def call_batched(numeric_function: NumericFunction, arguments: Mapping[str, Any]) -> QuantityArray:
+    values = numeric_function.arguments(arguments)
+    result = numeric_function(**values)
+    # result might not depend on some of the arguments, eg when law is constant
+    shape = np.broadcast_shapes(*(np.shape(v) for v in values.values()))
+    result = np.broadcast_to(result, shape)
+    target = numeric_function.target
+    dimension = target.dimension if isinstance(target, DimensionSymbol) else dimensionless
+    return QuantityArray(result, dimension=dimension)
+
+
+# Evaluates function without numeric form for QuantityArray arguments by calling it for each
+# value of the arrays, so that checks and post-processing of the result in the function body are
+# applied to every value. 'arguments' are bound arguments of the function.
+def call_elementwise(func: Callable[..., Any], arguments: inspect.BoundArguments) -> QuantityArray:
+    arrays = {
+        name: value
+        for (name, value) in arguments.arguments.items()
+        if isinstance(value, QuantityArray)
+    }
+    shape = np.broadcast_shapes(*(a.shape for a in arrays.values()))
+    broadcasted = {
+        name: QuantityArray(np.broadcast_to(a.values, shape), dimension=a.dimension)
+        for (name, a) in arrays.items()
+    }
+    results = []
+    for index in np.ndindex(shape):
+        for (name, array) in broadcasted.items():
+            arguments.arguments[name] = array[index]
+        results.append(func(*arguments.args, **arguments.kwargs))
+    result = QuantityArray.from_quantities(results)
+    return QuantityArray(result.values.reshape(shape), dimension=result.dimension)
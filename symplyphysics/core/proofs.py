@@ -0,0 +1,114 @@
+"""
+Registry of law derivations (proofs).
+
+Law modules derive or confirm themselves with SymPy when imported. These derivations are not
+required to use the law, but they are costly. Derivation code should be placed into a function
+decorated with @proof. By default the function is executed right away, so importing the module
+proves the law as before. When deferred mode is enabled, either with SYMPLYPHYSICS_DEFER_PROOFS
+environment variable or with set_deferred_proofs(), proofs are only registered and can be run on
+demand with verify().
+
+Example:
+# symplyphysics.proofs.set_deferred_proofs(True)
+# from symplyphysics.laws.dynamics import period_of_ideal_pendulum_from_length
+# symplyphysics.proofs.verify("dynamics.period_of_ideal_pendulum_from_length")
+"""
+
+import importlib
+import importlib.util
+import os
+from typing import Callable, TypeVar
+
+DEFER_PROOFS_ENV = "SYMPLYPHYSICS_DEFER_PROOFS"
+
+# Packages that are searched when module name is not fully qualified
+_SEARCH_PACKAGES = ("symplyphysics.laws", "symplyphysics")
+
+ProofFunction = TypeVar("ProofFunction", bound=Callable[[], None])
+
+# Mapping from module name to the proofs defined in this module
+_proofs: dict[str, list[Callable[[], None]]] = {}
+# Modules with all proofs passed
+_verified: set[str] = set()
+_deferred = os.environ.get(DEFER_PROOFS_ENV, "") not in ("", "0")
+
+
+def deferred_proofs() -> bool:
+    return _deferred
+
+
+# Only affects modules that are imported after this call, already imported modules keep their
+# proofs state.
+def set_deferred_proofs(deferred: bool) -> None:
+    global _deferred  # pylint: disable=global-statement
+    _deferred = deferred
+
+
+# Decorator to register law derivation. Derivation is a function without arguments, that raises
+# AssertionError when derivation fails.
+# Example:
+# @proof
+# def _derive_law():
+#     ...
+#     assert expr_equals(derived_law.rhs, law.rhs)
+def proof(func: ProofFunction) -> ProofFunction:
+    module_name = func.__module__
+    _proofs.setdefault(module_name, []).append(func)
+    if _deferred:
+        _verified.discard(module_name)
+    else:
+        _run_proof(module_name, func)
+    return func
+
+
+def _run_proof(module_name: str, func: Callable[[], None]) -> None:
+    _verified.discard(module_name)
+    func()
+    _verified.add(module_name)
+
+
+def _resolve_module_name(name: str) -> str:
+    if name in _proofs:
+        return name
+    for package in _SEARCH_PACKAGES:
+        full_name = f"{package}.{name}"
+        try:
+            if importlib.util.find_spec(full_name) is not None:
+                return full_name
+        except ModuleNotFoundError:
+            continue
+    return name
+
+
+# Imports module and runs all its proofs. Module name can be fully qualified, eg
+# "symplyphysics.laws.dynamics.braking_path", or relative to laws package, eg
+# "dynamics.braking_path", or relative to symplyphysics package, eg
+# "definitions.mass_flow_rate".
+# Returns fully qualified module name.
+def verify(name: str) -> str:
+    module_name = _resolve_module_name(name)
+    importlib.import_module(module_name)
+    module_proofs = _proofs.get(module_name, [])
+    if len(module_proofs) == 0:
+        raise ValueError(f"Module '{module_name}' does not have any proofs registered")
+    for func in module_proofs:
+        _run_proof(module_name, func)
+    return module_name
+
+
+# Runs proofs of all imported modules that are not verified yet.
+# Returns list of fully qualified names of verified modules.
+def verify_all() -> list[str]:
+    result: list[str] = []
+    for module_name in list(_proofs.keys()):
+        if module_name not in _verified:
+            result.append(verify(module_name))
+    return result
+
+
+def is_verified(name: str) -> bool:
+    return _resolve_module_name(name) in _verified
+
+
+def registered_proofs() -> list[str]:
+    return list(_proofs.keys())
@@ -0,0 +1,235 @@
+"""
+Numeric integration of SymPy expressions with adaptive Gauss-Kronrod rules.
+
+Symbolic integrate() is slow for non-trivial integrands and often returns unevaluated Integral.
+Numeric integration compiles the integrand once with lambdify() and evaluates it for all
+quadrature points at once. Integration region is mapped to the unit cube, so that limits of
+inner integrals may depend on outer integration parameters, as in integrate().
+
+Each box of the region is integrated with the 15-point Kronrod rule along every axis, ie with
+tensor product rule in 2-D and 3-D. Difference with the 7-point Gauss rule, that uses the same
+points, is the error estimate. Boxes with large errors are split in halves along the axis with the
+largest error, until the total error is within tolerance or evaluation budget is spent.
+
+Example:
+# result = integrate_numeric(exp(-x**2) * y, (x, 0, 1), (y, 0, 2))
+# print(result.value, result.error)
+"""
+
+import warnings
+from typing import Any, Callable, Sequence, TypeAlias
+import numpy as np
+from sympy import Dummy, Expr, Float, lambdify, sympify
+from sympy.physics.units import Quantity as SymQuantity
+
+from .dimensions import ScalarValue, collect_factor_and_dimension, si_base_unit
+from .errors import IntegrationWarning
+from .numeric import NUMERIC_MODULES, compile_expression
+from .symbols.quantities import Quantity
+
+# Integration parameter with its lower and upper limits, as in integrate()
+IntegralLimits: TypeAlias = tuple[Expr, ScalarValue, ScalarValue]
+
+DEFAULT_ABS_TOLERANCE = 1e-10
+DEFAULT_REL_TOLERANCE = 1e-8
+# Maximum number of integrand evaluations. 3-D rule uses 15**3 = 3375 points for each box.
+DEFAULT_MAX_EVALUATIONS = 10**7
+# Maximum number of points, that are evaluated in one call of the compiled integrand
+EVALUATION_CHUNK_SIZE = 2**20
+
+# Nodes and weights of the 15-point Kronrod rule on [-1, 1], from QUADPACK. Nodes with odd indices
+# and zero are also nodes of the 7-point Gauss rule.
+_KRONROD_NODES = np.array([
+    0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245, 0.0
+])
+_KRONROD_WEIGHTS = np.array([
+    0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649, 0.209482141084727828012999174891714
+])
+_GAUSS_WEIGHTS = np.array([
+    0.129484966168869693270611432679082, 0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975, 0.417959183673469387755102040816327
+])
+
+
+# Returns nodes, Kronrod weights and Gauss weights of the rule on [0, 1]
+def _unit_rule() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    nodes = np.concatenate([-_KRONROD_NODES, _KRONROD_NODES[-2::-1]])
+    kronrod_weights = np.concatenate([_KRONROD_WEIGHTS, _KRONROD_WEIGHTS[-2::-1]])
+    gauss_weights = np.zeros(len(nodes))
+    gauss_weights[1:14:2] = np.concatenate([_GAUSS_WEIGHTS, _GAUSS_WEIGHTS[-2::-1]])
+    return ((1 + nodes) / 2, kronrod_weights / 2, gauss_weights / 2)
+
+
+_NODES, _KRONROD, _GAUSS = _unit_rule()
+RULE_SIZE = len(_NODES)
+
+
+class QuadratureResult:  # pylint: disable=too-few-public-methods
+    """
+    Value of the integral with its error estimate and number of integrand evaluations.
+    """
+
+    value: float
+    error: float
+    evaluations: int
+
+    def __init__(self, value: float, error: float, evaluations: int):
+        self.value = value
+        self.error = error
+        self.evaluations = evaluations
+
+    def __repr__(self) -> str:
+        return f"QuadratureResult(value={self.value}, error={self.error}, evaluations={self.evaluations})"
+
+
+# Contracts last axes of 'values' with weights for each axis
+def _contract(values: np.ndarray, weights: Sequence[np.ndarray]) -> np.ndarray:
+    for axis_weights in reversed(weights):
+        values = values @ axis_weights
+    return values
+
+
+# Integrates 'function' over boxes, set by their lower corners and widths of (N, D) shape.
+# Returns integrals of (N,) shape and error estimates along each axis of (N, D) shape.
+def _integrate_boxes(function: Callable[..., Any], lower: np.ndarray,
+    width: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    (count, dimensions) = lower.shape
+    points_shape = (count,) + (RULE_SIZE,) * dimensions
+    coordinates = []
+    for axis in range(dimensions):
+        shape = [count] + [1] * dimensions
+        shape[axis + 1] = RULE_SIZE
+        axis_coordinates = lower[:, axis, np.newaxis] + width[:, axis, np.newaxis] * _NODES
+        coordinates.append(axis_coordinates.reshape(shape))
+    values = np.broadcast_to(np.asarray(function(*coordinates), dtype=np.float64), points_shape)
+    volumes = np.prod(width, axis=1)
+    kronrod = _contract(values, [_KRONROD] * dimensions)
+    errors = np.empty((count, dimensions))
+    for axis in range(dimensions):
+        weights = [_KRONROD] * dimensions
+        weights[axis] = _GAUSS
+        errors[:, axis] = np.abs(kronrod - _contract(values, weights))
+    return (kronrod * volumes, errors * volumes[:, np.newaxis])
+
+
+def _integrate_boxes_chunked(function: Callable[..., Any], lower: np.ndarray,
+    width: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    chunk = max(1, EVALUATION_CHUNK_SIZE // RULE_SIZE**lower.shape[1])
+    results = [
+        _integrate_boxes(function, lower[i:i + chunk], width[i:i + chunk])
+        for i in range(0, len(lower), chunk)
+    ]
+    return (np.concatenate([r[0] for r in results]), np.concatenate([r[1] for r in results]))
+
+
+# Integrates 'function' of D coordinates over the unit cube. 'function' accepts arrays of
+# coordinates and returns array of integrand values.
+def integrate_unit_cube(function: Callable[..., Any],
+    dimensions: int,
+    *,
+    abs_tolerance: float = DEFAULT_ABS_TOLERANCE,
+    rel_tolerance: float = DEFAULT_REL_TOLERANCE,
+    max_evaluations: int = DEFAULT_MAX_EVALUATIONS) -> QuadratureResult:
+    if dimensions < 1:
+        raise ValueError(f"Integral should have at least one dimension, got {dimensions}")
+    box_evaluations = RULE_SIZE**dimensions
+    lower = np.zeros((1, dimensions))
+    width = np.ones((1, dimensions))
+    (values, errors) = _integrate_boxes(function, lower, width)
+    evaluations = box_evaluations
+    while True:
+        error = float(np.sum(errors))
+        tolerance = max(abs_tolerance, rel_tolerance * abs(float(np.sum(values))))
+        # each split box is replaced with 2 new boxes
+        budget = (max_evaluations - evaluations) // (2 * box_evaluations)
+        if error <= tolerance or budget < 1 or not np.isfinite(error):
+            break
+        box_errors = np.sum(errors, axis=1)
+        # boxes should have errors, that are proportional to their volume
+        split = np.flatnonzero(box_errors > tolerance * np.prod(width, axis=1))
+        if len(split) == 0:
+            split = np.array([np.argmax(box_errors)])
+        if len(split) > budget:
+            split = split[np.argsort(box_errors[split])[-budget:]]
+        rows = np.arange(len(split))
+        axes = np.argmax(errors[split], axis=1)
+        split_width = width[split].copy()
+        split_width[rows, axes] /= 2
+        upper_lower = lower[split].copy()
+        upper_lower[rows, axes] += split_width[rows, axes]
+        new_lower = np.concatenate([lower[split], upper_lower])
+        new_width = np.concatenate([split_width, split_width])
+        (new_values, new_errors) = _integrate_boxes_chunked(function, new_lower, new_width)
+        evaluations += len(new_lower) * box_evaluations
+        keep = np.ones(len(lower), dtype=bool)
+        keep[split] = False
+        lower = np.concatenate([lower[keep], new_lower])
+        width = np.concatenate([width[keep], new_width])
+        values = np.concatenate([values[keep], new_values])
+        errors = np.concatenate([errors[keep], new_errors])
+    return QuadratureResult(float(np.sum(values)), error, evaluations)
+
+
+# Maps integration parameters to the unit cube. 'limits' are in the order of integrate(), ie
+# the first integral is the inner one and its limits may depend on parameters of outer integrals.
+# Returns integrand, multiplied by the Jacobian, and new parameters.
+def _map_to_unit_cube(integrand: Expr,
+    limits: Sequence[IntegralLimits]) -> tuple[Expr, list[Dummy]]:
+    parameters = []
+    for (parameter, parameter_from, parameter_to) in limits:
+        unit_parameter = Dummy(f"unit_{parameter}")
+        length = sympify(parameter_to) - sympify(parameter_from)
+        integrand = integrand.subs(parameter, parameter_from + length * unit_parameter) * length
+        parameters.append(unit_parameter)
+    return (integrand, parameters)
+
+
+def _integrate_mapped(mapped: Expr, parameters: Sequence[Dummy], abs_tolerance: float,
+    rel_tolerance: float, max_evaluations: int) -> QuadratureResult:
+    (expression, symbols) = compile_expression(mapped)
+    unknown = set(symbols) - set(parameters)
+    if len(unknown) > 0:
+        raise ValueError(f"Integrand depends on symbols {unknown}, that are not integrated")
+    function = lambdify(parameters, expression, modules=NUMERIC_MODULES)
+    return integrate_unit_cube(function,
+        len(parameters),
+        abs_tolerance=abs_tolerance,
+        rel_tolerance=rel_tolerance,
+        max_evaluations=max_evaluations)
+
+
+# Numerically integrates 'integrand' over 'limits', given in the order of integrate(). Limits
+# should be finite. Quantities in the integrand and limits are converted to SI base units.
+def integrate_numeric(integrand: ScalarValue,
+    *limits: IntegralLimits,
+    abs_tolerance: float = DEFAULT_ABS_TOLERANCE,
+    rel_tolerance: float = DEFAULT_REL_TOLERANCE,
+    max_evaluations: int = DEFAULT_MAX_EVALUATIONS) -> QuadratureResult:
+    (mapped, parameters) = _map_to_unit_cube(sympify(integrand), limits)
+    return _integrate_mapped(mapped, parameters, abs_tolerance, rel_tolerance, max_evaluations)
+
+
+# Same as integrate_numeric(), but returns value of the integral as Quantity if integrand or
+# limits have dimension, so that it can be used instead of the result of integrate(). Warns with
+# IntegrationWarning if the error estimate is not within tolerance.
+def integrate_numeric_value(integrand: ScalarValue,
+    *limits: IntegralLimits,
+    abs_tolerance: float = DEFAULT_ABS_TOLERANCE,
+    rel_tolerance: float = DEFAULT_REL_TOLERANCE,
+    max_evaluations: int = DEFAULT_MAX_EVALUATIONS) -> ScalarValue:
+    (mapped, parameters) = _map_to_unit_cube(sympify(integrand), limits)
+    result = _integrate_mapped(mapped, parameters, abs_tolerance, rel_tolerance, max_evaluations)
+    if not result.error <= max(abs_tolerance, rel_tolerance * abs(result.value)):
+        warnings.warn(
+            f"Integral error estimate {result.error} is not within tolerance after "
+            f"{result.evaluations} evaluations", IntegrationWarning)
+    if len(mapped.atoms(SymQuantity)) == 0:
+        return Float(result.value)
+    (_, dimension) = collect_factor_and_dimension(mapped)
+    return Quantity(result.value * si_base_unit(dimension), dimension=dimension)
@@ -1,64 +1,164 @@
 import functools
 import inspect
-from typing import Any, Callable, Sequence
+from typing import Any, Callable, Optional, Sequence, get_args
 from sympy.physics.units import Quantity as SymQuantity, Dimension
 
 from .symbols.symbols import DimensionSymbol, Function, Symbol
-from .dimensions import assert_equivalent_dimension, ScalarValue
+from .symbols.quantity_array import QuantityArray
+from .vectors.vector_array import VectorArray
+from .dimensions import angle_stripped, assert_equivalent_dimension, ScalarValue
+from .numeric import call_elementwise, has_quantity_array
+from .validation import CallValidator
+
+
+def _expected_dimensions(
+    expected_units: Dimension | Symbol | Function | Sequence[Dimension | Symbol | Function]
+) -> tuple[list[Dimension], bool]:
+    is_tuple = isinstance(expected_units, Sequence)
+    units_list = list(expected_units) if isinstance(expected_units, Sequence) else [expected_units]
+    dimensions = [
+        angle_stripped(u.dimension if isinstance(u, DimensionSymbol) else u) for u in units_list
+    ]
+    return (dimensions, is_tuple)
+
+
+def _assert_dimensions(value: ScalarValue | SymQuantity | DimensionSymbol | QuantityArray |
+    Sequence[ScalarValue | SymQuantity | DimensionSymbol], expected_dimensions: list[Dimension],
+    is_tuple: bool, param_name: str, function_name: str):
+    indexed = isinstance(value, Sequence)
+    values = value if isinstance(value, Sequence) else (value,)
+    for idx, item in enumerate(values):
+        component: ScalarValue | SymQuantity | Dimension = item
+        if isinstance(item, SymQuantity):
+            component = item
+        elif isinstance(item, DimensionSymbol):
+            component = item.dimension
+        elif isinstance(item, (QuantityArray, VectorArray)):
+            # all values of the array have the same dimension, so it is checked only once
+            component = item.dimension
+        param_name_indexed = f"{param_name}[{idx}]" if indexed else param_name
+        expected_dimension = expected_dimensions[idx] if is_tuple else expected_dimensions[0]
+        assert_equivalent_dimension(component, param_name_indexed, function_name,
+            expected_dimension)
 
 
-def _assert_expected_unit(value: ScalarValue | SymQuantity | DimensionSymbol |
+def _assert_expected_unit(value: ScalarValue | SymQuantity | DimensionSymbol | QuantityArray |
     Sequence[ScalarValue | SymQuantity | DimensionSymbol],
     expected_units: Dimension | Symbol | Function | Sequence[Dimension | Symbol | Function],
     param_name: str, function_name: str):
-    components: list[ScalarValue | SymQuantity | Dimension] = []
-    indexed = isinstance(value, Sequence)
-    values = list(value) if isinstance(value, Sequence) else list([value])
-    for item in values:
-        if isinstance(item, SymQuantity):
-            components.append(item)
-        elif isinstance(item, DimensionSymbol):
-            components.append(item.dimension)
-        else:
-            components.append(item)
-
-    is_tuple = False
-    if isinstance(expected_units, Sequence):
-        is_tuple = True
-    else:
-        expected_units = [expected_units]
-
-    expected_unit_dimensions: list[Dimension] = []
-    for u in list(expected_units):
-        d = u.dimension if isinstance(u, DimensionSymbol) else u
-        expected_unit_dimensions.append(d)
-
-    for idx, c in enumerate(components):
-        param_name_indexed = f"{param_name}[{idx}]" if indexed else param_name
-        expected_dimension = expected_unit_dimensions[
-            idx] if is_tuple else expected_unit_dimensions[0]
-        assert_equivalent_dimension(c, param_name_indexed, function_name, expected_dimension)
+    (expected_dimensions, is_tuple) = _expected_dimensions(expected_units)
+    _assert_dimensions(value, expected_dimensions, is_tuple, param_name, function_name)
+
+
+# Validation plan of the function parameter, that is prepared once when function is decorated,
+# so that signature of the function is not inspected on every call. Expected dimensions are
+# resolved from symbols and angle is already stripped from them.
+class _ParameterPlan:  # pylint: disable=too-few-public-methods
+    name: str
+    # Position of the parameter, or None if it is keyword-only
+    index: Optional[int]
+    default: Any
+    expected_dimensions: list[Dimension]
+    is_tuple: bool
+
+    def __init__(self, parameter: inspect.Parameter, index: int, expected_units: Any = None):
+        self.name = parameter.name
+        positional = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        self.index = index if parameter.kind in positional else None
+        self.default = parameter.default
+        self.expected_dimensions = []
+        self.is_tuple = False
+        if expected_units is not None:
+            (self.expected_dimensions, self.is_tuple) = _expected_dimensions(expected_units)
+
+    # Returns argument value for this parameter, or 'inspect.Parameter.empty' if argument is
+    # not provided
+    def argument(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        if self.index is not None and self.index < len(args):
+            return args[self.index]
+        return kwargs.get(self.name, inspect.Parameter.empty)
+
+
+def _parameter_plans(func: Callable[..., Any],
+    expected_units: dict[str, Any]) -> tuple[inspect.Signature, list[_ParameterPlan]]:
+    signature = inspect.signature(func)
+    plans = [
+        _ParameterPlan(p, i, expected_units[p.name])
+        for (i, p) in enumerate(signature.parameters.values())
+        if p.name in expected_units
+    ]
+    return (signature, plans)
+
+
+# Returns hashable dimension of the value for 'first-call' validation policy, or None if value
+# should always be validated.
+# pylint: disable-next=too-many-return-statements
+def _dimension_signature(value: Any) -> Any:
+    if value is inspect.Parameter.empty:
+        return value
+    if isinstance(value, (QuantityArray, VectorArray)):
+        return value.dimension
+    if isinstance(value, SymQuantity):
+        # zero can be of any dimension, so it does not tell anything about valid dimension
+        return None if value.scale_factor == 0 else value.dimension
+    if isinstance(value, DimensionSymbol):
+        return value.dimension
+    if isinstance(value, (int, float)):
+        return type(value)
+    if isinstance(value, Sequence):
+        items = tuple(_dimension_signature(v) for v in value)
+        return None if any(i is None for i in items) else items
+    return None
+
+
+def _accepts_quantity_array(parameter: inspect.Parameter) -> bool:
+    annotation = parameter.annotation
+    return annotation is QuantityArray or QuantityArray in get_args(annotation)
 
 
 # Validates the input quantities. Input parameters should be sympy.physics.units.Quantity, list of Quantity or
 # Vector of Quantity type.
 # Unit should be should be Symbol with dimension property, or Dimension.
+# If any of the parameters is QuantityArray, function with numeric form is evaluated for all values
+# at once, see 'numeric' decorator. Functions without numeric form are called for each value of the
+# arrays and QuantityArray of the results is returned, unless function parameters accept QuantityArray.
+# Checks can be disabled or sampled with validation policy, see 'validation' module.
 # Example:
 # @validate_input(param1_=units.length, param2_=(1 / units.length))
 # @validate_input(param1_=body_mass, param2_=body_volume)
 def validate_input(**decorator_kwargs: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
 
     def validate_func(func: Callable[..., Any]) -> Callable[..., Any]:
+        (signature, plans) = _parameter_plans(func, decorator_kwargs)
+
+        def check_arguments(args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+            for plan in plans:
+                arg = plan.argument(args, kwargs)
+                if arg is inspect.Parameter.empty:
+                    if plan.default is not inspect.Parameter.empty:
+                        # default values are not validated
+                        continue
+                    # let Python raise the usual error for missing argument
+                    signature.bind(*args, **kwargs)
+                _assert_dimensions(arg, plan.expected_dimensions, plan.is_tuple, plan.name,
+                    func.__name__)
+
+        def arguments_signature(args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+            dimensions = tuple(_dimension_signature(plan.argument(args, kwargs)) for plan in plans)
+            return None if any(d is None for d in dimensions) else dimensions
+
+        validator = CallValidator(check_arguments, arguments_signature)
+        numeric_function = getattr(func, "numeric", None)
+        if numeric_function is not None:
+            numeric_function.bind_parameters(decorator_kwargs)
+        elementwise = numeric_function is None and not any(
+            _accepts_quantity_array(p) for p in signature.parameters.values())
 
         @functools.wraps(func)
         def wrapper_validate(*args: Any, **kwargs: Any) -> Any:
-            wrapped_signature = inspect.signature(func)
-            bound_args = wrapped_signature.bind(*args, **kwargs)
-            for param in wrapped_signature.parameters.values():
-                if param.name in decorator_kwargs:
-                    arg = bound_args.arguments[param.name]
-                    _assert_expected_unit(arg, decorator_kwargs[param.name], param.name,
-                        func.__name__)
+            validator.validate(args, kwargs)
+            if elementwise and has_quantity_array(args, kwargs):
+                return call_elementwise(func, signature.bind(*args, **kwargs))
             return func(*args, **kwargs)
 
         return wrapper_validate
@@ -74,13 +174,19 @@ def validate_input(**decorator_kwargs: Any) -> Callable[[Callable[..., Any]], Ca
 # @validate_output(body_volume)
 def validate_output(
         expected_unit: Dimension | Symbol | Function) -> Callable[[Any], Callable[..., Any]]:
+    (expected_dimensions, is_tuple) = _expected_dimensions(expected_unit)
 
     def validate_func(func: Callable[..., Any]) -> Callable[..., Any]:
 
+        def check_result(ret: Any) -> None:
+            _assert_dimensions(ret, expected_dimensions, is_tuple, "return", func.__name__)
+
+        validator = CallValidator(check_result, _dimension_signature)
+
         @functools.wraps(func)
         def wrapper_validate(*args: Any, **kwargs: Any) -> Any:
             ret = func(*args, **kwargs)
-            _assert_expected_unit(ret, expected_unit, "return", func.__name__)
+            validator.validate(ret)
             return ret
 
         return wrapper_validate
@@ -95,23 +201,31 @@ def validate_output(
 def validate_output_same(param_name: str) -> Callable[[Any], Callable[..., Any]]:
 
     def validate_func(func: Callable[..., Any]) -> Callable[..., Any]:
+        (signature, plans) = _parameter_plans(func, {param_name: None})
+        if len(plans) == 0:
+            raise TypeError(f"Argument '{param_name}' to decorator 'validate_output_same'"
+                f" should be in function parameters")
+        plan = plans[0]
+
+        def check_result(ret: Any, expected_unit: Any) -> None:
+            _assert_expected_unit(ret, expected_unit, "return", func.__name__)
+
+        def result_signature(ret: Any, expected_unit: Any) -> Any:
+            dimensions = (_dimension_signature(ret), _dimension_signature(expected_unit))
+            return None if any(d is None for d in dimensions) else dimensions
+
+        validator = CallValidator(check_result, result_signature)
 
         @functools.wraps(func)
         def wrapper_validate(*args: Any, **kwargs: Any) -> Any:
-            wrapped_signature = inspect.signature(func)
-            bound_args = wrapped_signature.bind(*args, **kwargs)
-            expected_unit = None
-            for param in wrapped_signature.parameters.values():
-                if param.name == param_name:
-                    arg = bound_args.arguments[param.name]
-                    expected_unit = arg
-                    break
-            if expected_unit is None:
-                raise TypeError(f"Argument '{param_name}' to decorator 'validate_output_same'"
-                    f" should be in function parameters")
+            expected_unit = plan.argument(args, kwargs)
+            if expected_unit is inspect.Parameter.empty:
+                expected_unit = plan.default
+            if expected_unit is inspect.Parameter.empty:
+                # let Python raise the usual error for missing argument
+                signature.bind(*args, **kwargs)
             ret = func(*args, **kwargs)
-
-            _assert_expected_unit(ret, expected_unit, "return", func.__name__)
+            validator.validate(ret, expected_unit)
             return ret
 
         return wrapper_validate
@@ -0,0 +1,33 @@
+from functools import lru_cache
+from typing import Any
+from sympy import Basic, Expr, solve
+
+from .budget import run_with_budget
+
+# Maximum number of memoized solutions. Each law usually has only a few symbols to solve for,
+# so the limit is only reached when laws are solved with generated symbols.
+SOLVED_CACHE_SIZE = 4096
+
+
+## Solves the law for the symbol and returns the first solution. Solutions are memoized, so
+## that 'calculate_*' functions do not call solve() for every invocation.
+## Cache is bounded and safe to use from multiple threads.
+## solve() is called within the current budget, see 'budget' module. Symbolic solution is
+## required, so BudgetExceededError is raised on expiry regardless of the budget policy.
+def solved_for(law: Basic, symbol: Expr) -> Expr:
+    return _solved_for(law, symbol)
+
+
+@lru_cache(maxsize=SOLVED_CACHE_SIZE)
+def _solved_for(law: Basic, symbol: Expr) -> Expr:
+    solutions = run_with_budget("solve", solve, law, symbol, dict=True)
+    return solutions[0][symbol]
+
+
+def solved_for_cache_info() -> Any:
+    # pylint: disable-next=no-value-for-parameter
+    return _solved_for.cache_info()
+
+
+def clear_solved_for_cache() -> None:
+    _solved_for.cache_clear()
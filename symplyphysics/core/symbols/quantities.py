@@ -1,15 +1,25 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 from functools import partial
-from typing import Any, Optional, Self, Sequence
+from typing import Any, Iterator, Optional, Self, Sequence
 from sympy import S, Basic, Expr, sympify
 from sympy.physics.units import Dimension, Quantity as SymQuantity
+from sympy.physics.units.prefixes import Prefix
 from sympy.physics.units.systems.si import SI
 
 from .symbols import DimensionSymbol, next_name
 from ..dimensions import collect_factor_and_dimension
 
+# Quantities are registered in the global SI unit system, so that SymPy unit functions, eg
+# sympy.physics.units.convert_to(), can use them. Registered quantities are never released.
+# Within quantity_scope() quantities are not registered, see below.
+_register_in_si: ContextVar[bool] = ContextVar("register_in_si", default=True)
+
 
 class Quantity(DimensionSymbol, SymQuantity):  # pylint: disable=too-many-ancestors
 
+    _scale_factor: Basic
+
     def __new__(cls,
         _name: Basic,
         _abbrev: Optional[str] = None,
@@ -27,8 +37,18 @@ class Quantity(DimensionSymbol, SymQuantity):  # pylint: disable=too-many-ancest
         (scale, dimension_) = collect_factor_and_dimension(sympify(expr))
         dimension = dimension_ if dimension is None else dimension
         super().__init__(self.name, dimension)
-        SI.set_quantity_dimension(self, dimension)
-        SI.set_quantity_scale_factor(self, scale)
+        # replace all prefixes by their ratio to canonical units, as SI unit system does
+        self._scale_factor = sympify(scale).replace(lambda x: isinstance(x, Prefix),
+            lambda x: x.scale_factor)
+        if _register_in_si.get():
+            SI.set_quantity_dimension(self, dimension)
+            SI.set_quantity_scale_factor(self, self._scale_factor)
+
+    # Scale factor is stored in the quantity itself, so that it is available even if quantity
+    # is not registered in SI unit system
+    @property
+    def scale_factor(self) -> Basic:
+        return self._scale_factor
 
     # This is required for integration to work properly
     @property
@@ -39,6 +59,24 @@ class Quantity(DimensionSymbol, SymQuantity):  # pylint: disable=too-many-ancest
         return self
 
 
+# Quantities, created within the scope, are not registered in the global SI unit system, so
+# that they are released as soon as they are not referenced anymore. It is useful for long
+# running processes, that create many temporary quantities, eg when calling 'calculate_*'
+# functions in a loop. Such quantities are fully supported by this library, but SymPy unit
+# functions, that look up SI unit system, do not know about them.
+# Example:
+# with quantity_scope():
+#     for length in lengths:
+#         periods.append(convert_to(calculate_period(length), units.second))
+@contextmanager
+def quantity_scope() -> Iterator[None]:
+    token = _register_in_si.set(False)
+    try:
+        yield
+    finally:
+        _register_in_si.reset(token)
+
+
 def list_of_quantities(input_: Sequence[Expr | float], subs_: dict[Expr,
     Quantity]) -> Sequence[Quantity]:
     return [Quantity(sympify(c).subs(subs_)) for c in input_]
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from numbers import Real
+from typing import Any, Iterable, Optional, Sequence
+import numpy as np
+from numpy.typing import ArrayLike
+from sympy import S, Basic, sympify
+from sympy.physics.units import Dimension, Quantity as SymQuantity
+
+from .quantities import Quantity
+from ..coordinate_systems.coordinate_systems import CoordinateSystem
+from ..dimensions import (assert_equivalent_dimension, dimensionless, si_base_unit, si_scale_factor)
+from ..vectors.vectors import QuantityVector
+
+
+class QuantityArray:
+    """
+    Array of values with the same dimension. Values are stored as contiguous float64 NumPy array
+    in SI base units, so that only one dimension is kept for the whole array.
+    Arithmetic operations with QuantityArray, Quantity and numbers propagate dimensions.
+    """
+
+    values: np.ndarray
+    dimension: Dimension
+
+    # NumPy should use reflected operators of this class instead of converting it to plain array,
+    # eg numpy.array([1, 2]) * QuantityArray(...) keeps the dimension.
+    __array_ufunc__ = None
+
+    def __init__(self,
+        values: ArrayLike,
+        unit: Basic | float = S.One,
+        *,
+        dimension: Optional[Dimension] = None):
+        """
+        Create array from ``values`` in ``unit``, eg QuantityArray([1, 2], units.kilometer).
+        If ``dimension`` is set, ``values`` should already be in SI base units.
+        """
+        if dimension is None:
+            (scale_expr, dimension) = si_scale_factor(unit)
+            scale = float(scale_expr)
+        else:
+            if sympify(unit) != S.One:
+                raise ValueError("Only one of 'unit' and 'dimension' should be set")
+            scale = 1.0
+        if np.iscomplexobj(values):
+            raise TypeError("QuantityArray values should be real numbers")
+        buffer = np.ascontiguousarray(values, dtype=np.float64)
+        self.values = buffer * scale if scale != 1.0 else buffer
+        self.dimension = dimension
+
+    @staticmethod
+    def from_quantities(quantities: Iterable[Quantity | float]) -> QuantityArray:
+        values = []
+        # find first dimension with non-zero scale factor, as in QuantityVector
+        dimension: Optional[Dimension] = None
+        dimensions: list[Dimension] = []
+        for q in quantities:
+            (scale, q_dimension) = si_scale_factor(q)
+            values.append(float(scale))
+            dimensions.append(q_dimension)
+            if dimension is None and scale != 0:
+                dimension = q_dimension
+        if dimension is None:
+            dimension = dimensions[0] if len(dimensions) > 0 else dimensionless
+        for (idx, d) in enumerate(dimensions):
+            if values[idx] != 0:
+                assert_equivalent_dimension(d, f"quantities[{idx}]", "QuantityArray", dimension)
+        return QuantityArray(values, dimension=dimension)
+
+    @staticmethod
+    def from_quantity_vector(vector: QuantityVector) -> QuantityArray:
+        return QuantityArray.from_quantities(vector.components)
+
+    def to_quantities(self) -> list[Quantity]:
+        unit = si_base_unit(self.dimension)
+        return [Quantity(v * unit, dimension=self.dimension) for v in self.values.flat]
+
+    def to_quantity_vector(
+        self,
+        coordinate_system: CoordinateSystem = CoordinateSystem(CoordinateSystem.System.CARTESIAN)
+    ) -> QuantityVector:
+        if self.values.ndim != 1:
+            raise ValueError(f"Only 1-D array can be converted to vector, got {self.shape}")
+        return QuantityVector(self.to_quantities(), coordinate_system)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.values.shape
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, key: Any) -> Quantity | QuantityArray:
+        item = self.values[key]
+        if np.ndim(item) == 0:
+            return Quantity(float(item) * si_base_unit(self.dimension), dimension=self.dimension)
+        return QuantityArray(item, dimension=self.dimension)
+
+    def __repr__(self) -> str:
+        return f"QuantityArray({self.values!r}, dimension={self.dimension})"
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> np.ndarray:
+        if copy:
+            return np.array(self.values, dtype=dtype)
+        return np.asarray(self.values, dtype=dtype)
+
+    def __neg__(self) -> QuantityArray:
+        return QuantityArray(-self.values, dimension=self.dimension)
+
+    def __pos__(self) -> QuantityArray:
+        return self
+
+    def __abs__(self) -> QuantityArray:
+        return QuantityArray(np.abs(self.values), dimension=self.dimension)
+
+    def __add__(self, other: Any) -> QuantityArray:
+        other_values = self._same_dimension_values(other, "__add__")
+        return QuantityArray(self.values + other_values, dimension=self.dimension)
+
+    def __radd__(self, other: Any) -> QuantityArray:
+        other_values = self._same_dimension_values(other, "__radd__")
+        return QuantityArray(other_values + self.values, dimension=self.dimension)
+
+    def __sub__(self, other: Any) -> QuantityArray:
+        other_values = self._same_dimension_values(other, "__sub__")
+        return QuantityArray(self.values - other_values, dimension=self.dimension)
+
+    def __rsub__(self, other: Any) -> QuantityArray:
+        other_values = self._same_dimension_values(other, "__rsub__")
+        return QuantityArray(other_values - self.values, dimension=self.dimension)
+
+    def __mul__(self, other: Any) -> QuantityArray:
+        (other_values, other_dimension) = _values_and_dimension(other)
+        return QuantityArray(self.values * other_values, dimension=self.dimension * other_dimension)
+
+    def __rmul__(self, other: Any) -> QuantityArray:
+        (other_values, other_dimension) = _values_and_dimension(other)
+        return QuantityArray(other_values * self.values, dimension=other_dimension * self.dimension)
+
+    def __truediv__(self, other: Any) -> QuantityArray:
+        (other_values, other_dimension) = _values_and_dimension(other)
+        return QuantityArray(self.values / other_values, dimension=self.dimension / other_dimension)
+
+    def __rtruediv__(self, other: Any) -> QuantityArray:
+        (other_values, other_dimension) = _values_and_dimension(other)
+        return QuantityArray(other_values / self.values, dimension=other_dimension / self.dimension)
+
+    def __pow__(self, exponent: float) -> QuantityArray:
+        if not isinstance(exponent, Real):
+            raise TypeError(f"Exponent should be a number, got '{exponent}'")
+        return QuantityArray(self.values**exponent, dimension=self.dimension**exponent)
+
+    def _same_dimension_values(self, other: Any, function_name: str) -> np.ndarray | float:
+        (other_values, other_dimension) = _values_and_dimension(other)
+        # zero can be of any dimension
+        if not isinstance(other, QuantityArray) and np.all(np.asarray(other_values) == 0):
+            return other_values
+        assert_equivalent_dimension(other_dimension, "other", function_name, self.dimension)
+        return other_values
+
+
+def _values_and_dimension(value: Any) -> tuple[np.ndarray | float, Dimension]:
+    if isinstance(value, QuantityArray):
+        return (value.values, value.dimension)
+    if isinstance(value, (SymQuantity, Basic)):
+        (scale, dimension) = si_scale_factor(value)
+        return (float(scale), dimension)
+    if isinstance(value, (np.ndarray, Sequence)):
+        return (np.asarray(value, dtype=np.float64), dimensionless)
+    return (float(value), dimensionless)
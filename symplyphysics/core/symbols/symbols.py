@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import lru_cache
 from typing import Any, Optional, Sequence, Self
 from sympy import S, Symbol as SymSymbol, Expr, Equality
 from sympy.physics.units import Dimension
@@ -125,3 +126,13 @@ def tuple_of_symbols(display_name: str,
     dimension: Dimension = Dimension(S.One),
     length: int = 1) -> tuple[Symbol, ...]:
     return tuple(Symbol(display_name + "_" + str(i), dimension) for i in range(length))
+
+
+# Same as tuple_of_symbols, but returns the same symbols when called with the same arguments.
+# Laws, built with these symbols, are equal between calls and can reuse memoized solutions,
+# see solvers.solved_for().
+@lru_cache(maxsize=256)
+def cached_tuple_of_symbols(display_name: str,
+    dimension: Dimension = Dimension(S.One),
+    length: int = 1) -> tuple[Symbol, ...]:
+    return tuple_of_symbols(display_name, dimension, length)
@@ -0,0 +1,173 @@
+"""
+Policy of dimension checks in validate_input() and validate_output() decorators.
+
+Checking dimensions of every argument is useful while developing, but it is an overhead in hot
+loops, where units are already known to be correct. Validation policy is one of:
+- full: every call is validated, this is the default;
+- first-call: only the first call with each distinct set of argument dimensions is validated;
+- sampled(p): calls are validated with probability p;
+- off: dimensions are not checked.
+
+Policy is set globally with set_validation_policy() or SYMPLYPHYSICS_VALIDATION environment
+variable, eg SYMPLYPHYSICS_VALIDATION=sampled(0.01). It can be changed for a block of code
+with validation_policy() context manager, eg for the calls in a batch job.
+
+Example:
+# with validation_policy("off"):
+#     for length in lengths:
+#         calculate_period(length)
+# print(validation_stats())
+"""
+
+import os
+import random
+import re
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum, unique
+from typing import Any, Callable, Iterator, Optional
+
+VALIDATION_ENV = "SYMPLYPHYSICS_VALIDATION"
+
+# Maximum number of argument dimension signatures, that are remembered for each function with
+# 'first-call' policy. Calls with new signatures are always validated after the limit is reached.
+FIRST_CALL_SIGNATURES_LIMIT = 1024
+
+
+@unique
+class ValidationMode(Enum):
+    FULL = "full"
+    FIRST_CALL = "first-call"
+    SAMPLED = "sampled"
+    OFF = "off"
+
+
+class ValidationPolicy:
+    mode: ValidationMode
+    # Probability to validate the call, only used in 'sampled' mode
+    probability: float
+
+    def __init__(self, mode: ValidationMode, probability: float = 1.0):
+        if not 0 <= probability <= 1:
+            raise ValueError(f"Probability should be in range [0..1], got {probability}")
+        self.mode = mode
+        self.probability = probability
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, ValidationPolicy):
+            return NotImplemented
+        return (self.mode, self.probability) == (other.mode, other.probability)
+
+    def __hash__(self) -> int:
+        return hash((self.mode, self.probability))
+
+    def __repr__(self) -> str:
+        if self.mode == ValidationMode.SAMPLED:
+            return f"sampled({self.probability})"
+        return self.mode.value
+
+
+FULL = ValidationPolicy(ValidationMode.FULL)
+FIRST_CALL = ValidationPolicy(ValidationMode.FIRST_CALL)
+OFF = ValidationPolicy(ValidationMode.OFF)
+
+
+def sampled(probability: float) -> ValidationPolicy:
+    return ValidationPolicy(ValidationMode.SAMPLED, probability)
+
+
+# Converts policy name, eg "first-call" or "sampled(0.1)", to policy.
+def parse_validation_policy(policy: str | ValidationPolicy) -> ValidationPolicy:
+    if isinstance(policy, ValidationPolicy):
+        return policy
+    name = policy.strip().lower()
+    sampled_match = re.fullmatch(r"sampled\((.+)\)", name)
+    if sampled_match is not None:
+        return sampled(float(sampled_match.group(1)))
+    for known in (FULL, FIRST_CALL, OFF):
+        if name == known.mode.value:
+            return known
+    raise ValueError(f"Unknown validation policy: '{policy}'")
+
+
+_global_policy = parse_validation_policy(os.environ.get(VALIDATION_ENV, "") or FULL)
+_scoped_policy: ContextVar[Optional[ValidationPolicy]] = ContextVar("scoped_policy", default=None)
+
+# Number of calls, that were validated or skipped. Counters are approximate when decorated
+# functions are called from multiple threads.
+_call_counts = {"validated": 0, "skipped": 0}
+
+
+def current_validation_policy() -> ValidationPolicy:
+    scoped = _scoped_policy.get()
+    return _global_policy if scoped is None else scoped
+
+
+def set_validation_policy(policy: str | ValidationPolicy) -> None:
+    global _global_policy  # pylint: disable=global-statement
+    _global_policy = parse_validation_policy(policy)
+
+
+@contextmanager
+def validation_policy(policy: str | ValidationPolicy) -> Iterator[None]:
+    token = _scoped_policy.set(parse_validation_policy(policy))
+    try:
+        yield
+    finally:
+        _scoped_policy.reset(token)
+
+
+def validation_stats() -> dict[str, Any]:
+    return {
+        "policy": repr(current_validation_policy()),
+        "validated": _call_counts["validated"],
+        "skipped": _call_counts["skipped"],
+    }
+
+
+def reset_validation_stats() -> None:
+    _call_counts["validated"] = 0
+    _call_counts["skipped"] = 0
+
+
+class CallValidator:  # pylint: disable=too-few-public-methods
+    """
+    Runs dimension checks of the decorated function according to the current policy. Each
+    decorator has its own validator to remember argument signatures for 'first-call' policy.
+    """
+
+    # 'check' raises an error if dimensions of the arguments are not valid. 'signature' returns
+    # hashable dimensions of the same arguments, or None if they cannot be found without a full
+    # check.
+    def __init__(self, check: Callable[..., None], signature: Callable[..., Any]) -> None:
+        self._check = check
+        self._signature = signature
+        self._signatures: set[Any] = set()
+        self._lock = threading.Lock()
+
+    def validate(self, *args: Any) -> None:
+        policy = current_validation_policy()
+        if policy.mode == ValidationMode.FULL:
+            _call_counts["validated"] += 1
+            self._check(*args)
+            return
+        if policy.mode == ValidationMode.OFF or (policy.mode == ValidationMode.SAMPLED and
+                random.random() >= policy.probability):
+            _call_counts["skipped"] += 1
+            return
+        if policy.mode == ValidationMode.SAMPLED:
+            _call_counts["validated"] += 1
+            self._check(*args)
+            return
+        signature = self._signature(*args)
+        if signature is not None and signature in self._signatures:
+            _call_counts["skipped"] += 1
+            return
+        _call_counts["validated"] += 1
+        self._check(*args)
+        # only remember signatures of successful checks
+        if signature is not None:
+            with self._lock:
+                if len(self._signatures) < FIRST_CALL_SIGNATURES_LIMIT:
+                    self._signatures.add(signature)
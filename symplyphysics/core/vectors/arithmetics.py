@@ -1,9 +1,12 @@
 from functools import reduce
 from operator import add
-from typing import Optional, Sequence
+from typing import Any, Optional, Sequence, overload
 from sympy import S, Expr, cos, sin, sqrt, sympify
 
 from .vectors import QuantityVector, Vector
+from .vector_array import (VectorArray, add_vector_arrays, as_vector_array, cross_vector_arrays,
+    dot_vector_arrays, scale_vector_array, vector_array_magnitude, vector_array_unit)
+from ..symbols.quantity_array import QuantityArray
 from ..expr_comparisons import expr_equals
 from ..symbols.quantities import Quantity
 from ..coordinate_systems.coordinate_systems import CoordinateSystem
@@ -44,7 +47,20 @@ def equal_vectors(vector_left: Vector, vector_right: Vector) -> bool:
 # To subtract vectors, multiply one of the vectors to -1 and add them.
 #NOTE: adding two non-cartesian vectors is not a trivial task. We suggest to convert them to cartesian
 #      vectors, add them and convert back.
+@overload
 def add_cartesian_vectors(vector_left: Vector, vector_right: Vector) -> Vector:
+    ...
+
+
+@overload
+def add_cartesian_vectors(vector_left: VectorArray, vector_right: VectorArray) -> VectorArray:
+    ...
+
+
+def add_cartesian_vectors(vector_left: Vector | VectorArray,
+    vector_right: Vector | VectorArray) -> Vector | VectorArray:
+    if isinstance(vector_left, VectorArray) or isinstance(vector_right, VectorArray):
+        return add_vector_arrays(as_vector_array(vector_left), as_vector_array(vector_right))
     if vector_left.coordinate_system != vector_right.coordinate_system:
         raise TypeError(
             f"Different coordinate systems in vectors: {str(vector_left.coordinate_system)} vs {str(vector_right.coordinate_system)}"
@@ -67,7 +83,19 @@ def add_cartesian_vectors(vector_left: Vector, vector_right: Vector) -> Vector:
 
 # Change Vector magnitude (length)
 # Scalar multiplication changes the magnitude of the vector and does not change it's direction.
+@overload
 def scale_vector(scalar_value: ScalarValue, vector: Vector) -> Vector:
+    ...
+
+
+@overload
+def scale_vector(scalar_value: Any, vector: VectorArray) -> VectorArray:
+    ...
+
+
+def scale_vector(scalar_value: Any, vector: Vector | VectorArray) -> Vector | VectorArray:
+    if isinstance(vector, VectorArray):
+        return scale_vector_array(scalar_value, vector)
     if vector.coordinate_system.coord_system_type == CoordinateSystem.System.CARTESIAN:
         vector_components = [scalar_value * e for e in vector.components]
         return Vector(vector_components, vector.coordinate_system)
@@ -98,7 +126,20 @@ def _multiply_lists_and_sum(list_left: Sequence[ScalarValue],
 # Dot product equals to magnitudes of both vectors multiplied * cos(phi), where
 # phi is angle between vectors.
 # Hence vectors are orthogonal (perpendicular) when dot product is zero.
+@overload
 def dot_vectors(vector_left: Vector, vector_right: Vector) -> Expr:
+    ...
+
+
+@overload
+def dot_vectors(vector_left: VectorArray, vector_right: VectorArray) -> QuantityArray:
+    ...
+
+
+def dot_vectors(vector_left: Vector | VectorArray,
+    vector_right: Vector | VectorArray) -> Expr | QuantityArray:
+    if isinstance(vector_left, VectorArray) or isinstance(vector_right, VectorArray):
+        return dot_vector_arrays(as_vector_array(vector_left), as_vector_array(vector_right))
     if vector_left.coordinate_system != vector_right.coordinate_system:
         raise TypeError(
             f"Different coordinate systems in vectors: {str(vector_left.coordinate_system)} vs {str(vector_right.coordinate_system)}"
@@ -122,7 +163,19 @@ def dot_vectors(vector_left: Vector, vector_right: Vector) -> Expr:
     return S.Zero
 
 
+@overload
 def vector_magnitude(vector_: Vector) -> Expr:
+    ...
+
+
+@overload
+def vector_magnitude(vector_: VectorArray) -> QuantityArray:
+    ...
+
+
+def vector_magnitude(vector_: Vector | VectorArray) -> Expr | QuantityArray:
+    if isinstance(vector_, VectorArray):
+        return vector_array_magnitude(vector_)
     squared_sum = dot_vectors(vector_, vector_)
     return sqrt(squared_sum)
 
@@ -134,7 +187,20 @@ def vector_magnitude(vector_: Vector) -> Expr:
 #      - Resulting vector is perpendicular to both input vectors;
 #      - Magnitude of resulting vector equals to the area of the parallelogram spanned by input vectors;
 #      is defined only in 3 and 7 dimensional Euclidean space.
+@overload
 def cross_cartesian_vectors(vector_left: Vector, vector_right: Vector) -> Vector:
+    ...
+
+
+@overload
+def cross_cartesian_vectors(vector_left: VectorArray, vector_right: VectorArray) -> VectorArray:
+    ...
+
+
+def cross_cartesian_vectors(vector_left: Vector | VectorArray,
+    vector_right: Vector | VectorArray) -> Vector | VectorArray:
+    if isinstance(vector_left, VectorArray) or isinstance(vector_right, VectorArray):
+        return cross_vector_arrays(as_vector_array(vector_left), as_vector_array(vector_right))
     if vector_left.coordinate_system != vector_right.coordinate_system:
         raise TypeError(
             f"Different coordinate systems in vectors: {str(vector_left.coordinate_system)} vs {str(vector_right.coordinate_system)}"
@@ -167,7 +233,19 @@ def cross_cartesian_vectors(vector_left: Vector, vector_right: Vector) -> Vector
 
 
 # Make unit vector (vector of size 1 and same direction as original vector)
+@overload
 def vector_unit(vector_: Vector) -> Vector:
+    ...
+
+
+@overload
+def vector_unit(vector_: VectorArray) -> VectorArray:
+    ...
+
+
+def vector_unit(vector_: Vector | VectorArray) -> Vector | VectorArray:
+    if isinstance(vector_, VectorArray):
+        return vector_array_unit(vector_)
     return scale_vector(1 / vector_magnitude(vector_), vector_)
 
 
@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Optional, Sequence
+import numpy as np
+from numpy.typing import ArrayLike
+from sympy import S, Basic, lambdify, sympify
+from sympy.physics.units import Dimension
+
+from .vectors import REBASE_PLAN_CACHE_SIZE, QuantityVector, Vector, rebase_plan
+from ..coordinate_systems.coordinate_systems import CoordinateSystem
+from ..dimensions import (assert_equivalent_dimension, dimensionless, si_base_unit, si_scale_factor)
+from ..symbols.quantities import Quantity
+from ..numeric import NUMERIC_MODULES
+from ..symbols.quantity_array import QuantityArray, _values_and_dimension
+
+# Vectors in array always have 3 components
+VECTOR_SIZE = 3
+
+# Number of vectors, that are summed at once in VectorArraySum. Each chunk is summed pairwise,
+# so larger chunks are faster, but use more memory for temporary arrays.
+SUM_CHUNK_SIZE = 65536
+
+
+class VectorArray:
+    """
+    Array of N numeric vectors in the same coordinate system and with the same dimension.
+    Components are stored as (N, 3) contiguous float64 NumPy array in SI base units. Vectors with
+    less than 3 components are padded with zeros.
+    Vector arithmetics, eg add_cartesian_vectors() or dot_vectors(), work with VectorArray as
+    with Vector, but for all N vectors at once.
+    """
+
+    values: np.ndarray
+    dimension: Dimension
+    coordinate_system: CoordinateSystem
+
+    # NumPy should use reflected operators of this class instead of converting it to plain array
+    __array_ufunc__ = None
+
+    def __init__(self,
+        values: ArrayLike,
+        unit: Basic | float = S.One,
+        coordinate_system: CoordinateSystem = CoordinateSystem(CoordinateSystem.System.CARTESIAN),
+        *,
+        dimension: Optional[Dimension] = None):
+        """
+        Create array from ``values`` of (N, 3) or (3,) shape in ``unit``, eg
+        VectorArray([[1, 2, 3], [4, 5, 6]], units.meter).
+        If ``dimension`` is set, ``values`` should already be in SI base units.
+        """
+        if dimension is None:
+            (scale_expr, dimension) = si_scale_factor(unit)
+            scale = float(scale_expr)
+        else:
+            if sympify(unit) != S.One:
+                raise ValueError("Only one of 'unit' and 'dimension' should be set")
+            scale = 1.0
+        if np.iscomplexobj(values):
+            raise TypeError("VectorArray values should be real numbers")
+        buffer = np.array(values, dtype=np.float64)
+        if buffer.shape == (0,):
+            # empty array of vectors
+            buffer = buffer.reshape(0, VECTOR_SIZE)
+        buffer = np.array(buffer, ndmin=2)
+        if buffer.ndim != 2 or buffer.shape[1] > VECTOR_SIZE:
+            raise ValueError(f"VectorArray values should have (N, 3) shape, got {buffer.shape}")
+        if buffer.shape[1] < VECTOR_SIZE:
+            buffer = np.pad(buffer, ((0, 0), (0, VECTOR_SIZE - buffer.shape[1])))
+        self.values = np.ascontiguousarray(buffer * scale if scale != 1.0 else buffer)
+        self.dimension = dimension
+        self.coordinate_system = coordinate_system
+
+    # Vectors should have numeric components, eg Vector([1, 2]) or
+    # QuantityVector([1 * units.meter, 2 * units.meter]).
+    @staticmethod
+    def from_vectors(vectors: Sequence[Vector]) -> VectorArray:
+        if len(vectors) == 0:
+            raise ValueError("At least one vector should be present")
+        coordinate_system = vectors[0].coordinate_system
+        components: list[Any] = []
+        for (idx, vector_) in enumerate(vectors):
+            if vector_.coordinate_system != coordinate_system:
+                raise TypeError(
+                    f"Different coordinate systems in vectors: {str(coordinate_system)} vs "
+                    f"{str(vector_.coordinate_system)} in vectors[{idx}]")
+            if len(vector_.components) > VECTOR_SIZE:
+                raise ValueError(f"Only {VECTOR_SIZE} dimensional vectors are supported. Got: "
+                    f"{len(vector_.components)} in vectors[{idx}]")
+            components.extend(vector_.components)
+            components.extend([0] * (VECTOR_SIZE - len(vector_.components)))
+        # checks that all components have the same dimension
+        array = QuantityArray.from_quantities(components)
+        return VectorArray(array.values.reshape(-1, VECTOR_SIZE),
+            coordinate_system=coordinate_system,
+            dimension=array.dimension)
+
+    @staticmethod
+    def from_vector(vector_: Vector) -> VectorArray:
+        return VectorArray.from_vectors([vector_])
+
+    # Components are in SI base units
+    def to_vectors(self) -> list[Vector]:
+        return [Vector(list(row), self.coordinate_system) for row in self.values.tolist()]
+
+    def to_quantity_vectors(self) -> list[QuantityVector]:
+        unit = si_base_unit(self.dimension)
+        return [
+            QuantityVector([Quantity(c * unit, dimension=self.dimension)
+            for c in row], self.coordinate_system)
+            for row in self.values.tolist()
+        ]
+
+    # Returns i'th component of all vectors, eg x coordinates in cartesian coordinate system
+    def component(self, index: int) -> QuantityArray:
+        return QuantityArray(self.values[:, index], dimension=self.dimension)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.values.shape
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, key: Any) -> VectorArray:
+        return VectorArray(self.values[key],
+            coordinate_system=self.coordinate_system,
+            dimension=self.dimension)
+
+    def __repr__(self) -> str:
+        return f"VectorArray({self.values!r}, dimension={self.dimension})"
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> np.ndarray:
+        if copy:
+            return np.array(self.values, dtype=dtype)
+        return np.asarray(self.values, dtype=dtype)
+
+    def __neg__(self) -> VectorArray:
+        return scale_vector_array(-1.0, self)
+
+    def __add__(self, other: VectorArray) -> VectorArray:
+        return add_vector_arrays(self, other)
+
+    def __sub__(self, other: VectorArray) -> VectorArray:
+        return add_vector_arrays(self, -other)
+
+    def __mul__(self, scalar: Any) -> VectorArray:
+        return scale_vector_array(scalar, self)
+
+    def __rmul__(self, scalar: Any) -> VectorArray:
+        return scale_vector_array(scalar, self)
+
+    def __truediv__(self, scalar: Any) -> VectorArray:
+        (scalar_values, scalar_dimension) = _values_and_dimension(scalar)
+        return scale_vector_array(
+            QuantityArray(1.0 / np.asarray(scalar_values), dimension=1 / scalar_dimension), self)
+
+    def rebase(self, coordinate_system: CoordinateSystem) -> VectorArray:
+        return rebase_vector_array(self, coordinate_system)
+
+
+def _assert_same_coordinate_system(vector_left: VectorArray, vector_right: VectorArray) -> None:
+    if vector_left.coordinate_system != vector_right.coordinate_system:
+        raise TypeError(
+            f"Different coordinate systems in vectors: {str(vector_left.coordinate_system)} vs {str(vector_right.coordinate_system)}"
+        )
+
+
+def _assert_cartesian(vector_: VectorArray, operation: str) -> None:
+    if vector_.coordinate_system.coord_system_type != CoordinateSystem.System.CARTESIAN:
+        coord_name_from = CoordinateSystem.system_to_transformation_name(
+            vector_.coordinate_system.coord_system_type)
+        raise ValueError(
+            f"{operation} is only supported for cartesian coordinates: got {coord_name_from}")
+
+
+# Scalar values are applied to each vector, so they should be a number, Quantity or an array of N
+# values.
+def _scalar_values(scalar_value: Any) -> tuple[np.ndarray, Dimension]:
+    (values, dimension) = _values_and_dimension(scalar_value)
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim > 1:
+        raise ValueError(f"Scalar values should be 1-D array, got {values.shape}")
+    return (values if values.ndim == 0 else values[:, np.newaxis], dimension)
+
+
+# Vectorized form of add_cartesian_vectors(). Arrays of the same length are added element-wise,
+# array of one vector is added to each vector of another array.
+def add_vector_arrays(vector_left: VectorArray, vector_right: VectorArray) -> VectorArray:
+    _assert_same_coordinate_system(vector_left, vector_right)
+    _assert_cartesian(vector_left, "Addition")
+    assert_equivalent_dimension(vector_right.dimension, "vector_right", "add_vector_arrays",
+        vector_left.dimension)
+    return VectorArray(vector_left.values + vector_right.values,
+        coordinate_system=vector_left.coordinate_system,
+        dimension=vector_left.dimension)
+
+
+# Vectorized form of scale_vector()
+def scale_vector_array(scalar_value: Any, vector_: VectorArray) -> VectorArray:
+    (scalar_values, scalar_dimension) = _scalar_values(scalar_value)
+    values = vector_.values.copy()
+    coord_system_type = vector_.coordinate_system.coord_system_type
+    if coord_system_type == CoordinateSystem.System.CARTESIAN:
+        values *= scalar_values
+    elif coord_system_type == CoordinateSystem.System.CYLINDRICAL:
+        # radius and height are scaled, angle is kept
+        values[:, 0::2] *= scalar_values
+    elif coord_system_type == CoordinateSystem.System.SPHERICAL:
+        values[:, 0:1] *= scalar_values
+    return VectorArray(values,
+        coordinate_system=vector_.coordinate_system,
+        dimension=vector_.dimension * scalar_dimension)
+
+
+# Vectorized form of dot_vectors()
+def dot_vector_arrays(vector_left: VectorArray, vector_right: VectorArray) -> QuantityArray:
+    _assert_same_coordinate_system(vector_left, vector_right)
+    dimension = vector_left.dimension * vector_right.dimension
+    (left, right) = np.broadcast_arrays(vector_left.values, vector_right.values)
+    coord_system_type = vector_left.coordinate_system.coord_system_type
+    if coord_system_type == CoordinateSystem.System.CYLINDRICAL:
+        (r1, theta1, z1) = left.T
+        (r2, theta2, z2) = right.T
+        return QuantityArray(r1 * r2 * np.cos(theta1 - theta2) + z1 * z2, dimension=dimension)
+    if coord_system_type == CoordinateSystem.System.SPHERICAL:
+        (r1, theta1, phi1) = left.T
+        (r2, theta2, phi2) = right.T
+        return QuantityArray(r1 * r2 *
+            (np.sin(phi1) * np.sin(phi2) * np.cos(theta1 - theta2) + np.cos(phi1) * np.cos(phi2)),
+            dimension=dimension)
+    return QuantityArray(np.einsum("ij,ij->i", left, right), dimension=dimension)
+
+
+# Vectorized form of vector_magnitude()
+def vector_array_magnitude(vector_: VectorArray) -> QuantityArray:
+    if vector_.coordinate_system.coord_system_type == CoordinateSystem.System.CARTESIAN:
+        # avoids overflow of squared components
+        return QuantityArray(np.linalg.norm(vector_.values, axis=1), dimension=vector_.dimension)
+    squared = dot_vector_arrays(vector_, vector_)
+    return QuantityArray(np.sqrt(squared.values), dimension=vector_.dimension)
+
+
+# Vectorized form of cross_cartesian_vectors()
+def cross_vector_arrays(vector_left: VectorArray, vector_right: VectorArray) -> VectorArray:
+    _assert_same_coordinate_system(vector_left, vector_right)
+    _assert_cartesian(vector_left, "Cross product")
+    return VectorArray(np.cross(vector_left.values, vector_right.values),
+        coordinate_system=vector_left.coordinate_system,
+        dimension=vector_left.dimension * vector_right.dimension)
+
+
+# Sum of vectors multiplied by scalar values, eg sum_i(m_i * r_i). Returns array of one vector.
+# Uses single matrix product, so that no temporary (N, 3) arrays are created.
+def weighted_sum_vector_array(scalar_values: Any, vector_: VectorArray) -> VectorArray:
+    _assert_cartesian(vector_, "Weighted sum")
+    (values, dimension) = _values_and_dimension(scalar_values)
+    values = np.asarray(values, dtype=np.float64)
+    if values.shape != (len(vector_),):
+        raise ValueError(
+            f"Expected {len(vector_)} scalar values for {len(vector_)} vectors, got {values.shape}")
+    return VectorArray(values @ vector_.values,
+        coordinate_system=vector_.coordinate_system,
+        dimension=vector_.dimension * dimension)
+
+
+# Weighted mean of vectors, eg sum_i(m_i * r_i) / sum_i(m_i). Each chunk contains scalar values and
+# vectors as VectorArray, so that only one chunk is kept in memory. Returns array of one vector.
+def weighted_mean_vector_array(chunks: Iterable[tuple[Any, VectorArray]]) -> VectorArray:
+    weighted_sum: Optional[VectorArray] = None
+    total = 0.0
+    dimension = dimensionless
+    for (scalar_values, vector_) in chunks:
+        chunk_sum = weighted_sum_vector_array(scalar_values, vector_)
+        # also checks that dimensions and coordinate systems of chunks are the same
+        weighted_sum = chunk_sum if weighted_sum is None else weighted_sum + chunk_sum
+        (values, dimension) = _values_and_dimension(scalar_values)
+        total += float(np.sum(values))
+    if weighted_sum is None:
+        raise ValueError("At least one vector should be present")
+    return weighted_sum / QuantityArray([total], dimension=dimension)
+
+
+# Vectorized form of vector_unit(). Unit vectors of zero vectors are not defined and contain NaN.
+def vector_array_unit(vector_: VectorArray) -> VectorArray:
+    magnitude = vector_array_magnitude(vector_)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inverse = 1.0 / magnitude.values
+    return scale_vector_array(QuantityArray(inverse, dimension=1 / vector_.dimension), vector_)
+
+
+# Compiled transformation of coordinates and numeric direction cosine matrix of the rebase plan
+# from 'source' to 'target' coordinate system, see Vector.rebase()
+@lru_cache(maxsize=REBASE_PLAN_CACHE_SIZE)
+def _numeric_rebase_plan(source: CoordinateSystem,
+    target: CoordinateSystem) -> tuple[Optional[Callable[..., Any]], np.ndarray]:
+    plan = rebase_plan(source, target)
+    transformation = None
+    if plan.transformation is not None:
+        transformation = lambdify(source.base_scalars(),
+            plan.transformation,
+            modules=NUMERIC_MODULES)
+    try:
+        rotation = np.array(plan.rotation.evalf(), dtype=np.float64)
+    except TypeError as e:
+        raise ValueError(f"Rotation matrix should be numeric, got {plan.rotation}") from e
+    return (transformation, rotation)
+
+
+# Vectorized form of Vector.rebase(). Transformation of coordinates and direction cosine matrix are
+# compiled once for each pair of coordinate systems. As for Vector with numeric components, only
+# rotation of coordinate system and change of its type are applied, eg shift of origin is not.
+# Polar coordinates have angle components, so change of coordinate system type is only supported
+# for dimensionless vectors.
+def rebase_vector_array(vector_: VectorArray, coordinate_system: CoordinateSystem) -> VectorArray:
+    (transformation, rotation) = _numeric_rebase_plan(vector_.coordinate_system, coordinate_system)
+    values = vector_.values
+    if transformation is not None:
+        assert_equivalent_dimension(vector_.dimension, "vector_", "rebase_vector_array",
+            dimensionless)
+        coordinates = transformation(*values.T)
+        values = np.stack([np.broadcast_to(c, (len(values),)) for c in coordinates], axis=1)
+    return VectorArray(values @ rotation.T,
+        coordinate_system=coordinate_system,
+        dimension=vector_.dimension)
+
+
+def rebase_vector_array_cache_info() -> Any:
+    # pylint: disable-next=no-value-for-parameter
+    return _numeric_rebase_plan.cache_info()
+
+
+def clear_rebase_vector_array_cache() -> None:
+    _numeric_rebase_plan.cache_clear()
+
+
+# Adds 'value' to the 'total' with Kahan-Babuska (Neumaier) compensation of rounding errors
+def _compensated_add(total: np.ndarray, compensation: np.ndarray, value: np.ndarray) -> None:
+    new_total = total + value
+    compensation += np.where(
+        np.abs(total) >= np.abs(value), (total - new_total) + value, (value - new_total) + total)
+    total[...] = new_total
+
+
+# Sums rows of 'values' per group, set with 'indices'. Rows of each group are summed pairwise, eg
+# ((v0 + v1) + (v2 + v3)) + v4, so that rounding error grows as log of the group size. All groups
+# are summed at once, so there are log2(N) NumPy operations for N rows.
+def _grouped_pairwise_sum(values: np.ndarray, indices: np.ndarray, groups: int) -> np.ndarray:
+    order = np.argsort(indices, kind="stable")
+    indices = indices[order]
+    values = values[order]
+    starts = np.searchsorted(indices, np.arange(groups))
+    # position of each row within its group
+    ranks = np.arange(len(indices)) - starts[indices]
+    while len(indices) > 0 and ranks.max() > 0:
+        evens = np.flatnonzero(ranks % 2 == 0)
+        with_pair = evens[evens + 1 < len(indices)]
+        with_pair = with_pair[indices[with_pair + 1] == indices[with_pair]]
+        # rows of groups are contiguous, so row with odd rank follows its pair with even rank
+        values[with_pair] += values[with_pair + 1]
+        values = values[evens]
+        indices = indices[evens]
+        ranks = ranks[evens] // 2
+    result = np.zeros((groups, values.shape[1]))
+    result[indices] = values
+    return result
+
+
+class VectorArraySum:
+    """
+    Numerically stable sum of vectors, eg superposition of forces. Vectors are added in chunks,
+    each chunk is summed pairwise and partial sums of chunks are added with Kahan-Babuska
+    compensation, so that the error does not grow with the number of vectors.
+    If 'groups' is set, vectors are summed per group, eg forces per body. Group of each vector is
+    set with an index array in add(). Vectors within a chunk of a group are also summed pairwise.
+    """
+
+    _groups: Optional[int]
+    _total: np.ndarray
+    _compensation: np.ndarray
+    _dimension: Optional[Dimension]
+    _coordinate_system: Optional[CoordinateSystem]
+
+    def __init__(self, groups: Optional[int] = None):
+        self._groups = groups
+        rows = 1 if groups is None else groups
+        self._total = np.zeros((rows, VECTOR_SIZE))
+        self._compensation = np.zeros((rows, VECTOR_SIZE))
+        self._dimension = None
+        self._coordinate_system = None
+
+    def add(self, vector_: VectorArray, group_indices: Optional[ArrayLike] = None) -> None:
+        _assert_cartesian(vector_, "Addition")
+        if self._dimension is None or self._coordinate_system is None:
+            self._dimension = vector_.dimension
+            self._coordinate_system = vector_.coordinate_system
+        else:
+            if vector_.coordinate_system != self._coordinate_system:
+                raise TypeError(
+                    f"Different coordinate systems in vectors: {str(self._coordinate_system)} vs {str(vector_.coordinate_system)}"
+                )
+            assert_equivalent_dimension(vector_.dimension, "vector_", "VectorArraySum.add",
+                self._dimension)
+        indices = self._group_indices(vector_, group_indices)
+        for start in range(0, len(vector_), SUM_CHUNK_SIZE):
+            chunk = vector_.values[start:start + SUM_CHUNK_SIZE]
+            if indices is None:
+                # sum of contiguous rows is pairwise in NumPy
+                partial = np.ascontiguousarray(chunk.T).sum(axis=1)[np.newaxis, :]
+            else:
+                chunk_indices = indices[start:start + SUM_CHUNK_SIZE]
+                partial = _grouped_pairwise_sum(chunk, chunk_indices, len(self._total))
+            _compensated_add(self._total, self._compensation, partial)
+
+    # Returns array of one vector, or one vector per group
+    def result(self) -> VectorArray:
+        if self._dimension is None or self._coordinate_system is None:
+            raise ValueError("At least one vector should be added")
+        return VectorArray(self._total + self._compensation,
+            coordinate_system=self._coordinate_system,
+            dimension=self._dimension)
+
+    def _group_indices(self, vector_: VectorArray,
+        group_indices: Optional[ArrayLike]) -> Optional[np.ndarray]:
+        if self._groups is None:
+            if group_indices is not None:
+                raise ValueError("Group indices are only used when groups are set")
+            return None
+        if group_indices is None:
+            raise ValueError("Group indices should be set when groups are set")
+        indices = np.asarray(group_indices)
+        if indices.shape != (len(vector_),) or not np.issubdtype(indices.dtype, np.integer):
+            raise ValueError(
+                f"Expected {len(vector_)} integer group indices, got {indices.shape} of {indices.dtype}"
+            )
+        if len(indices) > 0 and (indices.min() < 0 or indices.max() >= self._groups):
+            raise ValueError(f"Group indices should be in range [0..{self._groups - 1}]")
+        return indices
+
+
+# Converts Vector to VectorArray of one vector for arithmetics with VectorArray
+def as_vector_array(vector_: Vector | VectorArray) -> VectorArray:
+    if isinstance(vector_, VectorArray):
+        return vector_
+    return VectorArray.from_vector(vector_)
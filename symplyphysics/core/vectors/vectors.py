@@ -1,6 +1,8 @@
 from __future__ import annotations
-from typing import Optional, Sequence
-from sympy.vector import express, Vector as SymVector
+from functools import cached_property, lru_cache
+from typing import Any, Optional, Sequence
+from sympy import Expr, ImmutableMatrix, Matrix
+from sympy.vector import BaseScalar, CoordSys3D, Vector as SymVector
 from sympy.vector.operators import _get_coord_systems
 from sympy.physics.units import Dimension
 
@@ -9,6 +11,9 @@ from ..symbols.quantities import Quantity
 from ..symbols.symbols import DimensionSymbol, next_name
 from ..coordinate_systems.coordinate_systems import CoordinateSystem
 
+# Maximum number of memoized rebase plans, see rebase_plan()
+REBASE_PLAN_CACHE_SIZE = 1024
+
 
 # Contains list of SymPy expressions or any numbers as components.
 # Contains coordinate system to prevent using vector arithmetics with non compatible
@@ -62,40 +67,106 @@ class Vector:
     # Converts Vector to SymPy Vector
     def to_sympy_vector(self) -> SymVector:
         result_vector = SymVector.zero
-        base_vectors = self.coordinate_system.coord_system.base_vectors()
+        base_vectors = self.coordinate_system.base_vectors()
         for idx in range(min(len(base_vectors), len(self.components))):
             result_vector = result_vector + base_vectors[idx] * self.components[idx]
         return result_vector
 
     # Convert vector coordinate system to new basis and construct new vector.
     # Rebased vector should be the same as old vector but in new coordinate system.
+    # Transformation of coordinates, rotation matrix and substitutions of base scalars are taken
+    # from cached plan, see rebase_plan().
     def rebase(self, coordinate_system: CoordinateSystem) -> Vector:
-        vector_: Vector = self
-        if self.coordinate_system.coord_system_type != coordinate_system.coord_system_type:
-            new_scalars = list(
-                self.coordinate_system.transformation_to_system(
-                coordinate_system.coord_system_type))
+        plan = rebase_plan(self.coordinate_system, coordinate_system)
+        components = [0 if i >= len(self.components) else self.components[i] for i in range(3)]
+        if plan.transformation is not None:
             # now take each component of vector and assign them to base_scalars, eg x, y, z
             # replace each component of new_scalars with assigned x, y, z, eg r -> x, theta -> y
             # build new vector from these components
-            for i, scalar in enumerate(self.coordinate_system.coord_system.base_scalars()):
-                new_component = 0 if i >= len(self.components) else self.components[i]
-                for j, old_scalar in enumerate(new_scalars):
-                    new_scalars[j] = old_scalar.subs(scalar, new_component)
-            vector_ = Vector(new_scalars, self.coordinate_system)
-        # We do not want to maintain own vector transformation functions, so
-        # we convert our vector to SymPy format, transform it and convert back to Vector.
-        sympy_vector = vector_.to_sympy_vector()
-        transformed_vector_sympy = express(sympy_vector,
-            coordinate_system.coord_system,
-            None,
-            variables=True)
-        return Vector.from_sympy_vector(transformed_vector_sympy, coordinate_system)
+            substitutions = dict(zip(self.coordinate_system.base_scalars(), components))
+            components = [t.xreplace(substitutions) for t in plan.transformation]
+        if all(c == 0 for c in components):
+            return Vector([], coordinate_system)
+        # This is the same as SymPy express() with variables=True, but with cached rotation matrix
+        # and substitutions
+        components = [_express_scalars(c, coordinate_system.coord_system) for c in components]
+        return Vector(list(plan.rotation * Matrix(components)), coordinate_system)
+
+
+class RebasePlan:
+    """
+    Transformation of vectors from 'source' to 'target' coordinate system, see Vector.rebase().
+    Plans are memoized per pair of coordinate systems, see rebase_plan().
+    """
+
+    source: CoordinateSystem
+    target: CoordinateSystem
+    # Coordinates in target coordinate system type, as expressions of base scalars of source
+    # coordinate system, eg (sqrt(x**2 + y**2), atan2(y, x), z). None if systems have the same type.
+    transformation: Optional[tuple[Expr, ...]]
+
+    def __init__(self, source: CoordinateSystem, target: CoordinateSystem):
+        self.source = source
+        self.target = target
+        self.transformation = None
+        if source.coord_system_type != target.coord_system_type:
+            self.transformation = tuple(source.transformation_to_system(target.coord_system_type))
+
+    # Direction cosine matrix, that converts components in source coordinate system to target
+    # one. Raises ValueError if coordinate systems are not connected.
+    @cached_property
+    def rotation(self) -> ImmutableMatrix:
+        return _rotation_matrix(self.target.coord_system, self.source.coord_system)
+
+    # Base scalars of source coordinate system, expressed with base scalars of target one
+    @cached_property
+    def scalar_map(self) -> dict[Expr, Expr]:
+        return _scalar_map(self.source.coord_system, self.target.coord_system)
+
+
+@lru_cache(maxsize=REBASE_PLAN_CACHE_SIZE)
+def rebase_plan(source: CoordinateSystem, target: CoordinateSystem) -> RebasePlan:
+    return RebasePlan(source, target)
+
+
+@lru_cache(maxsize=REBASE_PLAN_CACHE_SIZE)
+def _rotation_matrix(target: CoordSys3D, source: CoordSys3D) -> ImmutableMatrix:
+    return ImmutableMatrix(target.rotation_matrix(source))
+
+
+@lru_cache(maxsize=REBASE_PLAN_CACHE_SIZE)
+def _scalar_map(source: CoordSys3D, target: CoordSys3D) -> dict[Expr, Expr]:
+    return source.scalar_map(target)
+
+
+# Replaces base scalars of other coordinate systems in 'component' with base scalars of 'target'
+def _express_scalars(component: Any, target: CoordSys3D) -> Any:
+    if not isinstance(component, Expr):
+        return component
+    systems = {s.system for s in component.atoms(BaseScalar) if s.system != target}
+    substitutions: dict[Expr, Expr] = {}
+    for system in systems:
+        substitutions.update(_scalar_map(system, target))
+    return component.subs(substitutions) if len(substitutions) > 0 else component
+
+
+def rebase_plan_cache_info() -> Any:
+    # pylint: disable-next=no-value-for-parameter
+    return rebase_plan.cache_info()
+
+
+def clear_rebase_plan_cache() -> None:
+    rebase_plan.cache_clear()
+    _rotation_matrix.cache_clear()
+    _scalar_map.cache_clear()
 
 
 # TODO: vectors in polar coordinates have angle type for some components.
 #       It is not supported by this class.
 class QuantityVector(Vector, DimensionSymbol):
+    # Component quantities are created once and shared by all users of the vector. Quantities
+    # are immutable, so they are not copied.
+    _quantities: tuple[Quantity, ...]
 
     def __init__(self,
         components: Sequence[Quantity | ScalarValue],
@@ -114,10 +185,14 @@ class QuantityVector(Vector, DimensionSymbol):
             scale_factors.append(c.scale_factor)
         DimensionSymbol.__init__(self, next_name("VEC"), dimension)
         Vector.__init__(self, scale_factors, coordinate_system)
+        # reuse component quantities when they already have dimension of the vector
+        self._quantities = tuple(
+            q if q.dimension == dimension else Quantity(q.scale_factor, dimension=dimension)
+            for q in quantities)
 
     @property
     def components(self) -> Sequence[Quantity]:
-        return [Quantity(c, dimension=self.dimension) for c in self._components]
+        return self._quantities
 
     @staticmethod
     def _expr_to_quantities(components: Sequence[ScalarValue | Quantity],
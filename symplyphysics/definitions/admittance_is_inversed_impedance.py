@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Admittance (a.k.a. complex conductance) is ability of dipole to conduct electrical signal.
@@ -23,7 +25,8 @@ def print_law() -> str:
 
 @validate_input(impedance_=dipole_impedance)
 @validate_output(dipole_admittance)
+@numeric(definition, dipole_admittance)
 def calculate_admittance(impedance_: Quantity) -> Quantity:
-    solved = solve(definition, dipole_admittance, dict=True)[0][dipole_admittance]
+    solved = solved_for(definition, dipole_admittance)
     result_expr = solved.subs({dipole_impedance: impedance_})
     return Quantity(result_expr)
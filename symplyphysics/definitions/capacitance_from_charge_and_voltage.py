@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The electrical capacitance of a capacitor is
@@ -27,7 +29,8 @@ def print_law() -> str:
 
 @validate_input(charge_=charge, voltage_=voltage)
 @validate_output(capacitance)
+@numeric(definition, capacitance)
 def calculate_capacitance(charge_: Quantity, voltage_: Quantity) -> Quantity:
-    solved = solve(definition, capacitance, dict=True)[0][capacitance]
+    solved = solved_for(definition, capacitance)
     result_expr = solved.subs({charge: charge_, voltage: voltage_})
     return Quantity(result_expr)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The density (more precisely, the volumetric mass density), of a substance
@@ -27,7 +29,8 @@ def print_law() -> str:
 
 @validate_input(mass_=mass, volume_=volume)
 @validate_output(density)
+@numeric(definition, density)
 def calculate_density(mass_: Quantity, volume_: Quantity) -> Quantity:
-    solved = solve(definition, density, dict=True)[0][density]
+    solved = solved_for(definition, density)
     result_expr = solved.subs({mass: mass_, volume: volume_})
     return Quantity(result_expr)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Conductivity is ability of medium to conduct electrical current.
@@ -24,7 +26,8 @@ def print_law() -> str:
 
 @validate_input(resistance_=object_resistance)
 @validate_output(object_conductivity)
+@numeric(definition, object_conductivity)
 def calculate_conductivity(resistance_: Quantity) -> Quantity:
-    solved = solve(definition, object_conductivity, dict=True)[0][object_conductivity]
+    solved = solved_for(definition, object_conductivity)
     result_expr = solved.subs({object_resistance: resistance_})
     return Quantity(result_expr)
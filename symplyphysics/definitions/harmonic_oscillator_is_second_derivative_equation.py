@@ -2,6 +2,8 @@ from sympy import (Derivative, Eq, cos, solve, symbols, Function as SymFunction)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
+from symplyphysics.core.derivation_cache import cached_call
 
 # Description
 ## In classical mechanics, a harmonic oscillator is a system that, when displaced from its equilibrium position, experiences a restoring force F proportional to the displacement x.
@@ -42,20 +44,28 @@ amplitude = symbols("amplitude")
 initial_phase = symbols("initial_phase")
 displacement_function_eq = Eq(displacement_function(time),
     amplitude * cos(angular_frequency * time + initial_phase))
-dsolved = definition.subs(displacement_function(time), displacement_function_eq.rhs)
-assert expr_equals(dsolved.lhs, dsolved.rhs)
-
-## There are many solutions for harmonic_oscillation_eq. Add condition, that at initial point of time (time = 0)
-## there is max displacement (displacement(time) = amplitude).
-## Let's prove that initial phase of cosine function (displacement_function_eq) should be zero.
-
-initial_condition = Eq(displacement_function(0), amplitude)
-displacement_function_at_zero_time_eq = displacement_function_eq.subs(time, 0)
-## Initial phase solutions have period of 2*pi. Take first solution.
-initial_phase_solved = solve([displacement_function_at_zero_time_eq, initial_condition],
-    (amplitude, initial_phase),
-    dict=True)[0][initial_phase]
-assert expr_equals(initial_phase_solved, 0)
+
+
+@proof
+def _confirm_cosine_solution():
+    # pylint: disable-next=assignment-from-no-return
+    dsolved = definition.subs(displacement_function(time), displacement_function_eq.rhs)
+    assert cached_call(__name__, "cosine_solution_equals", expr_equals, dsolved.lhs, dsolved.rhs)
+
+    ## There are many solutions for harmonic_oscillation_eq. Add condition, that at initial point of time (time = 0)
+    ## there is max displacement (displacement(time) = amplitude).
+    ## Let's prove that initial phase of cosine function (displacement_function_eq) should be zero.
+
+    initial_condition = Eq(displacement_function(0), amplitude)
+    # pylint: disable-next=assignment-from-no-return
+    displacement_function_at_zero_time_eq = displacement_function_eq.subs(time, 0)
+    ## Initial phase solutions have period of 2*pi. Take first solution.
+    initial_phase_solved = cached_call(__name__,
+        "initial_phase_solved",
+        solve, [displacement_function_at_zero_time_eq, initial_condition],
+        (amplitude, initial_phase),
+        dict=True)[0][initial_phase]
+    assert expr_equals(initial_phase_solved, 0)
 
 
 def print_law() -> str:
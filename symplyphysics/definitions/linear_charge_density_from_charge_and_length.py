@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Linear charge density is the quantity of charge per unit length, at any point on a line charge distribution.
@@ -27,8 +29,9 @@ def print_definition() -> str:
 
 @validate_input(charge_=charge, length_=length)
 @validate_output(linear_charge_density)
+@numeric(definition, linear_charge_density)
 def calculate_linear_charge_density(charge_, length_: Quantity) -> Quantity:
-    result_expr = solve(definition, linear_charge_density, dict=True)[0][linear_charge_density]
+    result_expr = solved_for(definition, linear_charge_density)
     result_linear_charge_density = result_expr.subs({
         charge: charge_,
         length: length_,
@@ -1,6 +1,7 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless, convert_to)
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.symbols.fraction import Fraction
 
 # Description
@@ -27,7 +28,7 @@ def print_law() -> str:
 @validate_input(mass_of_component_=mass_of_component, mass_of_mixture_=mass_of_mixture)
 @validate_output(mass_fraction)
 def calculate_mass_fraction(mass_of_component_: Quantity, mass_of_mixture_: Quantity) -> Fraction:
-    result_mass_fraction_expr = solve(definition, mass_fraction, dict=True)[0][mass_fraction]
+    result_mass_fraction_expr = solved_for(definition, mass_fraction)
     result_expr = result_mass_fraction_expr.subs({
         mass_of_component: mass_of_component_,
         mass_of_mixture: mass_of_mixture_
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The mechanical energy of the system is defined as the total kinetic energy plus the total potential energy.
@@ -26,8 +28,9 @@ def print_law() -> str:
 
 @validate_input(kinetic_energy_=kinetic_energy, potential_energy_=potential_energy)
 @validate_output(mechanical_energy)
+@numeric(definition, mechanical_energy)
 def calculate_mechanical_energy(kinetic_energy_: Quantity, potential_energy_: Quantity) -> Quantity:
-    solved = solve(definition, mechanical_energy, dict=True)[0][mechanical_energy]
+    solved = solved_for(definition, mechanical_energy)
     result_expr = solved.subs({
         kinetic_energy: kinetic_energy_,
         potential_energy: potential_energy_
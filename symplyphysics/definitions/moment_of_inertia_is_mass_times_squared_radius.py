@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## If the particle is about to spin around axle, it has moment of inertia.
@@ -28,7 +30,8 @@ def print_law() -> str:
 
 @validate_input(mass_=particle_mass, radius_=spinning_radius)
 @validate_output(moment_of_inertia)
+@numeric(definition, moment_of_inertia)
 def calculate_moment_of_inertia(mass_: Quantity, radius_: Quantity) -> Quantity:
-    result_inertia_expr = solve(definition, moment_of_inertia, dict=True)[0][moment_of_inertia]
+    result_inertia_expr = solved_for(definition, moment_of_inertia)
     result_expr = result_inertia_expr.subs({particle_mass: mass_, spinning_radius: radius_})
     return Quantity(result_expr)
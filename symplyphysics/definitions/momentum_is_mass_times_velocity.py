@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Momentum is the multiplication of velocity and mass. As velocity is vector, momentum is vector as well and it is collinear with velocity.
@@ -26,7 +28,8 @@ def print_law() -> str:
 
 @validate_input(velocity_=velocity, mass_=mass)
 @validate_output(momentum)
+@numeric(definition, momentum)
 def calculate_momentum(mass_: Quantity, velocity_: Quantity) -> Quantity:
-    solved = solve(definition, momentum, dict=True)[0][momentum]
+    solved = solved_for(definition, momentum)
     result_expr = solved.subs({mass: mass_, velocity: velocity_})
     return Quantity(result_expr)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Quality factor is the property of oscillatiing system. It shows the ratio between amount of energy stored in system and power losses.
@@ -29,8 +31,9 @@ def print_law() -> str:
 
 @validate_input(frequency_=resonant_frequency, energy_=stored_energy, power_=dissipated_power)
 @validate_output(quality_factor)
+@numeric(definition, quality_factor)
 def calculate_quality_factor(frequency_: Quantity, energy_: Quantity, power_: Quantity) -> Quantity:
-    result_factor_expr = solve(definition, quality_factor, dict=True)[0][quality_factor]
+    result_factor_expr = solved_for(definition, quality_factor)
     result_expr = result_factor_expr.subs({
         resonant_frequency: frequency_,
         stored_energy: energy_,
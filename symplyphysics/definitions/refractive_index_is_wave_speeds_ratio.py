@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (
     units,
     Quantity,
@@ -9,6 +9,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## If wave transfers from one medium to another, it refracts. That's because of different propagation speeds in different mediums.
@@ -39,8 +41,9 @@ def print_law() -> str:
 
 @validate_input(outer_speed_=outer_speed, refracting_speed_=refracting_speed)
 @validate_output(refractive_index)
+@numeric(definition, refractive_index)
 def calculate_refractive_index(outer_speed_: Quantity, refracting_speed_: Quantity) -> float:
-    result_index_expr = solve(definition, refractive_index, dict=True)[0][refractive_index]
+    result_index_expr = solved_for(definition, refractive_index)
     result_expr = result_index_expr.subs({
         outer_speed: outer_speed_,
         refracting_speed: refracting_speed_
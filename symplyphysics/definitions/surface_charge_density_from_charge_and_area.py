@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Surface charge density is the amount of charge per unit of a two-dimensional surface area. It is a measure of how much quantity of electric charge is accumulated over a surface.
@@ -27,8 +29,9 @@ def print_definition() -> str:
 
 @validate_input(charge_=charge, area_=area)
 @validate_output(surface_charge_density)
+@numeric(definition, surface_charge_density)
 def calculate_surface_charge_density(charge_: Quantity, area_: Quantity) -> Quantity:
-    result_expr = solve(definition, surface_charge_density, dict=True)[0][surface_charge_density]
+    result_expr = solved_for(definition, surface_charge_density)
     result_surface_charge_density = result_expr.subs({
         charge: charge_,
         area: area_,
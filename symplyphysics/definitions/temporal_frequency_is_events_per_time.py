@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (dimensionless, units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Frequency is the number of occurrences of a repeating event per unit of time.
@@ -25,9 +27,10 @@ def print_law() -> str:
     return print_expression(definition)
 
 
-@validate_input(time_=time)
+@validate_input(events_=events, time_=time)
 @validate_output(temporal_frequency)
+@numeric(definition, temporal_frequency)
 def calculate_frequency(events_: float, time_: Quantity) -> Quantity:
-    solved = solve(definition, temporal_frequency, dict=True)[0][temporal_frequency]
+    solved = solved_for(definition, temporal_frequency)
     result_expr = solved.subs({time: time_, events: events_})
     return Quantity(result_expr)
@@ -1,8 +1,10 @@
-from typing import Sequence
+from typing import Iterable, Sequence
+from numpy.typing import ArrayLike
 from symplyphysics import (units, validate_output)
 from symplyphysics.core.dimensions import assert_equivalent_dimension
 from symplyphysics.core.vectors.arithmetics import add_cartesian_vectors
 from symplyphysics.core.vectors.vectors import QuantityVector, Vector
+from symplyphysics.core.vectors.vector_array import VectorArray, VectorArraySum
 
 # Description
 ## R = sum(F)
@@ -22,8 +24,31 @@ def superposition_law(forces_: Sequence[Vector]) -> Vector:
     return result
 
 
+# Array form of the law for large number of forces. Forces are given in chunks of VectorArray,
+# eg when they are computed in batches, and are summed with compensation of rounding errors.
+def superposition_array(chunks: Iterable[VectorArray]) -> VectorArray:
+    total = VectorArraySum()
+    for forces_ in chunks:
+        total.add(forces_)
+    return total.result()
+
+
+# Array form of the law for many bodies at once. Each chunk contains forces and indices of bodies,
+# that forces act on. Result contains resultant force for each of 'bodies'.
+def superposition_by_body_array(chunks: Iterable[tuple[VectorArray, ArrayLike]],
+    bodies: int) -> VectorArray:
+    total = VectorArraySum(bodies)
+    for (forces_, body_indices_) in chunks:
+        total.add(forces_, body_indices_)
+    return total.result()
+
+
 @validate_output(units.force)
-def calculate_resultant_force(forces_: Sequence[QuantityVector]) -> QuantityVector:
+def calculate_resultant_force(forces_: Sequence[QuantityVector] | VectorArray) -> QuantityVector:
+    if isinstance(forces_, VectorArray):
+        assert_equivalent_dimension(forces_.dimension, "forces_", "calculate_resultant_force",
+            units.force)
+        return superposition_array([forces_]).to_quantity_vectors()[0]
     if len(forces_) == 0:
         return QuantityVector([])
     forces_ = list(forces_)
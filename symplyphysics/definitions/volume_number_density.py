@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, dimensionless, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Volume number density is the number of specified objects per unit volume.
@@ -25,7 +27,8 @@ def print_law() -> str:
 
 @validate_input(objects_=objects, volume_=volume)
 @validate_output(number_density)
+@numeric(definition, number_density)
 def calculate_number_density(objects_: int, volume_: Quantity) -> Quantity:
-    solved = solve(definition, number_density, dict=True)[0][number_density]
+    solved = solved_for(definition, number_density)
     result_expr = solved.subs({objects: objects_, volume: volume_})
     return Quantity(result_expr)
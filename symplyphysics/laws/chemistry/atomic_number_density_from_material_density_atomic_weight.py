@@ -1,6 +1,9 @@
 from sympy import (Eq, solve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
+from symplyphysics.core.proofs import proof
 from symplyphysics.definitions import volume_number_density
 from symplyphysics.definitions import density_from_mass_volume
 from symplyphysics.laws.chemistry import avogadro_number_from_mole_count
@@ -26,31 +29,36 @@ atomic_weight = Symbol("atomic_weight", units.mass / units.amount_of_substance)
 
 law = Eq(atomic_number_density, material_density * units.avogadro / atomic_weight)
 
-# Derive the same law from volume number density law
 
-density_law = density_from_mass_volume.definition.subs({
-    density_from_mass_volume.volume: volume_number_density.volume,
-    density_from_mass_volume.density: material_density
-})
+# Derive the same law from volume number density law
+@proof
+def _derive_law():
+    # pylint: disable-next=assignment-from-no-return
+    density_law = density_from_mass_volume.definition.subs({
+        density_from_mass_volume.volume: volume_number_density.volume,
+        density_from_mass_volume.density: material_density
+    })
 
-avogadro_law = avogadro_number_from_mole_count.law.subs(
-    {avogadro_number_from_mole_count.particles_count: volume_number_density.objects})
+    # pylint: disable-next=assignment-from-no-return
+    avogadro_law = avogadro_number_from_mole_count.law.subs(
+        {avogadro_number_from_mole_count.particles_count: volume_number_density.objects})
 
-atomic_weight_law = atomic_weight_from_mass_mole_count.law.subs({
-    atomic_weight_from_mass_mole_count.atomic_weight: atomic_weight,
-    atomic_weight_from_mass_mole_count.substance_mass: density_from_mass_volume.mass,
-    atomic_weight_from_mass_mole_count.mole_count: avogadro_number_from_mole_count.mole_count
-})
+    # pylint: disable-next=assignment-from-no-return
+    atomic_weight_law = atomic_weight_from_mass_mole_count.law.subs({
+        atomic_weight_from_mass_mole_count.atomic_weight: atomic_weight,
+        atomic_weight_from_mass_mole_count.substance_mass: density_from_mass_volume.mass,
+        atomic_weight_from_mass_mole_count.mole_count: avogadro_number_from_mole_count.mole_count
+    })
 
-derived_law = [volume_number_density.definition, density_law, avogadro_law, atomic_weight_law]
+    derived_law = [volume_number_density.definition, density_law, avogadro_law, atomic_weight_law]
 
-## Check the equivalence of 'law' and 'derived_law'
-derived_number_density = solve(derived_law,
-    (density_from_mass_volume.mass, volume_number_density.objects,
-    volume_number_density.number_density, avogadro_number_from_mole_count.mole_count),
-    dict=True)[0][volume_number_density.number_density]
-assert solve(law, atomic_number_density,
-    dict=True)[0][atomic_number_density] == derived_number_density
+    ## Check the equivalence of 'law' and 'derived_law'
+    derived_number_density = solve(derived_law,
+        (density_from_mass_volume.mass, volume_number_density.objects,
+        volume_number_density.number_density, avogadro_number_from_mole_count.mole_count),
+        dict=True)[0][volume_number_density.number_density]
+    assert solve(law, atomic_number_density,
+        dict=True)[0][atomic_number_density] == derived_number_density
 
 
 def print_law() -> str:
@@ -59,8 +67,9 @@ def print_law() -> str:
 
 @validate_input(material_density_=material_density, atomic_weight_=atomic_weight)
 @validate_output(atomic_number_density)
+@numeric(law, atomic_number_density)
 def calculate_atomic_number_density(material_density_: Quantity,
     atomic_weight_: Quantity) -> Quantity:
-    solved = solve(law, atomic_number_density, dict=True)[0][atomic_number_density]
+    solved = solved_for(law, atomic_number_density)
     result_expr = solved.subs({material_density: material_density_, atomic_weight: atomic_weight_})
     return Quantity(result_expr)
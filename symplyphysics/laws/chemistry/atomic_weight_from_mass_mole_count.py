@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The molar mass of a chemical compound is defined as the mass of a sample of that compound divided
@@ -25,7 +27,8 @@ def print_law() -> str:
 
 @validate_input(substance_mass_=substance_mass, mole_count_=mole_count)
 @validate_output(atomic_weight)
+@numeric(law, atomic_weight)
 def calculate_atomic_weight(substance_mass_: Quantity, mole_count_: Quantity) -> Quantity:
-    solved = solve(law, atomic_weight, dict=True)[0][atomic_weight]
+    solved = solved_for(law, atomic_weight)
     result_expr = solved.subs({substance_mass: substance_mass_, mole_count: mole_count_})
     return Quantity(result_expr)
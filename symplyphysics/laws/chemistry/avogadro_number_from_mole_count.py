@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (
     units,
     Quantity,
@@ -9,6 +9,7 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
 
 # Description
 ## The Avogadro constant is the proportionality factor that relates the number of constituent particles
@@ -33,7 +34,7 @@ def print_law() -> str:
 @validate_input(mole_count_=mole_count)
 @validate_output(particles_count)
 def calculate_particles_count(mole_count_: Quantity) -> int:
-    solved = solve(law, particles_count, dict=True)[0][particles_count]
+    solved = solved_for(law, particles_count)
     result_expr = solved.subs(mole_count, mole_count_)
     result = Quantity(result_expr)
     return int(convert_to(result, S.One).evalf())
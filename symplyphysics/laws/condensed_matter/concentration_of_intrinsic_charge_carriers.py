@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, sqrt, exp)
+from sympy import (Eq, sqrt, exp)
 from sympy.physics.units import boltzmann
 from symplyphysics import (
     units,
@@ -8,6 +8,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## In the absence of external influences (lighting, electric field, etc.), there is a
@@ -44,11 +46,11 @@ def print_law() -> str:
     band_gap_=band_gap,
     temperature_=temperature)
 @validate_output(charge_carriers_concentration)
+@numeric(law, charge_carriers_concentration)
 def calculate_concentration(density_of_states_in_conduction_band_: Quantity,
     density_of_states_in_valence_band_: Quantity, band_gap_: Quantity,
     temperature_: Quantity) -> Quantity:
-    result_expr = solve(law, charge_carriers_concentration,
-        dict=True)[0][charge_carriers_concentration]
+    result_expr = solved_for(law, charge_carriers_concentration)
     result_expr = result_expr.subs({
         density_of_states_in_conduction_band: density_of_states_in_conduction_band_,
         density_of_states_in_valence_band: density_of_states_in_valence_band_,
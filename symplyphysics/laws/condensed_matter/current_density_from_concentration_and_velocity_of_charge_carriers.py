@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Current density is the amount of charge per unit time that flows through a unit area of a chosen
@@ -38,9 +40,10 @@ def print_law() -> str:
     drift_velocity_=drift_velocity,
     charge_=charge)
 @validate_output(density_current)
+@numeric(law, density_current)
 def calculate_current(charge_carriers_concentration_: Quantity, drift_velocity_: Quantity,
     charge_: Quantity) -> Quantity:
-    result_expr = solve(law, density_current, dict=True)[0][density_current]
+    result_expr = solved_for(law, density_current)
     result_expr = result_expr.subs({
         charge_carriers_concentration: charge_carriers_concentration_,
         drift_velocity: drift_velocity_,
@@ -1,7 +1,10 @@
 from sympy import (Eq, solve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 
 from symplyphysics.laws.condensed_matter import current_density_from_concentration_and_velocity_of_charge_carriers as density_velocity_law
 from symplyphysics.laws.condensed_matter import drift_velocity_of_charge_carriers as velocity_law
@@ -40,40 +43,47 @@ law = Eq(
     (-electrons_concentration * electrons_mobility + holes_concentration * holes_mobility) *
     electric_intensity)
 
+
 ## This law might be derived via law for current density in metals.
-velocity_law_electrons = velocity_law.law.subs({
-    velocity_law.charge_carriers_mobility: electrons_mobility,
-    velocity_law.electric_intensity: electric_intensity,
-})
-velocity_electrons = solve(velocity_law_electrons, velocity_law.drift_velocity,
-    dict=True)[0][velocity_law.drift_velocity]
-density_velocity_law_electrons = density_velocity_law.law.subs({
-    density_velocity_law.charge: -charge,
-    density_velocity_law.charge_carriers_concentration: electrons_concentration,
-    density_velocity_law.drift_velocity: velocity_electrons,
-})
+@proof
+def _derive_law():
+    # pylint: disable-next=assignment-from-no-return
+    velocity_law_electrons = velocity_law.law.subs({
+        velocity_law.charge_carriers_mobility: electrons_mobility,
+        velocity_law.electric_intensity: electric_intensity,
+    })
+    velocity_electrons = solve(velocity_law_electrons, velocity_law.drift_velocity,
+        dict=True)[0][velocity_law.drift_velocity]
+    # pylint: disable-next=assignment-from-no-return
+    density_velocity_law_electrons = density_velocity_law.law.subs({
+        density_velocity_law.charge: -charge,
+        density_velocity_law.charge_carriers_concentration: electrons_concentration,
+        density_velocity_law.drift_velocity: velocity_electrons,
+    })
 
-velocity_law_holes = velocity_law.law.subs({
-    velocity_law.charge_carriers_mobility: holes_mobility,
-    velocity_law.electric_intensity: electric_intensity,
-})
-velocity_holes = solve(velocity_law_holes, velocity_law.drift_velocity,
-    dict=True)[0][velocity_law.drift_velocity]
-density_velocity_law_holes = density_velocity_law.law.subs({
-    density_velocity_law.charge: charge,
-    density_velocity_law.charge_carriers_concentration: holes_concentration,
-    density_velocity_law.drift_velocity: velocity_holes,
-})
-density_current_electrons_derived = solve(density_velocity_law_electrons,
-    density_velocity_law.density_current,
-    dict=True)[0][density_velocity_law.density_current]
-density_current_holes_derived = solve(density_velocity_law_holes,
-    density_velocity_law.density_current,
-    dict=True)[0][density_velocity_law.density_current]
-density_current_derived = density_current_electrons_derived + density_current_holes_derived
+    # pylint: disable-next=assignment-from-no-return
+    velocity_law_holes = velocity_law.law.subs({
+        velocity_law.charge_carriers_mobility: holes_mobility,
+        velocity_law.electric_intensity: electric_intensity,
+    })
+    velocity_holes = solve(velocity_law_holes, velocity_law.drift_velocity,
+        dict=True)[0][velocity_law.drift_velocity]
+    # pylint: disable-next=assignment-from-no-return
+    density_velocity_law_holes = density_velocity_law.law.subs({
+        density_velocity_law.charge: charge,
+        density_velocity_law.charge_carriers_concentration: holes_concentration,
+        density_velocity_law.drift_velocity: velocity_holes,
+    })
+    density_current_electrons_derived = solve(density_velocity_law_electrons,
+        density_velocity_law.density_current,
+        dict=True)[0][density_velocity_law.density_current]
+    density_current_holes_derived = solve(density_velocity_law_holes,
+        density_velocity_law.density_current,
+        dict=True)[0][density_velocity_law.density_current]
+    density_current_derived = density_current_electrons_derived + density_current_holes_derived
 
-# Check if derived density current is same as declared.
-assert expr_equals(density_current_derived, law.rhs)
+    # Check if derived density current is same as declared.
+    assert expr_equals(density_current_derived, law.rhs)
 
 
 def print_law() -> str:
@@ -86,10 +96,11 @@ def print_law() -> str:
     holes_mobility_=holes_mobility,
     electric_intensity_=electric_intensity)
 @validate_output(density_current)
+@numeric(law, density_current)
 def calculate_current_density(electrons_concentration_: Quantity, holes_concentration_: Quantity,
     electrons_mobility_: Quantity, holes_mobility_: Quantity,
     electric_intensity_: Quantity) -> Quantity:
-    result_expr = solve(law, density_current, dict=True)[0][density_current]
+    result_expr = solved_for(law, density_current)
     result_expr = result_expr.subs({
         electrons_concentration: electrons_concentration_,
         holes_concentration: holes_concentration_,
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Drift velocity is the average velocity attained by charged particles, such as electrons,
@@ -37,9 +39,10 @@ def print_law() -> str:
 @validate_input(charge_carriers_mobility_=charge_carriers_mobility,
     electric_intensity_=electric_intensity)
 @validate_output(drift_velocity)
+@numeric(law, drift_velocity)
 def calculate_velocity(charge_carriers_mobility_: Quantity,
     electric_intensity_: Quantity) -> Quantity:
-    result_expr = solve(law, drift_velocity, dict=True)[0][drift_velocity]
+    result_expr = solved_for(law, drift_velocity)
     result_expr = result_expr.subs({
         charge_carriers_mobility: charge_carriers_mobility_,
         electric_intensity: electric_intensity_,
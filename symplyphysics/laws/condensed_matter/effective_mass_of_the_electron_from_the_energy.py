@@ -2,7 +2,6 @@ from sympy import (
     Derivative,
     Expr,
     Eq,
-    solve,
     pi,
 )
 from sympy.physics.units import planck as planck_constant
@@ -16,6 +15,7 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.budget import budgeted_solve
 
 # Description
 ## In solid state physics, a particle's effective mass is the mass that it seems to have when responding to forces,
@@ -56,5 +56,5 @@ def calculate_mass(energy_function_: Expr, wavenumber_: Quantity) -> Quantity:
         energy_function.dimension)
     applied_law = apply_energy_function(energy_function_)
     result_expr = applied_law.subs(wavenumber, wavenumber_)
-    result = solve(result_expr, mass, dict=True)[0][mass]
+    result = budgeted_solve(result_expr, mass, dict=True)[0][mass]
     return Quantity(result)
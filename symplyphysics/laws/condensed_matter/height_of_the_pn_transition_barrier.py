@@ -1,7 +1,9 @@
-from sympy import (Eq, solve, log)
+from sympy import (Eq, log)
 from sympy.physics.units import boltzmann
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The p-n junction has a potential barrier preventing the movement of charge carriers. If the concentration
@@ -40,10 +42,11 @@ def print_law() -> str:
     temperature_=temperature,
     charge_electron_=charge_electron)
 @validate_output(height_barrier)
+@numeric(law, height_barrier)
 def calculate_height_barrier(donors_concentration_: Quantity, acceptors_concentration_: Quantity,
     charge_carriers_concentration_: Quantity, temperature_: Quantity,
     charge_electron_: Quantity) -> Quantity:
-    result_expr = solve(law, height_barrier, dict=True)[0][height_barrier]
+    result_expr = solved_for(law, height_barrier)
     result_expr = result_expr.subs({
         donors_concentration: donors_concentration_,
         acceptors_concentration: acceptors_concentration_,
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The resistance depends on the temperature. For different materials, the value
@@ -39,9 +41,10 @@ def print_law() -> str:
     temperature_coefficient_=temperature_coefficient,
     temperature_=temperature)
 @validate_output(resistance)
+@numeric(law, resistance)
 def calculate_resistance(resistance_initial_: Quantity, temperature_coefficient_: Quantity,
     temperature_: Quantity) -> Quantity:
-    result_expr = solve(law, resistance, dict=True)[0][resistance]
+    result_expr = solved_for(law, resistance)
     result_expr = result_expr.subs({
         resistance_initial: resistance_initial_,
         temperature_coefficient: temperature_coefficient_,
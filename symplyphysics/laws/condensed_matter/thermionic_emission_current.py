@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, exp)
+from sympy import (Eq, exp)
 from sympy.physics.units import boltzmann
 from symplyphysics import (
     units,
@@ -8,6 +8,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Thermionic emission is the liberation of electrons from an electrode by virtue of its temperature.
@@ -38,8 +40,9 @@ def print_law() -> str:
 
 @validate_input(thermodynamic_work_=thermodynamic_work, temperature_=temperature)
 @validate_output(density_current)
+@numeric(law, density_current)
 def calculate_current(thermodynamic_work_: Quantity, temperature_: Quantity) -> Quantity:
-    result_expr = solve(law, density_current, dict=True)[0][density_current]
+    result_expr = solved_for(law, density_current)
     result_expr = result_expr.subs({
         thermodynamic_work: thermodynamic_work_,
         temperature: temperature_,
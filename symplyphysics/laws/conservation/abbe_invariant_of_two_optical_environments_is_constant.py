@@ -1,7 +1,9 @@
-from sympy import Eq, solve, S
+from sympy import Eq, S
 from symplyphysics import (Symbol, units, print_expression, Quantity,
                            validate_input, validate_output, dimensionless,
                            convert_to)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The point S is located on the front of the optical axis,
@@ -51,13 +53,14 @@ def print_law() -> str:
     distance_from_image_=distance_from_image,
 )
 @validate_output(refraction_index_lens)
+@numeric(law, refraction_index_lens)
 def calculate_refraction_index_lens(
     distance_from_object_: Quantity,
     distance_from_image_: Quantity,
     curvature_radius_: Quantity,
     refraction_index_environment_: float,
 ) -> float:
-    solved = solve(law, refraction_index_lens, dict=True)[0][refraction_index_lens]
+    solved = solved_for(law, refraction_index_lens)
     result_expr = solved.subs({
         curvature_radius: curvature_radius_,
         refraction_index_environment: refraction_index_environment_,
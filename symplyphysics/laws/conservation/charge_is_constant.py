@@ -1,4 +1,4 @@
-from sympy import Eq, solve, dsolve, Derivative
+from sympy import Eq, Derivative
 from symplyphysics import (
     Symbol,
     Function,
@@ -8,6 +8,7 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.budget import budgeted_dsolve, budgeted_solve
 
 # Description
 ## The total charge of any isolated system is conserved.
@@ -32,9 +33,9 @@ def print_law() -> str:
 @validate_input(total_charge_before_=total_charge)
 @validate_output(total_charge)
 def calculate_charge_after(total_charge_before_: Quantity) -> Quantity:
-    dsolved = dsolve(law, total_charge(time))
+    dsolved = budgeted_dsolve(law, total_charge(time))
     dsolved_sub_before = dsolved.subs(total_charge(time), total_charge_before_)
-    C1 = solve(dsolved_sub_before, "C1")[0]
+    C1 = budgeted_solve(dsolved_sub_before, "C1")[0]
     dsolved_sub_after = dsolved.subs("C1", C1)
     result_charge = dsolved_sub_after.rhs
     return Quantity(result_charge)
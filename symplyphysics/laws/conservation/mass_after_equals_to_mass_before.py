@@ -1,7 +1,9 @@
 from sympy import (Eq, solve, dsolve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, Function, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.conservation import mass_is_constant
 
 # Description
@@ -20,20 +22,22 @@ mass = Function("mass", units.mass)
 
 law = Eq(mass(time_after), mass(time_before))
 
-# Derive the same law from constant mass
 
-## dsolve() shows that solution is constant C1
-dsolved = dsolve(mass_is_constant.law, mass_is_constant.mass(mass_is_constant.time))
+# Derive the same law from constant mass
+@proof
+def _derive_law():
+    ## dsolve() shows that solution is constant C1
+    dsolved = dsolve(mass_is_constant.law, mass_is_constant.mass(mass_is_constant.time))
 
-mass_before_eq = dsolved.subs(mass_is_constant.time, time_before)
-mass_before_eq = mass_before_eq.subs(mass_is_constant.mass(time_before), mass(time_before))
-mass_after_eq = dsolved.subs(mass_is_constant.time, time_after)
-mass_after_eq = mass_after_eq.subs(mass_is_constant.mass(time_after), mass(time_after))
+    mass_before_eq = dsolved.subs(mass_is_constant.time, time_before)
+    mass_before_eq = mass_before_eq.subs(mass_is_constant.mass(time_before), mass(time_before))
+    mass_after_eq = dsolved.subs(mass_is_constant.time, time_after)
+    mass_after_eq = mass_after_eq.subs(mass_is_constant.mass(time_after), mass(time_after))
 
-## Show that when mass is constant, mass_before equals to mass_after
-mass_after_solved = solve([mass_after_eq, mass_before_eq], (mass(time_after), "C1"),
-    dict=True)[0][mass(time_after)]
-assert expr_equals(mass_after_solved, law.rhs)
+    ## Show that when mass is constant, mass_before equals to mass_after
+    mass_after_solved = solve([mass_after_eq, mass_before_eq], (mass(time_after), "C1"),
+        dict=True)[0][mass(time_after)]
+    assert expr_equals(mass_after_solved, law.rhs)
 
 
 def print_law() -> str:
@@ -43,6 +47,6 @@ def print_law() -> str:
 @validate_input(mass_before_=mass)
 @validate_output(mass)
 def calculate_mass_after(mass_before_: Quantity) -> Quantity:
-    solved = solve(law, mass(time_after), dict=True)[0][mass(time_after)]
+    solved = solved_for(law, mass(time_after))
     result_expr = solved.subs(mass(time_before), mass_before_)
     return Quantity(result_expr)
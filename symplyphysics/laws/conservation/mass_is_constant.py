@@ -1,6 +1,7 @@
-from sympy import (Eq, dsolve, Derivative)
+from sympy import (Eq, Derivative)
 from symplyphysics import (units, Quantity, Symbol, print_expression, Function, validate_input,
     validate_output)
+from symplyphysics.core.budget import budgeted_dsolve
 
 # Description
 ## The mass is constant in a system that is closed, and mass is not transformed to energy
@@ -33,6 +34,6 @@ def print_law() -> str:
 @validate_input(mass_before_=mass)
 @validate_output(mass)
 def calculate_mass_after(mass_before_: Quantity) -> Quantity:
-    solved = dsolve(law, mass(time))
+    solved = budgeted_dsolve(law, mass(time))
     result_expr = solved.subs("C1", mass_before_).rhs
     return Quantity(result_expr)
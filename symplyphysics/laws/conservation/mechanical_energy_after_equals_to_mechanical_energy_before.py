@@ -1,7 +1,9 @@
 from sympy import (Eq, solve, dsolve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, Function, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.conservation import mechanical_energy_is_constant
 
 # Description
@@ -21,25 +23,28 @@ mechanical_energy = Function("mechanical_energy", units.energy)
 
 law = Eq(mechanical_energy(time_after), mechanical_energy(time_before))
 
-# Derive the same law from constant mechanical energy
-
-## dsolve() shows that solution is constant C1
-dsolved = dsolve(
-    mechanical_energy_is_constant.law,
-    mechanical_energy_is_constant.mechanical_energy(mechanical_energy_is_constant.time))
 
-energy_before_eq = dsolved.subs(mechanical_energy_is_constant.time, time_before)
-energy_before_eq = energy_before_eq.subs(
-    mechanical_energy_is_constant.mechanical_energy(time_before), mechanical_energy(time_before))
-energy_after_eq = dsolved.subs(mechanical_energy_is_constant.time, time_after)
-energy_after_eq = energy_after_eq.subs(mechanical_energy_is_constant.mechanical_energy(time_after),
-    mechanical_energy(time_after))
-
-## Show that when energy is constant, energy_before equals to energy_after
-energy_after_solved = solve([energy_after_eq, energy_before_eq],
-    (mechanical_energy(time_after), "C1"),
-    dict=True)[0][mechanical_energy(time_after)]
-assert expr_equals(energy_after_solved, law.rhs)
+# Derive the same law from constant mechanical energy
+@proof
+def _derive_law():
+    ## dsolve() shows that solution is constant C1
+    dsolved = dsolve(
+        mechanical_energy_is_constant.law,
+        mechanical_energy_is_constant.mechanical_energy(mechanical_energy_is_constant.time))
+
+    energy_before_eq = dsolved.subs(mechanical_energy_is_constant.time, time_before)
+    energy_before_eq = energy_before_eq.subs(
+        mechanical_energy_is_constant.mechanical_energy(time_before),
+        mechanical_energy(time_before))
+    energy_after_eq = dsolved.subs(mechanical_energy_is_constant.time, time_after)
+    energy_after_eq = energy_after_eq.subs(
+        mechanical_energy_is_constant.mechanical_energy(time_after), mechanical_energy(time_after))
+
+    ## Show that when energy is constant, energy_before equals to energy_after
+    energy_after_solved = solve([energy_after_eq, energy_before_eq],
+        (mechanical_energy(time_after), "C1"),
+        dict=True)[0][mechanical_energy(time_after)]
+    assert expr_equals(energy_after_solved, law.rhs)
 
 
 def print_law() -> str:
@@ -49,6 +54,6 @@ def print_law() -> str:
 @validate_input(mechanical_energy_before_=mechanical_energy)
 @validate_output(mechanical_energy)
 def calculate_energy_after(mechanical_energy_before_: Quantity) -> Quantity:
-    solved = solve(law, mechanical_energy(time_after), dict=True)[0][mechanical_energy(time_after)]
+    solved = solved_for(law, mechanical_energy(time_after))
     result_expr = solved.subs(mechanical_energy(time_before), mechanical_energy_before_)
     return Quantity(result_expr)
@@ -1,6 +1,7 @@
-from sympy import (Eq, dsolve, Derivative)
+from sympy import (Eq, Derivative)
 from symplyphysics import (units, Quantity, Symbol, print_expression, Function, validate_input,
     validate_output)
+from symplyphysics.core.budget import budgeted_dsolve
 
 # Description
 ## Mechanical energy, sum of the kinetic energy, or energy of motion, and the potential energy, or energy stored in a system by
@@ -31,6 +32,6 @@ def print_law() -> str:
 @validate_input(mechanical_energy_before_=mechanical_energy)
 @validate_output(mechanical_energy)
 def calculate_energy_after(mechanical_energy_before_: Quantity) -> Quantity:
-    solved = dsolve(law, mechanical_energy(time))
+    solved = budgeted_dsolve(law, mechanical_energy(time))
     result_expr = solved.subs("C1", mechanical_energy_before_).rhs
     return Quantity(result_expr)
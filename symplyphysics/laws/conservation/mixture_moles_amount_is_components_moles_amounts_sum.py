@@ -1,9 +1,10 @@
 from typing import Sequence
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, print_expression, Symbol, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.operations.sum_array import SumArray
-from symplyphysics.core.symbols.symbols import tuple_of_symbols
+from symplyphysics.core.symbols.symbols import cached_tuple_of_symbols
 
 # Description
 ## The total number of moles in the mixture is equal to the sum of the number of moles in each of the components
@@ -29,12 +30,11 @@ def print_law() -> str:
 @validate_input(moles_count_of_mixture_=moles_count_of_mixture)
 @validate_output(units.amount_of_substance)
 def calculate_moles_count_of_mixture(moles_count_of_mixture_: Sequence[Quantity]) -> Quantity:
-    moles_count_of_component_symbols = tuple_of_symbols("moles_count_of_component",
+    moles_count_of_component_symbols = cached_tuple_of_symbols("moles_count_of_component",
         units.amount_of_substance, len(moles_count_of_mixture_))
     moles_counts_of_components_law = law.subs(moles_count_of_components,
         moles_count_of_component_symbols).doit()
-    solved = solve(moles_counts_of_components_law, moles_count_of_mixture,
-        dict=True)[0][moles_count_of_mixture]
+    solved = solved_for(moles_counts_of_components_law, moles_count_of_mixture)
     for (from_, to_) in zip(moles_count_of_component_symbols, moles_count_of_mixture_):
         solved = solved.subs(from_, to_)
     return Quantity(solved)
@@ -1,6 +1,7 @@
-from sympy import (Derivative, Eq, dsolve)
+from sympy import (Derivative, Eq)
 from symplyphysics import (units, Quantity, Symbol, Function, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.budget import budgeted_dsolve
 
 # Description
 ## If there is no external force applied to system of objects, the summary momentum of this system remains constant
@@ -27,6 +28,6 @@ def print_law() -> str:
 @validate_input(momentum_before_=momentum)
 @validate_output(momentum)
 def calculate_momentum_after(momentum_before_: Quantity) -> Quantity:
-    solved = dsolve(law, momentum(time))
+    solved = budgeted_dsolve(law, momentum(time))
     result_expr = solved.subs("C1", momentum_before_).rhs
     return Quantity(result_expr)
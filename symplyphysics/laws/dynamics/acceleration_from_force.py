@@ -1,7 +1,10 @@
-from sympy import (Eq, solve, sympify)
+from sympy import (Eq, sympify)
 from symplyphysics import (Vector, units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.dynamics.vector import acceleration_from_force as acceleration_law_vector
 
 # Description
@@ -13,15 +16,17 @@ acceleration = Symbol("acceleration", units.acceleration)
 
 law = Eq(acceleration, force / mass)
 
-# Derive the same law from vector form
 
-# Scalar law is equivalent to using one-dimensional vectors
-force_vector = Vector([force])
-acceleration_vector = acceleration_law_vector.acceleration_law(force_vector)
-assert len(acceleration_vector.components) == 1
-acceleration_with_mass = sympify(acceleration_vector.components[0]).subs(
-    acceleration_law_vector.mass, mass)
-assert expr_equals(acceleration_with_mass, law.rhs)
+# Derive the same law from vector form
+@proof
+def _derive_law():
+    # Scalar law is equivalent to using one-dimensional vectors
+    force_vector = Vector([force])
+    acceleration_vector = acceleration_law_vector.acceleration_law(force_vector)
+    assert len(acceleration_vector.components) == 1
+    acceleration_with_mass = sympify(acceleration_vector.components[0]).subs(
+        acceleration_law_vector.mass, mass)
+    assert expr_equals(acceleration_with_mass, law.rhs)
 
 
 def print_law() -> str:
@@ -30,7 +35,8 @@ def print_law() -> str:
 
 @validate_input(mass_=mass, acceleration_=acceleration)
 @validate_output(force)
+@numeric(law, force)
 def calculate_force(mass_: Quantity, acceleration_: Quantity) -> Quantity:
-    result_force_expr = solve(law, force, dict=True)[0][force]
+    result_force_expr = solved_for(law, force)
     result_expr = result_force_expr.subs({mass: mass_, acceleration: acceleration_})
     return Quantity(result_expr)
@@ -1,6 +1,7 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
 
 # Description
 ## Any object, totally or partially immersed in a fluid or liquid (or gas), is buoyed up by a force equal to the
@@ -29,7 +30,7 @@ def print_law() -> str:
 @validate_input(fluid_density_=fluid_density, displaced_volume_=displaced_volume)
 @validate_output(force_buoyant)
 def calculate_force_buoyant(fluid_density_: Quantity, displaced_volume_: Quantity) -> Quantity:
-    result_force_expr = solve(law, force_buoyant, dict=True)[0][force_buoyant]
+    result_force_expr = solved_for(law, force_buoyant)
     result_expr = result_force_expr.subs({
         fluid_density: fluid_density_,
         displaced_volume: displaced_volume_
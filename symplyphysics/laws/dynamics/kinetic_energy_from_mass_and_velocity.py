@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 # Kinetic energy of body: EK = (m * v**2) / 2
@@ -21,7 +23,8 @@ def print_law() -> str:
 
 @validate_input(body_mass_=body_mass, body_velocity_=body_velocity)
 @validate_output(kinetic_energy_of_body)
+@numeric(law, kinetic_energy_of_body)
 def calculate_kinetic_energy(body_mass_: Quantity, body_velocity_: Quantity) -> Quantity:
-    result_energy_expr = solve(law, kinetic_energy_of_body, dict=True)[0][kinetic_energy_of_body]
+    result_energy_expr = solved_for(law, kinetic_energy_of_body)
     result_expr = result_energy_expr.subs({body_mass: body_mass_, body_velocity: body_velocity_})
     return Quantity(result_expr)
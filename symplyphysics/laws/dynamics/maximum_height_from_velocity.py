@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 # Description
 ## The maximum height to which a body thrown vertically upwards will rise depends on the initial velocity
 ## Law: h = (v**2)/(2*g)
@@ -19,7 +21,8 @@ def print_law() -> str:
 
 @validate_input(initial_velocity_=initial_velocity)
 @validate_output(maximum_height)
+@numeric(law, maximum_height)
 def calculate_maximum_height(initial_velocity_: Quantity) -> Quantity:
-    result_maximum_height = solve(law, maximum_height, dict=True)[0][maximum_height]
+    result_maximum_height = solved_for(law, maximum_height)
     result_expr = result_maximum_height.subs({initial_velocity: initial_velocity_})
     return Quantity(result_expr)
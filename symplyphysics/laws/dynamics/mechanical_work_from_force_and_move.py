@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Work is measured result of force applied. Mechanical work is the only reason for the object energy to be changed.
@@ -27,7 +29,8 @@ def print_law() -> str:
 
 @validate_input(force_=force, distance_=distance)
 @validate_output(work)
+@numeric(law, work)
 def calculate_work(force_: Quantity, distance_: Quantity) -> Quantity:
-    result_work_expr = solve(law, work, dict=True)[0][work]
+    result_work_expr = solved_for(law, work)
     result_expr = result_work_expr.subs({force: force_, distance: distance_})
     return Quantity(result_expr)
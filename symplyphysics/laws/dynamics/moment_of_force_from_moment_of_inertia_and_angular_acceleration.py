@@ -1,6 +1,8 @@
-from sympy import Eq, solve
+from sympy import Eq
 from symplyphysics import (angle_type, units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The moment of force (the moment of force relative to a point)
@@ -26,9 +28,10 @@ def print_law() -> str:
 
 @validate_input(moment_of_inertia_=moment_of_inertia, angular_acceleration_=angular_acceleration)
 @validate_output(moment_of_force)
+@numeric(law, moment_of_force)
 def calculate_moment_of_force(moment_of_inertia_: Quantity,
     angular_acceleration_: Quantity) -> Quantity:
-    solved = solve(law, moment_of_force, dict=True)[0][moment_of_force]
+    solved = solved_for(law, moment_of_force)
     result_expr = solved.subs({
         moment_of_inertia: moment_of_inertia_,
         angular_acceleration: angular_acceleration_
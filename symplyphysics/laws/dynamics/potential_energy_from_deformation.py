@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Spring accumulates energy while being deformated. This law is known as Hooke's law.
@@ -25,8 +27,9 @@ def print_law() -> str:
 
 @validate_input(elastic_koefficient_=elastic_koefficient, deformation_=deformation)
 @validate_output(spring_energy)
+@numeric(law, spring_energy)
 def calculate_energy(elastic_koefficient_: Quantity, deformation_: Quantity) -> Quantity:
-    result_energy_expr = solve(law, spring_energy, dict=True)[0][spring_energy]
+    result_energy_expr = solved_for(law, spring_energy)
     result_expr = result_energy_expr.subs({
         elastic_koefficient: elastic_koefficient_,
         deformation: deformation_
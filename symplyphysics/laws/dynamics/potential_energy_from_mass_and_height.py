@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Potential energy of body EP = m * g * h
@@ -23,8 +25,8 @@ def print_law() -> str:
 
 @validate_input(body_mass_=body_mass, height_=height)
 @validate_output(potential_energy_of_body)
+@numeric(law, potential_energy_of_body)
 def calculate_potential_energy(body_mass_: Quantity, height_: Quantity) -> Quantity:
-    result_energy_expr = solve(law, potential_energy_of_body,
-        dict=True)[0][potential_energy_of_body]
+    result_energy_expr = solved_for(law, potential_energy_of_body)
     result_expr = result_energy_expr.subs({body_mass: body_mass_, height: height_})
     return Quantity(result_expr)
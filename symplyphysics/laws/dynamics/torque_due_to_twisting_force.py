@@ -11,7 +11,10 @@ from symplyphysics import (
     dot_vectors,
     vector_magnitude,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.core.symbols.quantities import scale_factor
 from symplyphysics.laws.dynamics.vector import torque_vector_of_twisting_force as torque_vector_def
 
@@ -35,28 +38,31 @@ angle = Symbol("angle", angle_type)
 
 law = Eq(torque, distance_to_axis * force * sin(angle))
 
+
 # Derive law from its vector counterpart.
-force_vector = Vector(symbols("force_x:z", real=True))
-position_vector = Vector(symbols("x:z", real=True))
+@proof
+def _derive_law():
+    force_vector = Vector(symbols("force_x:z", real=True))
+    position_vector = Vector(symbols("x:z", real=True))
 
-torque_vector_derived = torque_vector_def.torque_definition(force_vector, position_vector)
-torque_magnitude_derived = vector_magnitude(torque_vector_derived)
+    torque_vector_derived = torque_vector_def.torque_definition(force_vector, position_vector)
+    torque_magnitude_derived = vector_magnitude(torque_vector_derived)
 
-force_magnitude = vector_magnitude(force_vector)
-position_magnitude = vector_magnitude(position_vector)
+    force_magnitude = vector_magnitude(force_vector)
+    position_magnitude = vector_magnitude(position_vector)
 
-# Use the definition of dot product (a, b) = |a| * |b| * cos(a, b) to find the sine of angle between vectors
-cosine_of_angle_in_between = (dot_vectors(force_vector, position_vector) / force_magnitude /
-    position_magnitude)
-sine_of_angle_in_between = sqrt(1 - cosine_of_angle_in_between**2)
+    # Use the definition of dot product (a, b) = |a| * |b| * cos(a, b) to find the sine of angle between vectors
+    cosine_of_angle_in_between = (dot_vectors(force_vector, position_vector) / force_magnitude /
+        position_magnitude)
+    sine_of_angle_in_between = sqrt(1 - cosine_of_angle_in_between**2)
 
-torque_magnitude_from_law = solve(law, torque)[0].subs({
-    force: force_magnitude,
-    distance_to_axis: position_magnitude,
-    sin(angle): sine_of_angle_in_between,
-})
+    torque_magnitude_from_law = solve(law, torque)[0].subs({
+        force: force_magnitude,
+        distance_to_axis: position_magnitude,
+        sin(angle): sine_of_angle_in_between,
+    })
 
-assert expr_equals(torque_magnitude_derived, torque_magnitude_from_law)
+    assert expr_equals(torque_magnitude_derived, torque_magnitude_from_law)
 
 
 def print_law() -> str:
@@ -65,9 +71,10 @@ def print_law() -> str:
 
 @validate_input(force_=force, distance_to_axis_=distance_to_axis, angle_=angle)
 @validate_output(torque)
+@numeric(law, torque)
 def calculate_torque(force_: Quantity, distance_to_axis_: Quantity,
     angle_: Quantity | float) -> Quantity:
-    result = solve(law, torque)[0]
+    result = solved_for(law, torque)
     angle_value = scale_factor(angle_)
     result_torque = result.subs({
         distance_to_axis: distance_to_axis_,
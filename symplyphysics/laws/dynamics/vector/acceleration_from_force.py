@@ -12,6 +12,7 @@ from symplyphysics import (
     list_of_quantities,
 )
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.definitions import (
     momentum_is_mass_times_velocity as momentum_def,
     acceleration_is_velocity_derivative as acceleration_def,
@@ -39,34 +40,36 @@ def force_law(acceleration_: Vector) -> Vector:
 
 # Derive this law from law of force and momentum
 # Condition: mass is constant
-
-time = force_momentum_law.time
-
-momentum_x = Function("momentum_x", units.momentum)
-momentum_y = Function("momentum_y", units.momentum)
-momentum_z = Function("momentum_z", units.momentum)
-momentum_vec = Vector([momentum_x(time), momentum_y(time), momentum_z(time)])
-
-force_derived = force_momentum_law.force_law(momentum_vec)
-
-momentum_def_sub = momentum_def.definition.subs(momentum_def.mass, mass)
-velocity_from_momentum = solve(momentum_def_sub, momentum_def.velocity)[0]
-velocity_vec = Vector([
-    velocity_from_momentum.subs(momentum_def.momentum, momentum_component)
-    for momentum_component in momentum_vec.components
-])
-
-acceleration_def_sub = acceleration_def.definition.rhs.subs(acceleration_def.time, time)
-acceleration_vec = Vector([
-    acceleration_def_sub.subs(acceleration_def.velocity(time), velocity_component)
-    for velocity_component in velocity_vec.components
-])
-
-force_from_law = force_law(acceleration_vec)
-
-for component_derived, component_from_law in zip(force_derived.components,
-    force_from_law.components):
-    assert expr_equals(component_derived, component_from_law)
+@proof
+def _derive_law():
+    time = force_momentum_law.time
+
+    momentum_x = Function("momentum_x", units.momentum)
+    momentum_y = Function("momentum_y", units.momentum)
+    momentum_z = Function("momentum_z", units.momentum)
+    momentum_vec = Vector([momentum_x(time), momentum_y(time), momentum_z(time)])
+
+    force_derived = force_momentum_law.force_law(momentum_vec)
+
+    # pylint: disable-next=assignment-from-no-return
+    momentum_def_sub = momentum_def.definition.subs(momentum_def.mass, mass)
+    velocity_from_momentum = solve(momentum_def_sub, momentum_def.velocity)[0]
+    velocity_vec = Vector([
+        velocity_from_momentum.subs(momentum_def.momentum, momentum_component)
+        for momentum_component in momentum_vec.components
+    ])
+
+    acceleration_def_sub = acceleration_def.definition.rhs.subs(acceleration_def.time, time)
+    acceleration_vec = Vector([
+        acceleration_def_sub.subs(acceleration_def.velocity(time), velocity_component)
+        for velocity_component in velocity_vec.components
+    ])
+
+    force_from_law = force_law(acceleration_vec)
+
+    for component_derived, component_from_law in zip(force_derived.components,
+        force_from_law.components):
+        assert expr_equals(component_derived, component_from_law)
 
 
 @validate_input(mass_=mass, acceleration_=units.acceleration)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve, cos)
+from sympy import (Eq, cos)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, angle_type)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Ampere's law is the law that determines the force with which a magnetic field acts on
@@ -34,9 +36,10 @@ def print_law() -> str:
 
 @validate_input(current_=current, length_=length, angle_=angle, induction_=induction)
 @validate_output(force)
+@numeric(law, force)
 def calculate_force(current_: Quantity, length_: Quantity, angle_: float | Quantity,
     induction_: Quantity) -> Quantity:
-    result_expr = solve(law, force, dict=True)[0][force]
+    result_expr = solved_for(law, force)
     result_expr = result_expr.subs({
         current: current_,
         length: length_,
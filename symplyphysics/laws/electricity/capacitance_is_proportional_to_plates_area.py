@@ -1,7 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import electric_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The basic characteristic of a capacitor is its capacitance - the ability of the capacitor to accumulate an electric charge.
@@ -28,11 +30,14 @@ def print_law() -> str:
     return print_expression(law)
 
 
-@validate_input(plate_area_=plate_area, distance_between_plates_=distance_between_plates)
+@validate_input(dielectric_permeability_=dielectric_permeability,
+    plate_area_=plate_area,
+    distance_between_plates_=distance_between_plates)
 @validate_output(capacitor_capacitance)
+@numeric(law, capacitor_capacitance)
 def calculate_capacitance(dielectric_permeability_: float, plate_area_: Quantity,
     distance_between_plates_: Quantity) -> Quantity:
-    result_capacitance_expr = solve(law, capacitor_capacitance, dict=True)[0][capacitor_capacitance]
+    result_capacitance_expr = solved_for(law, capacitor_capacitance)
     result_expr = result_capacitance_expr.subs({
         dielectric_permeability: dielectric_permeability_,
         plate_area: plate_area_,
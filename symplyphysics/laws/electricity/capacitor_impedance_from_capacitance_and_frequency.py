@@ -1,6 +1,8 @@
-from sympy import (I, Eq, solve)
+from sympy import (I, Eq)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, angle_type)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## While the serial resistance of ideal capacitor is zero, its reactance depends on its capacitance and frequency.
@@ -23,8 +25,9 @@ def print_law() -> str:
 
 @validate_input(capacitance_=capacitor_capacitance, circular_frequency_=circular_frequency)
 @validate_output(capacitor_impedance)
+@numeric(law, capacitor_impedance)
 def calculate_impedance(capacitance_: Quantity, circular_frequency_: Quantity) -> Quantity:
-    result_impedance_expr = solve(law, capacitor_impedance, dict=True)[0][capacitor_impedance]
+    result_impedance_expr = solved_for(law, capacitor_impedance)
     result_expr = result_impedance_expr.subs({
         capacitor_capacitance: capacitance_,
         circular_frequency: circular_frequency_
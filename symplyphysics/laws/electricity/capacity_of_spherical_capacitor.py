@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
 from sympy.physics.units import electric_constant
 from symplyphysics import (
     units,
@@ -9,6 +9,7 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
 
 # Description
 ## A spherical capacitor consists of two concentric spherical plates separated
@@ -42,7 +43,7 @@ def print_law() -> str:
 @validate_output(capacity)
 def calculate_capacity(relative_permittivity_: float, inner_radius_: Quantity,
     outer_radius_: Quantity) -> Quantity:
-    result_expr = solve(law, capacity, dict=True)[0][capacity]
+    result_expr = solved_for(law, capacity)
     result_expr = result_expr.subs({
         relative_permittivity: relative_permittivity_,
         inner_radius: min([inner_radius_, outer_radius_], key=lambda x: x.scale_factor),
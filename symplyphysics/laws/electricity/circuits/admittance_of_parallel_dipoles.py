@@ -1,8 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.operations.sum_array import SumArray
-from symplyphysics.core.symbols.symbols import tuple_of_symbols
+from symplyphysics.core.symbols.symbols import cached_tuple_of_symbols
 
 # Description
 ## If dipoles (resistor, capacitor or coil) are connected in parallel, total admittance is a sum of admittance of each dipole.
@@ -22,9 +23,9 @@ def print_law() -> str:
 @validate_input(admittances_=admittances)
 @validate_output(units.conductance)
 def calculate_parallel_admittance(admittances_: list[Quantity]) -> Quantity:
-    admittance_symbols = tuple_of_symbols("admittance", units.conductance, len(admittances_))
+    admittance_symbols = cached_tuple_of_symbols("admittance", units.conductance, len(admittances_))
     admittances_law = law.subs(admittances, admittance_symbols).doit()
-    solved = solve(admittances_law, parallel_admittance, dict=True)[0][parallel_admittance]
+    solved = solved_for(admittances_law, parallel_admittance)
     for (from_, to_) in zip(admittance_symbols, admittances_):
         solved = solved.subs(from_, to_)
     return Quantity(solved)
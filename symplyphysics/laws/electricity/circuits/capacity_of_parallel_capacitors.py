@@ -1,8 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.operations.sum_array import SumArray
-from symplyphysics.core.symbols.symbols import tuple_of_symbols
+from symplyphysics.core.symbols.symbols import cached_tuple_of_symbols
 
 # Description
 ## If capacitors are connected in parallel, total capacitance is a sum of capacitances of each capacitor.
@@ -22,9 +23,10 @@ def print_law() -> str:
 @validate_input(capacitances_=capacitances)
 @validate_output(units.capacitance)
 def calculate_parallel_capacitance(capacitances_: list[Quantity]) -> Quantity:
-    capacitance_symbols = tuple_of_symbols("capacitance", units.capacitance, len(capacitances_))
+    capacitance_symbols = cached_tuple_of_symbols("capacitance", units.capacitance,
+        len(capacitances_))
     capacitances_law = law.subs(capacitances, capacitance_symbols).doit()
-    solved = solve(capacitances_law, parallel_capacitance, dict=True)[0][parallel_capacitance]
+    solved = solved_for(capacitances_law, parallel_capacitance)
     for (from_, to_) in zip(capacitance_symbols, capacitances_):
         solved = solved.subs(from_, to_)
     return Quantity(solved)
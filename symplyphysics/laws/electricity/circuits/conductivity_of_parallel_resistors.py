@@ -1,8 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.operations.sum_array import SumArray
-from symplyphysics.core.symbols.symbols import tuple_of_symbols
+from symplyphysics.core.symbols.symbols import cached_tuple_of_symbols
 
 # Description
 ## If resistors are connected in parallel, total conductance is a sum of conductances of each resistor.
@@ -22,9 +23,10 @@ def print_law() -> str:
 @validate_input(conductances_=conductances)
 @validate_output(units.conductance)
 def calculate_parallel_conductance(conductances_: list[Quantity]) -> Quantity:
-    conductance_symbols = tuple_of_symbols("conductance", units.conductance, len(conductances_))
+    conductance_symbols = cached_tuple_of_symbols("conductance", units.conductance,
+        len(conductances_))
     conductances_law = law.subs(conductances, conductance_symbols).doit()
-    solved = solve(conductances_law, parallel_conductance, dict=True)[0][parallel_conductance]
+    solved = solved_for(conductances_law, parallel_conductance)
     for (from_, to_) in zip(conductance_symbols, conductances_):
         solved = solved.subs(from_, to_)
     return Quantity(solved)
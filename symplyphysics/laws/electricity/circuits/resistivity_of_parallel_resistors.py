@@ -7,8 +7,11 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.expr_comparisons import expr_equals
-from symplyphysics.core.symbols.symbols import tuple_of_symbols
+from symplyphysics.core.proofs import proof
+from symplyphysics.core.derivation_cache import cached_call
+from symplyphysics.core.symbols.symbols import cached_tuple_of_symbols, tuple_of_symbols
 from symplyphysics.core.operations.sum_array import SumArray
 import symplyphysics.laws.electricity.circuits.conductivity_of_parallel_resistors as parallel_conductivity
 import symplyphysics.definitions.electrical_conductivity_is_inversed_resistance as conductance_definition
@@ -23,35 +26,38 @@ conductances = Symbol("conductances", units.conductance)
 parallel_resistance = Symbol("parallel_resistance", units.impedance)
 law = Eq(parallel_resistance, 1 / SumArray(conductances), evaluate=False)
 
-# Derive the law from the conductivity law for parallel resistors
 
-# Deriving the law for two resistors. Unfortunately, it is not possible to formally derive this for an arbitrary
-# number of resistors due to the proof limitation of sympy. But it is possible to follow the following technique
-# for any other number of resistors to prove the given equivalence.
+# Derive the law from the conductivity law for parallel resistors
+@proof
+def _derive_law():
+    # Deriving the law for two resistors. Unfortunately, it is not possible to formally derive this for an arbitrary
+    # number of resistors due to the proof limitation of sympy. But it is possible to follow the following technique
+    # for any other number of resistors to prove the given equivalence.
 
-resistance1, resistance2 = tuple_of_symbols("resistance", units.impedance, 2)
+    resistance1, resistance2 = tuple_of_symbols("resistance", units.impedance, 2)
 
-conductance1 = solve(
-    conductance_definition.definition.subs(conductance_definition.object_resistance, resistance1),
-    conductance_definition.object_conductivity)[0]
+    conductance1 = solve(
+        conductance_definition.definition.subs(conductance_definition.object_resistance,
+        resistance1), conductance_definition.object_conductivity)[0]
 
-conductance2 = solve(
-    conductance_definition.definition.subs(conductance_definition.object_resistance, resistance2),
-    conductance_definition.object_conductivity)[0]
+    conductance2 = solve(
+        conductance_definition.definition.subs(conductance_definition.object_resistance,
+        resistance2), conductance_definition.object_conductivity)[0]
 
-parallel_conductance = solve(
-    parallel_conductivity.law.subs(parallel_conductivity.conductances,
-    (conductance1, conductance2)), parallel_conductivity.parallel_conductance)[0]
+    parallel_conductance = solve(
+        parallel_conductivity.law.subs(parallel_conductivity.conductances,
+        (conductance1, conductance2)), parallel_conductivity.parallel_conductance)[0]
 
-parallel_resistance_from_conductivity_law = solve(
-    conductance_definition.definition.subs(conductance_definition.object_conductivity,
-    parallel_conductance), conductance_definition.object_resistance)[0]
+    parallel_resistance_from_conductivity_law = cached_call(
+        __name__, "parallel_resistance_from_conductivity_law", solve,
+        conductance_definition.definition.subs(conductance_definition.object_conductivity,
+        parallel_conductance), conductance_definition.object_resistance)[0]
 
-parallel_resistance_from_law_in_question = solve(
-    law.subs(conductances, (conductance1, conductance2)), parallel_resistance)[0]
+    parallel_resistance_from_law_in_question = solve(
+        law.subs(conductances, (conductance1, conductance2)), parallel_resistance)[0]
 
-assert expr_equals(parallel_resistance_from_conductivity_law,
-    parallel_resistance_from_law_in_question)
+    assert expr_equals(parallel_resistance_from_conductivity_law,
+        parallel_resistance_from_law_in_question)
 
 
 def print_law() -> str:
@@ -63,9 +69,10 @@ def print_law() -> str:
 def calculate_parallel_resistance(resistances_: list[Quantity]) -> Quantity:
     conductances_ = tuple(
         conductance_definition.calculate_conductivity(resistance) for resistance in resistances_)
-    conductance_symbols = tuple_of_symbols("conductance", units.conductance, len(conductances_))
+    conductance_symbols = cached_tuple_of_symbols("conductance", units.conductance,
+        len(conductances_))
     resistances_law = law.subs(conductances, conductance_symbols).doit()
-    solved = solve(resistances_law, parallel_resistance, dict=True)[0][parallel_resistance]
+    solved = solved_for(resistances_law, parallel_resistance)
     for symbol, value in zip(conductance_symbols, conductances_):
         solved = solved.subs(symbol, value)
     return Quantity(solved)
@@ -1,6 +1,10 @@
 from sympy import (Derivative, Eq, solve, exp, simplify)
 from symplyphysics import (units, Quantity, Symbol, Function, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
+from symplyphysics.core.proofs import proof
+from symplyphysics.core.derivation_cache import cached_call
 from symplyphysics.core.symbols.symbols import tuple_of_symbols
 from symplyphysics.definitions import current_is_charge_derivative as charge_definition
 from symplyphysics.definitions import capacitance_from_charge_and_voltage as capacitance_definition
@@ -29,78 +33,89 @@ capacitor_voltage = Function("capacitor_voltage", units.voltage)
 
 law = Eq(capacitor_voltage(time), initial_voltage * (1 - exp(-time / (capacitance * resistance))))
 
-## Derive the same law from the Ohms and Kirchhoff laws
 
-capacitor_current = Function("capacitor_current", units.current)
-resistor_current = Function("resistor_current", units.current)
-resistor_voltage = Function("resistor_voltage", units.voltage)
-
-current_symbols = tuple_of_symbols("current", units.current, 2)
-two_currents_law = kirchhoff_law.law.subs(kirchhoff_law.currents, current_symbols).doit()
-# capacitor current is in, resistor current is out
-two_currents_applied = two_currents_law.subs({
-    current_symbols[0]: capacitor_current(time),
-    current_symbols[1]: -1 * resistor_current(time)
-})
-capacitor_current_applied = solve(two_currents_applied, capacitor_current(time),
-    dict=True)[0][capacitor_current(time)]
-capacitor_current_eq = Eq(capacitor_current(time), capacitor_current_applied)
-
-## 1. Prove that capacitor_current(time) = resistor_current(time)
-assert capacitor_current_eq.lhs == capacitor_current(time)
-assert capacitor_current_eq.rhs == resistor_current(time)
-
-voltage_symbols = tuple_of_symbols("voltage", units.voltage, 3)
-three_voltages_law = kirchhoff_law_2.law.subs(kirchhoff_law_2.voltages, voltage_symbols).doit()
-# initial_voltage is voltage source, capacitor and resistor are voltage consumers
-three_voltages_applied = three_voltages_law.subs({
-    voltage_symbols[0]: -1 * capacitor_voltage(time),
-    voltage_symbols[1]: -1 * resistor_voltage(time),
-    voltage_symbols[2]: initial_voltage
-})
-resistor_voltage_applied = solve(three_voltages_applied, resistor_voltage(time),
-    dict=True)[0][resistor_voltage(time)]
-resistor_voltage_eq = Eq(resistor_voltage(time), resistor_voltage_applied)
-
-## 2. Prove that resistor_voltage(time) = initial_voltage - capacitor_voltage(time)
-assert resistor_voltage_eq.rhs == initial_voltage - capacitor_voltage(time)
-
-# use resistor_voltage as proven in resistor_voltage_eq
-# use charge_definition.current since it is same on resistor and capacitor as proven in capacitor_current_eq
-resistor_ohm_eq = ohms_law.law.subs({
-    ohms_law.voltage: initial_voltage - capacitor_voltage(time),
-    ohms_law.resistance: resistance,
-    ohms_law.current: charge_definition.current(time)
-})
-capacitance_eq = capacitance_definition.definition.subs({
-    capacitance_definition.capacitance: capacitance,
-    capacitance_definition.charge: charge_definition.charge(time),
-    capacitance_definition.voltage: capacitor_voltage(time)
-})
-charge_eq = charge_definition.definition.subs(charge_definition.time, time)
-
-derived_law = [resistor_ohm_eq, capacitance_eq, charge_eq]
-
-solved_charge_function = solve(derived_law,
-    (capacitor_voltage(time), charge_definition.current(time), charge_definition.charge(time)),
-    dict=True)[0][charge_definition.charge(time)]
-charge_diff_eq = Eq(charge_definition.charge(time), solved_charge_function)
-
-## 3. Prove that charge(time) = capacitance * initial_voltage - capacitance * resistance * Derivative(charge(time), time))
-## Q(t) = U0 * C - R * C * dQ(t) / dt
-capacitor_charge_function = initial_voltage * capacitance - resistance * capacitance * Derivative(
-    charge_definition.charge(time), time)
-assert simplify(charge_diff_eq.rhs - capacitor_charge_function) == 0
-
-## 4. Convert charge to capacitor voltage
-capacitor_voltage_solved = solve(capacitance_eq, charge_definition.charge(time),
-    dict=True)[0][charge_definition.charge(time)]
-voltage_diff_eq = charge_diff_eq.subs(charge_definition.charge(time), capacitor_voltage_solved)
-
-## 5. Solve differential equation
-# HACK: use known solution since sympy.dsolve() gives us another result
-voltage_diff_solution = voltage_diff_eq.subs(capacitor_voltage(time), law.rhs)
-assert simplify(voltage_diff_solution.lhs - voltage_diff_solution.rhs) == 0
+## Derive the same law from the Ohms and Kirchhoff laws
+@proof
+def _derive_law():
+    capacitor_current = Function("capacitor_current", units.current)
+    resistor_current = Function("resistor_current", units.current)
+    resistor_voltage = Function("resistor_voltage", units.voltage)
+
+    current_symbols = tuple_of_symbols("current", units.current, 2)
+    two_currents_law = kirchhoff_law.law.subs(kirchhoff_law.currents, current_symbols).doit()
+    # capacitor current is in, resistor current is out
+    two_currents_applied = two_currents_law.subs({
+        current_symbols[0]: capacitor_current(time),
+        current_symbols[1]: -1 * resistor_current(time)
+    })
+    capacitor_current_applied = solve(two_currents_applied, capacitor_current(time),
+        dict=True)[0][capacitor_current(time)]
+    capacitor_current_eq = Eq(capacitor_current(time), capacitor_current_applied)
+
+    ## 1. Prove that capacitor_current(time) = resistor_current(time)
+    assert capacitor_current_eq.lhs == capacitor_current(time)
+    assert capacitor_current_eq.rhs == resistor_current(time)
+
+    voltage_symbols = tuple_of_symbols("voltage", units.voltage, 3)
+    three_voltages_law = kirchhoff_law_2.law.subs(kirchhoff_law_2.voltages, voltage_symbols).doit()
+    # initial_voltage is voltage source, capacitor and resistor are voltage consumers
+    three_voltages_applied = three_voltages_law.subs({
+        voltage_symbols[0]: -1 * capacitor_voltage(time),
+        voltage_symbols[1]: -1 * resistor_voltage(time),
+        voltage_symbols[2]: initial_voltage
+    })
+    resistor_voltage_applied = solve(three_voltages_applied, resistor_voltage(time),
+        dict=True)[0][resistor_voltage(time)]
+    resistor_voltage_eq = Eq(resistor_voltage(time), resistor_voltage_applied)
+
+    ## 2. Prove that resistor_voltage(time) = initial_voltage - capacitor_voltage(time)
+    assert resistor_voltage_eq.rhs == initial_voltage - capacitor_voltage(time)
+
+    # use resistor_voltage as proven in resistor_voltage_eq
+    # use charge_definition.current since it is same on resistor and capacitor as proven in capacitor_current_eq
+    # pylint: disable-next=assignment-from-no-return
+    resistor_ohm_eq = ohms_law.law.subs({
+        ohms_law.voltage: initial_voltage - capacitor_voltage(time),
+        ohms_law.resistance: resistance,
+        ohms_law.current: charge_definition.current(time)
+    })
+    # pylint: disable-next=assignment-from-no-return
+    capacitance_eq = capacitance_definition.definition.subs({
+        capacitance_definition.capacitance: capacitance,
+        capacitance_definition.charge: charge_definition.charge(time),
+        capacitance_definition.voltage: capacitor_voltage(time)
+    })
+    # pylint: disable-next=assignment-from-no-return
+    charge_eq = charge_definition.definition.subs(charge_definition.time, time)
+
+    derived_law = [resistor_ohm_eq, capacitance_eq, charge_eq]
+
+    solved_charge_function = cached_call(__name__,
+        "solved_charge_function",
+        solve,
+        derived_law,
+        (capacitor_voltage(time), charge_definition.current(time), charge_definition.charge(time)),
+        dict=True)[0][charge_definition.charge(time)]
+    charge_diff_eq = Eq(charge_definition.charge(time), solved_charge_function)
+
+    ## 3. Prove that charge(time) = capacitance * initial_voltage - capacitance * resistance * Derivative(charge(time), time))
+    ## Q(t) = U0 * C - R * C * dQ(t) / dt
+    capacitor_charge_function = initial_voltage * capacitance - resistance * capacitance * Derivative(
+        charge_definition.charge(time), time)
+    assert cached_call(__name__, "charge_difference", simplify,
+        charge_diff_eq.rhs - capacitor_charge_function) == 0
+
+    ## 4. Convert charge to capacitor voltage
+    capacitor_voltage_solved = solve(capacitance_eq, charge_definition.charge(time),
+        dict=True)[0][charge_definition.charge(time)]
+    # pylint: disable-next=assignment-from-no-return
+    voltage_diff_eq = charge_diff_eq.subs(charge_definition.charge(time), capacitor_voltage_solved)
+
+    ## 5. Solve differential equation
+    # HACK: use known solution since sympy.dsolve() gives us another result
+    voltage_diff_solution = voltage_diff_eq.subs(capacitor_voltage(time), law.rhs)
+    assert cached_call(__name__, "voltage_difference", simplify,
+        voltage_diff_solution.lhs - voltage_diff_solution.rhs) == 0
 
 
 def print_law() -> str:
@@ -112,10 +127,10 @@ def print_law() -> str:
     resistance_=resistance,
     time_=time)
 @validate_output(capacitor_voltage)
+@numeric(law, capacitor_voltage(time))
 def calculate_capacitor_voltage(initial_voltage_: Quantity, capacitance_: Quantity,
     resistance_: Quantity, time_: Quantity) -> Quantity:
-    capacitor_voltage_expr = solve(law, capacitor_voltage(time),
-        dict=True)[0][capacitor_voltage(time)]
+    capacitor_voltage_expr = solved_for(law, capacitor_voltage(time))
     result_expr = capacitor_voltage_expr.subs({
         initial_voltage: initial_voltage_,
         resistance: resistance_,
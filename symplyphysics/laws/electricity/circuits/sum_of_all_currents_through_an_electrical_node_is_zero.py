@@ -1,8 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (Symbol, units, Quantity, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.operations.sum_array import SumArray
-from symplyphysics.core.symbols.symbols import tuple_of_symbols
+from symplyphysics.core.symbols.symbols import cached_tuple_of_symbols
 
 # Description
 ## sum(I) = 0
@@ -25,10 +26,10 @@ def print_law() -> str:
 @validate_input(currents_=currents)
 @validate_output(units.current)
 def calculate_current_from_array(currents_: list[Quantity]) -> Quantity:
-    current_symbols = tuple_of_symbols("current", units.current, len(currents_) + 1)
+    current_symbols = cached_tuple_of_symbols("current", units.current, len(currents_) + 1)
     unknown_current = current_symbols[len(currents_)]
     currents_law = law.subs(currents, current_symbols).doit()
-    solved = solve(currents_law, unknown_current, dict=True)[0][unknown_current]
+    solved = solved_for(currents_law, unknown_current)
     for (from_, to_) in zip(current_symbols, currents_):
         solved = solved.subs(from_, to_)
     return Quantity(solved)
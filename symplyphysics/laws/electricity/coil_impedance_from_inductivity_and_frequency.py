@@ -1,6 +1,8 @@
-from sympy import (I, Eq, solve)
+from sympy import (I, Eq)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, angle_type)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The impedance of ideal coil depends on its inductivity and frequency. While having zero resistivity, the real part of
@@ -24,8 +26,9 @@ def print_law() -> str:
 
 @validate_input(inductivity_=coil_inductivity, circular_frequency_=circular_frequency)
 @validate_output(coil_impedance)
+@numeric(law, coil_impedance)
 def calculate_impedance(inductivity_: Quantity, circular_frequency_: Quantity) -> Quantity:
-    result_impedance_expr = solve(law, coil_impedance, dict=True)[0][coil_impedance]
+    result_impedance_expr = solved_for(law, coil_impedance)
     result_expr = result_impedance_expr.subs({
         coil_inductivity: inductivity_,
         circular_frequency: circular_frequency_
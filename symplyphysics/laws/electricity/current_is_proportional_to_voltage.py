@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Current flowing through the resistor is proportional to applied voltage and reversly proportional to impedance of that resistor
@@ -22,7 +24,8 @@ def print_law() -> str:
 
 @validate_input(voltage_=voltage, resistance_=resistance)
 @validate_output(current)
+@numeric(law, current)
 def calculate_current(voltage_: Quantity, resistance_: Quantity) -> Quantity:
-    result_current_expr = solve(law, current, dict=True)[0][current]
+    result_current_expr = solved_for(law, current)
     result_expr = result_current_expr.subs({voltage: voltage_, resistance: resistance_})
     return Quantity(result_expr)
@@ -1,7 +1,10 @@
 from sympy import (Eq, solve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.electricity import power_from_energy_time as power_and_time
 from symplyphysics.laws.electricity import current_is_proportional_to_voltage as ohm_law
 from symplyphysics.laws.electricity import amount_energy_from_voltage_time_resistance as joule_lenz_law
@@ -20,26 +23,31 @@ resistance = Symbol("resistance", units.impedance)
 
 law = Eq(heat_power, current**2 * resistance)
 
-# This law might be easily derived via Joule-Lenz law and dependence of power from energy and time
-
-ohm_law_applied = ohm_law.law.subs({
-    ohm_law.voltage: joule_lenz_law.voltage,
-    ohm_law.current: current,
-    ohm_law.resistance: resistance
-})
-power_and_time_applied = power_and_time.law.subs({
-    power_and_time.energy: joule_lenz_law.amount_energy,
-    power_and_time.time: joule_lenz_law.time
-})
-joule_lenz_law_applied = joule_lenz_law.law.subs({joule_lenz_law.resistance: resistance})
 
-law_derived = [ohm_law_applied, power_and_time_applied, joule_lenz_law_applied]
-power_derived = solve(law_derived,
-    (joule_lenz_law.voltage, joule_lenz_law.amount_energy, power_and_time.power),
-    dict=True)[0][power_and_time.power]
-
-# Check if derived power is same as declared
-assert expr_equals(power_derived, law.rhs)
+# This law might be easily derived via Joule-Lenz law and dependence of power from energy and time
+@proof
+def _derive_law():
+    # pylint: disable-next=assignment-from-no-return
+    ohm_law_applied = ohm_law.law.subs({
+        ohm_law.voltage: joule_lenz_law.voltage,
+        ohm_law.current: current,
+        ohm_law.resistance: resistance
+    })
+    # pylint: disable-next=assignment-from-no-return
+    power_and_time_applied = power_and_time.law.subs({
+        power_and_time.energy: joule_lenz_law.amount_energy,
+        power_and_time.time: joule_lenz_law.time
+    })
+    # pylint: disable-next=assignment-from-no-return
+    joule_lenz_law_applied = joule_lenz_law.law.subs({joule_lenz_law.resistance: resistance})
+
+    law_derived = [ohm_law_applied, power_and_time_applied, joule_lenz_law_applied]
+    power_derived = solve(law_derived,
+        (joule_lenz_law.voltage, joule_lenz_law.amount_energy, power_and_time.power),
+        dict=True)[0][power_and_time.power]
+
+    # Check if derived power is same as declared
+    assert expr_equals(power_derived, law.rhs)
 
 
 def print_law() -> str:
@@ -48,7 +56,8 @@ def print_law() -> str:
 
 @validate_input(current_=current, resistance_=resistance)
 @validate_output(heat_power)
+@numeric(law, heat_power)
 def calculate_heat_power(current_: Quantity, resistance_: Quantity) -> Quantity:
-    result_power_expr = solve(law, heat_power, dict=True)[0][heat_power]
+    result_power_expr = solved_for(law, heat_power)
     result_expr = result_power_expr.subs({current: current_, resistance: resistance_})
     return Quantity(result_expr)
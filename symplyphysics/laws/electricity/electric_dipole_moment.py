@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The electric dipole moment is a measure of the separation of positive and negative electrical charges within a system,
@@ -32,8 +34,9 @@ def print_law() -> str:
 
 @validate_input(charge_=charge, distance_=distance)
 @validate_output(electric_moment)
+@numeric(law, electric_moment)
 def calculate_electric_moment(charge_: Quantity, distance_: Quantity) -> Quantity:
-    result_expr = solve(law, electric_moment, dict=True)[0][electric_moment]
+    result_expr = solved_for(law, electric_moment)
     result_expr = result_expr.subs({
         charge: charge_,
         distance: distance_,
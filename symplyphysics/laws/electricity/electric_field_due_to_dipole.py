@@ -8,7 +8,10 @@ from symplyphysics import (
     validate_output,
     dimensionless,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.electricity import electric_field_due_to_point_charge as point_field
 from symplyphysics.laws.electricity import electric_dipole_moment
 
@@ -33,58 +36,61 @@ distance_to_dipole = Symbol("distance_to_dipole", units.length)
 
 law = Eq(electric_field, 2 * units.coulomb_constant * dipole_moment / distance_to_dipole**3)
 
+
 # Derive the law from the expression for the electric field of point charges.
 # Assuming the dipole is made up of two point charges q and -q (q > 0) with distance d in between.
 # Assume the z-axis running through both charges, and let its origin be at their middle point,
 # the negative charge located below and the positive one above the origin.
+@proof
+def _derive_law():
+    charge = Symbol("charge", units.charge)
+    distance_between_charges = Symbol("distance_between_charges", units.length)
+    distance_to_origin = Symbol("distance_to_origin", units.length)
+
+    positive_charge_field = point_field.law.rhs.subs({
+        point_field.point_charge: charge,
+        point_field.distance: distance_to_origin - distance_between_charges / 2
+    })
+    negative_charge_field = point_field.law.rhs.subs({
+        point_field.point_charge: -charge,
+        point_field.distance: distance_to_origin + distance_between_charges / 2
+    })
 
-charge = Symbol("charge", units.charge)
-distance_between_charges = Symbol("distance_between_charges", units.length)
-distance_to_origin = Symbol("distance_to_origin", units.length)
-
-positive_charge_field = point_field.law.rhs.subs({
-    point_field.point_charge: charge,
-    point_field.distance: distance_to_origin - distance_between_charges / 2
-})
-negative_charge_field = point_field.law.rhs.subs({
-    point_field.point_charge: -charge,
-    point_field.distance: distance_to_origin + distance_between_charges / 2
-})
-
-# The net electric field is the sum of electric fields due to both charges
-net_field = positive_charge_field + negative_charge_field
+    # The net electric field is the sum of electric fields due to both charges
+    net_field = positive_charge_field + negative_charge_field
 
-# The condition that distance_to_origin/distance_between_charges >> 1 can be analyzed as such:
-# Let distance_between_charges = factor * distance_to_origin, where factor -> 0.
-factor = Symbol("factor", dimensionless)
+    # The condition that distance_to_origin/distance_between_charges >> 1 can be analyzed as such:
+    # Let distance_between_charges = factor * distance_to_origin, where factor -> 0.
+    factor = Symbol("factor", dimensionless)
 
-# Use the above definition of factor to substitute distance_to_origin in the net_field formula
-net_field_sub = net_field.subs(distance_between_charges, factor * distance_to_origin)
+    # Use the above definition of factor to substitute distance_to_origin in the net_field formula
+    net_field_sub = net_field.subs(distance_between_charges, factor * distance_to_origin)
 
-# Expand net_field_sub with respect to factor around 0 up to the first power
-# in order to find the first approximation of the current formula.
-net_field_approx = series(net_field_sub, factor, 0, 2).removeO()
+    # Expand net_field_sub with respect to factor around 0 up to the first power
+    # in order to find the first approximation of the current formula.
+    net_field_approx = series(net_field_sub, factor, 0, 2).removeO()
 
-# Substitute distance_to_origin back into the net_field formula
-net_field_approx_sub = net_field_approx.subs(factor, distance_between_charges / distance_to_origin)
+    # Substitute distance_to_origin back into the net_field formula
+    net_field_approx_sub = net_field_approx.subs(factor,
+        distance_between_charges / distance_to_origin)
 
-# Replace charge*distance_between_charges back with dipole_moment
-net_field_derived = solve(
-    [
-    Eq(electric_field, net_field_approx_sub),
-    electric_dipole_moment.law.subs({
-    electric_dipole_moment.electric_moment: dipole_moment,
-    electric_dipole_moment.charge: charge,
-    electric_dipole_moment.distance: distance_between_charges,
-    }),
-    ],
-    (charge, electric_field),
-    dict=True,
-)[0][electric_field]
+    # Replace charge*distance_between_charges back with dipole_moment
+    net_field_derived = solve(
+        [
+        Eq(electric_field, net_field_approx_sub),
+        electric_dipole_moment.law.subs({
+        electric_dipole_moment.electric_moment: dipole_moment,
+        electric_dipole_moment.charge: charge,
+        electric_dipole_moment.distance: distance_between_charges,
+        }),
+        ],
+        (charge, electric_field),
+        dict=True,
+    )[0][electric_field]
 
-net_field_from_law = law.rhs.subs(distance_to_dipole, distance_to_origin)
+    net_field_from_law = law.rhs.subs(distance_to_dipole, distance_to_origin)
 
-assert expr_equals(net_field_from_law, net_field_derived)
+    assert expr_equals(net_field_from_law, net_field_derived)
 
 
 def print_law() -> str:
@@ -93,8 +99,9 @@ def print_law() -> str:
 
 @validate_input(dipole_moment_=dipole_moment, distance_to_dipole_=distance_to_dipole)
 @validate_output(electric_field)
+@numeric(law, electric_field)
 def calculate_electric_field(dipole_moment_: Quantity, distance_to_dipole_: Quantity) -> Quantity:
-    result = solve(law, electric_field)[0]
+    result = solved_for(law, electric_field)
     result_field = result.subs({
         dipole_moment: dipole_moment_,
         distance_to_dipole: distance_to_dipole_,
@@ -7,7 +7,10 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.electricity import force_from_charge_and_distance as coulombs_law
 from symplyphysics.laws.electricity import electric_field_value_is_force_over_test_charge as electric_field_def
 
@@ -27,25 +30,29 @@ distance = Symbol("distance", units.length)
 
 law = Eq(electric_field, units.coulomb_constant * point_charge / distance**2)
 
-# Derive this law from Coulomb's law and the definition of electric field
 
-test_charge = Symbol("test_charge", units.charge)
+# Derive this law from Coulomb's law and the definition of electric field
+@proof
+def _derive_law():
+    test_charge = Symbol("test_charge", units.charge)
 
-coulombs_law_sub = coulombs_law.law.subs({
-    coulombs_law.first_charge: point_charge,
-    coulombs_law.second_charge: test_charge,
-    coulombs_law.distance: distance,
-})
-force = solve(coulombs_law_sub, coulombs_law.force)[0]
+    # pylint: disable-next=assignment-from-no-return
+    coulombs_law_sub = coulombs_law.law.subs({
+        coulombs_law.first_charge: point_charge,
+        coulombs_law.second_charge: test_charge,
+        coulombs_law.distance: distance,
+    })
+    force = solve(coulombs_law_sub, coulombs_law.force)[0]
 
-electric_field_def_sub = electric_field_def.law.subs({
-    electric_field_def.electrostatic_force: force,
-    electric_field_def.test_charge: test_charge,
-})
-electric_field_derived = solve(electric_field_def_sub, electric_field_def.electric_field)[0]
-electric_field_from_law = law.rhs
+    # pylint: disable-next=assignment-from-no-return
+    electric_field_def_sub = electric_field_def.law.subs({
+        electric_field_def.electrostatic_force: force,
+        electric_field_def.test_charge: test_charge,
+    })
+    electric_field_derived = solve(electric_field_def_sub, electric_field_def.electric_field)[0]
+    electric_field_from_law = law.rhs
 
-assert expr_equals(electric_field_from_law, electric_field_derived)
+    assert expr_equals(electric_field_from_law, electric_field_derived)
 
 
 def print_law() -> str:
@@ -54,8 +61,9 @@ def print_law() -> str:
 
 @validate_input(point_charge_=point_charge, distance_=distance)
 @validate_output(electric_field)
+@numeric(law, electric_field)
 def calculate_electric_field(point_charge_: Quantity, distance_: Quantity) -> Quantity:
-    result = solve(law, electric_field)[0]
+    result = solved_for(law, electric_field)
     result_field = result.subs({
         point_charge: point_charge_,
         distance: distance_,
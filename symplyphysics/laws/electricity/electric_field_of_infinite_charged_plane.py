@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import electric_constant
 from symplyphysics import (
     units,
@@ -8,6 +8,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## An infinite plane has an arbitrary surface charge density. The tension lines are perpendicular
@@ -32,8 +34,9 @@ def print_law() -> str:
 
 @validate_input(surface_charge_density_=surface_charge_density)
 @validate_output(electric_intensity)
+@numeric(law, electric_intensity)
 def calculate_electric_intensity(surface_charge_density_: Quantity) -> Quantity:
-    result_expr = solve(law, electric_intensity, dict=True)[0][electric_intensity]
+    result_expr = solved_for(law, electric_intensity)
     result_expr = result_expr.subs({
         surface_charge_density: surface_charge_density_,
     })
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
 from sympy.physics.units import electric_constant
 from symplyphysics import (
     units,
@@ -8,6 +8,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Let there be a uniformly charged sphere. Outside a uniformly charged sphere, the electric field
@@ -35,8 +37,9 @@ def print_law() -> str:
 
 @validate_input(charge_=charge, distance_=distance)
 @validate_output(electric_intensity)
+@numeric(law, electric_intensity)
 def calculate_electric_intensity(charge_: Quantity, distance_: Quantity) -> Quantity:
-    result_expr = solve(law, electric_intensity, dict=True)[0][electric_intensity]
+    result_expr = solved_for(law, electric_intensity)
     result_expr = result_expr.subs({
         charge: charge_,
         distance: distance_,
@@ -1,4 +1,4 @@
-from sympy import Eq, solve
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 
@@ -28,8 +30,9 @@ def print_law() -> str:
 
 @validate_input(electrostatic_force_=electrostatic_force, test_charge_=test_charge)
 @validate_output(electric_field)
+@numeric(law, electric_field)
 def calculate_electric_field(electrostatic_force_: Quantity, test_charge_: Quantity) -> Quantity:
-    result = solve(law, electric_field)[0]
+    result = solved_for(law, electric_field)
     result_field = result.subs({
         electrostatic_force: electrostatic_force_,
         test_charge: test_charge_,
@@ -1,7 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import faraday_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solvers import solved_for
 
 # Description
 ## Faraday's second law of electrolysis. The equivalent mass of a substance in general in chemistry is its molar mass divided by an integer
@@ -35,7 +36,7 @@ def calculate_equivalent(molar_mass_: Quantity, valence_: int) -> Quantity:
     if valence_ <= 0:
         raise ValueError("valence_ must be greater than 0.")
 
-    result_expr = solve(law, equivalent, dict=True)[0][equivalent]
+    result_expr = solved_for(law, equivalent)
     result_expr = result_expr.subs({
         molar_mass: molar_mass_,
         valence: valence_,
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Capacitor can accumlate energy in the electric field inside it.
@@ -22,7 +24,8 @@ def print_law() -> str:
 
 @validate_input(capacitance_=capacitance, voltage_=voltage)
 @validate_output(accumulated_energy)
+@numeric(law, accumulated_energy)
 def calculate_accumulated_energy(capacitance_: Quantity, voltage_: Quantity) -> Quantity:
-    result_energy_expr = solve(law, accumulated_energy, dict=True)[0][accumulated_energy]
+    result_energy_expr = solved_for(law, accumulated_energy)
     result_expr = result_energy_expr.subs({capacitance: capacitance_, voltage: voltage_})
     return Quantity(result_expr)
@@ -1,7 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import electric_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## In physics, energy density or volumic energy is the amount of energy stored in a given system or region of space per unit volume.
@@ -29,9 +31,10 @@ def print_law() -> str:
 @validate_input(relative_permittivity_=relative_permittivity,
     electric_intensity_=electric_intensity)
 @validate_output(energy_density)
+@numeric(law, energy_density)
 def calculate_energy_density(relative_permittivity_: float,
     electric_intensity_: Quantity) -> Quantity:
-    result_expr = solve(law, energy_density, dict=True)[0][energy_density]
+    result_expr = solved_for(law, energy_density)
     result_expr = result_expr.subs({
         relative_permittivity: relative_permittivity_,
         electric_intensity: electric_intensity_,
@@ -1,7 +1,9 @@
 from sympy.physics.units import elementary_charge
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## There is an expression for the total energy of the hydrogen atom according to Bohr's theory.
@@ -26,7 +28,8 @@ def print_law() -> str:
 
 @validate_input(radius_of_electron_=radius_of_electron)
 @validate_output(energy_of_electron)
+@numeric(law, energy_of_electron)
 def calculate_energy_of_electron(radius_of_electron_: Quantity) -> Quantity:
-    result_expr = solve(law, energy_of_electron, dict=True)[0][energy_of_electron]
+    result_expr = solved_for(law, energy_of_electron)
     result = result_expr.subs(radius_of_electron, radius_of_electron_)
     return Quantity(result)
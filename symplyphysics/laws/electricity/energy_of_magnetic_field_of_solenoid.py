@@ -1,7 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import magnetic_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## A solenoid is a cylindrical coil consisting of a large number of turns of wire forming a helical line.
@@ -29,9 +31,10 @@ def print_law() -> str:
 
 @validate_input(relative_permeability_=relative_permeability, intensity_=intensity, volume_=volume)
 @validate_output(energy)
+@numeric(law, energy)
 def calculate_energy(relative_permeability_: float, intensity_: Quantity,
     volume_: Quantity) -> Quantity:
-    result_energy_expr = solve(law, energy, dict=True)[0][energy]
+    result_energy_expr = solved_for(law, energy)
     result_expr = result_energy_expr.subs({
         relative_permeability: relative_permeability_,
         intensity: intensity_,
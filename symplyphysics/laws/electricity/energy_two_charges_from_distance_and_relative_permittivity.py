@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
 from sympy.physics.units import electric_constant
 from symplyphysics import (
     units,
@@ -9,6 +9,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Potential energy is a function of the state of the system. The zero value is taken when the charges are infinitely
@@ -43,9 +45,10 @@ def print_law() -> str:
     charge_1_=charge_1,
     charge_2_=charge_2)
 @validate_output(energy)
+@numeric(law, energy)
 def calculate_energy(relative_permittivity_: float, distance_: Quantity, charge_1_: Quantity,
     charge_2_: Quantity) -> Quantity:
-    result_expr = solve(law, energy, dict=True)[0][energy]
+    result_expr = solved_for(law, energy)
     result_expr = result_expr.subs({
         relative_permittivity: relative_permittivity_,
         distance: distance_,
@@ -1,7 +1,9 @@
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
 from sympy.physics.units import magnetic_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Two parallel wires through which current flows interact with each other.
@@ -40,9 +42,10 @@ def print_law() -> str:
     length_=length,
     distance_=distance)
 @validate_output(force)
+@numeric(law, force)
 def calculate_force(relative_permeability_: float, first_wire_current_: Quantity,
     second_wire_current_: Quantity, length_: Quantity, distance_: Quantity) -> Quantity:
-    result_expr = solve(law, force, dict=True)[0][force]
+    result_expr = solved_for(law, force)
     result_expr = result_expr.subs({
         relative_permeability: relative_permeability_,
         first_wire_current: first_wire_current_,
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Coulomb's law states that the force F between two point charges, q1 and q2, in a vacuum is proportional to their product
@@ -36,9 +38,10 @@ def print_law() -> str:
 
 @validate_input(first_charge_=first_charge, second_charge_=second_charge, distance_=distance)
 @validate_output(force)
+@numeric(law, force)
 def calculate_force(first_charge_: Quantity, second_charge_: Quantity,
     distance_: Quantity) -> Quantity:
-    solved = solve(law, force, dict=True)[0][force]
+    solved = solved_for(law, force)
     result_expr = solved.subs({
         first_charge: first_charge_,
         second_charge: second_charge_,
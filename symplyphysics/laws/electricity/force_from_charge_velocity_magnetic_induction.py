@@ -1,6 +1,8 @@
-from sympy import (Eq, solve, sin)
+from sympy import (Eq, sin)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, angle_type)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Lorentz force is force acting on a charge moving at speed from magnetic field.
@@ -31,9 +33,10 @@ def print_law() -> str:
 
 @validate_input(charge_=charge, velocity_=velocity, angle_=angle, induction_=induction)
 @validate_output(force)
+@numeric(law, force)
 def calculate_force(charge_: Quantity, velocity_: Quantity, angle_: float | Quantity,
     induction_: Quantity) -> Quantity:
-    result_expr = solve(law, force, dict=True)[0][force]
+    result_expr = solved_for(law, force)
     result_expr = result_expr.subs({
         charge: charge_,
         velocity: velocity_,
@@ -1,7 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import magnetic_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The basic characteristic of a coil is its inductance - the ability of the coil to accumulate energy as magnetic field.
@@ -27,11 +29,15 @@ def print_law() -> str:
     return print_expression(law)
 
 
-@validate_input(turn_area_=turn_area, coil_length_=coil_length)
+@validate_input(magnetic_permeability_=magnetic_permeability,
+    number_of_turns_=number_of_turns,
+    turn_area_=turn_area,
+    coil_length_=coil_length)
 @validate_output(coil_inductance)
+@numeric(law, coil_inductance)
 def calculate_inductance(magnetic_permeability_: float, number_of_turns_: float,
     turn_area_: Quantity, coil_length_: Quantity) -> Quantity:
-    result_inductance_expr = solve(law, coil_inductance, dict=True)[0][coil_inductance]
+    result_inductance_expr = solved_for(law, coil_inductance)
     result_expr = result_inductance_expr.subs({
         magnetic_permeability: magnetic_permeability_,
         number_of_turns: number_of_turns_,
@@ -1,7 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import magnetic_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## A solenoid is a cylindrical coil consisting of a large number of turns of wire forming a helical line.
@@ -32,9 +34,10 @@ def print_law() -> str:
     number_of_turns_per_length_=number_of_turns_per_length,
     volume_=volume)
 @validate_output(inductance)
+@numeric(law, inductance)
 def calculate_inductance(relative_permeability_: float, number_of_turns_per_length_: Quantity,
     volume_: Quantity) -> Quantity:
-    result_inductance_expr = solve(law, inductance, dict=True)[0][inductance]
+    result_inductance_expr = solved_for(law, inductance)
     result_expr = result_inductance_expr.subs({
         relative_permeability: relative_permeability_,
         number_of_turns_per_length: number_of_turns_per_length_,
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## A magnetic field intensity is a vector field that describes the magnetic influence on moving electric
@@ -32,8 +34,9 @@ def print_law() -> str:
 
 @validate_input(current_=current, distance_=distance)
 @validate_output(magnetic_intensity)
+@numeric(law, magnetic_intensity)
 def calculate_magnetic_intensity(current_: Quantity, distance_: Quantity) -> Quantity:
-    result_expr = solve(law, magnetic_intensity, dict=True)[0][magnetic_intensity]
+    result_expr = solved_for(law, magnetic_intensity)
     result_expr = result_expr.subs({
         current: current_,
         distance: distance_,
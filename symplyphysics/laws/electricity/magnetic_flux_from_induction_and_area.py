@@ -1,6 +1,8 @@
-from sympy import (Eq, solve, cos)
+from sympy import (Eq, cos)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, angle_type)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Magnetic flux is the flux of a magnetic induction vector through a certain surface.
@@ -25,7 +27,8 @@ def print_law() -> str:
 
 @validate_input(induction_=induction, area_=area, angle_=angle)
 @validate_output(flux)
+@numeric(law, flux)
 def calculate_flux(induction_: Quantity, area_: Quantity, angle_: Quantity | float) -> Quantity:
-    result_flux_expr = solve(law, flux, dict=True)[0][flux]
+    result_flux_expr = solved_for(law, flux)
     result_expr = result_flux_expr.subs({induction: induction_, area: area_, angle: angle_})
     return Quantity(result_expr)
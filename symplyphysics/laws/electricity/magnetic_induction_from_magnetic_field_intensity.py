@@ -1,7 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import magnetic_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Magnetic induction is a physical quantity that is a force characteristic of a magnetic field, namely, a characteristic
@@ -27,8 +29,9 @@ def print_law() -> str:
 
 @validate_input(relative_permeability_=relative_permeability, intensity_=intensity)
 @validate_output(induction)
+@numeric(law, induction)
 def calculate_induction(relative_permeability_: float, intensity_: Quantity) -> Quantity:
-    result_expr = solve(law, induction, dict=True)[0][induction]
+    result_expr = solved_for(law, induction)
     result_expr = result_expr.subs({
         relative_permeability: relative_permeability_,
         intensity: intensity_,
@@ -1,7 +1,9 @@
-from sympy import (Eq, solve, pi, cos)
+from sympy import (Eq, pi, cos)
 from sympy.physics.units import magnetic_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless, angle_type)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Let there be a rectilinear conductor of finite length. Then its magnetic induction will depend on
@@ -46,10 +48,11 @@ def print_law() -> str:
     second_angle_=second_angle,
     distance_=distance)
 @validate_output(induction)
+@numeric(law, induction)
 def calculate_induction(relative_permeability_: float, current_: Quantity,
     first_angle_: float | Quantity, second_angle_: float | Quantity,
     distance_: Quantity) -> Quantity:
-    result_expr = solve(law, induction, dict=True)[0][induction]
+    result_expr = solved_for(law, induction)
     result_expr = result_expr.subs({
         relative_permeability: relative_permeability_,
         current: current_,
@@ -1,7 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import magnetic_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solvers import solved_for
 
 # Description
 ## A solenoid is a cylindrical coil consisting of a large number of turns of wire forming a helical line.
@@ -38,7 +39,7 @@ def calculate_induction(current_: Quantity, length_: Quantity, relative_permeabi
     number_turns_: float) -> Quantity:
     if number_turns_ < 0:
         raise ValueError("Number of turns cannot be negative")
-    result_expr = solve(law, induction, dict=True)[0][induction]
+    result_expr = solved_for(law, induction)
     result_expr = result_expr.subs({
         current: current_,
         length: length_,
@@ -1,7 +1,9 @@
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
 from sympy.physics.units import magnetic_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Let there be an infinite thin conductor. Then the magnetic field created by the current in
@@ -32,9 +34,10 @@ def print_law() -> str:
 
 @validate_input(relative_permeability_=relative_permeability, current_=current, distance_=distance)
 @validate_output(induction)
+@numeric(law, induction)
 def calculate_induction(relative_permeability_: float, current_: Quantity,
     distance_: Quantity) -> Quantity:
-    result_expr = solve(law, induction, dict=True)[0][induction]
+    result_expr = solved_for(law, induction)
     result_expr = result_expr.subs({
         relative_permeability: relative_permeability_,
         current: current_,
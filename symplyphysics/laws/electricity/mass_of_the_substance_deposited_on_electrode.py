@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Faraday's first law of electrolysis: the mass of a substance deposited on an electrode during electrolysis
@@ -34,7 +36,8 @@ def print_law() -> str:
 
 @validate_input(equivalent_=equivalent, current_=current, time_=time)
 @validate_output(mass)
+@numeric(law, mass)
 def calculate_mass(equivalent_: Quantity, current_: Quantity, time_: Quantity) -> Quantity:
-    result_expr = solve(law, mass, dict=True)[0][mass]
+    result_expr = solved_for(law, mass)
     result_expr = result_expr.subs({equivalent: equivalent_, current: current_, time: time_})
     return Quantity(result_expr)
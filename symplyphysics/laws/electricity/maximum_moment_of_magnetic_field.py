@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The magnetic moment is the main physical quantity characterizing the magnetic properties of a substance,
@@ -38,7 +40,8 @@ def print_law() -> str:
 
 @validate_input(current_=current, area_=area)
 @validate_output(moment)
+@numeric(law, moment)
 def calculate_moment(current_: Quantity, area_: Quantity) -> Quantity:
-    result_expr = solve(law, moment, dict=True)[0][moment]
+    result_expr = solved_for(law, moment)
     result_expr = result_expr.subs({current: current_, area: area_})
     return Quantity(result_expr)
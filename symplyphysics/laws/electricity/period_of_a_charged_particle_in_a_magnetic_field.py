@@ -1,6 +1,8 @@
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Let an arbitrary particle move in a magnetic field around a circle. Then period of its motion depends on
@@ -27,7 +29,8 @@ def print_law() -> str:
 
 @validate_input(mass_=mass, charge_=charge, induction_=induction)
 @validate_output(period)
+@numeric(law, period)
 def calculate_period(mass_: Quantity, charge_: Quantity, induction_: Quantity) -> Quantity:
-    result_period_expr = solve(law, period, dict=True)[0][period]
+    result_period_expr = solved_for(law, period)
     result_expr = result_period_expr.subs({mass: mass_, charge: charge_, induction: induction_})
     return Quantity(result_expr)
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The electrostatic potential is a scalar physical quantity equal to the ratio of the potential energy
@@ -33,8 +35,9 @@ def print_law() -> str:
 
 @validate_input(potential_energy_=potential_energy, charge_=charge)
 @validate_output(electrostatic_potential)
+@numeric(law, electrostatic_potential)
 def calculate_potential(potential_energy_: Quantity, charge_: Quantity) -> Quantity:
-    result_expr = solve(law, electrostatic_potential, dict=True)[0][electrostatic_potential]
+    result_expr = solved_for(law, electrostatic_potential)
     result_expr = result_expr.subs({
         potential_energy: potential_energy_,
         charge: charge_,
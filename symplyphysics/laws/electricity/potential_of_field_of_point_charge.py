@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
 from sympy.physics.units import electric_constant
 from symplyphysics import (
     units,
@@ -9,6 +9,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The potential of the electrostatic field φ at a given point is a scalar value equal to the ratio
@@ -39,9 +41,10 @@ def print_law() -> str:
 
 @validate_input(relative_permittivity_=relative_permittivity, distance_=distance, charge_=charge)
 @validate_output(electrostatic_potential)
+@numeric(law, electrostatic_potential)
 def calculate_electrostatic_potential(relative_permittivity_: float, distance_: Quantity,
     charge_: Quantity) -> Quantity:
-    result_expr = solve(law, electrostatic_potential, dict=True)[0][electrostatic_potential]
+    result_expr = solved_for(law, electrostatic_potential)
     result_expr = result_expr.subs({
         relative_permittivity: relative_permittivity_,
         distance: distance_,
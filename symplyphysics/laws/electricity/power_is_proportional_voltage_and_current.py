@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 # Power of current is proportional to current and voltage
@@ -22,7 +24,8 @@ def print_law() -> str:
 
 @validate_input(current_=current, voltage_=voltage)
 @validate_output(power)
+@numeric(law, power)
 def calculate_power(current_: Quantity, voltage_: Quantity) -> Quantity:
-    result_power_expr = solve(law, power, dict=True)[0][power]
+    result_power_expr = solved_for(law, power)
     result_expr = result_power_expr.subs({current: current_, voltage: voltage_})
     return Quantity(result_expr)
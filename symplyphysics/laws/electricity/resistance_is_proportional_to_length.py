@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Resistance of the wire is proportional to its length and resistivity and inversely proportional to its cross-sectional area.
@@ -24,9 +26,10 @@ def print_law() -> str:
 
 @validate_input(resistivity_=resistivity, wire_length_=wire_length, cross_section_=cross_section)
 @validate_output(resistance)
+@numeric(law, resistance)
 def calculate_resistance(resistivity_: Quantity, wire_length_: Quantity,
     cross_section_: Quantity) -> Quantity:
-    result_resistance_expr = solve(law, resistance, dict=True)[0][resistance]
+    result_resistance_expr = solved_for(law, resistance)
     result_expr = result_resistance_expr.subs({
         resistivity: resistivity_,
         wire_length: wire_length_,
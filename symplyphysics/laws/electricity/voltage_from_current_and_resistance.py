@@ -1,7 +1,10 @@
 from sympy import (Eq, solve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 
 from symplyphysics.laws.electricity import current_is_proportional_to_voltage as ohm_law
 
@@ -22,17 +25,20 @@ outer_resistance = Symbol("outer_resistance", units.impedance)
 
 law = Eq(voltage, current * (inner_resistance + outer_resistance))
 
-# This law might be derived via Ohm's law.
 
-ohm_law_applied = ohm_law.law.subs({
-    ohm_law.voltage: ohm_law.voltage,
-    ohm_law.current: current,
-    ohm_law.resistance: inner_resistance + outer_resistance
-})
-voltage_derived = solve(ohm_law_applied, ohm_law.voltage, dict=True)[0][ohm_law.voltage]
+# This law might be derived via Ohm's law.
+@proof
+def _derive_law():
+    # pylint: disable-next=assignment-from-no-return
+    ohm_law_applied = ohm_law.law.subs({
+        ohm_law.voltage: ohm_law.voltage,
+        ohm_law.current: current,
+        ohm_law.resistance: inner_resistance + outer_resistance
+    })
+    voltage_derived = solve(ohm_law_applied, ohm_law.voltage, dict=True)[0][ohm_law.voltage]
 
-# Check if derived voltage is same as declared.
-assert expr_equals(voltage_derived, law.rhs)
+    # Check if derived voltage is same as declared.
+    assert expr_equals(voltage_derived, law.rhs)
 
 
 def print_law() -> str:
@@ -43,9 +49,10 @@ def print_law() -> str:
     inner_resistance_=inner_resistance,
     outer_resistance_=outer_resistance)
 @validate_output(voltage)
+@numeric(law, voltage)
 def calculate_voltage(current_: Quantity, inner_resistance_: Quantity,
     outer_resistance_: Quantity) -> Quantity:
-    result_voltage_expr = solve(law, voltage, dict=True)[0][voltage]
+    result_voltage_expr = solved_for(law, voltage)
     result_expr = result_voltage_expr.subs({
         current: current_,
         inner_resistance: inner_resistance_,
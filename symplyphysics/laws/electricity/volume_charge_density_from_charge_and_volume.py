@@ -1,6 +1,9 @@
 from sympy import (Eq, solve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
+from symplyphysics.core.proofs import proof
 from symplyphysics.definitions import volume_number_density
 
 # Description
@@ -19,18 +22,21 @@ volume = Symbol("volume", units.volume)
 
 law = Eq(volume_charge_density, charge / volume)
 
-## Proof
 
-## Let's express the number of objects from the volume number density definition
-## In this case, the objects are charged particles.
-expr = volume_number_density.definition.subs({
-    volume_number_density.volume: volume,
-    volume_number_density.objects: charge
-})
+## Proof
+@proof
+def _derive_law():
+    ## Let's express the number of objects from the volume number density definition
+    ## In this case, the objects are charged particles.
+    # pylint: disable-next=assignment-from-no-return
+    expr = volume_number_density.definition.subs({
+        volume_number_density.volume: volume,
+        volume_number_density.objects: charge
+    })
 
-derived_law = solve(expr, volume_number_density.number_density,
-    dict=True)[0][volume_number_density.number_density]
-assert law.rhs == derived_law
+    derived_law = solve(expr, volume_number_density.number_density,
+        dict=True)[0][volume_number_density.number_density]
+    assert law.rhs == derived_law
 
 
 def print_definition() -> str:
@@ -39,8 +45,9 @@ def print_definition() -> str:
 
 @validate_input(charge_=charge, volume_=volume)
 @validate_output(volume_charge_density)
+@numeric(law, volume_charge_density)
 def calculate_volume_charge_density(charge_: Quantity, volume_: Quantity) -> Quantity:
-    result_expr = solve(law, volume_charge_density, dict=True)[0][volume_charge_density]
+    result_expr = solved_for(law, volume_charge_density)
     result_volume_charge_density = result_expr.subs({
         charge: charge_,
         volume: volume_,
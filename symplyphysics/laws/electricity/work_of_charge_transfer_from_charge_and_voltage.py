@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## When the test charge moves in an electric field, we can talk about the work being done
@@ -31,8 +33,9 @@ def print_law() -> str:
 
 @validate_input(charge_=charge, voltage_=voltage)
 @validate_output(work_of_charge_transfer)
+@numeric(law, work_of_charge_transfer)
 def calculate_work(charge_: Quantity, voltage_: Quantity) -> Quantity:
-    result_expr = solve(law, work_of_charge_transfer, dict=True)[0][work_of_charge_transfer]
+    result_expr = solved_for(law, work_of_charge_transfer)
     result_expr = result_expr.subs({
         charge: charge_,
         voltage: voltage_,
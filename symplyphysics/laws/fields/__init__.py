@@ -0,0 +1,3 @@
+from symplyphysics.core.lazy_modules import lazy_package
+
+__getattr__, __dir__ = lazy_package(__name__)
@@ -2,7 +2,7 @@ from typing import Sequence
 from sympy import (Expr, Symbol as SymSymbol)
 from symplyphysics import Quantity
 from symplyphysics.core.dimensions import ScalarValue
-from symplyphysics.core.fields.analysis import circulation_along_curve
+from symplyphysics.core.fields.analysis import SYMBOLIC_METHOD, circulation_along_curve
 from symplyphysics.core.fields.vector_field import VectorField
 
 # Description
@@ -36,14 +36,21 @@ from symplyphysics.core.fields.vector_field import VectorField
 parameter = SymSymbol("parameter")
 
 
-def circulation_law(field: VectorField, trajectory: Sequence[Expr], parameter_from: ScalarValue,
-    parameter_to: ScalarValue) -> ScalarValue:
-    return circulation_along_curve(field, trajectory, (parameter, parameter_from, parameter_to))
+def circulation_law(field: VectorField,
+    trajectory: Sequence[Expr],
+    parameter_from: ScalarValue,
+    parameter_to: ScalarValue,
+    method: str = SYMBOLIC_METHOD) -> ScalarValue:
+    return circulation_along_curve(field, trajectory, (parameter, parameter_from, parameter_to),
+        method)
 
 
 # trajectory should be array with projections to coordinates, eg [3 * cos(parameter), 3 * sin(parameter)]
-def calculate_circulation(field: VectorField, trajectory: Sequence[Expr],
-    parameter_limits: tuple[ScalarValue, ScalarValue]) -> Quantity:
+# method is "symbolic" or "numeric", see core/fields/analysis.py
+def calculate_circulation(field: VectorField,
+    trajectory: Sequence[Expr],
+    parameter_limits: tuple[ScalarValue, ScalarValue],
+    method: str = SYMBOLIC_METHOD) -> Quantity:
     (parameter_from, parameter_to) = parameter_limits
-    result_expr = circulation_law(field, trajectory, parameter_from, parameter_to)
+    result_expr = circulation_law(field, trajectory, parameter_from, parameter_to, method)
     return Quantity(result_expr)
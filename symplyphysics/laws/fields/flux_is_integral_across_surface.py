@@ -2,7 +2,7 @@ from typing import Sequence
 from sympy import (Expr, Symbol as SymSymbol)
 from symplyphysics import Quantity
 from symplyphysics.core.dimensions import ScalarValue
-from symplyphysics.core.fields.analysis import flux_across_surface
+from symplyphysics.core.fields.analysis import SYMBOLIC_METHOD, flux_across_surface
 from symplyphysics.core.fields.vector_field import VectorField
 
 # Description
@@ -37,16 +37,22 @@ parameter1 = SymSymbol("parameter1")
 parameter2 = SymSymbol("parameter2")
 
 
-def flux_law(field: VectorField, trajectory: Sequence[Expr], parameter1_limits: tuple[ScalarValue,
-    ScalarValue], parameter2_limits: tuple[ScalarValue, ScalarValue]) -> ScalarValue:
+def flux_law(field: VectorField,
+    trajectory: Sequence[Expr],
+    parameter1_limits: tuple[ScalarValue, ScalarValue],
+    parameter2_limits: tuple[ScalarValue, ScalarValue],
+    method: str = SYMBOLIC_METHOD) -> ScalarValue:
     return flux_across_surface(field, trajectory,
         (parameter1, parameter1_limits[0], parameter1_limits[1]),
-        (parameter2, parameter2_limits[0], parameter2_limits[1]))
+        (parameter2, parameter2_limits[0], parameter2_limits[1]), method)
 
 
 # surface should be array with projections to coordinates, eg [3 * cos(parameter), 3 * sin(parameter)]
-def calculate_flux(field: VectorField, surface: Sequence[Expr],
-    parameter1_limits: tuple[ScalarValue, ScalarValue], parameter2_limits: tuple[ScalarValue,
-    ScalarValue]) -> Quantity:
-    result_expr = flux_law(field, surface, parameter1_limits, parameter2_limits)
+# method is "symbolic" or "numeric", see core/fields/analysis.py
+def calculate_flux(field: VectorField,
+    surface: Sequence[Expr],
+    parameter1_limits: tuple[ScalarValue, ScalarValue],
+    parameter2_limits: tuple[ScalarValue, ScalarValue],
+    method: str = SYMBOLIC_METHOD) -> Quantity:
+    result_expr = flux_law(field, surface, parameter1_limits, parameter2_limits, method)
     return Quantity(result_expr)
@@ -1,7 +1,9 @@
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
 from sympy.physics.units import gravitational_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Law: V = √(G * M / (R + h))
 # Where:
@@ -25,8 +27,9 @@ def print_law():
 
 @validate_input(planet_mass_=planet_mass, radius_=radius, height_=height)
 @validate_output(velocity)
+@numeric(law, velocity)
 def calculate_velocity(planet_mass_: Quantity, radius_: Quantity, height_: Quantity) -> Quantity:
-    result_velocity_expr = solve(law, velocity, dict=True)[0][velocity]
+    result_velocity_expr = solved_for(law, velocity)
     result_expr = result_velocity_expr.subs({
         planet_mass: planet_mass_,
         radius: radius_,
@@ -1,7 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import gravitational_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Every object generates gravity field around it. Any other object in this field is pulled toward generator.
@@ -31,9 +33,10 @@ def print_law() -> str:
     second_object_mass_=second_object_mass,
     distance_between_objects_=distance_between_mass_centers)
 @validate_output(gravitational_force)
+@numeric(law, gravitational_force)
 def calculate_force(first_object_mass_: Quantity, second_object_mass_: Quantity,
     distance_between_objects_: Quantity) -> Quantity:
-    result_force_expr = solve(law, gravitational_force, dict=True)[0][gravitational_force]
+    result_force_expr = solved_for(law, gravitational_force)
     result_expr = result_force_expr.subs({
         first_object_mass: first_object_mass_,
         second_object_mass: second_object_mass_,
@@ -2,7 +2,10 @@ from sympy import (Eq, solve, sin, pi)
 from sympy.physics.units import acceleration_due_to_gravity as earth_free_fall_acceleration
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, angle_type)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.kinematic import constant_acceleration_movement_is_parabolic as distance_law
 from symplyphysics.laws.kinematic import planar_projection_is_cosine as projection_law
 from symplyphysics.laws.kinematic import accelerated_velocity_from_time as velocity_law
@@ -26,36 +29,42 @@ angle = Symbol("angle", angle_type)
 
 law = Eq(height, initial_velocity**2 * sin(angle)**2 / (2 * earth_free_fall_acceleration))
 
+
 # This law might be derived via "constant_acceleration_movement_is_parabolic" law, "planar_projection_is_cosine" law
 # and "accelerated_velocity_from_time" law.
+@proof
+def _derive_law():
+    # The law seeks a projection on the horizontal axis, but a projection on the vertical axis is necessary,
+    # so the angle is represented as a "pi/2 - angle".
+    # pylint: disable-next=assignment-from-no-return
+    projection_law_applied = projection_law.law.subs({
+        projection_law.vector_length: initial_velocity,
+        projection_law.vector_angle: (pi / 2) - angle,
+    })
+    vertical_projection_derived = solve(projection_law_applied,
+        projection_law.projection,
+        dict=True)[0][projection_law.projection]
 
-# The law seeks a projection on the horizontal axis, but a projection on the vertical axis is necessary,
-# so the angle is represented as a "pi/2 - angle".
-projection_law_applied = projection_law.law.subs({
-    projection_law.vector_length: initial_velocity,
-    projection_law.vector_angle: (pi / 2) - angle,
-})
-vertical_projection_derived = solve(projection_law_applied, projection_law.projection,
-    dict=True)[0][projection_law.projection]
-
-# Vertical velocity is zero in the highest point of trajectory.
-velocity_law_applied = velocity_law.law.subs({
-    velocity_law.initial_velocity: vertical_projection_derived,
-    velocity_law.velocity: 0,
-    velocity_law.acceleration: -earth_free_fall_acceleration,
-})
-time_derived = solve(velocity_law_applied, velocity_law.time, dict=True)[0][velocity_law.time]
+    # Vertical velocity is zero in the highest point of trajectory.
+    # pylint: disable-next=assignment-from-no-return
+    velocity_law_applied = velocity_law.law.subs({
+        velocity_law.initial_velocity: vertical_projection_derived,
+        velocity_law.velocity: 0,
+        velocity_law.acceleration: -earth_free_fall_acceleration,
+    })
+    time_derived = solve(velocity_law_applied, velocity_law.time, dict=True)[0][velocity_law.time]
 
-# The acceleration of gravity is directed opposite to the vertical coordinate axis,
-## so there is a minus sign before the acceleration.
-height_law_applied = distance_law.law.subs({
-    distance_law.initial_velocity: vertical_projection_derived,
-    distance_law.movement_time: time_derived,
-    distance_law.constant_acceleration: -earth_free_fall_acceleration,
-})
+    # The acceleration of gravity is directed opposite to the vertical coordinate axis,
+    ## so there is a minus sign before the acceleration.
+    # pylint: disable-next=assignment-from-no-return
+    height_law_applied = distance_law.law.subs({
+        distance_law.initial_velocity: vertical_projection_derived,
+        distance_law.movement_time: time_derived,
+        distance_law.constant_acceleration: -earth_free_fall_acceleration,
+    })
 
-# Check if derived height is same as declared.
-assert expr_equals(height_law_applied.rhs, law.rhs)
+    # Check if derived height is same as declared.
+    assert expr_equals(height_law_applied.rhs, law.rhs)
 
 
 def print_law() -> str:
@@ -64,8 +73,9 @@ def print_law() -> str:
 
 @validate_input(initial_velocity_=initial_velocity, angle_=angle)
 @validate_output(height)
+@numeric(law, height)
 def calculate_height(initial_velocity_: Quantity, angle_: float | Quantity) -> Quantity:
-    result_expr = solve(law, height, dict=True)[0][height]
+    result_expr = solved_for(law, height)
     result_expr = result_expr.subs({
         initial_velocity: initial_velocity_,
         angle: angle_,
@@ -2,7 +2,10 @@ from sympy import (Eq, solve, sin, pi)
 from sympy.physics.units import acceleration_due_to_gravity as earth_free_fall_acceleration
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, angle_type)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.kinematic import constant_acceleration_movement_is_parabolic as distance_law
 from symplyphysics.laws.kinematic import planar_projection_is_cosine as projection_law
 
@@ -25,30 +28,34 @@ angle = Symbol("angle", angle_type)
 
 law = Eq(movement_time, 2 * initial_velocity * sin(angle) / earth_free_fall_acceleration)
 
+
 # This law might be derived via "constant_acceleration_movement_is_parabolic" law
 # and "planar_projection_is_cosine" law.
+@proof
+def _derive_law():
+    # The law seeks a projection on the horizontal axis, but a projection on the vertical axis is necessary,
+    # so the angle is represented as a "pi/2 - angle".
+    # pylint: disable-next=assignment-from-no-return
+    projection_law_applied = projection_law.law.subs({
+        projection_law.vector_length: initial_velocity,
+        projection_law.vector_angle: (pi / 2) - angle,
+    })
+    projection_derived = solve(projection_law_applied, projection_law.projection,
+        dict=True)[0][projection_law.projection]
 
-# The law seeks a projection on the horizontal axis, but a projection on the vertical axis is necessary,
-# so the angle is represented as a "pi/2 - angle".
-projection_law_applied = projection_law.law.subs({
-    projection_law.vector_length: initial_velocity,
-    projection_law.vector_angle: (pi / 2) - angle,
-})
-projection_derived = solve(projection_law_applied, projection_law.projection,
-    dict=True)[0][projection_law.projection]
-
-# The acceleration of gravity is directed opposite to the vertical coordinate axis,
-## so there is a minus sign before the acceleration.
-distance_law_applied = distance_law.law.subs({
-    distance_law.initial_velocity: projection_derived,
-    distance_law.constant_acceleration: -earth_free_fall_acceleration,
-    distance_law.distance(distance_law.movement_time): 0,
-})
-time_derived = solve(distance_law_applied, distance_law.movement_time,
-    dict=True)[1][distance_law.movement_time]
+    # The acceleration of gravity is directed opposite to the vertical coordinate axis,
+    ## so there is a minus sign before the acceleration.
+    # pylint: disable-next=assignment-from-no-return
+    distance_law_applied = distance_law.law.subs({
+        distance_law.initial_velocity: projection_derived,
+        distance_law.constant_acceleration: -earth_free_fall_acceleration,
+        distance_law.distance(distance_law.movement_time): 0,
+    })
+    time_derived = solve(distance_law_applied, distance_law.movement_time,
+        dict=True)[1][distance_law.movement_time]
 
-# Check if derived movement time is same as declared.
-assert expr_equals(time_derived, law.rhs)
+    # Check if derived movement time is same as declared.
+    assert expr_equals(time_derived, law.rhs)
 
 
 def print_law() -> str:
@@ -57,8 +64,9 @@ def print_law() -> str:
 
 @validate_input(initial_velocity_=initial_velocity, angle_=angle)
 @validate_output(movement_time)
+@numeric(law, movement_time)
 def calculate_movement_time(initial_velocity_: Quantity, angle_: float | Quantity) -> Quantity:
-    result_expr = solve(law, movement_time, dict=True)[0][movement_time]
+    result_expr = solved_for(law, movement_time)
     result_expr = result_expr.subs({
         initial_velocity: initial_velocity_,
         angle: angle_,
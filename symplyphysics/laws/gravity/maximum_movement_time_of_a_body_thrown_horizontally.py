@@ -8,7 +8,10 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.kinematic import constant_acceleration_movement_is_parabolic as distance_law
 
 # Description
@@ -26,19 +29,22 @@ height = Symbol("height", units.length)
 
 law = Eq(movement_time, sqrt(2 * height / earth_free_fall_acceleration))
 
+
 # This law might be derived via "constant_acceleration_movement_is_parabolic" law.
 # Horizontal vector of movement does not change falling time.
+@proof
+def _derive_law():
+    # pylint: disable-next=assignment-from-no-return
+    distance_law_applied = distance_law.law.subs({
+        distance_law.initial_velocity: 0,
+        distance_law.constant_acceleration: earth_free_fall_acceleration,
+        distance_law.distance(distance_law.movement_time): height,
+    })
+    time_derived = solve(distance_law_applied, distance_law.movement_time,
+        dict=True)[1][distance_law.movement_time]
 
-distance_law_applied = distance_law.law.subs({
-    distance_law.initial_velocity: 0,
-    distance_law.constant_acceleration: earth_free_fall_acceleration,
-    distance_law.distance(distance_law.movement_time): height,
-})
-time_derived = solve(distance_law_applied, distance_law.movement_time,
-    dict=True)[1][distance_law.movement_time]
-
-# Check if derived movement time is same as declared.
-assert expr_equals(time_derived, law.rhs)
+    # Check if derived movement time is same as declared.
+    assert expr_equals(time_derived, law.rhs)
 
 
 def print_law() -> str:
@@ -47,8 +53,9 @@ def print_law() -> str:
 
 @validate_input(height_=height)
 @validate_output(movement_time)
+@numeric(law, movement_time)
 def calculate_movement_time(height_: Quantity) -> Quantity:
-    result_expr = solve(law, movement_time, dict=True)[0][movement_time]
+    result_expr = solved_for(law, movement_time)
     result_expr = result_expr.subs({
         height: height_,
     })
@@ -2,7 +2,10 @@ from sympy import (Eq, solve, sin, simplify)
 from sympy.physics.units import acceleration_due_to_gravity as earth_free_fall_acceleration
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, angle_type)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.kinematic import distance_from_constant_velocity as distance_law
 from symplyphysics.laws.kinematic import planar_projection_is_cosine as projection_law
 from symplyphysics.laws.gravity import maximum_movement_time_of_a_body_thrown_at_an_angle_to_horizon as time_law
@@ -25,30 +28,37 @@ angle = Symbol("angle", angle_type)
 
 law = Eq(throw_range, initial_velocity**2 * sin(2 * angle) / earth_free_fall_acceleration)
 
+
 # This law might be derived via "distance_from_constant_velocity" law, "planar_projection_is_cosine" law
 # and "maximum_movement_time_of_a_body_thrown_at_an_angle_to_horizon" law.
+@proof
+def _derive_law():
+    # pylint: disable-next=assignment-from-no-return
+    projection_law_applied = projection_law.law.subs({
+        projection_law.vector_length: initial_velocity,
+        projection_law.vector_angle: angle,
+    })
+    horizontal_projection_derived = solve(projection_law_applied,
+        projection_law.projection,
+        dict=True)[0][projection_law.projection]
 
-projection_law_applied = projection_law.law.subs({
-    projection_law.vector_length: initial_velocity,
-    projection_law.vector_angle: angle,
-})
-horizontal_projection_derived = solve(projection_law_applied, projection_law.projection,
-    dict=True)[0][projection_law.projection]
-
-time_law_applied = time_law.law.subs({
-    time_law.initial_velocity: initial_velocity,
-    time_law.angle: angle,
-})
-time_derived = solve(time_law_applied, time_law.movement_time, dict=True)[0][time_law.movement_time]
+    # pylint: disable-next=assignment-from-no-return
+    time_law_applied = time_law.law.subs({
+        time_law.initial_velocity: initial_velocity,
+        time_law.angle: angle,
+    })
+    time_derived = solve(time_law_applied, time_law.movement_time,
+        dict=True)[0][time_law.movement_time]
 
-range_law_applied = distance_law.law.subs({
-    distance_law.initial_position: 0,
-    distance_law.constant_velocity: horizontal_projection_derived,
-    distance_law.movement_time: time_derived,
-})
+    # pylint: disable-next=assignment-from-no-return
+    range_law_applied = distance_law.law.subs({
+        distance_law.initial_position: 0,
+        distance_law.constant_velocity: horizontal_projection_derived,
+        distance_law.movement_time: time_derived,
+    })
 
-# Check if derived range is same as declared.
-assert expr_equals(simplify(range_law_applied.rhs), law.rhs)
+    # Check if derived range is same as declared.
+    assert expr_equals(simplify(range_law_applied.rhs), law.rhs)
 
 
 def print_law() -> str:
@@ -57,11 +67,12 @@ def print_law() -> str:
 
 @validate_input(initial_velocity_=initial_velocity, angle_=angle)
 @validate_output(throw_range)
+@numeric(law, throw_range)
 def calculate_range(
     initial_velocity_: Quantity,
     angle_: float | Quantity,
 ) -> Quantity:
-    result_expr = solve(law, throw_range, dict=True)[0][throw_range]
+    result_expr = solved_for(law, throw_range)
     result_expr = result_expr.subs({
         initial_velocity: initial_velocity_,
         angle: angle_,
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The Archimedean force acting on a body immersed in a liquid (or gas) is equal to the weight of the liquid (or gas) displaced by the body.
@@ -27,8 +29,9 @@ def print_law() -> str:
 
 @validate_input(weight_air_=weight_air, liquid_density_=liquid_density, body_density_=body_density)
 @validate_output(weight_liquid)
+@numeric(law, weight_liquid)
 def calculate_weight(weight_air_: Quantity, liquid_density_, body_density_: Quantity) -> Quantity:
-    result_expr = solve(law, weight_liquid, dict=True)[0][weight_liquid]
+    result_expr = solved_for(law, weight_liquid)
     result_weight = result_expr.subs({
         weight_air: weight_air_,
         liquid_density: liquid_density_,
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## When liquid flows, it causes additional pressure, known as dynamic pressure.
@@ -24,7 +26,8 @@ def print_law() -> str:
 
 @validate_input(density_=liquid_density, velocity_=flow_velocity)
 @validate_output(dynamic_pressure)
+@numeric(law, dynamic_pressure)
 def calculate_pressure(density_: Quantity, velocity_: Quantity) -> Quantity:
-    result_pressure_expr = solve(law, dynamic_pressure, dict=True)[0][dynamic_pressure]
+    result_pressure_expr = solved_for(law, dynamic_pressure)
     result_expr = result_pressure_expr.subs({liquid_density: density_, flow_velocity: velocity_})
     return Quantity(result_expr)
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless, convert_to)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Since the hydraulic press is a mechanism, its operation can be characterized by a coefficient of efficiency.
@@ -31,9 +33,10 @@ def print_law() -> str:
     expended_force_=expended_force,
     expended_height_=expended_height)
 @validate_output(efficiency)
+@numeric(law, efficiency)
 def calculate_efficiency(useful_force_: Quantity, useful_height_: Quantity,
     expended_force_: Quantity, expended_height_: Quantity) -> float:
-    result_expr = solve(law, efficiency, dict=True)[0][efficiency]
+    result_expr = solved_for(law, efficiency)
     result_efficiency = result_expr.subs({
         useful_force: useful_force_,
         useful_height: useful_height_,
@@ -1,6 +1,8 @@
-from sympy import Eq, solve, sqrt, S
+from sympy import Eq, sqrt, S
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
                            validate_output, dimensionless, convert_to)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 
 # Description
@@ -35,8 +37,9 @@ def print_law() -> str:
 
 @validate_input(velocity_=velocity, characteristic_length_=characteristic_length)
 @validate_output(froude_number)
+@numeric(law, froude_number)
 def calculate_froude_number(velocity_: Quantity, characteristic_length_: Quantity) -> float:
-    result_expr = solve(law, froude_number, dict=True)[0][froude_number]
+    result_expr = solved_for(law, froude_number)
     result_applied = result_expr.subs({
         velocity: velocity_,
         characteristic_length: characteristic_length_
@@ -1,7 +1,9 @@
-from sympy import Eq, solve, pi
+from sympy import Eq, pi
 
 from symplyphysics import (Quantity, Symbol, print_expression, units, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Law: delta_p = 8 * mu * L * Q / (pi * R**4)
 # delta_p - pressure difference,
@@ -30,9 +32,10 @@ def print_law() -> str:
     radius_=radius,
 )
 @validate_output(delta_pressure)
+@numeric(law, delta_pressure)
 def calculate_delta_pressure(dynamic_viscosity_: Quantity, length_: Quantity, flow_rate_: Quantity,
     radius_: Quantity) -> Quantity:
-    result_expr = solve(law, delta_pressure, dict=True)[0][delta_pressure]
+    result_expr = solved_for(law, delta_pressure)
     result_applied = result_expr.subs({
         dynamic_viscosity: dynamic_viscosity_,
         length: length_,
@@ -1,4 +1,4 @@
-from sympy import Eq, solve
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Inner pressure of an ideal fluid is the sum of static, dynamic, and hydrostatic pressure at chosen point.
@@ -41,12 +43,13 @@ def print_law() -> str:
     hydrostatic_pressure_=hydrostatic_pressure,
 )
 @validate_output(inner_pressure)
+@numeric(law, inner_pressure)
 def calculate_inner_pressure(
     static_pressure_: Quantity,
     dynamic_pressure_: Quantity,
     hydrostatic_pressure_: Quantity,
 ) -> Quantity:
-    result_expr = solve(law, inner_pressure)[0]
+    result_expr = solved_for(law, inner_pressure)
     result_inner_pressure = result_expr.subs({
         static_pressure: static_pressure_,
         dynamic_pressure: dynamic_pressure_,
@@ -1,4 +1,4 @@
-from sympy import Eq, dsolve, Derivative
+from sympy import Eq, Derivative
 from symplyphysics import (
     units,
     Quantity,
@@ -8,6 +8,7 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.budget import budgeted_dsolve
 
 # Description
 ## Bernoulli's equation applied to an ideal liquid specifies that the inner
@@ -37,6 +38,6 @@ def print_law() -> str:
 @validate_input(inner_pressure_before_=inner_pressure)
 @validate_output(inner_pressure)
 def calculate_inner_pressure(inner_pressure_before_: Quantity) -> Quantity:
-    dsolved = dsolve(law, inner_pressure(time))
+    dsolved = budgeted_dsolve(law, inner_pressure(time))
     result_expr = dsolved.subs("C1", inner_pressure_before_).rhs
     return Quantity(result_expr)
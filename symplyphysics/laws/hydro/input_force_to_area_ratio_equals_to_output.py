@@ -1,8 +1,11 @@
 from sympy import (Eq, solve, dsolve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.laws.hydro import pressure_from_force_and_area as pressure_law
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.hydro import inner_pressure_of_fluid_is_constant as constant_pressure_law
 
 # Description
@@ -27,29 +30,32 @@ output_forces_area = Symbol("output_forces_area", units.area)
 
 law = Eq(input_force / input_area, output_force / output_forces_area)
 
-pressure_input = pressure_law.law.rhs.subs({
-    pressure_law.force: input_force,
-    pressure_law.area: input_area
-})
 
-pressure_output = pressure_law.law.rhs.subs({
-    pressure_law.force: output_force,
-    pressure_law.area: output_forces_area,
-})
+@proof
+def _derive_law():
+    pressure_input = pressure_law.law.rhs.subs({
+        pressure_law.force: input_force,
+        pressure_law.area: input_area
+    })
+
+    pressure_output = pressure_law.law.rhs.subs({
+        pressure_law.force: output_force,
+        pressure_law.area: output_forces_area,
+    })
 
-## If the pistons are in equilibrium, then the pressures pressure_input and pressure_output are equal
-dsolved = dsolve(constant_pressure_law.law,
-    constant_pressure_law.inner_pressure(constant_pressure_law.time))
-dsolved_input = dsolved.subs(constant_pressure_law.inner_pressure(constant_pressure_law.time),
-    pressure_input)
-dsolved_output = dsolved.subs(constant_pressure_law.inner_pressure(constant_pressure_law.time),
-    pressure_output)
-solved_input = solve([dsolved_input, dsolved_output], (pressure_input, "C1"),
-    dict=True)[0][pressure_input]
-pressure_equation = Eq(pressure_input, solved_input)
+    ## If the pistons are in equilibrium, then the pressures pressure_input and pressure_output are equal
+    dsolved = dsolve(constant_pressure_law.law,
+        constant_pressure_law.inner_pressure(constant_pressure_law.time))
+    dsolved_input = dsolved.subs(constant_pressure_law.inner_pressure(constant_pressure_law.time),
+        pressure_input)
+    dsolved_output = dsolved.subs(constant_pressure_law.inner_pressure(constant_pressure_law.time),
+        pressure_output)
+    solved_input = solve([dsolved_input, dsolved_output], (pressure_input, "C1"),
+        dict=True)[0][pressure_input]
+    pressure_equation = Eq(pressure_input, solved_input)
 
-assert expr_equals(law.rhs, pressure_equation.rhs)
-assert expr_equals(law.lhs, pressure_equation.lhs)
+    assert expr_equals(law.rhs, pressure_equation.rhs)
+    assert expr_equals(law.lhs, pressure_equation.lhs)
 
 
 def print_law() -> str:
@@ -60,9 +66,10 @@ def print_law() -> str:
     input_area_=input_area,
     output_forces_area_=output_forces_area)
 @validate_output(output_force)
+@numeric(law, output_force)
 def calculate_output_force(input_force_: Quantity, input_area_,
     output_forces_area_: Quantity) -> Quantity:
-    result_expr = solve(law, output_force, dict=True)[0][output_force]
+    result_expr = solved_for(law, output_force)
     result_force = result_expr.subs({
         input_force: input_force_,
         input_area: input_area_,
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Pressure has a direct relationship with force. Assuming that the area is constant, pressure increases as the force applied also increases.
@@ -24,8 +26,9 @@ def print_law() -> str:
 
 @validate_input(force_=force, area_=area)
 @validate_output(pressure)
+@numeric(law, pressure)
 def calculate_pressure(force_: Quantity, area_: Quantity) -> Quantity:
-    result_expr = solve(law, pressure, dict=True)[0][pressure]
+    result_expr = solved_for(law, pressure)
     result_pressure = result_expr.subs({
         force: force_,
         area: area_,
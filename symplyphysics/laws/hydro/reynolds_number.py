@@ -1,6 +1,8 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless, convert_to)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 # The Reynolds number is a dimensionless quantity that characterizes the flow of a fluid in a pipe.
@@ -28,9 +30,10 @@ def print_law() -> str:
     velocity_=velocity,
     dynamic_viscosity_=dynamic_viscosity)
 @validate_output(reynolds_number)
+@numeric(law, reynolds_number)
 def calculate_reynolds_number(diameter_: Quantity, density_: Quantity, velocity_: Quantity,
     dynamic_viscosity_: Quantity) -> float:
-    result_expr = solve(law, reynolds_number, dict=True)[0][reynolds_number]
+    result_expr = solved_for(law, reynolds_number)
     result_applied = result_expr.subs({
         diameter: diameter_,
         density: density_,
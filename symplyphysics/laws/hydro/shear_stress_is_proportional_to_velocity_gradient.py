@@ -1,5 +1,6 @@
-from sympy import Eq, Derivative, solve
+from sympy import Eq, Derivative
 from symplyphysics import units, Quantity, Symbol, Function, print_expression, validate_input, validate_output
+from symplyphysics.core.budget import budgeted_solve
 
 # Description
 ## An element of flowing fluid will endure forces from the surrounding fluid (stress forces), that
@@ -53,5 +54,5 @@ def calculate_shear_stress(
         dynamic_viscosity: dynamic_viscosity_,
         fluid_speed(layer_position): fluid_speed_function,
     })
-    result_expr = solve(applied_law, shear_stress)[0]
+    result_expr = budgeted_solve(applied_law, shear_stress)[0]
     return Quantity(result_expr)
@@ -1,4 +1,4 @@
-from sympy import Eq, solve
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Shear stress is the component of stress coplanar with the material cross section on which it acts,
@@ -31,8 +33,9 @@ def print_law() -> str:
 
 @validate_input(force_applied_=force_applied, area_=area)
 @validate_output(shear_stress)
+@numeric(law, shear_stress)
 def calculate_shear_stress(force_applied_: Quantity, area_: Quantity) -> Quantity:
-    solved = solve(law, shear_stress)[0]
+    solved = solved_for(law, shear_stress)
     result = solved.subs({
         force_applied: force_applied_,
         area: area_,
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The surface tension force is directed tangentially to the surface of the liquid, perpendicular to
@@ -31,8 +33,9 @@ def print_law() -> str:
 
 @validate_input(surface_coefficient_=surface_coefficient, contour_length_=contour_length)
 @validate_output(force)
+@numeric(law, force)
 def calculate_force(surface_coefficient_: Quantity, contour_length_: Quantity) -> Quantity:
-    result_expr = solve(law, force, dict=True)[0][force]
+    result_expr = solved_for(law, force)
     result_expr = result_expr.subs({
         surface_coefficient: surface_coefficient_,
         contour_length: contour_length_,
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve, sqrt)
+from sympy import (Eq, sqrt)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## If hole appears in side wall or bottom of tank with liquid, liquid starts flowing out of this tank with some velocity.
@@ -26,7 +28,8 @@ def print_law() -> str:
 
 @validate_input(height_=height_above_hole)
 @validate_output(liquid_velocity)
+@numeric(law, liquid_velocity)
 def calculate_velocity(height_: Quantity) -> Quantity:
-    result_velocity_expr = solve(law, liquid_velocity, dict=True)[0][liquid_velocity]
+    result_velocity_expr = solved_for(law, liquid_velocity)
     result_expr = result_velocity_expr.subs({height_above_hole: height_})
     return Quantity(result_expr)
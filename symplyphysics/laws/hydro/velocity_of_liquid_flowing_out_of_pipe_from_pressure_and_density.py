@@ -7,7 +7,10 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.hydro import hydrostatic_pressure_from_density_and_depth as pressure_law
 from symplyphysics.laws.hydro import velocity_from_height as velocity_law
 
@@ -27,21 +30,26 @@ density = Symbol("density", units.mass / units.volume)
 
 law = Eq(velocity, sqrt(2 * pressure / density))
 
+
 # This law might be derived via "hydrostatic_pressure_from_density_and_depth" law
 # and "velocity_from_height" law.
+@proof
+def _derive_law():
+    # pylint: disable-next=assignment-from-no-return
+    pressure_law_applied = pressure_law.law.subs({
+        pressure_law.density: density,
+        pressure_law.hydrostatic_pressure: pressure
+    })
+    height_derived = solve(pressure_law_applied, pressure_law.depth,
+        dict=True)[0][pressure_law.depth]
 
-pressure_law_applied = pressure_law.law.subs({
-    pressure_law.density: density,
-    pressure_law.hydrostatic_pressure: pressure
-})
-height_derived = solve(pressure_law_applied, pressure_law.depth, dict=True)[0][pressure_law.depth]
-
-velocity_law_applied = velocity_law.law.subs({velocity_law.height_above_hole: height_derived})
-velocity_derived = solve(velocity_law_applied, velocity_law.liquid_velocity,
-    dict=True)[0][velocity_law.liquid_velocity]
+    # pylint: disable-next=assignment-from-no-return
+    velocity_law_applied = velocity_law.law.subs({velocity_law.height_above_hole: height_derived})
+    velocity_derived = solve(velocity_law_applied, velocity_law.liquid_velocity,
+        dict=True)[0][velocity_law.liquid_velocity]
 
-# Check if derived velocity is same as declared.
-assert expr_equals(velocity_derived, law.rhs)
+    # Check if derived velocity is same as declared.
+    assert expr_equals(velocity_derived, law.rhs)
 
 
 def print_law() -> str:
@@ -50,8 +58,9 @@ def print_law() -> str:
 
 @validate_input(pressure_=pressure, density_=density)
 @validate_output(velocity)
+@numeric(law, velocity)
 def calculate_velocity(pressure_: Quantity, density_: Quantity) -> Quantity:
-    result_expr = solve(law, velocity, dict=True)[0][velocity]
+    result_expr = solved_for(law, velocity)
     result_expr = result_expr.subs({
         pressure: pressure_,
         density: density_,
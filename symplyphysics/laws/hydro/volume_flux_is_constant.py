@@ -1,4 +1,4 @@
-from sympy import Eq, solve, dsolve, Derivative
+from sympy import Eq, Derivative
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,7 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.budget import budgeted_dsolve, budgeted_solve
 
 # Description
 ## The product of the area and the fluid speed, which is called volume flux, is constant
@@ -38,8 +39,8 @@ law = Eq(Derivative(tube_area(time) * fluid_speed(time), time), 0)
 @validate_output(fluid_speed)
 def calculate_fluid_speed(tube_area_before_: Quantity, fluid_speed_before_: Quantity,
     tube_area_after_: Quantity) -> Quantity:
-    dsolved = dsolve(law, fluid_speed(time))
-    c1_value = solve(dsolved, "C1")[0].subs({
+    dsolved = budgeted_dsolve(law, fluid_speed(time))
+    c1_value = budgeted_solve(dsolved, "C1")[0].subs({
         tube_area(time): tube_area_before_,
         fluid_speed(time): fluid_speed_before_,
     })
@@ -1,6 +1,7 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
 
 # Description
 ## If the body is on the surface of a liquid (floating), then only two forces act on it (Archimedes up and gravity down), which balance each other.
@@ -37,7 +38,7 @@ def calculate_submerged_volume(body_volume_: Quantity, body_density_,
     liquid_density_: Quantity) -> Quantity:
     if body_density_.scale_factor > liquid_density_.scale_factor:
         raise ValueError("Density of body should be less or equal than density of fluid.")
-    result_expr = solve(law, submerged_volume, dict=True)[0][submerged_volume]
+    result_expr = solved_for(law, submerged_volume)
     result_volume = result_expr.subs({
         body_volume: body_volume_,
         body_density: body_density_,
@@ -1,7 +1,10 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (angle_type, units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.core.symbols.quantities import scale_factor
 from symplyphysics.definitions import temporal_frequency_is_events_per_time as frequency_def
 
@@ -21,13 +24,15 @@ angular_frequency = Symbol("angular_frequency", angle_type / units.time)
 
 law = Eq(angular_frequency, radians / time)
 
-# Derive the same law from temporal frequency definition
 
-frequency_of_radian = frequency_def.definition.subs({
-    frequency_def.events: radians,
-    frequency_def.time: time
-}).rhs
-assert expr_equals(frequency_of_radian, law.rhs)
+# Derive the same law from temporal frequency definition
+@proof
+def _derive_law():
+    frequency_of_radian = frequency_def.definition.subs({
+        frequency_def.events: radians,
+        frequency_def.time: time
+    }).rhs
+    assert expr_equals(frequency_of_radian, law.rhs)
 
 
 def print_law() -> str:
@@ -36,9 +41,10 @@ def print_law() -> str:
 
 @validate_input(time_=time, radians_=radians)
 @validate_output(angular_frequency)
+@numeric(law, angular_frequency)
 def calculate_frequency(radians_: float | Quantity, time_: Quantity) -> Quantity:
     #HACK: SymPy angles are always in radians
     angle_radians = scale_factor(radians_)
-    solved = solve(law, angular_frequency, dict=True)[0][angular_frequency]
+    solved = solved_for(law, angular_frequency)
     result_expr = solved.subs({time: time_, radians: angle_radians})
     return Quantity(result_expr)
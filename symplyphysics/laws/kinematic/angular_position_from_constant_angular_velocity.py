@@ -9,6 +9,8 @@ from symplyphysics import (
     angle_type,
 )
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
+from symplyphysics.core.derivation_cache import cached_call
 from symplyphysics.definitions import angular_velocity_is_angle_derivative as angular_velocity_def
 
 # Description
@@ -31,21 +33,26 @@ law = Eq(
     initial_angular_position + angular_velocity * time,
 )
 
-# Derive law from definition of angular velocity
 
-angular_position_formula = dsolve(
-    angular_velocity_def.definition.subs(angular_velocity_def.time, time),
-    angular_velocity_def.angle_function(time),
-).rhs.subs(
-    angular_velocity_def.angular_velocity(time),
-    angular_velocity,
-).doit()
+# Derive law from definition of angular velocity
+@proof
+def _derive_law():
+    angular_position_formula = cached_call(
+        __name__,
+        "angular_position_formula",
+        dsolve,
+        angular_velocity_def.definition.subs(angular_velocity_def.time, time),
+        angular_velocity_def.angle_function(time),
+    ).rhs.subs(
+        angular_velocity_def.angular_velocity(time),
+        angular_velocity,
+    ).doit()
 
-C1 = solve(Eq(initial_angular_position, angular_position_formula.subs(time, 0)), "C1")[0]
+    C1 = solve(Eq(initial_angular_position, angular_position_formula.subs(time, 0)), "C1")[0]
 
-angular_position_derived = angular_position_formula.subs("C1", C1)
+    angular_position_derived = angular_position_formula.subs("C1", C1)
 
-assert expr_equals(angular_position_derived, law.rhs)
+    assert expr_equals(angular_position_derived, law.rhs)
 
 
 def print_law() -> str:
@@ -9,6 +9,8 @@ from symplyphysics import (
     angle_type,
 )
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
+from symplyphysics.core.derivation_cache import cached_call
 from symplyphysics.definitions import (
     angular_acceleration_is_angular_velocity_derivative as angular_acceleration_def,)
 
@@ -32,23 +34,28 @@ time = Symbol("time", units.time)
 
 law = Eq(angular_velocity, initial_angular_velocity + angular_acceleration * time)
 
-# Derive this law from definition of angular acceleration
 
-angular_velocity_formula = dsolve(
-    angular_acceleration_def.definition.subs(angular_acceleration_def.time, time),
-    angular_acceleration_def.angular_velocity(time),
-).rhs.subs(
-    angular_acceleration_def.angular_acceleration(time),
-    angular_acceleration,
-).doit()
+# Derive this law from definition of angular acceleration
+@proof
+def _derive_law():
+    angular_velocity_formula = cached_call(
+        __name__,
+        "angular_velocity_formula",
+        dsolve,
+        angular_acceleration_def.definition.subs(angular_acceleration_def.time, time),
+        angular_acceleration_def.angular_velocity(time),
+    ).rhs.subs(
+        angular_acceleration_def.angular_acceleration(time),
+        angular_acceleration,
+    ).doit()
 
-angular_velocity_derived = solve([
-    Eq(initial_angular_velocity, angular_velocity_formula.subs(time, 0)),
-    Eq(angular_velocity, angular_velocity_formula)
-], ("C1", angular_velocity),
-    dict=True)[0][angular_velocity]
+    angular_velocity_derived = solve([
+        Eq(initial_angular_velocity, angular_velocity_formula.subs(time, 0)),
+        Eq(angular_velocity, angular_velocity_formula)
+    ], ("C1", angular_velocity),
+        dict=True)[0][angular_velocity]
 
-assert expr_equals(angular_velocity_derived, law.rhs)
+    assert expr_equals(angular_velocity_derived, law.rhs)
 
 
 def print_law() -> str:
@@ -1,7 +1,11 @@
-from sympy import (Eq, solve, dsolve)
+from sympy import (Eq, dsolve)
 from symplyphysics import (units, Quantity, Symbol, Function, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
+from symplyphysics.core.derivation_cache import cached_call
 from symplyphysics.definitions import velocity_is_movement_derivative as velocity_definition
 from symplyphysics.definitions import acceleration_is_velocity_derivative as acceleration_definition
 
@@ -27,31 +31,35 @@ distance = Function("distance_function", units.length)
 law = Eq(distance(movement_time),
     initial_velocity * movement_time + constant_acceleration * movement_time**2 / 2)
 
-# Derive the same law from velocity and acceleration definitions
 
-constant_acceleration_definition = acceleration_definition.definition.subs({
-    acceleration_definition.acceleration(acceleration_definition.time): constant_acceleration,
-    acceleration_definition.time: movement_time
-})
-dsolved_velocity = dsolve(constant_acceleration_definition,
-    acceleration_definition.velocity(movement_time))
-constant_accelerated_velocity_function = dsolved_velocity.rhs
+# Derive the same law from velocity and acceleration definitions
+@proof
+def _derive_law():
+    # pylint: disable-next=assignment-from-no-return
+    constant_acceleration_definition = acceleration_definition.definition.subs({
+        acceleration_definition.acceleration(acceleration_definition.time): constant_acceleration,
+        acceleration_definition.time: movement_time
+    })
+    dsolved_velocity = cached_call(__name__, "dsolved_velocity", dsolve,
+        constant_acceleration_definition, acceleration_definition.velocity(movement_time))
+    constant_accelerated_velocity_function = dsolved_velocity.rhs
 
-constant_accelerated_movement_definition = velocity_definition.definition.subs({
-    velocity_definition.velocity(velocity_definition.moving_time):
-        constant_accelerated_velocity_function,
-    velocity_definition.moving_time:
-        movement_time
-})
-dsolved_movement = dsolve(constant_accelerated_movement_definition,
-    velocity_definition.movement(movement_time))
-constant_accelerated_movement_function = dsolved_movement.rhs
+    # pylint: disable-next=assignment-from-no-return
+    constant_accelerated_movement_definition = velocity_definition.definition.subs({
+        velocity_definition.velocity(velocity_definition.moving_time):
+            constant_accelerated_velocity_function,
+        velocity_definition.moving_time:
+            movement_time
+    })
+    dsolved_movement = cached_call(__name__, "dsolved_movement", dsolve,
+        constant_accelerated_movement_definition, velocity_definition.movement(movement_time))
+    constant_accelerated_movement_function = dsolved_movement.rhs
 
-derived_law = Eq(distance(movement_time), constant_accelerated_movement_function)
+    derived_law = Eq(distance(movement_time), constant_accelerated_movement_function)
 
-# Prove that constant_accelerated_movement_function equals to law.rhs, given C1 = initial_velocity,
-# C2 = initial distance = 0
-assert expr_equals(derived_law.rhs.subs({"C1": initial_velocity, "C2": 0}), law.rhs)
+    # Prove that constant_accelerated_movement_function equals to law.rhs, given C1 = initial_velocity,
+    # C2 = initial distance = 0
+    assert expr_equals(derived_law.rhs.subs({"C1": initial_velocity, "C2": 0}), law.rhs)
 
 
 def print_law() -> str:
@@ -62,9 +70,10 @@ def print_law() -> str:
     acceleration_=constant_acceleration,
     time_=movement_time)
 @validate_output(distance)
+@numeric(law, distance(movement_time))
 def calculate_distance(initial_velocity_: Quantity, acceleration_: Quantity,
     time_: Quantity) -> Quantity:
-    result_expr = solve(law, distance(movement_time), dict=True)[0][distance(movement_time)]
+    result_expr = solved_for(law, distance(movement_time))
     result_expr_substituted = result_expr.subs({
         initial_velocity: initial_velocity_,
         constant_acceleration: acceleration_,
@@ -9,6 +9,8 @@ from symplyphysics import (
     angle_type,
 )
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
+from symplyphysics.core.derivation_cache import cached_call
 from symplyphysics.definitions import (
     angular_acceleration_is_angular_velocity_derivative as angular_acceleration_def,
     angular_velocity_is_angle_derivative as angular_velocity_def,
@@ -39,45 +41,53 @@ law = Eq(
     initial_angular_velocity * time + angular_acceleration * time**2 / 2,
 )
 
-# Derive law from definitions of angular velocity and acceleration
 
-angular_velocity_formula = dsolve(
-    angular_acceleration_def.definition.subs(angular_acceleration_def.time, time),
-    angular_acceleration_def.angular_velocity(time),
-).rhs.subs(
-    angular_acceleration_def.angular_acceleration(time),
-    angular_acceleration,
-).doit()
+# Derive law from definitions of angular velocity and acceleration
+@proof
+def _derive_law():
+    angular_velocity_formula = cached_call(
+        __name__,
+        "angular_velocity_formula",
+        dsolve,
+        angular_acceleration_def.definition.subs(angular_acceleration_def.time, time),
+        angular_acceleration_def.angular_velocity(time),
+    ).rhs.subs(
+        angular_acceleration_def.angular_acceleration(time),
+        angular_acceleration,
+    ).doit()
 
-angular_velocity = Symbol("angular_velocity", angle_type / units.time)
-angular_velocity_derived = solve(
-    [
-    Eq(initial_angular_velocity, angular_velocity_formula.subs(time, 0)),
-    Eq(angular_velocity, angular_velocity_formula)
-    ],
-    ("C1", angular_velocity),
-    dict=True,
-)[0][angular_velocity]
+    angular_velocity = Symbol("angular_velocity", angle_type / units.time)
+    angular_velocity_derived = solve(
+        [
+        Eq(initial_angular_velocity, angular_velocity_formula.subs(time, 0)),
+        Eq(angular_velocity, angular_velocity_formula)
+        ],
+        ("C1", angular_velocity),
+        dict=True,
+    )[0][angular_velocity]
 
-angular_displacement_formula = dsolve(
-    angular_velocity_def.definition.subs(angular_velocity_def.time, time),
-    angular_velocity_def.angle_function(time),
-).rhs.subs(
-    angular_velocity_def.angular_velocity(time),
-    angular_velocity_derived,
-).doit()
+    angular_displacement_formula = cached_call(
+        __name__,
+        "angular_displacement_formula",
+        dsolve,
+        angular_velocity_def.definition.subs(angular_velocity_def.time, time),
+        angular_velocity_def.angle_function(time),
+    ).rhs.subs(
+        angular_velocity_def.angular_velocity(time),
+        angular_velocity_derived,
+    ).doit()
 
-angular_displacement_derived = solve(
-    [
-    # initial angular displacement is 0 by condition
-    Eq(0, angular_displacement_formula.subs(time, 0)),
-    Eq(angular_displacement, angular_displacement_formula)
-    ],
-    ("C1", angular_displacement),
-    dict=True,
-)[0][angular_displacement]
+    angular_displacement_derived = solve(
+        [
+        # initial angular displacement is 0 by condition
+        Eq(0, angular_displacement_formula.subs(time, 0)),
+        Eq(angular_displacement, angular_displacement_formula)
+        ],
+        ("C1", angular_displacement),
+        dict=True,
+    )[0][angular_displacement]
 
-assert expr_equals(angular_displacement_derived, law.rhs)
+    assert expr_equals(angular_displacement_derived, law.rhs)
 
 
 def print_law() -> str:
@@ -1,7 +1,10 @@
-from sympy import (Eq, solve, dsolve)
+from sympy import (Eq, dsolve)
 from symplyphysics import (units, Quantity, Symbol, Function, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.definitions import velocity_is_movement_derivative as velocity_definition
 
 # Description
@@ -26,17 +29,20 @@ distance = Function("distance_function", units.length)
 
 law = Eq(distance(movement_time), initial_position + constant_velocity * movement_time)
 
-# Derive the same law from velocity definition
 
-constant_velocity_movement_definition = velocity_definition.definition.subs({
-    velocity_definition.velocity(velocity_definition.moving_time): constant_velocity,
-    velocity_definition.moving_time: movement_time
-})
-dsolved_movement = dsolve(constant_velocity_movement_definition,
-    velocity_definition.movement(movement_time))
+# Derive the same law from velocity definition
+@proof
+def _derive_law():
+    # pylint: disable-next=assignment-from-no-return
+    constant_velocity_movement_definition = velocity_definition.definition.subs({
+        velocity_definition.velocity(velocity_definition.moving_time): constant_velocity,
+        velocity_definition.moving_time: movement_time
+    })
+    dsolved_movement = dsolve(constant_velocity_movement_definition,
+        velocity_definition.movement(movement_time))
 
-# Prove that derived movement function equals to law.rhs, given C1 = initial_position
-assert (expr_equals(dsolved_movement.rhs.subs("C1", initial_position), law.rhs))
+    # Prove that derived movement function equals to law.rhs, given C1 = initial_position
+    assert (expr_equals(dsolved_movement.rhs.subs("C1", initial_position), law.rhs))
 
 
 def print_law() -> str:
@@ -47,9 +53,10 @@ def print_law() -> str:
     velocity_=constant_velocity,
     time_=movement_time)
 @validate_output(distance)
+@numeric(law, distance(movement_time))
 def calculate_distance(initial_distance_: Quantity, velocity_: Quantity,
     time_: Quantity) -> Quantity:
-    result_expr = solve(law, distance(movement_time), dict=True)[0][distance(movement_time)]
+    result_expr = solved_for(law, distance(movement_time))
     result_expr_substituted = result_expr.subs({
         initial_position: initial_distance_,
         constant_velocity: velocity_,
@@ -1,7 +1,10 @@
 from sympy import (Eq, solve, pi)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.kinematic import angular_frequency_from_radians_per_time as frequency_def
 
 # Description
@@ -20,16 +23,19 @@ circular_frequency = Symbol("circular_frequency", units.frequency)
 
 law = Eq(period, 2 * pi / circular_frequency)
 
-# Derive the same law from angular frequency
 
-# 2 * pi radians is a full cycle and 'period' is time to complete full cycle rotation
-frequency_of_full_cycle_def = frequency_def.law.subs({
-    frequency_def.radians: 2 * pi,
-    frequency_def.time: period,
-    frequency_def.angular_frequency: circular_frequency
-})
-full_cycle_period = solve(frequency_of_full_cycle_def, period, dict=True)[0][period]
-assert expr_equals(full_cycle_period, law.rhs)
+# Derive the same law from angular frequency
+@proof
+def _derive_law():
+    # 2 * pi radians is a full cycle and 'period' is time to complete full cycle rotation
+    # pylint: disable-next=assignment-from-no-return
+    frequency_of_full_cycle_def = frequency_def.law.subs({
+        frequency_def.radians: 2 * pi,
+        frequency_def.time: period,
+        frequency_def.angular_frequency: circular_frequency
+    })
+    full_cycle_period = solve(frequency_of_full_cycle_def, period, dict=True)[0][period]
+    assert expr_equals(full_cycle_period, law.rhs)
 
 
 def print_law() -> str:
@@ -38,7 +44,8 @@ def print_law() -> str:
 
 @validate_input(frequency_=circular_frequency)
 @validate_output(period)
+@numeric(law, period)
 def calculate_period(frequency_: Quantity) -> Quantity:
-    solved = solve(law, period, dict=True)[0][period]
+    solved = solved_for(law, period)
     result_expr = solved.subs(circular_frequency, frequency_)
     return Quantity(result_expr)
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, symbols, cos)
+from sympy import (Eq, symbols, cos)
 from symplyphysics import (
     Quantity,
     Symbol,
@@ -6,6 +6,7 @@ from symplyphysics import (
     angle_type,
     validate_input,
 )
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.quantity_decorator import validate_output_same
 from symplyphysics.core.symbols.quantities import scale_factor
 
@@ -32,7 +33,7 @@ def print_law() -> str:
 @validate_input(angle_=vector_angle)
 @validate_output_same("vector_length_")
 def calculate_projection(vector_length_: Quantity, angle_: Quantity | float) -> Quantity:
-    result_projection_expr = solve(law, projection, dict=True)[0][projection]
+    result_projection_expr = solved_for(law, projection)
     #HACK: sympy angles are always in radians
     angle_radians = scale_factor(angle_)
     result_expr = result_projection_expr.subs({
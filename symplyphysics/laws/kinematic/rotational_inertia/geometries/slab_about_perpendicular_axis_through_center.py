@@ -8,6 +8,7 @@ from symplyphysics import (
     validate_output,
 )
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.kinematic.rotational_inertia import (
     rotational_inertia_cartesian_integral as integral_law,)
 from symplyphysics.definitions import density_from_mass_volume as density_def
@@ -27,35 +28,45 @@ width = Symbol("width", units.length)
 
 law = Eq(rotational_inertia, mass * (length**2 + width**2) / 12)
 
+
 # Derive this law from the integral definition of rotational inertia in cartesian coordiantes.
 # Condition: density of slab is constant.
+@proof
+def _derive_law():
+    # Reference frame:
+    ## z-axis is parallel to the rotational axis in question (height of slab)
+    ## x-axis and y-axis are perpendicular to the rotational axis (length and width of slab)
 
-# Reference frame:
-## z-axis is parallel to the rotational axis in question (height of slab)
-## x-axis and y-axis are perpendicular to the rotational axis (length and width of slab)
-
-height = Symbol("height", units.length)
-volume = length * width * height
+    height = Symbol("height", units.length)
+    volume = length * width * height
 
-density = density_def.definition.rhs.subs({
-    density_def.mass: mass,
-    density_def.volume: volume,
-})
+    density = density_def.definition.rhs.subs({
+        density_def.mass: mass,
+        density_def.volume: volume,
+    })
 
-distance_to_axis = sqrt(integral_law.x**2 + integral_law.y**2)
+    distance_to_axis = sqrt(integral_law.x**2 + integral_law.y**2)
 
-rotational_inertia_derived = integral_law.law.rhs.subs({
-    integral_law.density(integral_law.x, integral_law.y, integral_law.z): density,
-    integral_law.distance_to_axis(integral_law.x, integral_law.y, integral_law.z): distance_to_axis,
-    integral_law.x_start: -1 * length / 2,
-    integral_law.y_start: -1 * width / 2,
-    integral_law.z_start: 0,
-    integral_law.x_end: length / 2,
-    integral_law.y_end: width / 2,
-    integral_law.z_end: height,
-}).doit().simplify()
+    rotational_inertia_derived = integral_law.law.rhs.subs({
+        integral_law.density(integral_law.x, integral_law.y, integral_law.z):
+            density,
+        integral_law.distance_to_axis(integral_law.x, integral_law.y, integral_law.z):
+            distance_to_axis,
+        integral_law.x_start:
+        -1 * length / 2,
+        integral_law.y_start:
+        -1 * width / 2,
+        integral_law.z_start:
+            0,
+        integral_law.x_end:
+        length / 2,
+        integral_law.y_end:
+        width / 2,
+        integral_law.z_end:
+            height,
+    }).doit().simplify()
 
-assert expr_equals(law.rhs, rotational_inertia_derived)
+    assert expr_equals(law.rhs, rotational_inertia_derived)
 
 
 def print_law() -> str:
@@ -8,6 +8,7 @@ from symplyphysics import (
     validate_output,
 )
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.kinematic.rotational_inertia import rotational_inertia_cylindrical_integral as integral_law
 from symplyphysics.definitions import density_from_mass_volume as density_def
 
@@ -25,34 +26,36 @@ radius = Symbol("radius", units.length)
 
 law = Eq(rotational_inertia, mass * radius**2 / 2)
 
-# Derive law from general integral in cylindrical coordinates
 
-length = Symbol("length", units.length)
-volume = pi * radius**2 * length
+# Derive law from general integral in cylindrical coordinates
+@proof
+def _derive_law():
+    length = Symbol("length", units.length)
+    volume = pi * radius**2 * length
 
-density = density_def.definition.rhs.subs({
-    density_def.mass: mass,
-    density_def.volume: volume,
-})
+    density = density_def.definition.rhs.subs({
+        density_def.mass: mass,
+        density_def.volume: volume,
+    })
 
-rotational_inertia_derived = integral_law.law.rhs.subs({
-    integral_law.density(integral_law.radius, integral_law.polar_angle, integral_law.height):
-        density,
-    integral_law.radius_start:
-        0,
-    integral_law.radius_end:
-        radius,
-    integral_law.polar_angle_start:
-        0,
-    integral_law.polar_angle_end:
-    2 * pi,
-    integral_law.height_start:
-        0,
-    integral_law.height_end:
-        length,
-}).doit()
+    rotational_inertia_derived = integral_law.law.rhs.subs({
+        integral_law.density(integral_law.radius, integral_law.polar_angle, integral_law.height):
+            density,
+        integral_law.radius_start:
+            0,
+        integral_law.radius_end:
+            radius,
+        integral_law.polar_angle_start:
+            0,
+        integral_law.polar_angle_end:
+        2 * pi,
+        integral_law.height_start:
+            0,
+        integral_law.height_end:
+            length,
+    }).doit()
 
-assert expr_equals(rotational_inertia_derived, law.rhs)
+    assert expr_equals(rotational_inertia_derived, law.rhs)
 
 
 def print_law() -> str:
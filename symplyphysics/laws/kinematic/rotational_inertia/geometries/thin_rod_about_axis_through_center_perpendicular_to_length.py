@@ -8,6 +8,7 @@ from symplyphysics import (
     validate_output,
 )
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.kinematic.rotational_inertia.geometries import (
     slab_about_perpendicular_axis_through_center as slab_formula
 )
@@ -30,14 +31,15 @@ law = Eq(rotational_inertia, mass * length**2 / 12)
 # Derive law from formula for a slab rotating about the axis perpendicular to its lenght and width
 # passing through its center. The thin rod is a particular case of it, when the width of the slab
 # approaches zero.
+@proof
+def _derive_law():
+    rotational_inertia_derived = slab_formula.law.rhs.subs({
+        slab_formula.mass: mass,
+        slab_formula.length: length,
+        slab_formula.width: 0,
+    })
 
-rotational_inertia_derived = slab_formula.law.rhs.subs({
-    slab_formula.mass: mass,
-    slab_formula.length: length,
-    slab_formula.width: 0,
-})
-
-assert expr_equals(law.rhs, rotational_inertia_derived)
+    assert expr_equals(law.rhs, rotational_inertia_derived)
 
 
 def print_law() -> str:
@@ -1,4 +1,4 @@
-from sympy import Eq, solve
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,8 +7,9 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.operations.sum_array import SumArray
-from symplyphysics.core.symbols.symbols import tuple_of_symbols
+from symplyphysics.core.symbols.symbols import cached_tuple_of_symbols
 
 # Description
 ## For a system of particles, its total rotational inertia is the sum of the rotational
@@ -27,10 +28,10 @@ def print_law() -> str:
 @validate_input(rotational_inertias_=rotational_inertias)
 @validate_output(total_rotational_inertia)
 def calculate_rotational_inertia(rotational_inertias_: list[Quantity]) -> Quantity:
-    rotational_inertia_symbols = tuple_of_symbols("rotational_inertia",
+    rotational_inertia_symbols = cached_tuple_of_symbols("rotational_inertia",
         units.mass * units.length**2, len(rotational_inertias_))
     rotational_inertia_law = law.subs(rotational_inertias, rotational_inertia_symbols).doit()
-    solved = solve(rotational_inertia_law, total_rotational_inertia)[0]
+    solved = solved_for(rotational_inertia_law, total_rotational_inertia)
     for (symbol, value) in zip(rotational_inertia_symbols, rotational_inertias_):
         solved = solved.subs(symbol, value)
     return Quantity(solved)
@@ -1,7 +1,10 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.definitions import temporal_frequency_is_events_per_time as frequency_def
 
 # Description
@@ -18,14 +21,16 @@ temporal_frequency = Symbol("temporal_frequency", units.frequency)
 
 law = Eq(temporal_frequency, 1 / period)
 
-# Derive the same law from temporal frequency definition
 
-# Period is time span between events, so we are having 1 event per 'period' time
-frequency_of_single_event = frequency_def.definition.subs({
-    frequency_def.events: 1,
-    frequency_def.time: period
-}).rhs
-assert expr_equals(frequency_of_single_event, law.rhs)
+# Derive the same law from temporal frequency definition
+@proof
+def _derive_law():
+    # Period is time span between events, so we are having 1 event per 'period' time
+    frequency_of_single_event = frequency_def.definition.subs({
+        frequency_def.events: 1,
+        frequency_def.time: period
+    }).rhs
+    assert expr_equals(frequency_of_single_event, law.rhs)
 
 
 def print_law() -> str:
@@ -34,7 +39,8 @@ def print_law() -> str:
 
 @validate_input(period_=period)
 @validate_output(temporal_frequency)
+@numeric(law, temporal_frequency)
 def calculate_frequency(period_: Quantity) -> Quantity:
-    solved = solve(law, temporal_frequency, dict=True)[0][temporal_frequency]
+    solved = solved_for(law, temporal_frequency)
     result_expr = solved.subs(period, period_)
     return Quantity(result_expr)
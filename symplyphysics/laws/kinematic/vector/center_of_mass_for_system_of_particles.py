@@ -1,4 +1,4 @@
-from typing import Sequence
+from typing import Any, Iterable, Sequence
 
 from sympy import S
 from symplyphysics import (
@@ -6,12 +6,15 @@ from symplyphysics import (
     validate_input,
     validate_output,
     Quantity,
+    QuantityArray,
     Vector,
+    VectorArray,
     QuantityVector,
     add_cartesian_vectors,
     scale_vector,
 )
 from symplyphysics.core.dimensions import ScalarValue
+from symplyphysics.core.vectors.vector_array import weighted_mean_vector_array
 
 # Description
 ## The center of mass (com) of a system of particles is a unique point at any given time where
@@ -42,14 +45,25 @@ def center_of_mass_law(
     return scaled_result
 
 
+# Array form of the law for large number of particles. Each chunk contains masses, eg QuantityArray,
+# and positions of particles as VectorArray. Particles can be split into chunks, eg when they are
+# read from a file, so that only one chunk is kept in memory.
+def center_of_mass_array(chunks: Iterable[tuple[Any, VectorArray]]) -> VectorArray:
+    return weighted_mean_vector_array(chunks)
+
+
 @validate_input(
     masses_=units.mass,
     position_vectors_=units.length,
 )
 @validate_output(units.length)
 def calculate_center_of_mass(
-    masses_: Sequence[Quantity],
-    position_vectors_: Sequence[QuantityVector],
+    masses_: Sequence[Quantity] | QuantityArray,
+    position_vectors_: Sequence[QuantityVector] | VectorArray,
 ) -> QuantityVector:
+    if isinstance(position_vectors_, VectorArray):
+        return center_of_mass_array([(masses_, position_vectors_)]).to_quantity_vectors()[0]
+    if isinstance(masses_, QuantityArray):
+        raise TypeError("Positions should be VectorArray when masses are QuantityArray")
     result = center_of_mass_law(masses_, position_vectors_)
     return QuantityVector(result.components, result.coordinate_system)
@@ -1,6 +1,9 @@
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.nuclear.buckling import neutron_flux_for_uniform_cylinder as cylinder_flux
 
 # Description
@@ -21,18 +24,20 @@ geometric_buckling_squared = Symbol("geometric_buckling_squared", 1 / units.area
 
 law = Eq(geometric_buckling_squared, (2.405 / cylinder_radius)**2 + (pi / cylinder_height)**2)
 
+
 # This law is derived from geometric buckling definition (see geometric_buckling_from_neutron_flux.py),
 # neutron flux laplacian in cylindrical coordinates and boundary conditions.
-
-# Unfortunately sympy does not support solving with complex boundary conditions so we simply check with known
-# solution for the neutron flux:
-# See [neutron flux for uniform cylinder](./neutron_flux_for_uniform_cylinder.py)
-geometric_buckling_cylinder_squared = cylinder_flux.radial_constant**2 + cylinder_flux.axial_constant**2
-geometric_buckling_cylinder_solved = geometric_buckling_cylinder_squared.subs({
-    cylinder_flux.cylinder_radius: cylinder_radius,
-    cylinder_flux.cylinder_height: cylinder_height
-})
-assert geometric_buckling_cylinder_solved.evalf(7) == law.rhs.evalf(7)
+@proof
+def _derive_law():
+    # Unfortunately sympy does not support solving with complex boundary conditions so we simply check with known
+    # solution for the neutron flux:
+    # See [neutron flux for uniform cylinder](./neutron_flux_for_uniform_cylinder.py)
+    geometric_buckling_cylinder_squared = cylinder_flux.radial_constant**2 + cylinder_flux.axial_constant**2
+    geometric_buckling_cylinder_solved = geometric_buckling_cylinder_squared.subs({
+        cylinder_flux.cylinder_radius: cylinder_radius,
+        cylinder_flux.cylinder_height: cylinder_height
+    })
+    assert geometric_buckling_cylinder_solved.evalf(7) == law.rhs.evalf(7)
 
 
 def print_law() -> str:
@@ -41,9 +46,10 @@ def print_law() -> str:
 
 @validate_input(cylinder_radius_=cylinder_radius, cylinder_height_=cylinder_height)
 @validate_output(geometric_buckling_squared)
+@numeric(law, geometric_buckling_squared)
 def calculate_geometric_buckling_squared(cylinder_radius_: Quantity,
     cylinder_height_: Quantity) -> Quantity:
-    solved = solve(law, geometric_buckling_squared, dict=True)[0][geometric_buckling_squared]
+    solved = solved_for(law, geometric_buckling_squared)
     result_expr = solved.subs({
         cylinder_radius: cylinder_radius_,
         cylinder_height: cylinder_height_
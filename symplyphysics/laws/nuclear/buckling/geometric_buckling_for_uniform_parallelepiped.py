@@ -1,6 +1,9 @@
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.nuclear.buckling import neutron_flux_for_uniform_parallelepiped as parallelepiped_flux
 
 # Description
@@ -24,20 +27,22 @@ geometric_buckling_squared = Symbol("geometric_buckling_squared", 1 / units.area
 law = Eq(geometric_buckling_squared, (pi / parallelepiped_width)**2 +
     (pi / parallelepiped_length)**2 + (pi / parallelepiped_height)**2)
 
+
 # This law is derived from geometric buckling definition (see geometric_buckling_from_neutron_flux.py),
 # neutron flux laplacian in cartesian coordinates and boundary conditions.
-
-# Unfortunately sympy does not support solving with complex boundary conditions so we simply check with known
-# solution for the neutron flux:
-# See [neutron flux for uniform parallelepiped](./neutron_flux_for_uniform_parallelepiped.py)
-geometric_buckling_parallelepiped_squared = (parallelepiped_flux.width_constant**2 +
-    parallelepiped_flux.length_constant**2 + parallelepiped_flux.height_constant**2)
-geometric_buckling_parallelepiped_solved = geometric_buckling_parallelepiped_squared.subs({
-    parallelepiped_flux.parallelepiped_width: parallelepiped_width,
-    parallelepiped_flux.parallelepiped_length: parallelepiped_length,
-    parallelepiped_flux.parallelepiped_height: parallelepiped_height
-})
-assert geometric_buckling_parallelepiped_solved == law.rhs
+@proof
+def _derive_law():
+    # Unfortunately sympy does not support solving with complex boundary conditions so we simply check with known
+    # solution for the neutron flux:
+    # See [neutron flux for uniform parallelepiped](./neutron_flux_for_uniform_parallelepiped.py)
+    geometric_buckling_parallelepiped_squared = (parallelepiped_flux.width_constant**2 +
+        parallelepiped_flux.length_constant**2 + parallelepiped_flux.height_constant**2)
+    geometric_buckling_parallelepiped_solved = geometric_buckling_parallelepiped_squared.subs({
+        parallelepiped_flux.parallelepiped_width: parallelepiped_width,
+        parallelepiped_flux.parallelepiped_length: parallelepiped_length,
+        parallelepiped_flux.parallelepiped_height: parallelepiped_height
+    })
+    assert geometric_buckling_parallelepiped_solved == law.rhs
 
 
 def print_law() -> str:
@@ -48,9 +53,10 @@ def print_law() -> str:
     parallelepiped_length_=parallelepiped_length,
     parallelepiped_height_=parallelepiped_height)
 @validate_output(geometric_buckling_squared)
+@numeric(law, geometric_buckling_squared)
 def calculate_geometric_buckling_squared(parallelepiped_width_: Quantity,
     parallelepiped_length_: Quantity, parallelepiped_height_: Quantity) -> Quantity:
-    solved = solve(law, geometric_buckling_squared, dict=True)[0][geometric_buckling_squared]
+    solved = solved_for(law, geometric_buckling_squared)
     result_expr = solved.subs({
         parallelepiped_width: parallelepiped_width_,
         parallelepiped_length: parallelepiped_length_,
@@ -1,6 +1,9 @@
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.nuclear.buckling import neutron_flux_for_uniform_sphere as sphere_flux
 
 # Description
@@ -19,16 +22,18 @@ geometric_buckling_squared = Symbol("geometric_buckling_squared", 1 / units.area
 
 law = Eq(geometric_buckling_squared, (pi / sphere_radius)**2)
 
+
 # This law is derived from geometric buckling definition (see geometric_buckling_from_neutron_flux.py),
 # neutron flux laplacian in spherical coordinates and boundary condtitions.
-
-# Unfortunately sympy does not support solving with complex boundary conditions so we simply check with known
-# solution for the neutron flux:
-# See [neutron flux for uniform sphere](./neutron_flux_for_uniform_sphere.py)
-geometric_buckling_sphere_squared = sphere_flux.radial_constant**2
-geometric_buckling_sphere_flux_solved = geometric_buckling_sphere_squared.subs(
-    sphere_flux.sphere_radius, sphere_radius)
-assert geometric_buckling_sphere_flux_solved == law.rhs
+@proof
+def _derive_law():
+    # Unfortunately sympy does not support solving with complex boundary conditions so we simply check with known
+    # solution for the neutron flux:
+    # See [neutron flux for uniform sphere](./neutron_flux_for_uniform_sphere.py)
+    geometric_buckling_sphere_squared = sphere_flux.radial_constant**2
+    geometric_buckling_sphere_flux_solved = geometric_buckling_sphere_squared.subs(
+        sphere_flux.sphere_radius, sphere_radius)
+    assert geometric_buckling_sphere_flux_solved == law.rhs
 
 
 def print_law() -> str:
@@ -37,7 +42,8 @@ def print_law() -> str:
 
 @validate_input(sphere_radius_=sphere_radius)
 @validate_output(geometric_buckling_squared)
+@numeric(law, geometric_buckling_squared)
 def calculate_geometric_buckling_squared(sphere_radius_: Quantity) -> Quantity:
-    solved = solve(law, geometric_buckling_squared, dict=True)[0][geometric_buckling_squared]
+    solved = solved_for(law, geometric_buckling_squared)
     result_expr = solved.subs(sphere_radius, sphere_radius_)
     return Quantity(result_expr)
@@ -1,7 +1,11 @@
 from sympy import (Eq, solve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, dimensionless, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
+from symplyphysics.core.derivation_cache import cached_call
 from symplyphysics.laws.nuclear import diffusion_equation_from_neutron_flux as diffusion_equation_law
 from symplyphysics.laws.nuclear.buckling import geometric_buckling_from_neutron_flux as buckling_law
 
@@ -33,37 +37,45 @@ law = Eq(geometric_buckling_squared,
     ((neutrons_per_fission / effective_multiplication_factor) * macroscopic_fission_cross_section -
     macroscopic_absorption_cross_section) / diffusion_coefficient)
 
-# Derive the same law from the diffusion equation and geometric buckling from neutron flux law
 
-diffusion_eq1 = diffusion_equation_law.law.subs({
-    diffusion_equation_law.effective_multiplication_factor:
-        effective_multiplication_factor,
-    diffusion_equation_law.diffusion_coefficient:
-        diffusion_coefficient,
-    diffusion_equation_law.macroscopic_absorption_cross_section:
-        macroscopic_absorption_cross_section,
-    diffusion_equation_law.macroscopic_fission_cross_section:
-        macroscopic_fission_cross_section,
-    diffusion_equation_law.neutrons_per_fission:
-        neutrons_per_fission
-})
-buckling_eq2 = buckling_law.law.subs({
-    buckling_law.geometric_buckling_squared: geometric_buckling_squared,
-    buckling_law.neutron_flux: diffusion_equation_law.neutron_flux,
-    buckling_law.flux_position: diffusion_equation_law.flux_position,
-    buckling_law.neutron_flux_laplacian: diffusion_equation_law.neutron_flux_laplacian
-})
+# Derive the same law from the diffusion equation and geometric buckling from neutron flux law
+@proof
+def _derive_law():
+    # pylint: disable-next=assignment-from-no-return
+    diffusion_eq1 = diffusion_equation_law.law.subs({
+        diffusion_equation_law.effective_multiplication_factor:
+            effective_multiplication_factor,
+        diffusion_equation_law.diffusion_coefficient:
+            diffusion_coefficient,
+        diffusion_equation_law.macroscopic_absorption_cross_section:
+            macroscopic_absorption_cross_section,
+        diffusion_equation_law.macroscopic_fission_cross_section:
+            macroscopic_fission_cross_section,
+        diffusion_equation_law.neutrons_per_fission:
+            neutrons_per_fission
+    })
+    # pylint: disable-next=assignment-from-no-return
+    buckling_eq2 = buckling_law.law.subs({
+        buckling_law.geometric_buckling_squared: geometric_buckling_squared,
+        buckling_law.neutron_flux: diffusion_equation_law.neutron_flux,
+        buckling_law.flux_position: diffusion_equation_law.flux_position,
+        buckling_law.neutron_flux_laplacian: diffusion_equation_law.neutron_flux_laplacian
+    })
 
-derived_law = [
-    diffusion_eq1, buckling_eq2, diffusion_equation_law.neutron_flux_laplacian_definition
-]
+    derived_law = [
+        diffusion_eq1, buckling_eq2, diffusion_equation_law.neutron_flux_laplacian_definition
+    ]
 
-## Check the equivalence of 'law' and 'derived_law'
-derived_geometric_buckling_squared = solve(derived_law, (geometric_buckling_squared,
-    diffusion_equation_law.neutron_flux(diffusion_equation_law.flux_position),
-    diffusion_equation_law.neutron_flux_laplacian(diffusion_equation_law.flux_position)),
-    dict=True)[0][geometric_buckling_squared]
-assert expr_equals(law.rhs, derived_geometric_buckling_squared)
+    ## Check the equivalence of 'law' and 'derived_law'
+    derived_geometric_buckling_squared = cached_call(__name__,
+        "derived_geometric_buckling_squared",
+        solve,
+        derived_law, (geometric_buckling_squared,
+        diffusion_equation_law.neutron_flux(diffusion_equation_law.flux_position),
+        diffusion_equation_law.neutron_flux_laplacian(diffusion_equation_law.flux_position)),
+        dict=True)[0][geometric_buckling_squared]
+    assert cached_call(__name__, "law_equals", expr_equals, law.rhs,
+        derived_geometric_buckling_squared)
 
 
 def print_law() -> str:
@@ -76,11 +88,11 @@ def print_law() -> str:
     macroscopic_absorption_cross_section_=macroscopic_absorption_cross_section,
     diffusion_coefficient_=diffusion_coefficient)
 @validate_output(geometric_buckling_squared)
+@numeric(law, geometric_buckling_squared)
 def calculate_buckling(neutrons_per_fission_: float, effective_multiplication_factor_: float,
     macroscopic_fission_cross_section_: Quantity, macroscopic_absorption_cross_section_: Quantity,
     diffusion_coefficient_: Quantity) -> Quantity:
-    result_buckling_expr = solve(law, geometric_buckling_squared,
-        dict=True)[0][geometric_buckling_squared]
+    result_buckling_expr = solved_for(law, geometric_buckling_squared)
     result_expr = result_buckling_expr.subs({
         neutrons_per_fission: neutrons_per_fission_,
         effective_multiplication_factor: effective_multiplication_factor_,
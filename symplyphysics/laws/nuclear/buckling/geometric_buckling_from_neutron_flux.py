@@ -1,7 +1,9 @@
-from sympy import (Eq, solve, Expr, symbols, simplify, Equality)
+from sympy import (Eq, Expr, symbols, Equality)
 from sympy.vector import Laplacian
 from symplyphysics import (SI, Function, units, Quantity, Symbol, print_expression, validate_output)
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
+from symplyphysics.core.budget import budgeted_simplify, budgeted_solve
 from symplyphysics.laws.nuclear import diffusion_equation_from_neutron_flux as diffusion_equation
 
 # Description
@@ -38,11 +40,14 @@ neutron_flux_laplacian_definition = Eq(neutron_flux_laplacian(flux_position),
 law = Eq(geometric_buckling_squared,
     -1 * neutron_flux_laplacian(flux_position) / neutron_flux(flux_position))
 
-# Check laplacian definition is the same as in diffusion equation
 
-diffusion_equation_laplacian = diffusion_equation.neutron_flux_laplacian_definition.rhs.subs(
-    diffusion_equation.neutron_flux(diffusion_equation.flux_position), neutron_flux(flux_position))
-assert expr_equals(diffusion_equation_laplacian, neutron_flux_laplacian_definition.rhs)
+# Check laplacian definition is the same as in diffusion equation
+@proof
+def _check_laplacian_definition():
+    diffusion_equation_laplacian = diffusion_equation.neutron_flux_laplacian_definition.rhs.subs(
+        diffusion_equation.neutron_flux(diffusion_equation.flux_position),
+        neutron_flux(flux_position))
+    assert expr_equals(diffusion_equation_laplacian, neutron_flux_laplacian_definition.rhs)
 
 
 def print_law() -> str:
@@ -59,7 +64,7 @@ def apply_neutron_flux_function(neutron_flux_function_: Expr) -> Equality:
         neutron_flux(flux_position), neutron_flux_function_).doit() / unit_length**2
     applied_law = law.subs(neutron_flux_laplacian(flux_position), neutron_flux_laplacian_eval)
     applied_law = applied_law.subs(neutron_flux(flux_position), neutron_flux_function_)
-    return simplify(applied_law)
+    return budgeted_simplify(applied_law)
 
 
 # neutron_flux_function_ should be a function on CoordSys3D
@@ -72,6 +77,6 @@ def calculate_geometric_buckling_squared(neutron_flux_function_: Expr) -> Quanti
         neutron_flux.dimension)
 
     result_expr = apply_neutron_flux_function(neutron_flux_function_)
-    result_buckling_expr = solve(result_expr, geometric_buckling_squared,
+    result_buckling_expr = budgeted_solve(result_expr, geometric_buckling_squared,
         dict=True)[0][geometric_buckling_squared]
     return Quantity(result_buckling_expr)
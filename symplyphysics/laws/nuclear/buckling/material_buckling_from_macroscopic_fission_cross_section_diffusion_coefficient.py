@@ -1,7 +1,11 @@
 from sympy import (Eq, solve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, dimensionless, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
+from symplyphysics.core.derivation_cache import cached_call
 from symplyphysics.laws.nuclear.buckling import geometric_buckling_from_macroscopic_fission_cross_section_diffusion_coefficient as buckling_law
 
 # Description
@@ -28,24 +32,30 @@ material_buckling_squared = Symbol("material_buckling_squared", 1 / units.area)
 law = Eq(material_buckling_squared, (neutrons_per_fission * macroscopic_fission_cross_section -
     macroscopic_absorption_cross_section) / diffusion_coefficient)
 
-# Derive the same law from the geometric buckling and critical reactor condition
 
-buckling_eq1 = buckling_law.law.subs({
-    buckling_law.geometric_buckling_squared: material_buckling_squared,
-    buckling_law.neutrons_per_fission: neutrons_per_fission,
-    buckling_law.macroscopic_fission_cross_section: macroscopic_fission_cross_section,
-    buckling_law.macroscopic_absorption_cross_section: macroscopic_absorption_cross_section,
-    buckling_law.diffusion_coefficient: diffusion_coefficient
-})
-critical_condition_eq2 = Eq(buckling_law.effective_multiplication_factor, 1)
+# Derive the same law from the geometric buckling and critical reactor condition
+@proof
+def _derive_law():
+    # pylint: disable-next=assignment-from-no-return
+    buckling_eq1 = buckling_law.law.subs({
+        buckling_law.geometric_buckling_squared: material_buckling_squared,
+        buckling_law.neutrons_per_fission: neutrons_per_fission,
+        buckling_law.macroscopic_fission_cross_section: macroscopic_fission_cross_section,
+        buckling_law.macroscopic_absorption_cross_section: macroscopic_absorption_cross_section,
+        buckling_law.diffusion_coefficient: diffusion_coefficient
+    })
+    critical_condition_eq2 = Eq(buckling_law.effective_multiplication_factor, 1)
 
-derived_law = [buckling_eq1, critical_condition_eq2]
+    derived_law = [buckling_eq1, critical_condition_eq2]
 
-## Check the equivalence of 'law' and 'derived_law'
-derived_material_buckling_squared = solve(derived_law,
-    (material_buckling_squared, buckling_law.effective_multiplication_factor),
-    dict=True)[0][material_buckling_squared]
-assert expr_equals(law.rhs, derived_material_buckling_squared)
+    ## Check the equivalence of 'law' and 'derived_law'
+    derived_material_buckling_squared = cached_call(__name__,
+        "derived_material_buckling_squared",
+        solve,
+        derived_law, (material_buckling_squared, buckling_law.effective_multiplication_factor),
+        dict=True)[0][material_buckling_squared]
+    assert cached_call(__name__, "law_equals", expr_equals, law.rhs,
+        derived_material_buckling_squared)
 
 
 def print_law() -> str:
@@ -57,10 +67,10 @@ def print_law() -> str:
     macroscopic_absorption_cross_section_=macroscopic_absorption_cross_section,
     diffusion_coefficient_=diffusion_coefficient)
 @validate_output(material_buckling_squared)
+@numeric(law, material_buckling_squared)
 def calculate_buckling(neutrons_per_fission_: float, macroscopic_fission_cross_section_: Quantity,
     macroscopic_absorption_cross_section_: Quantity, diffusion_coefficient_: Quantity) -> Quantity:
-    result_buckling_expr = solve(law, material_buckling_squared,
-        dict=True)[0][material_buckling_squared]
+    result_buckling_expr = solved_for(law, material_buckling_squared)
     result_expr = result_buckling_expr.subs({
         neutrons_per_fission: neutrons_per_fission_,
         macroscopic_fission_cross_section: macroscopic_fission_cross_section_,
@@ -2,6 +2,7 @@ from sympy import (Eq, pi, cos)
 from sympy.vector import CoordSys3D
 from sympy.functions.special.bessel import besselj
 from symplyphysics import (Function, Quantity, Symbol, print_expression, units)
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.nuclear.buckling import geometric_buckling_from_neutron_flux
 from symplyphysics.laws.nuclear.buckling import neutron_flux_for_uniform_slab
 
@@ -54,26 +55,29 @@ law = Eq(
 # radial_constant is the solution of the Bessel function J0, with a condition the neutron flux cannot
 # have negative values (finite flux condition) and with zero flux boundary condition
 
-# Define flux function in cylindrical coordinates as a function of cylinder radius and height
 
-# CoordinateSystem class does not work here, because Laplacian obtains coordinate system from
-# the provided scalar field (neutron_flux function)
-cylindrical_coordinates = CoordSys3D("cylindrical_coordinates", transformation="cylindrical")
-# Make linter happy
-r = getattr(cylindrical_coordinates, "r")
-z = getattr(cylindrical_coordinates, "z")
-unit_length = Quantity(1, dimension=units.length)
-neutron_flux_function_cylindrical = law.subs({
-    radial_distance_from_center: r * unit_length,
-    axial_distance_from_center: z * unit_length
-})
-
-solved = geometric_buckling_from_neutron_flux.apply_neutron_flux_function(
-    neutron_flux_function_cylindrical.rhs)
-
-# check with the derived law: Bg^2 = radial_constant**2 + axial_constant**2
-# limit decimals to bypass rounding errors
-assert solved.rhs.evalf(7) == (radial_constant**2 + axial_constant**2).evalf(7)
+# Define flux function in cylindrical coordinates as a function of cylinder radius and height
+@proof
+def _check_solution():
+    # CoordinateSystem class does not work here, because Laplacian obtains coordinate system from
+    # the provided scalar field (neutron_flux function)
+    cylindrical_coordinates = CoordSys3D("cylindrical_coordinates", transformation="cylindrical")
+    # Make linter happy
+    r = getattr(cylindrical_coordinates, "r")
+    z = getattr(cylindrical_coordinates, "z")
+    unit_length = Quantity(1, dimension=units.length)
+    # pylint: disable-next=assignment-from-no-return
+    neutron_flux_function_cylindrical = law.subs({
+        radial_distance_from_center: r * unit_length,
+        axial_distance_from_center: z * unit_length
+    })
+
+    solved = geometric_buckling_from_neutron_flux.apply_neutron_flux_function(
+        neutron_flux_function_cylindrical.rhs)
+
+    # check with the derived law: Bg^2 = radial_constant**2 + axial_constant**2
+    # limit decimals to bypass rounding errors
+    assert solved.rhs.evalf(7) == (radial_constant**2 + axial_constant**2).evalf(7)
 
 
 def print_law() -> str:
@@ -1,6 +1,7 @@
 from sympy import Eq, pi, cos
 from sympy.vector import CoordSys3D
 from symplyphysics import (Function, Quantity, Symbol, print_expression, units)
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.nuclear.buckling import geometric_buckling_from_neutron_flux
 from symplyphysics.laws.nuclear.buckling import neutron_flux_for_uniform_slab
 
@@ -55,24 +56,28 @@ law = Eq(
 # - interface condition: the neutron flux and the normal component of the neutron current must be continuous
 # - source condition: all neutrons flowing through the bounding area of the source must come from the neutron source
 
+
 # define flux function in cylindrical coordinates as a function of cylinder radius and height
-cartesian_coordinates = CoordSys3D("cartesian_coordinates")
-# Make linter happy
-x = getattr(cartesian_coordinates, "x")
-y = getattr(cartesian_coordinates, "y")
-z = getattr(cartesian_coordinates, "z")
-unit_length = Quantity(1, dimension=units.length)
-neutron_flux_function_cartesian = law.subs({
-    x_distance_from_center: x * unit_length,
-    y_distance_from_center: y * unit_length,
-    z_distance_from_center: z * unit_length
-})
-
-solved = geometric_buckling_from_neutron_flux.apply_neutron_flux_function(
-    neutron_flux_function_cartesian.rhs)
-
-# check with the derived law: Bg^2 = width_constant**2 + length_constant**2 + height_constant**2
-assert solved.rhs == (width_constant**2 + length_constant**2 + height_constant**2)
+@proof
+def _check_solution():
+    cartesian_coordinates = CoordSys3D("cartesian_coordinates")
+    # Make linter happy
+    x = getattr(cartesian_coordinates, "x")
+    y = getattr(cartesian_coordinates, "y")
+    z = getattr(cartesian_coordinates, "z")
+    unit_length = Quantity(1, dimension=units.length)
+    # pylint: disable-next=assignment-from-no-return
+    neutron_flux_function_cartesian = law.subs({
+        x_distance_from_center: x * unit_length,
+        y_distance_from_center: y * unit_length,
+        z_distance_from_center: z * unit_length
+    })
+
+    solved = geometric_buckling_from_neutron_flux.apply_neutron_flux_function(
+        neutron_flux_function_cartesian.rhs)
+
+    # check with the derived law: Bg^2 = width_constant**2 + length_constant**2 + height_constant**2
+    assert solved.rhs == (width_constant**2 + length_constant**2 + height_constant**2)
 
 
 def print_law() -> str:
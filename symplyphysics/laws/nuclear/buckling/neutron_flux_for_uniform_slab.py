@@ -1,6 +1,7 @@
 from sympy import (Eq, pi, cos)
 from sympy.vector import CoordSys3D
 from symplyphysics import (Function, Quantity, Symbol, print_expression, units)
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.nuclear.buckling import geometric_buckling_from_neutron_flux
 
 # Description
@@ -36,18 +37,22 @@ law = Eq(neutron_flux(distance_from_center),
 # - interface condition: the neutron flux and the normal component of the neutron current must be continuous
 # - source condition: all neutrons flowing through the bounding area of the source must come from the neutron source
 
-# define flux function in cartesian coordinates as a function of x coordinate
-cartesian_coordinates = CoordSys3D("cartesian_coordinates")
-# Make linter happy
-x = getattr(cartesian_coordinates, "x")
-unit_length = Quantity(1, dimension=units.length)
-neutron_flux_function_cartesian = law.subs(distance_from_center, x * unit_length)
-
-solved = geometric_buckling_from_neutron_flux.apply_neutron_flux_function(
-    neutron_flux_function_cartesian.rhs)
 
-# check with the derived law: Bg^2 = axial_constant**2
-assert solved.rhs == axial_constant**2
+# define flux function in cartesian coordinates as a function of x coordinate
+@proof
+def _check_solution():
+    cartesian_coordinates = CoordSys3D("cartesian_coordinates")
+    # Make linter happy
+    x = getattr(cartesian_coordinates, "x")
+    unit_length = Quantity(1, dimension=units.length)
+    # pylint: disable-next=assignment-from-no-return
+    neutron_flux_function_cartesian = law.subs(distance_from_center, x * unit_length)
+
+    solved = geometric_buckling_from_neutron_flux.apply_neutron_flux_function(
+        neutron_flux_function_cartesian.rhs)
+
+    # check with the derived law: Bg^2 = axial_constant**2
+    assert solved.rhs == axial_constant**2
 
 
 def print_law() -> str:
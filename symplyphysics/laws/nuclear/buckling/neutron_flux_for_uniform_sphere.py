@@ -1,6 +1,7 @@
 from sympy import Eq, pi, sin
 from sympy.vector import CoordSys3D
 from symplyphysics import (Function, Quantity, Symbol, print_expression, units)
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.nuclear.buckling import geometric_buckling_from_neutron_flux
 
 # Description
@@ -39,18 +40,22 @@ law = Eq(
 # - source condition: all neutrons flowing through the bounding area of the source must come from the neutron source
 # - albedo boundary condition: Ф(Ralbedo) = 0
 
+
 # define flux function in spherical coordinates as a function of sphere radius
-spherical_coordinates = CoordSys3D("spherical_coordinates", transformation="spherical")
-# Make linter happy
-r = getattr(spherical_coordinates, "r")
-unit_length = Quantity(1, dimension=units.length)
-neutron_flux_function_spherical = law.subs(distance_from_center, r * unit_length)
+@proof
+def _check_solution():
+    spherical_coordinates = CoordSys3D("spherical_coordinates", transformation="spherical")
+    # Make linter happy
+    r = getattr(spherical_coordinates, "r")
+    unit_length = Quantity(1, dimension=units.length)
+    # pylint: disable-next=assignment-from-no-return
+    neutron_flux_function_spherical = law.subs(distance_from_center, r * unit_length)
 
-solved = geometric_buckling_from_neutron_flux.apply_neutron_flux_function(
-    neutron_flux_function_spherical.rhs)
+    solved = geometric_buckling_from_neutron_flux.apply_neutron_flux_function(
+        neutron_flux_function_spherical.rhs)
 
-# check with the derived law: Bg^2 = radial_constant**2
-assert solved.rhs == radial_constant**2
+    # check with the derived law: Bg^2 = radial_constant**2
+    assert solved.rhs == radial_constant**2
 
 
 def print_law() -> str:
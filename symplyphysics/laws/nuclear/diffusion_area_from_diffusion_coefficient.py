@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The physical meaning of the diffusion length can be seen by calculating the mean square distance that
@@ -30,9 +32,10 @@ def print_law() -> str:
 @validate_input(diffusion_coefficient_=diffusion_coefficient,
     macroscopic_absorption_cross_section_=macroscopic_absorption_cross_section)
 @validate_output(diffusion_area)
+@numeric(law, diffusion_area)
 def calculate_diffusion_area(diffusion_coefficient_: Quantity,
     macroscopic_absorption_cross_section_: Quantity) -> Quantity:
-    result_diffusion_expr = solve(law, diffusion_area, dict=True)[0][diffusion_area]
+    result_diffusion_expr = solved_for(law, diffusion_area)
     result_expr = result_diffusion_expr.subs({
         diffusion_coefficient: diffusion_coefficient_,
         macroscopic_absorption_cross_section: macroscopic_absorption_cross_section_
@@ -1,4 +1,4 @@
-from sympy import (Eq, Expr, solve, symbols, S, simplify)
+from sympy import (Eq, Expr, symbols, S)
 from sympy.vector import Laplacian
 from symplyphysics import (
     SI,
@@ -12,6 +12,7 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.budget import budgeted_simplify, budgeted_solve
 
 # Description
 ## The diffusion equation, based on Fick's law, provides an analytical solution of spatial neutron flux
@@ -76,7 +77,7 @@ def apply_neutron_flux_function(neutron_flux_function_: Expr) -> Expr:
         neutron_flux(flux_position), neutron_flux_function_).doit() / unit_length**2
     applied_law = law.subs(neutron_flux_laplacian(flux_position), neutron_flux_laplacian_eval)
     applied_law = applied_law.subs(neutron_flux(flux_position), neutron_flux_function_)
-    return simplify(applied_law)
+    return budgeted_simplify(applied_law)
 
 
 # neutron_flux_function_ should be a function on CoordSys3D
@@ -102,7 +103,7 @@ def calculate_multiplication_factor(neutron_flux_function_: Expr, neutrons_per_f
         macroscopic_absorption_cross_section: macroscopic_absorption_cross_section_,
         diffusion_coefficient: diffusion_coefficient_
     })
-    result_factor_expr = solve(result_expr, effective_multiplication_factor,
+    result_factor_expr = budgeted_solve(result_expr, effective_multiplication_factor,
         dict=True)[0][effective_multiplication_factor]
     result_factor = Quantity(result_factor_expr)
     return float(convert_to(result_factor, S.One).evalf())
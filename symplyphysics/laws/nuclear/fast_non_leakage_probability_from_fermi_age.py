@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, exp, S)
+from sympy import (Eq, exp, S)
 from symplyphysics import (
     units,
     Quantity,
@@ -9,6 +9,7 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.symbols.probability import Probability
 
 # Description
@@ -40,8 +41,7 @@ def print_law() -> str:
 @validate_output(fast_non_leakage_probability)
 def calculate_probability(geometric_buckling_: Quantity,
     neutron_fermi_age_: Quantity) -> Probability:
-    result_probability_expr = solve(law, fast_non_leakage_probability,
-        dict=True)[0][fast_non_leakage_probability]
+    result_probability_expr = solved_for(law, fast_non_leakage_probability)
     result_expr = result_probability_expr.subs({
         geometric_buckling: geometric_buckling_,
         neutron_fermi_age: neutron_fermi_age_
@@ -1,5 +1,6 @@
-from sympy import (Eq, solve, symbols)
+from sympy import (Eq, symbols)
 from symplyphysics import print_expression
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.symbols.probability import Probability
 
 # Description
@@ -35,8 +36,7 @@ def print_law() -> str:
 def calculate_multiplication_factor(neutron_reproduction_: float, fast_fission_: float,
     resonance_escape_probability_: Probability, thermal_utilisation_: Probability) -> float:
 
-    result_factor_expr = solve(law, infinite_multiplication_factor,
-        dict=True)[0][infinite_multiplication_factor]
+    result_factor_expr = solved_for(law, infinite_multiplication_factor)
     result_expr = result_factor_expr.subs({
         neutron_reproduction: neutron_reproduction_,
         fast_fission: fast_fission_,
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (
     units,
     Quantity,
@@ -9,6 +9,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Infinite multiplication factor: k_infinite = v * Σf / Σa
@@ -39,12 +41,12 @@ def print_law() -> str:
     macroscopic_fission_cross_section_=macroscopic_fission_cross_section,
     macroscopic_absorption_cross_section_=macroscopic_absorption_cross_section)
 @validate_output(infinite_multiplication_factor)
+@numeric(law, infinite_multiplication_factor)
 def calculate_multiplication_factor(neutrons_per_fission_: float,
     macroscopic_fission_cross_section_: Quantity,
     macroscopic_absorption_cross_section_: Quantity) -> float:
 
-    result_factor_expr = solve(law, infinite_multiplication_factor,
-        dict=True)[0][infinite_multiplication_factor]
+    result_factor_expr = solved_for(law, infinite_multiplication_factor)
     result_expr = result_factor_expr.subs({
         neutrons_per_fission: neutrons_per_fission_,
         macroscopic_fission_cross_section: macroscopic_fission_cross_section_,
@@ -1,6 +1,7 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, convert_to, dimensionless)
+from symplyphysics.core.solvers import solved_for
 
 # Description
 ## Half-life is the time required for a quantity (of substance) to reduce to half of its initial value.
@@ -35,7 +36,7 @@ def calculate_number_of_cores(number_of_cores_initial_: int, half_life_: Quantit
     decay_time_: Quantity) -> int:
     if number_of_cores_initial_ < 0:
         raise ValueError("Number of cores cannot be negative")
-    result_expr = solve(law, number_of_cores, dict=True)[0][number_of_cores]
+    result_expr = solved_for(law, number_of_cores)
     result_expr = result_expr.subs({
         number_of_cores_initial: number_of_cores_initial_,
         half_life: half_life_,
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Macroscopic cross-section - represents the effective target area of all of the nuclei contained
@@ -31,8 +33,8 @@ def print_law() -> str:
 
 @validate_input(mean_free_path_=mean_free_path)
 @validate_output(macroscopic_cross_section)
+@numeric(law, macroscopic_cross_section)
 def calculate_cross_section(mean_free_path_: Quantity) -> Quantity:
-    result_cross_section_expr = solve(law, macroscopic_cross_section,
-        dict=True)[0][macroscopic_cross_section]
+    result_cross_section_expr = solved_for(law, macroscopic_cross_section)
     result_expr = result_cross_section_expr.subs(mean_free_path, mean_free_path_)
     return Quantity(result_expr)
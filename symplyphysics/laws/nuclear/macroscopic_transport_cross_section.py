@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -8,6 +8,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The transport mean free path (λtr) is an average distance a neutron will move in its original direction
@@ -39,10 +41,10 @@ def print_law() -> str:
 @validate_input(macroscopic_scattering_cross_section_=macroscopic_scattering_cross_section,
     average_scattering_angle_cosine_=average_scattering_angle_cosine)
 @validate_output(macroscopic_transport_cross_section)
+@numeric(law, macroscopic_transport_cross_section)
 def calculate_cross_section(macroscopic_scattering_cross_section_: Quantity,
     average_scattering_angle_cosine_: float) -> Quantity:
-    result_cross_section_expr = solve(law, macroscopic_transport_cross_section,
-        dict=True)[0][macroscopic_transport_cross_section]
+    result_cross_section_expr = solved_for(law, macroscopic_transport_cross_section)
     result_expr = result_cross_section_expr.subs({
         macroscopic_scattering_cross_section: macroscopic_scattering_cross_section_,
         average_scattering_angle_cosine: average_scattering_angle_cosine_
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Migration area (M^2) is equal to one-sixth of the square of the average distance (in all dimensions) between
@@ -35,8 +37,9 @@ def print_law() -> str:
 
 @validate_input(diffusion_area_=diffusion_area, neutron_fermi_age_=neutron_fermi_age)
 @validate_output(migration_area)
+@numeric(law, migration_area)
 def calculate_migration_area(diffusion_area_: Quantity, neutron_fermi_age_: Quantity) -> Quantity:
-    result_area_expr = solve(law, migration_area, dict=True)[0][migration_area]
+    result_area_expr = solved_for(law, migration_area)
     result_expr = result_area_expr.subs({
         diffusion_area: diffusion_area_,
         neutron_fermi_age: neutron_fermi_age_
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The current density vector J is proportional to the negative of the gradient of the neutron flux.
@@ -37,9 +39,9 @@ def print_law() -> str:
 
 @validate_input(macroscopic_transport_cross_section_=macroscopic_transport_cross_section)
 @validate_output(neutron_diffusion_coefficient)
+@numeric(law, neutron_diffusion_coefficient)
 def calculate_diffusion_coefficient(macroscopic_transport_cross_section_: Quantity) -> Quantity:
-    result_coefficient_expr = solve(law, neutron_diffusion_coefficient,
-        dict=True)[0][neutron_diffusion_coefficient]
+    result_coefficient_expr = solved_for(law, neutron_diffusion_coefficient)
     result_expr = result_coefficient_expr.subs(
         {macroscopic_transport_cross_section: macroscopic_transport_cross_section_})
     return Quantity(result_expr)
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, exp, S)
+from sympy import (Eq, exp, S)
 from symplyphysics import (
     units,
     Quantity,
@@ -9,6 +9,7 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.symbols.probability import Probability
 
 # Description
@@ -61,8 +62,7 @@ def calculate_resonance_escape_probability(
         average_lethargy_change_: float,
         macroscopic_scattering_cross_section_moderator_: Quantity) -> Probability:
 
-    result_factor_expr = solve(law, resonance_escape_probability,
-        dict=True)[0][resonance_escape_probability]
+    result_factor_expr = solved_for(law, resonance_escape_probability)
     result_expr = result_factor_expr.subs({
         absorber_atomic_number_density:
             absorber_atomic_number_density_,
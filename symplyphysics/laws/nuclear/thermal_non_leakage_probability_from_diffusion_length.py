@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (
     units,
     Quantity,
@@ -9,6 +9,7 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.symbols.probability import Probability
 
 # Description
@@ -39,8 +40,7 @@ def print_law() -> str:
 @validate_output(thermal_non_leakage_probability)
 def calculate_probability(thermal_diffusion_area_: Quantity,
     geometric_buckling_: Quantity) -> Probability:
-    result_probability_expr = solve(law, thermal_non_leakage_probability,
-        dict=True)[0][thermal_non_leakage_probability]
+    result_probability_expr = solved_for(law, thermal_non_leakage_probability)
     result_expr = result_probability_expr.subs({
         thermal_diffusion_area: thermal_diffusion_area_,
         geometric_buckling: geometric_buckling_
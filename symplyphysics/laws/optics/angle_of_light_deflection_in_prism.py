@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (Quantity, Symbol, print_expression, validate_input, validate_output,
     dimensionless, angle_type)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## A prism, an optical prism, is a body made of a homogeneous material transparent to optical radiation,
@@ -34,8 +36,9 @@ def print_law() -> str:
 
 @validate_input(angle_faces_=angle_faces, refractive_index_=refractive_index)
 @validate_output(angle_deviation)
+@numeric(law, angle_deviation)
 def calculate_angle_deviation(angle_faces_: float | Quantity, refractive_index_: float) -> Quantity:
-    result_expr = solve(law, angle_deviation, dict=True)[0][angle_deviation]
+    result_expr = solved_for(law, angle_deviation)
     result_expr = result_expr.subs({
         angle_faces: angle_faces_,
         refractive_index: refractive_index_,
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve, sin)
+from sympy import (Eq, sin)
 from symplyphysics import (units, Quantity, Symbol, print_expression, dimensionless, validate_input,
     validate_output, angle_type)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Diffraction from a three-dimensional periodic structure such as atoms in a crystal is called Bragg
@@ -37,9 +39,10 @@ def print_law() -> str:
     angle_=angle,
 )
 @validate_output(distance)
+@numeric(law, distance)
 def calculate_distance(diffraction_order_: int, wavelength_: Quantity,
     angle_: float | Quantity) -> Quantity:
-    result_expr = solve(law, distance, dict=True)[0][distance]
+    result_expr = solved_for(law, distance)
     distance_applied = result_expr.subs({
         diffraction_order: diffraction_order_,
         wavelength: wavelength_,
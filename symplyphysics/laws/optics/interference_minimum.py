@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## If the travel difference is equal to an odd number of half-waves,
@@ -27,8 +29,9 @@ def print_law():
 
 @validate_input(wave_length_=wave_length, number_minimum_=number_minimum)
 @validate_output(travel_difference)
+@numeric(law, travel_difference)
 def calculate_travel_difference(wave_length_: Quantity, number_minimum_: int) -> Quantity:
-    solved = solve(law, travel_difference, dict=True)[0][travel_difference]
+    solved = solved_for(law, travel_difference)
     result_expr = solved.subs({wave_length: wave_length_, number_minimum: number_minimum_})
     result = Quantity(result_expr)
     return result
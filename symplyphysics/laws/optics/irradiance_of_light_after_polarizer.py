@@ -1,4 +1,4 @@
-from sympy import Eq, solve, cos
+from sympy import Eq, cos
 from symplyphysics import (
     units,
     Quantity,
@@ -9,6 +9,8 @@ from symplyphysics import (
     dimensionless,
     angle_type,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Malus's law states that the irradiance of linearly polarized light that passes through a polarizer
@@ -43,12 +45,13 @@ def print_law() -> str:
     polarization_angle_=polarization_angle,
 )
 @validate_output(irradiance_final)
+@numeric(law, irradiance_final)
 def calculate_irradiance(
     irradiance_initial_: Quantity,
     transparency_coefficient_: float,
     polarization_angle_: Quantity | float,
 ) -> Quantity:
-    result_expr = solve(law, irradiance_final, dict=True)[0][irradiance_final]
+    result_expr = solved_for(law, irradiance_final)
     irradiance_applied = result_expr.subs({
         irradiance_initial: irradiance_initial_,
         transparency_coefficient: transparency_coefficient_,
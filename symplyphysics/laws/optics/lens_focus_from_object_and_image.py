@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Any optic lens creates image of an object. Distances lens-object and lens-image depend on lens optical strength.
@@ -28,8 +30,9 @@ def print_law() -> str:
 
 @validate_input(object_distance_=distance_to_object, image_distance_=distance_to_image)
 @validate_output(focus_distance)
+@numeric(law, focus_distance)
 def calculate_focus(object_distance_: Quantity, image_distance_: Quantity) -> Quantity:
-    result_expr = solve(law, focus_distance, dict=True)[0][focus_distance]
+    result_expr = solved_for(law, focus_distance)
     focus_applied = result_expr.subs({
         distance_to_object: object_distance_,
         distance_to_image: image_distance_
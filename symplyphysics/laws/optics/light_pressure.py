@@ -1,7 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import speed_of_light
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Light pressure is the pressure exerted by light radiation incident on the surface of a body.
@@ -28,8 +30,9 @@ def print_law() -> str:
 
 @validate_input(intensity_=intensity, reflection_coefficient_=reflection_coefficient)
 @validate_output(pressure)
+@numeric(law, pressure)
 def calculate_pressure(intensity_: Quantity, reflection_coefficient_: float) -> Quantity:
-    result_expr = solve(law, pressure, dict=True)[0][pressure]
+    result_expr = solved_for(law, pressure)
     result_expr = result_expr.subs({
         intensity: intensity_,
         reflection_coefficient: reflection_coefficient_,
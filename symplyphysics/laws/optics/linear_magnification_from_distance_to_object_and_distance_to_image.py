@@ -1,6 +1,7 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless, convert_to)
+from symplyphysics.core.solvers import solved_for
 
 # Description
 ## Magnification, in optics, the size of an image relative to the size of the object creating it.
@@ -35,7 +36,7 @@ def print_law() -> str:
 def calculate_magnification(distance_to_image_: Quantity, distance_to_object_: Quantity) -> float:
     if distance_to_object_.scale_factor > 0:
         raise ValueError("The distance to the object must be non-positive.")
-    result_expr = solve(law, magnification, dict=True)[0][magnification]
+    result_expr = solved_for(law, magnification)
     result_magnification = result_expr.subs({
         distance_to_image: distance_to_image_,
         distance_to_object: distance_to_object_,
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless, convert_to)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Magnification, in optics, the size of an image relative to the size of the object creating it.
@@ -28,8 +30,9 @@ def print_law() -> str:
 
 @validate_input(image_height_=image_height, object_height_=object_height)
 @validate_output(magnification)
+@numeric(law, magnification)
 def calculate_magnification(image_height_: Quantity, object_height_: Quantity) -> float:
-    result_expr = solve(law, magnification, dict=True)[0][magnification]
+    result_expr = solved_for(law, magnification)
     result_magnification = result_expr.subs({
         image_height: image_height_,
         object_height: object_height_,
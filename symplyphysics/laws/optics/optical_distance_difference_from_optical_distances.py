@@ -1,7 +1,9 @@
-from sympy import Eq, solve
+from sympy import Eq
 
 from symplyphysics import Symbol, units, print_expression, Quantity, \
     validate_input, validate_output
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The optical difference in the course of two rays is the difference
@@ -25,9 +27,10 @@ def print_law() -> str:
 
 @validate_input(optical_distance1_=optical_distance1, optical_distance2_=optical_distance2)
 @validate_output(optical_difference_distance)
+@numeric(law, optical_difference_distance)
 def calculate_optical_difference_distance(optical_distance1_: Quantity,
     optical_distance2_: Quantity) -> Quantity:
-    solved = solve(law, optical_difference_distance, dict=True)[0][optical_difference_distance]
+    solved = solved_for(law, optical_difference_distance)
     result_expr = solved.subs({
         optical_distance1: optical_distance1_,
         optical_distance2: optical_distance2_
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, dimensionless, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Optical power is the degree to which a lens, mirror, or other optical system converges or diverges light.
@@ -42,9 +44,10 @@ def print_law() -> str:
     front_radius_=front_radius,
     back_radius_=back_radius)
 @validate_output(optical_power)
+@numeric(law, optical_power)
 def calculate_optical_power(lens_refractive_index_: float, medium_refractive_index_: float,
     front_radius_: Quantity, back_radius_: Quantity) -> Quantity:
-    result_expr = solve(law, optical_power, dict=True)[0][optical_power]
+    result_expr = solved_for(law, optical_power)
     optical_power_applied = result_expr.subs({
         lens_refractive_index: lens_refractive_index_,
         medium_refractive_index: medium_refractive_index_,
@@ -1,7 +1,11 @@
 from sympy import (Eq, solve, S)
 from symplyphysics import (units, Quantity, Symbol, print_expression,
     validate_input, validate_output, dimensionless, convert_to)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
+from symplyphysics.core.derivation_cache import cached_call
 
 from symplyphysics.laws.conservation import abbe_invariant_of_two_optical_environments_is_constant as abbe_conservation_law
 
@@ -33,19 +37,24 @@ law = Eq(
     (refraction_index_lens - refraction_index_environment) / curvature_radius_lens
 )
 
-# From Abbe's invariants:
 
-invariant_conservation_eq = abbe_conservation_law.law.subs({
-    abbe_conservation_law.refraction_index_environment: refraction_index_environment,
-    abbe_conservation_law.refraction_index_lens: refraction_index_lens,
-    abbe_conservation_law.distance_from_image: distance_to_image,
-    abbe_conservation_law.distance_from_object: distance_to_object,
-    abbe_conservation_law.curvature_radius: curvature_radius_lens,
-})
+# From Abbe's invariants:
+@proof
+def _derive_law():
+    # pylint: disable-next=assignment-from-no-return
+    invariant_conservation_eq = abbe_conservation_law.law.subs({
+        abbe_conservation_law.refraction_index_environment: refraction_index_environment,
+        abbe_conservation_law.refraction_index_lens: refraction_index_lens,
+        abbe_conservation_law.distance_from_image: distance_to_image,
+        abbe_conservation_law.distance_from_object: distance_to_object,
+        abbe_conservation_law.curvature_radius: curvature_radius_lens,
+    })
 
-radius_lens_from_law = solve(law, curvature_radius_lens, dict=True)[0][curvature_radius_lens]
-radius_lens_from_invariants = solve(invariant_conservation_eq, curvature_radius_lens, dict=True)[0][curvature_radius_lens]
-assert expr_equals(radius_lens_from_law, radius_lens_from_invariants)
+    radius_lens_from_law = cached_call(__name__, "radius_lens_from_law", solve, law,
+        curvature_radius_lens, dict=True)[0][curvature_radius_lens]
+    radius_lens_from_invariants = cached_call(__name__, "radius_lens_from_invariants", solve,
+        invariant_conservation_eq, curvature_radius_lens, dict=True)[0][curvature_radius_lens]
+    assert expr_equals(radius_lens_from_law, radius_lens_from_invariants)
 
 
 def print_law() -> str:
@@ -59,13 +68,14 @@ def print_law() -> str:
     refraction_index_environment_=refraction_index_environment
 )
 @validate_output(refraction_index_lens)
+@numeric(law, refraction_index_lens)
 def calculate_refraction_index_lens(
         distance_to_object_: Quantity,
         distance_to_image_: Quantity,
         curvature_radius_lens_: Quantity,
         refraction_index_environment_: float
 ) -> float:
-    solved = solve(law, refraction_index_lens, dict=True)[0][refraction_index_lens]
+    solved = solved_for(law, refraction_index_lens)
     result_expr = solved.subs({
         distance_to_object: distance_to_object_,
         distance_to_image: distance_to_image_,
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (
     units,
     Quantity,
@@ -7,6 +7,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Intensity is a scalar physical quantity that quantitatively characterizes the power carried by
@@ -37,7 +39,8 @@ def print_law() -> str:
     time_=time,
 )
 @validate_output(intensity)
+@numeric(law, intensity)
 def calculate_intensity(energy_: Quantity, area_: Quantity, time_: Quantity) -> Quantity:
-    result_expr = solve(law, intensity, dict=True)[0][intensity]
+    result_expr = solved_for(law, intensity)
     intensity_applied = result_expr.subs({energy: energy_, area: area_, time: time_})
     return Quantity(intensity_applied)
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, sqrt)
+from sympy import (Eq, sqrt)
 from sympy.physics.units import speed_of_light
 from symplyphysics import (
     units,
@@ -8,6 +8,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Let the frame of reference move relative to the other frame of reference at a constant speed along the X
@@ -39,10 +41,10 @@ def print_law() -> str:
     velocity_=velocity,
     time_first_frame_=time_first_frame)
 @validate_output(coordinate_second_frame)
+@numeric(law, coordinate_second_frame)
 def calculate_coordinate_second_frame(coordinate_first_frame_: Quantity, velocity_: Quantity,
     time_first_frame_: Quantity) -> Quantity:
-    result_coordinate_first_frame_second_frame_expr = solve(law, coordinate_second_frame,
-        dict=True)[0][coordinate_second_frame]
+    result_coordinate_first_frame_second_frame_expr = solved_for(law, coordinate_second_frame)
     result_expr = result_coordinate_first_frame_second_frame_expr.subs({
         coordinate_first_frame: coordinate_first_frame_,
         velocity: velocity_,
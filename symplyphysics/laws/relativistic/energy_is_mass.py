@@ -1,5 +1,7 @@
-from sympy import Eq, solve
+from sympy import Eq
 from symplyphysics import units, Quantity, Symbol, print_expression, validate_input, validate_output
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Fundamentally inner energy of an object is synonimical to its mass.
@@ -21,7 +23,8 @@ def print_law() -> str:
 
 @validate_input(rest_mass_=rest_mass)
 @validate_output(rest_energy)
+@numeric(law, rest_energy)
 def calculate_rest_energy(rest_mass_: Quantity) -> Quantity:
-    result_expr = solve(law, rest_energy, dict=True)[0][rest_energy]
+    result_expr = solved_for(law, rest_energy)
     energy_applied = result_expr.subs({rest_mass: rest_mass_})
     return Quantity(energy_applied)
@@ -1,8 +1,10 @@
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
 from sympy.physics.units import speed_of_light
 
 from symplyphysics import (Quantity, Symbol, print_expression, units, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 # Length contraction is the phenomenon that a moving object's length is
@@ -27,7 +29,8 @@ def print_law():
 
 @validate_input(rest_length_=rest_length, velocity_=velocity)
 @validate_output(relativistic_length)
+@numeric(law, relativistic_length)
 def calculate_relativistic_length(rest_length_: Quantity, velocity_: Quantity) -> Quantity:
-    result_expr = solve(law, relativistic_length, dict=True)[0][relativistic_length]
+    result_expr = solved_for(law, relativistic_length)
     length_applied = result_expr.subs({rest_length: rest_length_, velocity: velocity_})
     return Quantity(length_applied)
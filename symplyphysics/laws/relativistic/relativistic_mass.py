@@ -1,8 +1,10 @@
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
 from sympy.physics.units import speed_of_light
 
 from symplyphysics import (Quantity, Symbol, print_expression, units, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The relativistic mass is the sum total quantity of energy in a body or system
@@ -28,7 +30,8 @@ def print_law() -> str:
 
 @validate_input(rest_mass_=rest_mass, velocity_=velocity)
 @validate_output(relativistic_mass)
+@numeric(law, relativistic_mass)
 def calculate_relativistic_mass(rest_mass_: Quantity, velocity_: Quantity) -> Quantity:
-    result_expr = solve(law, relativistic_mass, dict=True)[0][relativistic_mass]
+    result_expr = solved_for(law, relativistic_mass)
     mass_applied = result_expr.subs({rest_mass: rest_mass_, velocity: velocity_})
     return Quantity(mass_applied)
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, sqrt)
+from sympy import (Eq, sqrt)
 from sympy.physics.units import speed_of_light
 from symplyphysics import (
     units,
@@ -8,6 +8,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Momentum (amount of motion) is a vector physical quantity that is a measure of the mechanical movement
@@ -33,8 +35,9 @@ def print_law() -> str:
 
 @validate_input(mass_=mass, velocity_=velocity)
 @validate_output(momentum)
+@numeric(law, momentum)
 def calculate_momentum(mass_: Quantity, velocity_: Quantity) -> Quantity:
-    result_expr = solve(law, momentum, dict=True)[0][momentum]
+    result_expr = solved_for(law, momentum)
     result_expr = result_expr.subs({
         mass: mass_,
         velocity: velocity_,
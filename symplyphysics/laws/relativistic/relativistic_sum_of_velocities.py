@@ -1,8 +1,10 @@
-from sympy import Eq, solve
+from sympy import Eq
 from sympy.physics.units import speed_of_light
 
 from symplyphysics import (Quantity, Symbol, print_expression, units, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 # In relativistic mechanics, if a body moves relative to a moving reference
@@ -32,8 +34,9 @@ def print_law() -> str:
     second_velocity_=second_velocity,
 )
 @validate_output(resulting_velocity)
+@numeric(law, resulting_velocity)
 def calculate_velocity(first_velocity_, second_velocity_):
-    result_expr = solve(law, resulting_velocity)[0]
+    result_expr = solved_for(law, resulting_velocity)
     velocity_applied = result_expr.subs({
         first_velocity: first_velocity_,
         second_velocity: second_velocity_,
@@ -1,8 +1,10 @@
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
 from sympy.physics.units import speed_of_light
 
 from symplyphysics import (Quantity, Symbol, print_expression, units, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 
 # Description
@@ -30,8 +32,9 @@ def print_law() -> str:
 
 @validate_input(moving_observer_time_=moving_observer_time, velocity_=velocity)
 @validate_output(relativistic_time)
+@numeric(law, relativistic_time)
 def calculate_relativistic_time(moving_observer_time_: Quantity, velocity_: Quantity) -> Quantity:
-    result_expr = solve(law, relativistic_time, dict=True)[0][relativistic_time]
+    result_expr = solved_for(law, relativistic_time)
     time_applied = result_expr.subs({
         moving_observer_time: moving_observer_time_,
         velocity: velocity_
@@ -1,7 +1,9 @@
-from sympy import (Eq, cos, solve, sqrt)
+from sympy import (Eq, cos, sqrt)
 from sympy.physics.units import speed_of_light
 from symplyphysics import (angle_type, units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.symbols.quantities import scale_factor
 
 # Description
@@ -43,11 +45,12 @@ def print_law() -> str:
     relative_speed_=relative_speed,
     source_angle_=source_angle)
 @validate_output(observed_frequency)
+@numeric(law, observed_frequency)
 def calculate_observed_frequency(real_frequency_: Quantity, relative_speed_: Quantity,
     source_angle_: float | Quantity) -> Quantity:
     #HACK: sympy angles are always in radians
     source_angle_radians = scale_factor(source_angle_)
-    result_expr = solve(law, observed_frequency, dict=True)[0][observed_frequency]
+    result_expr = solved_for(law, observed_frequency)
     frequency_applied = result_expr.subs({
         real_frequency: real_frequency_,
         relative_speed: relative_speed_,
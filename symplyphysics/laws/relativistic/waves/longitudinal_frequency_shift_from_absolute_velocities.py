@@ -1,7 +1,9 @@
-from sympy import (Eq, solve, sqrt)
+from sympy import (Eq, sqrt)
 from sympy.physics.units import speed_of_light
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## General relativistic Doppler effect that is classical Doppler effect with relativistic coefficient. This law is not
@@ -60,10 +62,11 @@ def print_law() -> str:
     source_velocity_=source_velocity,
     observer_velocity_=observer_velocity)
 @validate_output(observed_frequency)
+@numeric(law, observed_frequency)
 def calculate_observed_frequency(real_frequency_: Quantity, wave_velocity_: Quantity,
     source_velocity_: Quantity, observer_velocity_: Quantity) -> Quantity:
 
-    result_expr = solve(law, observed_frequency, dict=True)[0][observed_frequency]
+    result_expr = solved_for(law, observed_frequency)
     frequency_applied = result_expr.subs({
         real_frequency: real_frequency_,
         wave_velocity: wave_velocity_,
@@ -1,8 +1,12 @@
-from sympy import (Eq, pi, solve, sqrt, simplify)
+from sympy import (Eq, pi, sqrt, simplify)
 from sympy.physics.units import speed_of_light
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
+from symplyphysics.core.derivation_cache import cached_call
 from symplyphysics.laws.relativistic.waves import longitudinal_frequency_shift_from_absolute_velocities as general_doppler_law
 from symplyphysics.laws.relativistic.waves import frequency_shift_from_velocity_and_angle as relativistic_doppler_with_angle
 
@@ -38,38 +42,42 @@ law = Eq(
     real_frequency * sqrt(
     (speed_of_light - relative_velocity) / (speed_of_light + relative_velocity)))
 
+
 # As the signal propagation speed wave_velocity goes to speed_of_light, Doppler effect
 # formula evolves to relativistic version
+@proof
+def _derive_law():
+    general_relativistic_law = cached_call(
+        __name__, "general_relativistic_law", simplify,
+        general_doppler_law.law.subs({
+        general_doppler_law.wave_velocity: speed_of_light,
+        general_doppler_law.real_frequency: real_frequency
+        }))
+    # Relative velocity is a relativistic version of velocities addition
+    add_velocities = (general_doppler_law.observer_velocity +
+        general_doppler_law.source_velocity) / (1 + general_doppler_law.observer_velocity *
+        general_doppler_law.source_velocity / speed_of_light**2)
+    applied_law = law.rhs.subs(relative_velocity, add_velocities)
+    # We verify that expressions inside square root are identical - that's enough to prove
+    # that our relativistic version of law is indeed a special case of general_doppler_law
+    assert cached_call(__name__, "applied_law_equals", expr_equals,
+        (general_relativistic_law.rhs / real_frequency)**2, (applied_law / real_frequency)**2)
 
-general_relativistic_law = simplify(
-    general_doppler_law.law.subs({
-    general_doppler_law.wave_velocity: speed_of_light,
-    general_doppler_law.real_frequency: real_frequency
-    }))
-# Relative velocity is a relativistic version of velocities addition
-add_velocities = (general_doppler_law.observer_velocity +
-    general_doppler_law.source_velocity) / (1 +
-    general_doppler_law.observer_velocity * general_doppler_law.source_velocity / speed_of_light**2)
-applied_law = law.rhs.subs(relative_velocity, add_velocities)
-# We verify that expressions inside square root are identical - that's enough to prove
-# that our relativistic version of law is indeed a special case of general_doppler_law
-assert expr_equals((general_relativistic_law.rhs / real_frequency)**2,
-    (applied_law / real_frequency)**2)
-
-# Confirm that Doppler effect for collinear movement is a subset of Doppler effect with angles
+    # Confirm that Doppler effect for collinear movement is a subset of Doppler effect with angles
 
-## Classical Doppler effect angles are calculated with respect to the signal vector, directed
-## from source to observer. Hence source moving directly towards observer has 0 angle. Therefore
-## its cosine is positive, when moving towards observer.
-## This law has reverse notation - source velocity is positive when moving away from the observer.
-## Therefore we should use opposite direction for source - set pi as source angle.
-observed_frequency_zero_angles = relativistic_doppler_with_angle.law.subs({
-    relativistic_doppler_with_angle.source_angle: pi,
-    relativistic_doppler_with_angle.relative_speed: relative_velocity,
-    relativistic_doppler_with_angle.real_frequency: real_frequency,
-}).rhs
-## Square roots fail to compare with each other. Raise both parts to power of 2 before checking for equality.
-assert expr_equals(observed_frequency_zero_angles**2, law.rhs**2)
+    ## Classical Doppler effect angles are calculated with respect to the signal vector, directed
+    ## from source to observer. Hence source moving directly towards observer has 0 angle. Therefore
+    ## its cosine is positive, when moving towards observer.
+    ## This law has reverse notation - source velocity is positive when moving away from the observer.
+    ## Therefore we should use opposite direction for source - set pi as source angle.
+    observed_frequency_zero_angles = relativistic_doppler_with_angle.law.subs({
+        relativistic_doppler_with_angle.source_angle: pi,
+        relativistic_doppler_with_angle.relative_speed: relative_velocity,
+        relativistic_doppler_with_angle.real_frequency: real_frequency,
+    }).rhs
+    ## Square roots fail to compare with each other. Raise both parts to power of 2 before checking for equality.
+    assert cached_call(__name__, "zero_angles_equals", expr_equals,
+        observed_frequency_zero_angles**2, law.rhs**2)
 
 
 def print_law() -> str:
@@ -78,9 +86,10 @@ def print_law() -> str:
 
 @validate_input(real_frequency_=real_frequency, relative_velocity_=relative_velocity)
 @validate_output(observed_frequency)
+@numeric(law, observed_frequency)
 def calculate_observed_frequency(real_frequency_: Quantity,
     relative_velocity_: Quantity) -> Quantity:
-    result_expr = solve(law, observed_frequency, dict=True)[0][observed_frequency]
+    result_expr = solved_for(law, observed_frequency)
     frequency_applied = result_expr.subs({
         real_frequency: real_frequency_,
         relative_velocity: relative_velocity_
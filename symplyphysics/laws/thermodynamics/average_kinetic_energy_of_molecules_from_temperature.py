@@ -1,7 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import boltzmann
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The kinetic theory of ideal gases allows us to determine the average kinetic energy for an ideal gas.
@@ -28,8 +30,9 @@ def print_law() -> str:
 
 @validate_input(temperature_=temperature)
 @validate_output(average_kinetic_energy)
+@numeric(law, average_kinetic_energy)
 def calculate_average_kinetic_energy(temperature_: Quantity) -> Quantity:
-    result_expr = solve(law, average_kinetic_energy, dict=True)[0][average_kinetic_energy]
+    result_expr = solved_for(law, average_kinetic_energy)
     result_average_kinetic_energy = result_expr.subs({
         temperature: temperature_,
     })
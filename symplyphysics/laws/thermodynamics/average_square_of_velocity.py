@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## For an ideal gas, the average square of velocity is directly proportional to its temperature and inversely proportional to the molar mass of the gas: <V^2> = 3 k T / m
@@ -25,10 +27,10 @@ def print_law() -> str:
 
 @validate_input(temperature_in_gas_=temperature_in_gas, mass_of_molecule_=mass_of_molecule)
 @validate_output(average_square_velocity)
+@numeric(law, average_square_velocity)
 def calculate_average_square_velocity(temperature_in_gas_: Quantity,
     mass_of_molecule_: Quantity) -> Quantity:
-    result_average_square_velocity = solve(law, average_square_velocity,
-        dict=True)[0][average_square_velocity]
+    result_average_square_velocity = solved_for(law, average_square_velocity)
     result_expr = result_average_square_velocity.subs({
         temperature_in_gas: temperature_in_gas_,
         mass_of_molecule: mass_of_molecule_
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve, S)
+from sympy import (Eq, S)
 from symplyphysics import (units, Quantity, Symbol, print_expression, convert_to, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The efficiency of a heat engine is the ratio of the useful energy used to the total amount of energy received by the system: eta = (Q_h - Q_r) / Q_h.
@@ -22,9 +24,10 @@ def print_law() -> str:
 
 @validate_input(heat_from_heater_=heat_from_heater, heat_to_refrigerator_=heat_to_refrigerator)
 @validate_output(efficiency_factor)
+@numeric(law, efficiency_factor)
 def calculate_efficiency_factor(heat_from_heater_: Quantity,
     heat_to_refrigerator_: Quantity) -> float:
-    result_efficiency_factor = solve(law, efficiency_factor, dict=True)[0][efficiency_factor]
+    result_efficiency_factor = solved_for(law, efficiency_factor)
     result_expr = result_efficiency_factor.subs({
         heat_from_heater: heat_from_heater_,
         heat_to_refrigerator: heat_to_refrigerator_
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The heat of vaporization of a substance is the amount of heat that must be communicated
@@ -36,9 +38,10 @@ def print_law() -> str:
 @validate_input(specific_heat_vaporization_=specific_heat_vaporization,
     mass_of_matter_=mass_of_matter)
 @validate_output(amount_energy)
+@numeric(law, amount_energy)
 def calculate_amount_energy(specific_heat_vaporization_: Quantity,
     mass_of_matter_: Quantity) -> Quantity:
-    result_amount_energy_expr = solve(law, amount_energy, dict=True)[0][amount_energy]
+    result_amount_energy_expr = solved_for(law, amount_energy)
     result_expr = result_amount_energy_expr.subs({
         specific_heat_vaporization: specific_heat_vaporization_,
         mass_of_matter: mass_of_matter_
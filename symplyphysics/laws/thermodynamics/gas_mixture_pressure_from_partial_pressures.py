@@ -1,9 +1,10 @@
 from typing import Sequence
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, print_expression, Symbol, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.operations.sum_array import SumArray
-from symplyphysics.core.symbols.symbols import tuple_of_symbols
+from symplyphysics.core.symbols.symbols import cached_tuple_of_symbols
 
 # Description
 ## The pressure of a mixture of gases is equal to the sum of their partial pressures.
@@ -26,10 +27,10 @@ def print_law() -> str:
 @validate_input(total_pressure_=total_pressure)
 @validate_output(units.pressure)
 def calculate_total_pressure(total_pressure_: Sequence[Quantity]) -> Quantity:
-    partial_pressures_symbols = tuple_of_symbols("partial_pressure", units.pressure,
+    partial_pressures_symbols = cached_tuple_of_symbols("partial_pressure", units.pressure,
         len(total_pressure_))
     partial_pressures_law = law.subs(partial_pressures, partial_pressures_symbols).doit()
-    solved = solve(partial_pressures_law, total_pressure, dict=True)[0][total_pressure]
+    solved = solved_for(partial_pressures_law, total_pressure)
     for (from_, to_) in zip(partial_pressures_symbols, total_pressure_):
         solved = solved.subs(from_, to_)
     return Quantity(solved)
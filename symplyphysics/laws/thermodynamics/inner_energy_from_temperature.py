@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Inner energy of ideal gas is sum of kinetic energy of all it's molecules.
@@ -29,9 +31,10 @@ def print_law() -> str:
 
 @validate_input(mass_of_gas_=mass_of_gas, temperature_=temperature, mole_mass_=mole_mass)
 @validate_output(inner_energy)
+@numeric(law, inner_energy)
 def calculate_inner_energy(mass_of_gas_: Quantity, temperature_: Quantity,
     mole_mass_: Quantity) -> Quantity:
-    solved = solve(law, inner_energy, dict=True)[0][inner_energy]
+    solved = solved_for(law, inner_energy)
     result_expr = solved.subs({
         mass_of_gas: mass_of_gas_,
         temperature: temperature_,
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Under the curved surface of the liquid, in addition to the internal pressure, additional pressure is created due to the curvature of the surface.
@@ -24,9 +26,10 @@ def print_law() -> str:
 @validate_input(surface_tension_of_the_liquid_=surface_tension_of_the_liquid,
     radius_of_curvature_=radius_of_curvature)
 @validate_output(laplas_pressure)
+@numeric(law, laplas_pressure)
 def calculate_laplas_pressure(surface_tension_of_the_liquid_: Quantity,
     radius_of_curvature_: Quantity) -> Quantity:
-    solved = solve(law, laplas_pressure, dict=True)[0][laplas_pressure]
+    solved = solved_for(law, laplas_pressure)
     result_expr = solved.subs({
         surface_tension_of_the_liquid: surface_tension_of_the_liquid_,
         radius_of_curvature: radius_of_curvature_
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Ideal gas law: P * V = n * R * T
@@ -25,8 +27,9 @@ def print_law() -> str:
 
 @validate_input(volume_=volume, temperature_=temperature, mole_count_=mole_count)
 @validate_output(pressure)
+@numeric(law, pressure)
 def calculate_pressure(volume_: Quantity, temperature_: Quantity,
     mole_count_: Quantity) -> Quantity:
-    solved = solve(law, pressure, dict=True)[0][pressure]
+    solved = solved_for(law, pressure)
     result_expr = solved.subs({volume: volume_, temperature: temperature_, mole_count: mole_count_})
     return Quantity(result_expr)
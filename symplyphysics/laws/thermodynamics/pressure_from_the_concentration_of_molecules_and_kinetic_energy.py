@@ -1,6 +1,9 @@
 from sympy import (Eq, solve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
+from symplyphysics.core.proofs import proof
 
 from symplyphysics.laws.thermodynamics import pressure_from_temperature_and_volume as ideal_gas_law
 from symplyphysics.laws.thermodynamics import average_kinetic_energy_of_molecules_from_temperature as kinetic_energy
@@ -23,35 +26,41 @@ pressure = Symbol("pressure", units.pressure)
 
 law = Eq(pressure, 2 / 3 * molecules_concentration * average_kinetic_energy)
 
-## Proof
-
-temperature_eq = kinetic_energy.law.subs(
-    {kinetic_energy.average_kinetic_energy: average_kinetic_energy})
-
-derived_temperature = solve(temperature_eq, kinetic_energy.temperature,
-    dict=True)[0][kinetic_energy.temperature]
 
-particles_number_eq = volume_number_density.definition.subs({
-    volume_number_density.volume: ideal_gas_law.volume,
-    volume_number_density.number_density: molecules_concentration
-})
+## Proof
+@proof
+def _derive_law():
+    # pylint: disable-next=assignment-from-no-return
+    temperature_eq = kinetic_energy.law.subs(
+        {kinetic_energy.average_kinetic_energy: average_kinetic_energy})
+
+    derived_temperature = solve(temperature_eq, kinetic_energy.temperature,
+        dict=True)[0][kinetic_energy.temperature]
+
+    # pylint: disable-next=assignment-from-no-return
+    particles_number_eq = volume_number_density.definition.subs({
+        volume_number_density.volume: ideal_gas_law.volume,
+        volume_number_density.number_density: molecules_concentration
+    })
 
-derived_particles_number = solve(particles_number_eq, volume_number_density.objects,
-    dict=True)[0][volume_number_density.objects]
+    derived_particles_number = solve(particles_number_eq, volume_number_density.objects,
+        dict=True)[0][volume_number_density.objects]
 
-mole_count_eq = avogadro_number.law.subs(
-    {avogadro_number.particles_count: derived_particles_number})
+    # pylint: disable-next=assignment-from-no-return
+    mole_count_eq = avogadro_number.law.subs(
+        {avogadro_number.particles_count: derived_particles_number})
 
-derived_mole_count = solve(mole_count_eq, avogadro_number.mole_count,
-    dict=True)[0][avogadro_number.mole_count]
+    derived_mole_count = solve(mole_count_eq, avogadro_number.mole_count,
+        dict=True)[0][avogadro_number.mole_count]
 
-derived_pressure = ideal_gas_law.law.subs({
-    ideal_gas_law.temperature: derived_temperature,
-    ideal_gas_law.units.molar_gas_constant: units.boltzmann * units.avogadro,
-    ideal_gas_law.mole_count: derived_mole_count
-})
+    # pylint: disable-next=assignment-from-no-return
+    derived_pressure = ideal_gas_law.law.subs({
+        ideal_gas_law.temperature: derived_temperature,
+        ideal_gas_law.units.molar_gas_constant: units.boltzmann * units.avogadro,
+        ideal_gas_law.mole_count: derived_mole_count
+    })
 
-assert derived_pressure.rhs == law.rhs
+    assert derived_pressure.rhs == law.rhs
 
 
 def print_law() -> str:
@@ -61,9 +70,10 @@ def print_law() -> str:
 @validate_input(molecules_concentration_=molecules_concentration,
     average_kinetic_energy_=average_kinetic_energy)
 @validate_output(pressure)
+@numeric(law, pressure)
 def calculate_pressure(molecules_concentration_: Quantity,
     average_kinetic_energy_: Quantity) -> Quantity:
-    result_expr = solve(law, pressure, dict=True)[0][pressure]
+    result_expr = solved_for(law, pressure)
     result_pressure = result_expr.subs({
         molecules_concentration: molecules_concentration_,
         average_kinetic_energy: average_kinetic_energy_,
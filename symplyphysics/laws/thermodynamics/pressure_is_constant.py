@@ -1,6 +1,9 @@
 from sympy import (Eq, solve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.thermodynamics import pressure_from_temperature_and_volume as thermodynamics_law
 
 # Description
@@ -40,10 +43,13 @@ eq_end = thermodynamics_law.law.subs({
 
 derived_law = [eq_start, eq_end, isobaric_condition]
 
+
 ## Check the equivalence of 'law' and 'derived_law'
-derived_temperature_end = solve(derived_law, (pressure_start, pressure_end, temperature_end),
-    dict=True)[0][temperature_end]
-assert solve(law, temperature_end, dict=True)[0][temperature_end] == derived_temperature_end
+@proof
+def _derive_law():
+    derived_temperature_end = solve(derived_law, (pressure_start, pressure_end, temperature_end),
+        dict=True)[0][temperature_end]
+    assert solve(law, temperature_end, dict=True)[0][temperature_end] == derived_temperature_end
 
 
 def print_law() -> str:
@@ -54,9 +60,10 @@ def print_law() -> str:
     temperature_end_=temperature_end,
     volume_start_=volume_start)
 @validate_output(volume_end)
+@numeric(law, volume_end)
 def calculate_volume(temperature_start_: Quantity, volume_start_: Quantity,
     temperature_end_: Quantity) -> Quantity:
-    solved = solve(law, volume_end, dict=True)[0][volume_end]
+    solved = solved_for(law, volume_end)
     result_expr = solved.subs({
         temperature_start: temperature_start_,
         volume_start: volume_start_,
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The Stefan–Boltzmann law, also known as Stefan's law, states that the total energy radiated per
@@ -28,7 +30,8 @@ def print_law() -> str:
 
 @validate_input(temperature_=temperature)
 @validate_output(radiance)
+@numeric(law, radiance)
 def calculate_radiance(temperature_: Quantity) -> Quantity:
-    solved = solve(law, radiance, dict=True)[0][radiance]
+    solved = solved_for(law, radiance)
     result_expr = solved.subs(temperature, temperature_)
     return Quantity(result_expr)
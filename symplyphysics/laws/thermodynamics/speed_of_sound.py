@@ -1,7 +1,9 @@
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
 
 from symplyphysics import (Quantity, Symbol, dimensionless, print_expression, units, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Speed of sound for ideal gases
 # c = sqrt( gamma * R * T / M ), where
@@ -28,12 +30,13 @@ def print_law():
     heat_capacity_ratio_=heat_capacity_ratio,
     mole_mass_=mole_mass)
 @validate_output(speed_of_sound)
+@numeric(law, speed_of_sound)
 def calculate_speed_of_sound(
     temperature_: Quantity,
     heat_capacity_ratio_: float,
     mole_mass_: Quantity,
 ) -> Quantity:
-    result_expr = solve(law, speed_of_sound, dict=True)[0][speed_of_sound]
+    result_expr = solved_for(law, speed_of_sound)
     result_applied = result_expr.subs({
         temperature: temperature_,
         heat_capacity_ratio: heat_capacity_ratio_,
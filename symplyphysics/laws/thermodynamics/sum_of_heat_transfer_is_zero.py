@@ -1,8 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, print_expression, Symbol, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
 from symplyphysics.core.operations.sum_array import SumArray
-from symplyphysics.core.symbols.symbols import tuple_of_symbols
+from symplyphysics.core.symbols.symbols import cached_tuple_of_symbols
 
 # Description
 ## The first law of thermodynamics for a closed and adiabatically isolated
@@ -23,11 +24,11 @@ def print_law() -> str:
 @validate_input(amounts_energy_=amounts_energy)
 @validate_output(units.energy)
 def calculate_amount_energy(amounts_energy_: list[Quantity]) -> Quantity:
-    amounts_energy_symbols = tuple_of_symbols("amount_energy", units.energy,
+    amounts_energy_symbols = cached_tuple_of_symbols("amount_energy", units.energy,
         len(amounts_energy_) + 1)
     unknown_amount_energy = amounts_energy_symbols[len(amounts_energy_)]
     amounts_energy_law = law.subs(amounts_energy, amounts_energy_symbols).doit()
-    solved = solve(amounts_energy_law, unknown_amount_energy, dict=True)[0][unknown_amount_energy]
+    solved = solved_for(amounts_energy_law, unknown_amount_energy)
     for (from_, to_) in zip(amounts_energy_symbols, amounts_energy_):
         solved = solved.subs(from_, to_)
     return Quantity(solved)
@@ -1,6 +1,9 @@
 from sympy import (Eq, solve)
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.thermodynamics import pressure_from_temperature_and_volume as thermodynamics_law
 
 # Description
@@ -40,10 +43,13 @@ eq_end = thermodynamics_law.law.subs({
 
 derived_law = [eq_start, eq_end, isothermal_condition]
 
+
 ## Check the equivalence of 'law' and 'derived_law'
-derived_pressure_end = solve(derived_law, (temperature_start, temperature_end, pressure_end),
-    dict=True)[0][pressure_end]
-assert solve(law, pressure_end, dict=True)[0][pressure_end] == derived_pressure_end
+@proof
+def _derive_law():
+    derived_pressure_end = solve(derived_law, (temperature_start, temperature_end, pressure_end),
+        dict=True)[0][pressure_end]
+    assert solve(law, pressure_end, dict=True)[0][pressure_end] == derived_pressure_end
 
 
 def print_law() -> str:
@@ -54,9 +60,10 @@ def print_law() -> str:
     pressure_end_=pressure_end,
     volume_start_=volume_start)
 @validate_output(volume_end)
+@numeric(law, volume_end)
 def calculate_volume(pressure_start_: Quantity, volume_start_: Quantity,
     pressure_end_: Quantity) -> Quantity:
-    solved = solve(law, volume_end, dict=True)[0][volume_end]
+    solved = solved_for(law, volume_end)
     result_expr = solved.subs({
         pressure_start: pressure_start_,
         volume_start: volume_start_,
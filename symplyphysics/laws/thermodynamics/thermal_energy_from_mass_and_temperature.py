@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 # Amount of energy for body heat Q = C * m * (t2 - t1)
@@ -33,10 +35,11 @@ def print_law() -> str:
     temperature_end_=temperature_end,
     temperature_origin_=temperature_origin)
 @validate_output(amount_energy)
+@numeric(law, amount_energy)
 def calculate_amount_energy(specific_heat_capacity_: Quantity, body_mass_: Quantity,
     temperature_end_: Quantity, temperature_origin_: Quantity) -> Quantity:
 
-    result_amount_energy_expr = solve(law, amount_energy, dict=True)[0][amount_energy]
+    result_amount_energy_expr = solved_for(law, amount_energy)
     result_expr = result_amount_energy_expr.subs({
         specific_heat_capacity: specific_heat_capacity_,
         body_mass: body_mass_,
@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## As the temperature increases, the intensity of the thermal motion of the particles of matter increases. This leads to the fact that the molecules are more "actively" repelled from each other.
@@ -37,9 +39,10 @@ def print_law() -> str:
     final_temperature_=final_temperature,
     start_temperature_=start_temperature)
 @validate_output(final_volume)
+@numeric(law, final_volume)
 def calculate_final_volume(start_volume_, expansion_coefficient_, final_temperature_,
     start_temperature_: Quantity) -> Quantity:
-    result_expr = solve(law, final_volume, dict=True)[0][final_volume]
+    result_expr = solved_for(law, final_volume)
     result_volume = result_expr.subs({
         start_volume: start_volume_,
         expansion_coefficient: expansion_coefficient_,
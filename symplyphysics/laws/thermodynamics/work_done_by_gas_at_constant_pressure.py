@@ -1,6 +1,8 @@
-from sympy import Eq, solve
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 # When energy is added to gas molecules and increases their kinetic energy,
@@ -31,9 +33,10 @@ def print_law():
 
 @validate_input(pressure_=pressure, init_volume_=init_volume, result_volume_=result_volume)
 @validate_output(work)
+@numeric(law, work)
 def calculate_work(pressure_: Quantity, init_volume_: Quantity,
     result_volume_: Quantity) -> Quantity:
-    result_work_expr = solve(law, work, dict=True)[0][work]
+    result_work_expr = solved_for(law, work)
     result_work = result_work_expr.subs({
         pressure: pressure_,
         init_volume: init_volume_,
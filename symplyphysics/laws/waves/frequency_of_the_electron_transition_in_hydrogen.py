@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, dimensionless, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## There is an empirical formula for the spectral lines of the hydrogen atom.
@@ -28,8 +30,9 @@ def print_law() -> str:
 
 @validate_input(number_level_to_=number_level_to, number_level_from_=number_level_from)
 @validate_output(transition_frequency)
+@numeric(law, transition_frequency)
 def calculate_transition_frequency(number_level_to_: int, number_level_from_: int) -> Quantity:
-    result_expr = solve(law, transition_frequency, dict=True)[0][transition_frequency]
+    result_expr = solved_for(law, transition_frequency)
     transition_frequency_applied = result_expr.subs({
         number_level_to: number_level_to_,
         number_level_from: number_level_from_
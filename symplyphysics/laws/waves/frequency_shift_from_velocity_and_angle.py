@@ -1,7 +1,11 @@
 from sympy import (Eq, cos, solve)
 from symplyphysics import (units, angle_type, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
+from symplyphysics.core.derivation_cache import cached_call
 from symplyphysics.core.symbols.quantities import scale_factor
 from symplyphysics.laws.waves import wavelength_from_wave_speed_and_period as period_law
 from symplyphysics.laws.kinematic import temporal_frequency_from_period as frequency_def
@@ -53,79 +57,83 @@ law = Eq(
     real_frequency * (wave_velocity - observer_speed * cos(observer_angle)) /
     (wave_velocity - source_speed * cos(source_angle)))
 
+
 # Derive the same law from frequency, wavelength laws, and assumption that moving source or
 # observer affects wavelength.
+@proof
+def _derive_law():
+    ## Start with idle observer and moving source
+
+    period_from_frequency = solve(frequency_def.law, frequency_def.period,
+        dict=True)[0][frequency_def.period]
+    wave_period = period_from_frequency.subs(frequency_def.temporal_frequency, real_frequency)
+
+    wavelength_from_period = solve(period_law.law, period_law.wavelength,
+        dict=True)[0][period_law.wavelength]
+    wavelength = wavelength_from_period.subs({
+        period_law.oscillation_period: wave_period,
+        period_law.propagation_speed: wave_velocity
+    })
 
-## Start with idle observer and moving source
-
-period_from_frequency = solve(frequency_def.law, frequency_def.period,
-    dict=True)[0][frequency_def.period]
-wave_period = period_from_frequency.subs(frequency_def.temporal_frequency, real_frequency)
-
-wavelength_from_period = solve(period_law.law, period_law.wavelength,
-    dict=True)[0][period_law.wavelength]
-wavelength = wavelength_from_period.subs({
-    period_law.oscillation_period: wave_period,
-    period_law.propagation_speed: wave_velocity
-})
-
-## While wave travels (wave_period * wave_velocity) distance, moving source travels (wave_period * source_velocity)
-## distance.
-## We are only interested in the wavelength on the wave signal vector (shortest path from source to observer), as
-## it is what we measure on observer. Therefore we take 'source_speed' projection on the signal vector.
-
-source_speed_projection_on_signal = projector.law.subs({
-    projector.vector_angle: source_angle,
-    projector.vector_length: source_speed
-}).rhs
-
-## Assume constant velocity during 'wave_period'
-moving_source_distance_for_period = distance_law.law.subs({
-    distance_law.initial_position: 0,
-    distance_law.movement_time: wave_period,
-    distance_law.constant_velocity: source_speed_projection_on_signal,
-}).rhs
-
-## Assuming signal vector pointing from source to observer, positive projection should decrease wavelength.
-wavelength_observed = wavelength - moving_source_distance_for_period
-
-period_from_wavelength = solve(period_law.law, period_law.oscillation_period,
-    dict=True)[0][period_law.oscillation_period]
-observed_wave_period = period_from_wavelength.subs({
-    period_law.wavelength: wavelength_observed,
-    period_law.propagation_speed: wave_velocity
-})
+    ## While wave travels (wave_period * wave_velocity) distance, moving source travels (wave_period * source_velocity)
+    ## distance.
+    ## We are only interested in the wavelength on the wave signal vector (shortest path from source to observer), as
+    ## it is what we measure on observer. Therefore we take 'source_speed' projection on the signal vector.
+
+    source_speed_projection_on_signal = projector.law.subs({
+        projector.vector_angle: source_angle,
+        projector.vector_length: source_speed
+    }).rhs
+
+    ## Assume constant velocity during 'wave_period'
+    moving_source_distance_for_period = distance_law.law.subs({
+        distance_law.initial_position: 0,
+        distance_law.movement_time: wave_period,
+        distance_law.constant_velocity: source_speed_projection_on_signal,
+    }).rhs
+
+    ## Assuming signal vector pointing from source to observer, positive projection should decrease wavelength.
+    wavelength_observed = wavelength - moving_source_distance_for_period
+
+    period_from_wavelength = solve(period_law.law, period_law.oscillation_period,
+        dict=True)[0][period_law.oscillation_period]
+    observed_wave_period = period_from_wavelength.subs({
+        period_law.wavelength: wavelength_observed,
+        period_law.propagation_speed: wave_velocity
+    })
 
-## Confirm that derived law is the same as expected for idle observer
+    ## Confirm that derived law is the same as expected for idle observer
 
-frequency_from_period = solve(frequency_def.law, frequency_def.temporal_frequency,
-    dict=True)[0][frequency_def.temporal_frequency]
-frequency_observed = frequency_from_period.subs(frequency_def.period, observed_wave_period)
-assert expr_equals(frequency_observed, law.rhs.subs(observer_speed, 0))
+    frequency_from_period = solve(frequency_def.law, frequency_def.temporal_frequency,
+        dict=True)[0][frequency_def.temporal_frequency]
+    frequency_observed = frequency_from_period.subs(frequency_def.period, observed_wave_period)
+    assert cached_call(__name__, "idle_observer_equals", expr_equals, frequency_observed,
+        law.rhs.subs(observer_speed, 0))
 
-## Now apply movement of the observer
+    ## Now apply movement of the observer
 
-observer_speed_projection_on_signal = projector.law.subs({
-    projector.vector_angle: observer_angle,
-    projector.vector_length: observer_speed
-}).rhs
+    observer_speed_projection_on_signal = projector.law.subs({
+        projector.vector_angle: observer_angle,
+        projector.vector_length: observer_speed
+    }).rhs
 
-# NOTE: Relativistic velocity addition should be applied when wave speed is close to speed of light
+    # NOTE: Relativistic velocity addition should be applied when wave speed is close to speed of light
 
-## Assuming signal vector pointing from source to observer, positive projection should decrease relative wave
-## velocity from observer point of view, according to Galilean velocity addition formula.
-relative_wave_speed = wave_velocity - observer_speed_projection_on_signal
+    ## Assuming signal vector pointing from source to observer, positive projection should decrease relative wave
+    ## velocity from observer point of view, according to Galilean velocity addition formula.
+    relative_wave_speed = wave_velocity - observer_speed_projection_on_signal
 
-period_relative_source = period_from_wavelength.subs({
-    period_law.wavelength: wavelength_observed,
-    period_law.propagation_speed: relative_wave_speed
-})
+    period_relative_source = period_from_wavelength.subs({
+        period_law.wavelength: wavelength_observed,
+        period_law.propagation_speed: relative_wave_speed
+    })
 
-frequency_relative_observer = frequency_from_period.subs(frequency_def.period,
-    period_relative_source)
+    frequency_relative_observer = frequency_from_period.subs(frequency_def.period,
+        period_relative_source)
 
-## Confirm that derived law is the same as expected
-assert expr_equals(frequency_relative_observer, law.rhs)
+    ## Confirm that derived law is the same as expected
+    assert cached_call(__name__, "moving_observer_equals", expr_equals, frequency_relative_observer,
+        law.rhs)
 
 
 def print_law() -> str:
@@ -137,6 +145,7 @@ def print_law() -> str:
     source_speed_angle=(source_speed, source_angle),
     observer_speed_angle=(observer_speed, observer_angle))
 @validate_output(observed_frequency)
+@numeric(law, observed_frequency)
 def calculate_observed_frequency(
         real_frequency_: Quantity, wave_velocity_: Quantity, source_speed_angle: tuple[Quantity,
     float | Quantity], observer_speed_angle: tuple[Quantity, float | Quantity]) -> Quantity:
@@ -145,7 +154,7 @@ def calculate_observed_frequency(
     #HACK: sympy angles are always in radians
     observer_angle_radians = scale_factor(observer_angle_)
     source_angle_radians = scale_factor(source_angle_)
-    result_expr = solve(law, observed_frequency, dict=True)[0][observed_frequency]
+    result_expr = solved_for(law, observed_frequency)
     frequency_applied = result_expr.subs({
         real_frequency: real_frequency_,
         wave_velocity: wave_velocity_,
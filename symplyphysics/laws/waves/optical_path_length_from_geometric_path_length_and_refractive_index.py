@@ -1,6 +1,8 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output, dimensionless)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The optical path length of light in a substance is numerically equal to the path length in a vacuum, which contains the same number of light waves as the geometric length in a substance.
@@ -27,8 +29,9 @@ def print_law() -> str:
 
 @validate_input(geometric_path_=geometric_path, refractive_index_=refractive_index)
 @validate_output(optical_path)
+@numeric(law, optical_path)
 def calculate_optical_path(geometric_path_: Quantity, refractive_index_: float) -> Quantity:
-    result_expr = solve(law, optical_path, dict=True)[0][optical_path]
+    result_expr = solved_for(law, optical_path)
     result_optical_path = result_expr.subs({
         geometric_path: geometric_path_,
         refractive_index: refractive_index_,
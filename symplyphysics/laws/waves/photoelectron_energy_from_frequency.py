@@ -1,7 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import planck as planck_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## The photoelectric effect is a theory proposed by Einstein.
@@ -28,8 +30,9 @@ def print_law() -> str:
 
 @validate_input(photon_frequency_=photon_frequency, work_function_=work_function)
 @validate_output(max_kinetic_energy)
+@numeric(law, max_kinetic_energy)
 def calculate_max_kinetic_energy(photon_frequency_: Quantity, work_function_: Quantity) -> Quantity:
-    result_energy_expr = solve(law, max_kinetic_energy, dict=True)[0][max_kinetic_energy]
+    result_energy_expr = solved_for(law, max_kinetic_energy)
     result_expr = result_energy_expr.subs({
         photon_frequency: photon_frequency_,
         work_function: work_function_
@@ -1,7 +1,9 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import planck as planck_constant
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Photon is the elementary part of any electromagnetical radiation which has no mass and always moves with speed of light.
@@ -23,7 +25,8 @@ def print_law() -> str:
 
 @validate_input(photon_frequency_=photon_frequency)
 @validate_output(photon_energy)
+@numeric(law, photon_energy)
 def calculate_energy(photon_frequency_: Quantity) -> Quantity:
-    result_energy_expr = solve(law, photon_energy, dict=True)[0][photon_energy]
+    result_energy_expr = solved_for(law, photon_energy)
     result_expr = result_energy_expr.subs({photon_frequency: photon_frequency_})
     return Quantity(result_expr)
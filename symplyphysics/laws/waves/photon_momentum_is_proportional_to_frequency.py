@@ -1,8 +1,10 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from sympy.physics.units import planck as planck_constant
 from sympy.physics.units import speed_of_light
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Photon is the elementary part of any electromagnetical radiation which has no mass and always moves with speed of light.
@@ -25,7 +27,8 @@ def print_law() -> str:
 
 @validate_input(photon_frequency_=photon_frequency)
 @validate_output(photon_momentum)
+@numeric(law, photon_momentum)
 def calculate_momentum(photon_frequency_: Quantity) -> Quantity:
-    result_momentum_expr = solve(law, photon_momentum, dict=True)[0][photon_momentum]
+    result_momentum_expr = solved_for(law, photon_momentum)
     result_expr = result_momentum_expr.subs({photon_frequency: photon_frequency_})
     return Quantity(result_expr)
@@ -1,4 +1,4 @@
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
 from sympy.physics.units import planck as planck_constant
 from symplyphysics import (
     units,
@@ -8,6 +8,8 @@ from symplyphysics import (
     validate_input,
     validate_output,
 )
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Photon is the elementary part of any electromagnetical radiation which has no mass and always moves with speed of light.
@@ -29,7 +31,8 @@ def print_law() -> str:
 
 @validate_input(wavenumber_=wavenumber)
 @validate_output(photon_momentum)
+@numeric(law, photon_momentum)
 def calculate_momentum(wavenumber_: Quantity) -> Quantity:
-    result_momentum_expr = solve(law, photon_momentum, dict=True)[0][photon_momentum]
+    result_momentum_expr = solved_for(law, photon_momentum)
     result_expr = result_momentum_expr.subs({wavenumber: wavenumber_})
     return Quantity(result_expr)
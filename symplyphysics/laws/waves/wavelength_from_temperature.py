@@ -1,7 +1,9 @@
-from sympy import Eq, solve
+from sympy import Eq
 from sympy.physics.units import speed_of_light, planck, boltzmann
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Any object with non-zero absolute temperature radiates energy. Absolutely black object is objects, which doesn't reflect any radiation.
@@ -26,7 +28,8 @@ def print_law() -> str:
 
 @validate_input(object_temperature_=object_temperature)
 @validate_output(intensive_wavelength)
+@numeric(law, intensive_wavelength)
 def calculate_intensive_wavelength(object_temperature_: Quantity) -> Quantity:
-    result_wavelength_expr = solve(law, intensive_wavelength, dict=True)[0][intensive_wavelength]
+    result_wavelength_expr = solved_for(law, intensive_wavelength)
     result_expr = result_wavelength_expr.subs({object_temperature: object_temperature_})
     return Quantity(result_expr)
@@ -1,7 +1,10 @@
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.proofs import proof
 from symplyphysics.laws.kinematic import distance_from_constant_velocity as velocity_definition
 
 # Description
@@ -21,17 +24,20 @@ oscillation_period = Symbol("oscillation_period", units.time)
 
 law = Eq(wavelength, propagation_speed * oscillation_period)
 
+
 # Derive the same law from constant velocity motion, assuming wave length is a distance that wave travels
 # during oscillation period.
-
-# Prove that derived movement function equals to law.rhs, given initial position = 0
-# and propagation_speed is constant_velocity
-constant_velocity_movement_definition = velocity_definition.law.subs({
-    velocity_definition.constant_velocity: propagation_speed,
-    velocity_definition.movement_time: oscillation_period,
-    velocity_definition.initial_position: 0
-})
-assert expr_equals(constant_velocity_movement_definition.rhs, law.rhs)
+@proof
+def _derive_law():
+    # Prove that derived movement function equals to law.rhs, given initial position = 0
+    # and propagation_speed is constant_velocity
+    # pylint: disable-next=assignment-from-no-return
+    constant_velocity_movement_definition = velocity_definition.law.subs({
+        velocity_definition.constant_velocity: propagation_speed,
+        velocity_definition.movement_time: oscillation_period,
+        velocity_definition.initial_position: 0
+    })
+    assert expr_equals(constant_velocity_movement_definition.rhs, law.rhs)
 
 
 def print_law() -> str:
@@ -40,8 +46,9 @@ def print_law() -> str:
 
 @validate_input(velocity_=propagation_speed, period_=oscillation_period)
 @validate_output(wavelength)
+@numeric(law, wavelength)
 def calculate_wavelength(velocity_: Quantity, period_: Quantity) -> Quantity:
-    applied_definition = solve(law, wavelength, dict=True)[0][wavelength]
+    applied_definition = solved_for(law, wavelength)
     result_expr = applied_definition.subs({
         propagation_speed: velocity_,
         oscillation_period: period_
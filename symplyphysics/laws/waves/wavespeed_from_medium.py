@@ -1,7 +1,9 @@
 from sympy.physics.units import speed_of_light
-from sympy import (Eq, solve)
+from sympy import Eq
 from symplyphysics import (units, Quantity, Symbol, print_expression, dimensionless, validate_input,
     validate_output)
+from symplyphysics.core.solvers import solved_for
+from symplyphysics.core.numeric import numeric
 
 # Description
 ## Wavespeed differs in different medium. Electromagnetic wave propagation speed depends on refraction factor of medium.
@@ -24,7 +26,8 @@ def print_law() -> str:
 
 @validate_input(refraction_factor_=refraction_factor)
 @validate_output(wave_speed_in_medium)
+@numeric(law, wave_speed_in_medium)
 def calculate_wavespeed(refraction_factor_: float) -> Quantity:
-    result_expr = solve(law, wave_speed_in_medium, dict=True)[0][wave_speed_in_medium]
+    result_expr = solved_for(law, wave_speed_in_medium)
     wavespeed_applied = result_expr.subs(refraction_factor, refraction_factor_)
     return Quantity(wavespeed_applied)
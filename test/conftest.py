@@ -0,0 +1,4 @@
+from symplyphysics.core import derivation_cache
+
+# Tests should not read or write derivation cache of the user
+derivation_cache.set_cache_directory(None)
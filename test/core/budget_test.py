@@ -0,0 +1,149 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pytest import approx, fixture, raises
+from sympy import Eq, cos, sin, sqrt, symbols
+from symplyphysics import errors, Function
+from symplyphysics.core import budget
+from symplyphysics.core.budget import (budget_policy, budgeted_integrate, budgeted_simplify,
+    budgeted_solve, run_with_budget, set_budget_policy)
+from symplyphysics.core.expr_comparisons import expr_equals
+from symplyphysics.core.solvers import clear_solved_for_cache, solved_for
+
+
+@fixture(name="stats")
+def stats_fixture():
+    budget.reset_budget_stats()
+    yield
+    set_budget_policy(budget.UNLIMITED)
+    budget.reset_budget_stats()
+
+
+def _step() -> None:
+    pass
+
+
+# Python calls are required to check the deadline outside of the main thread
+def _forever() -> str:
+    while True:
+        _step()
+        time.sleep(0.001)
+
+
+def test_parse_policy():
+    assert budget.parse_budget_policy("unlimited") == budget.UNLIMITED
+    policy = budget.parse_budget_policy("time=2.5, operations=100, on_expiry=fallback")
+    assert policy == budget.BudgetPolicy(2.5, 100, budget.ExpiryAction.FALLBACK)
+    assert budget.parse_budget_policy(repr(policy)) == policy
+    assert budget.parse_budget_policy("time=1").on_expiry == budget.ExpiryAction.RAISE
+    with raises(ValueError):
+        budget.parse_budget_policy("memory=100")
+    with raises(ValueError):
+        budget.parse_budget_policy("time=-1")
+
+
+def test_time_limit(stats):  # pylint: disable=unused-argument
+    start = time.monotonic()
+    with budget_policy("time=0.1"):
+        with raises(errors.BudgetExceededError):
+            run_with_budget("forever", _forever)
+    assert time.monotonic() - start < 5
+    assert budget.budget_stats() == {
+        "policy": "unlimited",
+        "calls": 1,
+        "expired": 1,
+        "fallbacks": 0
+    }
+    # budget exception is also a timeout
+    with budget_policy("time=0.1"):
+        with raises(TimeoutError):
+            run_with_budget("forever", _forever)
+
+
+def test_time_limit_in_thread(stats):  # pylint: disable=unused-argument
+
+    def _run() -> str:
+        with budget_policy("time=0.1,on_expiry=fallback"):
+            return run_with_budget("forever", _forever, fallback=lambda: "fallback")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(lambda _: _run(), range(2)))
+    assert results == ["fallback", "fallback"]
+    assert budget.budget_stats()["fallbacks"] == 2
+
+
+def test_nested_budgets(stats):  # pylint: disable=unused-argument
+
+    def _inner() -> str:
+        with budget_policy("time=10"):
+            return run_with_budget("inner", _forever)
+
+    start = time.monotonic()
+    with budget_policy("time=0.1"):
+        with raises(errors.BudgetExceededError):
+            run_with_budget("outer", _inner)
+    # outer deadline is earlier
+    assert time.monotonic() - start < 5
+
+
+def test_nested_budgets_fallback(stats):  # pylint: disable=unused-argument
+
+    def _inner() -> str:
+        with budget_policy("time=10,on_expiry=fallback"):
+            run_with_budget("inner", _forever, fallback=lambda: "fallback")
+        # outer call should not continue after its deadline
+        end = time.monotonic() + 3
+        while time.monotonic() < end:
+            _step()
+            time.sleep(0.001)
+        return "finished"
+
+    start = time.monotonic()
+    with budget_policy("time=0.1"):
+        with raises(errors.BudgetExceededError):
+            run_with_budget("outer", _inner)
+    assert time.monotonic() - start < 2
+    assert budget.budget_stats()["fallbacks"] == 0
+
+
+def test_operation_limit(stats):  # pylint: disable=unused-argument
+    x, y = symbols("x y")
+    clear_solved_for_cache()
+    with budget_policy("operations=2,on_expiry=fallback"):
+        # solved_for() has no fallback
+        with raises(errors.BudgetExceededError):
+            solved_for(Eq(y, 2 * x + 1), x)
+        assert budgeted_simplify(sin(x)**2 + cos(x)**2) == sin(x)**2 + cos(x)**2
+        assert budgeted_simplify(x + 1) == x + 1
+    assert budget.budget_stats()["expired"] == 2
+
+
+def test_solve_fallback(stats):  # pylint: disable=unused-argument
+    x, y = symbols("x y")
+    with budget_policy("operations=1,on_expiry=fallback"):
+        (solution,) = budgeted_solve(Eq(x**3 + x, 3), x, dict=True)
+        assert solution[x] == approx(1.2134116627622)
+        # numeric root is only found for equations with single symbol
+        with raises(errors.BudgetExceededError):
+            budgeted_solve(Eq(x**3 + x, y), x)
+
+
+def test_integrate_fallback(stats):  # pylint: disable=unused-argument
+    x = symbols("x")
+    with budget_policy("time=0.001"):
+        with raises(errors.BudgetExceededError):
+            budgeted_integrate(sqrt(1 + cos(x)**3), (x, 0, 1))
+    with budget_policy("time=0.001,on_expiry=fallback"):
+        result = budgeted_integrate(sqrt(1 + cos(x)**3), (x, 0, 1), fallback=lambda: 1.0)
+    assert result == 1.0
+
+
+def test_expr_equals_fallback(stats):  # pylint: disable=unused-argument
+    x = symbols("x")
+    f = Function("f")
+    # numeric comparison is not possible with undefined function
+    assert expr_equals(f(x) * (x + 1), f(x) * x + f(x))
+    with budget_policy("operations=1,on_expiry=fallback"):
+        # expressions are equal, so expired comparison should not report them as different
+        with raises(errors.BudgetExceededError):
+            expr_equals(f(x) * (x + 1), f(x) * x + f(x))
+    assert budget.budget_stats()["fallbacks"] == 0
@@ -0,0 +1,48 @@
+import copy
+from sympy import pi, symbols
+from sympy.vector import CoordSys3D
+from symplyphysics import Vector, add_cartesian_vectors
+from symplyphysics.core.coordinate_systems.coordinate_systems import (CoordinateSystem,
+    coordinates_rotate, coordinates_transform)
+
+
+def test_root_systems_are_different():
+    C1 = CoordinateSystem()
+    C2 = CoordinateSystem()
+    assert C1 is not C2
+    assert C1.coord_system != C2.coord_system
+
+
+def test_wrapped_systems_are_interned():
+    inner = CoordSys3D("inner")
+    C1 = CoordinateSystem(CoordinateSystem.System.CARTESIAN, inner)
+    C2 = CoordinateSystem(CoordinateSystem.System.CARTESIAN, inner)
+    assert C1 is C2
+    assert CoordinateSystem(CoordinateSystem.System.CYLINDRICAL, inner) is not C1
+    assert copy.deepcopy(C1) is C1
+
+
+def test_derived_systems_are_interned():
+    C = CoordinateSystem()
+    angle = symbols("angle")
+    rotated = coordinates_rotate(C, angle, C.coord_system.k)
+    assert coordinates_rotate(C, angle, C.coord_system.k) is rotated
+    assert coordinates_rotate(C, pi / 2, C.coord_system.k) is not rotated
+    assert coordinates_rotate(C, angle, C.coord_system.i) is not rotated
+    spherical = coordinates_transform(C, CoordinateSystem.System.SPHERICAL)
+    assert coordinates_transform(C, CoordinateSystem.System.SPHERICAL) is spherical
+    assert coordinates_transform(rotated, CoordinateSystem.System.SPHERICAL) is not spherical
+    # wrapping CoordSys3D of derived system returns the same system
+    assert CoordinateSystem(spherical.coord_system_type, spherical.coord_system) is spherical
+    # vectors in the same derived system can be added
+    result = add_cartesian_vectors(Vector([1, 2], coordinates_rotate(C, pi, C.coord_system.k)),
+        Vector([3, 4], coordinates_rotate(C, pi, C.coord_system.k)))
+    assert result.components == [4, 6]
+
+
+def test_cached_base_scalars():
+    C = CoordinateSystem(CoordinateSystem.System.SPHERICAL)
+    assert C.base_scalars() == C.coord_system.base_scalars()
+    assert C.base_vectors() == C.coord_system.base_vectors()
+    names = [f"{C.coord_system}.{n}" for n in ("r", "theta", "phi")]
+    assert [str(s) for s in C.base_scalars()] == names
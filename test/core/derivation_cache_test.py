@@ -0,0 +1,140 @@
+import json
+import os
+from pytest import fixture
+from sympy import Eq, dsolve, solve
+from sympy.physics import units
+from symplyphysics import Function, Quantity, Symbol
+from symplyphysics.core import derivation_cache
+
+
+@fixture(name="cache_dir")
+def cache_dir_fixture(tmp_path):
+    old_directory = derivation_cache.cache_directory()
+    derivation_cache.set_cache_directory(str(tmp_path))
+    yield str(tmp_path)
+    derivation_cache.set_cache_directory(old_directory)
+
+
+class CountingCall:  # pylint: disable=too-few-public-methods
+
+    def __init__(self, func):
+        self.func = func
+        self.calls = 0
+
+    def __call__(self, *args, **kwargs):
+        self.calls += 1
+        return self.func(*args, **kwargs)
+
+
+def test_cached_solve(cache_dir):
+    x = Symbol("x")
+    y = Symbol("y")
+    counting_solve = CountingCall(solve)
+    result = derivation_cache.cached_call(__name__, "solved", counting_solve, Eq(y, 2 * x), x)
+    assert result == [y / 2]
+    assert counting_solve.calls == 1
+    assert len(os.listdir(cache_dir)) == 1
+    # Simulate new process - reload cache from disk, symbols have different generated names
+    derivation_cache.set_cache_directory(cache_dir)
+    x_new = Symbol("x")
+    y_new = Symbol("y")
+    assert x_new.name != x.name
+    result = derivation_cache.cached_call(__name__, "solved", counting_solve, Eq(y_new, 2 * x_new),
+        x_new)
+    assert result == [y_new / 2]
+    assert counting_solve.calls == 1
+
+
+def test_cached_dsolve(cache_dir):
+    time = Symbol("time", units.time)
+    velocity = Function("velocity", units.velocity)
+    acceleration = Symbol("acceleration", units.acceleration)
+    counting_dsolve = CountingCall(dsolve)
+    equation = Eq(velocity(time).diff(time), acceleration)
+    result = derivation_cache.cached_call(__name__, "dsolved", counting_dsolve, equation,
+        velocity(time))
+    derivation_cache.set_cache_directory(cache_dir)
+    cached_result = derivation_cache.cached_call(__name__, "dsolved", counting_dsolve, equation,
+        velocity(time))
+    assert counting_dsolve.calls == 1
+    assert cached_result == result
+
+
+def test_changed_arguments(cache_dir):
+    x = Symbol("x")
+    counting_solve = CountingCall(solve)
+    derivation_cache.cached_call(__name__, "solved", counting_solve, Eq(x, 1), x)
+    derivation_cache.set_cache_directory(cache_dir)
+    result = derivation_cache.cached_call(__name__, "solved", counting_solve, Eq(x, 2), x)
+    assert result == [2]
+    assert counting_solve.calls == 2
+
+
+def test_stale_cache(cache_dir):
+    x = Symbol("x")
+    counting_solve = CountingCall(solve)
+    derivation_cache.cached_call(__name__, "solved", counting_solve, Eq(x, 1), x)
+    file_name = os.path.join(cache_dir, f"{__name__}.json")
+    with open(file_name, "r", encoding="utf-8") as file:
+        content = json.load(file)
+    content["key"]["sympy"] = "0.0.0"
+    with open(file_name, "w", encoding="utf-8") as file:
+        json.dump(content, file)
+    derivation_cache.set_cache_directory(cache_dir)
+    derivation_cache.cached_call(__name__, "solved", counting_solve, Eq(x, 1), x)
+    assert counting_solve.calls == 2
+    # Cache is rebuilt
+    derivation_cache.set_cache_directory(cache_dir)
+    derivation_cache.cached_call(__name__, "solved", counting_solve, Eq(x, 1), x)
+    assert counting_solve.calls == 2
+
+
+def test_quantities_are_not_cached(cache_dir):
+    x = Symbol("x")
+    counting_solve = CountingCall(solve)
+    derivation_cache.cached_call(__name__, "solved", counting_solve, Eq(x, Quantity(2)), x)
+    assert counting_solve.calls == 1
+    assert len(os.listdir(cache_dir)) == 0
+
+
+def test_clear_cache(cache_dir):
+    x = Symbol("x")
+    counting_solve = CountingCall(solve)
+    derivation_cache.cached_call(__name__, "solved", counting_solve, Eq(x, 1), x)
+    derivation_cache.clear_cache()
+    assert len(os.listdir(cache_dir)) == 0
+    derivation_cache.cached_call(__name__, "solved", counting_solve, Eq(x, 1), x)
+    assert counting_solve.calls == 2
+
+
+def test_disabled_cache(cache_dir):
+    derivation_cache.set_cache_directory(None)
+    x = Symbol("x")
+    counting_solve = CountingCall(solve)
+    derivation_cache.cached_call(__name__, "solved", counting_solve, Eq(x, 1), x)
+    derivation_cache.cached_call(__name__, "solved", counting_solve, Eq(x, 1), x)
+    assert counting_solve.calls == 2
+    assert len(os.listdir(cache_dir)) == 0
+
+
+def test_cache_is_not_executed(cache_dir):
+    x = Symbol("x")
+    counting_solve = CountingCall(solve)
+    derivation_cache.cached_call(__name__, "solved", counting_solve, Eq(x, 1), x)
+    file_name = os.path.join(cache_dir, f"{__name__}.json")
+    results = [
+        "__import__('os').getcwd()",
+        "[Integer(1).__class__]",
+        "[sin('Integer(2)')]",
+        "[Function('f')('x')]",
+        "[Symbol(*['x'])]",
+    ]
+    for result in results:
+        with open(file_name, "r", encoding="utf-8") as file:
+            content = json.load(file)
+        content["entries"]["solved"]["result"] = result
+        with open(file_name, "w", encoding="utf-8") as file:
+            json.dump(content, file)
+        derivation_cache.set_cache_directory(cache_dir)
+        assert derivation_cache.cached_call(__name__, "solved", counting_solve, Eq(x, 1), x) == [1]
+    assert counting_solve.calls == len(results) + 1
@@ -0,0 +1,62 @@
+from fractions import Fraction
+from pytest import raises
+from sympy import Symbol as SymSymbol, sqrt
+from sympy.physics.units import Dimension
+from symplyphysics import errors, units, angle_type, dimensionless, Quantity
+from symplyphysics.core.dimensions import (angle_stripped, assert_equivalent_dimension,
+    clear_dimension_caches, collect_factor_and_dimension, dimension_cache_info, dimension_vector)
+
+
+def test_dimension_vector():
+    # length, mass, time, current, temperature, amount of substance, luminous intensity, angle
+    assert dimension_vector(units.force) == (1, 1, -2, 0, 0, 0, 0, 0)
+    assert dimension_vector(units.length * units.mass / units.time**2) == dimension_vector(
+        units.force)
+    assert dimension_vector(dimensionless) == (0,) * 8
+    assert dimension_vector(angle_type / units.time) == (0, 0, -1, 0, 0, 0, 0, 1)
+    assert dimension_vector(Dimension(sqrt(units.length.name)))[0] == Fraction(1, 2)
+
+
+def test_unsupported_dimension_vector():
+    assert dimension_vector(Dimension(units.length.name**SymSymbol("x"))) is None
+    assert dimension_vector(Dimension("unknown")) is None
+
+
+def test_collect_dimension():
+    (factor, dimension) = collect_factor_and_dimension(
+        Quantity(2 * units.joule) + Quantity(3 * units.newton * units.meter))
+    assert factor == 5000
+    assert dimension_vector(dimension) == dimension_vector(units.energy)
+    with raises(ValueError):
+        collect_factor_and_dimension(Quantity(units.joule) + Quantity(units.newton))
+
+
+def test_assert_equivalent_dimension():
+    assert_equivalent_dimension(Quantity(units.newton), "arg", "test", units.force)
+    assert_equivalent_dimension(Quantity(units.radian), "arg", "test", dimensionless)
+    assert_equivalent_dimension(2, "arg", "test", angle_type)
+    assert_equivalent_dimension(Quantity(units.radian / units.second), "arg", "test",
+        units.frequency)
+    with raises(errors.UnitsError):
+        assert_equivalent_dimension(Quantity(units.joule), "arg", "test", units.force)
+    with raises(TypeError):
+        assert_equivalent_dimension(2, "arg", "test", units.force)
+
+
+def test_dimension_checks_are_cached():
+    clear_dimension_caches()
+    quantity = Quantity(units.newton)
+    assert_equivalent_dimension(quantity, "arg", "test", units.force)
+    assert_equivalent_dimension(quantity, "arg", "test", units.force)
+    with raises(errors.UnitsError):
+        assert_equivalent_dimension(quantity, "arg", "test", units.energy)
+    with raises(errors.UnitsError):
+        assert_equivalent_dimension(quantity, "arg", "test", units.energy)
+    info = dimension_cache_info()["dimension_checks"]
+    assert info.misses == 2
+    assert info.hits == 2
+
+
+def test_angle_stripped():
+    assert angle_stripped(angle_type / units.time) == 1 / units.time
+    assert angle_stripped(units.force) == units.force
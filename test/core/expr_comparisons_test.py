@@ -1,5 +1,8 @@
-from sympy import symbols, sin, cos, pi
-from symplyphysics.core.expr_comparisons import expr_equals, expr_equals_abs
+from sympy import log, sqrt, symbols, sin, cos, pi
+from sympy.vector import CoordSys3D
+from symplyphysics import Function, units
+from symplyphysics.core.expr_comparisons import (expr_equals, expr_equals_abs, expr_equals_stats,
+    reset_expr_equals_stats)
 
 
 def test_basic_comparison():
@@ -33,3 +36,53 @@ def test_basic_abs_comparison():
     assert expr_equals_abs(x1, -x1)
     assert expr_equals_abs(-x1, -x1)
     assert not expr_equals_abs(x1, x2)
+
+
+def test_assumptions_comparison():
+    x = symbols("x")
+    p, q = symbols("p q", positive=True)
+    n = symbols("n", integer=True)
+    assert expr_equals(sqrt(p**2), p)
+    assert not expr_equals(sqrt(x**2), x)
+    assert expr_equals(log(p * q), log(p) + log(q))
+    assert not expr_equals(log(p * q), log(-p) + log(-q))
+    assert expr_equals(cos(pi * n), (-1)**n)
+    assert not expr_equals(cos(pi * x), (-1)**x)
+
+
+def test_comparison_tiers():
+    x = symbols("x")
+    f = Function("f")
+    reset_expr_equals_stats()
+    assert expr_equals(x + 1, 1 + x)
+    assert expr_equals(sin(2 * x), 2 * sin(x) * cos(x))
+    assert not expr_equals(sin(x)**2, cos(x)**2)
+    assert expr_equals(f(x) * (x + 1), f(x) * x + f(x))
+    assert expr_equals_stats() == {"structural": 1, "numeric": 2, "simplify": 1}
+
+
+def test_vector_comparison():
+    (i, j, _) = CoordSys3D("C").base_vectors()
+    x = symbols("x")
+    assert expr_equals(sin(2 * x) * i + j, 2 * sin(x) * cos(x) * i + j)
+    assert not expr_equals(sin(x) * i, cos(x) * i)
+
+
+def test_quantity_comparison():
+    x = symbols("x")
+    reset_expr_equals_stats()
+    assert expr_equals(units.kilometer, 1000 * units.meter)
+    assert expr_equals(x * units.kilometer / units.hour, 5 * x * units.meter / (18 * units.second))
+    assert not expr_equals(units.kilometer, 100 * units.meter)
+    assert not expr_equals(units.meter, units.second)
+    assert expr_equals_stats()["simplify"] == 0
+
+
+def test_small_values_comparison():
+    x = symbols("x")
+    assert not expr_equals(units.planck, 2 * units.planck)
+    assert not expr_equals(units.hbar * x, 3 * units.hbar * x)
+    assert not expr_equals(x / 10**25, 2 * x / 10**25)
+    assert not expr_equals(x / 10**40, 0)
+    assert expr_equals(units.hbar * x * (sin(x)**2 + cos(x)**2), units.hbar * x)
+    assert expr_equals(sin(x)**2 + cos(x)**2 - 1, 0)
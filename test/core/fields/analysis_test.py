@@ -2,9 +2,11 @@ from collections import namedtuple
 from typing import Sequence
 from pytest import approx, fixture, mark, raises
 from sympy import Expr, cos, pi, sin, sqrt, Symbol as SymSymbol
+from symplyphysics.core.budget import budget_policy
 from symplyphysics.core.coordinate_systems.coordinate_systems import CoordinateSystem
 from symplyphysics.core.dimensions import ScalarValue
-from symplyphysics.core.fields.analysis import circulation_along_curve, circulation_along_surface_boundary, flux_across_curve, flux_across_surface, flux_across_surface_boundary, flux_across_volume_boundary
+from symplyphysics.core.errors import BudgetExceededError
+from symplyphysics.core.fields.analysis import NUMERIC_METHOD, circulation_along_curve, circulation_along_surface_boundary, flux_across_curve, flux_across_surface, flux_across_surface_boundary, flux_across_volume_boundary
 from symplyphysics.core.fields.vector_field import VectorField
 from symplyphysics.core.points.cartesian_point import CartesianPoint
 from symplyphysics.core.points.cylinder_point import CylinderPoint
@@ -214,3 +216,88 @@ def test_basic_flux_across_sphere_boundary():
     field = VectorField(field_function, B)
     result = flux_across_volume_boundary(field, (1, 2), (0, 2 * pi), (0, 5))
     assert result.evalf(4) == approx((150 * pi).evalf(4), 0.001)
+
+
+# Test numeric integration method
+
+
+def test_numeric_circulation_and_flux(test_args):
+    field = VectorField(lambda point: [point.y, 0, point.x + point.z], test_args.C)
+    curve = [cos(test_args.parameter1), sin(test_args.parameter1)]
+    result = circulation_along_curve(field, curve, (test_args.parameter1, 0, pi / 2),
+        NUMERIC_METHOD)
+    assert float(result) == approx(float(-pi / 4), rel=1e-10)
+    field = VectorField(lambda point: [point.x - point.y, point.x + point.y], test_args.C)
+    circle = [2 * cos(test_args.parameter1), 2 * sin(test_args.parameter1)]
+    result = flux_across_curve(field, circle, (test_args.parameter1, 0, 2 * pi), NUMERIC_METHOD)
+    assert float(result) == approx(float(8 * pi), rel=1e-10)
+    circle = [
+        test_args.parameter1 * cos(test_args.parameter2),
+        test_args.parameter1 * sin(test_args.parameter2)
+    ]
+    result = flux_across_surface_boundary(field, circle, (test_args.parameter1, 0, 2),
+        (test_args.parameter2, 0, 2 * pi), NUMERIC_METHOD)
+    assert float(result) == approx(float(8 * pi), rel=1e-10)
+    result = circulation_along_surface_boundary(field, circle, (test_args.parameter1, 0, 2),
+        (test_args.parameter2, 0, 2 * pi), NUMERIC_METHOD)
+    assert float(result) == approx(float(8 * pi), rel=1e-10)
+
+
+# symbolic integration of this flux takes too much time
+def test_numeric_gravitational_field_flux(test_args):
+    field = VectorField(
+        lambda point: [
+        point.x / _distance(point)**3, point.y / _distance(point)**3, point.z / _distance(point)**3
+        ], test_args.C)
+    # unit sphere with outward normal: parameter1 is polar angle, parameter2 is azimuthal angle
+    trajectory = [
+        cos(test_args.parameter2) * sin(test_args.parameter1),
+        sin(test_args.parameter2) * sin(test_args.parameter1),
+        cos(test_args.parameter1)
+    ]
+    result = flux_across_surface(field, trajectory, (test_args.parameter1, 0, pi),
+        (test_args.parameter2, 0, 2 * pi), NUMERIC_METHOD)
+    assert float(result) == approx(float(4 * pi), rel=1e-8)
+
+
+def test_symbolic_flux_budget_fallback(test_args):
+    field = VectorField(
+        lambda point: [
+        point.x / _distance(point)**3, point.y / _distance(point)**3, point.z / _distance(point)**3
+        ], test_args.C)
+    trajectory = [
+        cos(test_args.parameter2) * sin(test_args.parameter1),
+        sin(test_args.parameter2) * sin(test_args.parameter1),
+        cos(test_args.parameter1)
+    ]
+    with budget_policy("time=0.01"):
+        with raises(BudgetExceededError):
+            flux_across_surface(field, trajectory, (test_args.parameter1, 0, pi),
+                (test_args.parameter2, 0, 2 * pi))
+    # symbolic integral falls back to numeric quadrature
+    with budget_policy("time=0.01,on_expiry=fallback"):
+        result = flux_across_surface(field, trajectory, (test_args.parameter1, 0, pi),
+            (test_args.parameter2, 0, 2 * pi))
+    assert float(result) == approx(float(4 * pi), rel=1e-8)
+
+
+def test_numeric_flux_across_volume_boundary(test_args):
+    field = VectorField(lambda point: [point.x**2 / 2, point.y * point.z, -point.x * point.z],
+        test_args.C)
+    x = field.coordinate_system.coord_system.base_scalars()[0]
+    y = field.coordinate_system.coord_system.base_scalars()[1]
+    result = flux_across_volume_boundary(field, (-2, 2), (-sqrt(4 - x**2), sqrt(4 - x**2)),
+        (0, sqrt(4 - x**2 - y**2)), NUMERIC_METHOD)
+    assert float(result) == approx(float(4 * pi), rel=1e-6)
+
+
+def test_unknown_integration_method(test_args):
+    field = VectorField(lambda point: [point.y, 0], test_args.C)
+    curve = [cos(test_args.parameter1), sin(test_args.parameter1)]
+    with raises(ValueError):
+        circulation_along_curve(field, curve, (test_args.parameter1, 0, pi), "unknown")
+    # numeric integration does not support free symbols
+    radius = SymSymbol("radius")
+    with raises(ValueError):
+        circulation_along_curve(field, [radius * c for c in curve], (test_args.parameter1, 0, pi),
+            NUMERIC_METHOD)
@@ -0,0 +1,112 @@
+import numpy as np
+from pytest import approx, raises
+from sympy import cos, exp, pi, sin
+from symplyphysics.core.coordinate_systems.coordinate_systems import CoordinateSystem
+from symplyphysics.core.fields.operators import curl_operator, divergence_operator, gradient_operator
+from symplyphysics.core.fields.scalar_field import ScalarField
+from symplyphysics.core.fields.vector_field import VectorField
+from symplyphysics.core.fields.numeric_operators import (FieldGrid, numeric_curl,
+    numeric_divergence, numeric_gradient, numeric_laplacian)
+from symplyphysics.core.vectors.vectors import Vector
+
+# Numeric operators are validated against symbolic operators, evaluated on the same grid.
+
+
+def _symbolic_laplacian(field: ScalarField) -> ScalarField:
+    gradient = VectorField.from_vector(gradient_operator(field))
+    return ScalarField.from_expression(divergence_operator(gradient), field.coordinate_system)
+
+
+def _check_scalar_field(field: ScalarField, grid: FieldGrid) -> None:
+    values = field.evaluate_grid(*grid.axes)
+    gradient = VectorField.from_vector(gradient_operator(field)).evaluate_grid(*grid.axes)
+    assert np.allclose(numeric_gradient(values, grid), gradient, rtol=1e-2, atol=1e-2)
+    laplacian = _symbolic_laplacian(field).evaluate_grid(*grid.axes)
+    # Laplacian is only first-order accurate near non-periodic boundaries
+    interior = tuple(
+        slice(None) if period is not None or len(axis) == 1 else slice(2, -2)
+        for (axis, period) in zip(grid.axes, grid.periods))
+    assert np.allclose(numeric_laplacian(values, grid)[interior],
+        laplacian[interior],
+        rtol=1e-2,
+        atol=1e-2)
+
+
+def _check_vector_field(field: VectorField, grid: FieldGrid) -> None:
+    values = field.evaluate_grid(*grid.axes)
+    divergence = ScalarField.from_expression(divergence_operator(field),
+        field.coordinate_system).evaluate_grid(*grid.axes)
+    assert np.allclose(numeric_divergence(values, grid), divergence, rtol=1e-2, atol=1e-2)
+    curl = curl_operator(field).evaluate_grid(*grid.axes)
+    assert np.allclose(numeric_curl(values, grid), curl, rtol=1e-2, atol=1e-2)
+
+
+def test_cartesian_operators():
+    C = CoordinateSystem()
+    x, y, z = C.coord_system.base_scalars()
+    grid = FieldGrid(np.linspace(-1, 1, 81), np.linspace(0, 2, 81), np.linspace(0.5, 1, 41), C)
+    _check_scalar_field(ScalarField.from_expression(x**2 * y - sin(z) * exp(y), C), grid)
+    _check_vector_field(VectorField.from_vector(Vector([y * z, x**2 - z, cos(x * y)], C)), grid)
+
+
+def test_cylindrical_operators():
+    C = CoordinateSystem(CoordinateSystem.System.CYLINDRICAL)
+    r, theta, z = C.coord_system.base_scalars()
+    grid = FieldGrid(np.linspace(0.5, 2, 61),
+        np.linspace(0, 2 * np.pi, 80, endpoint=False),
+        np.linspace(-1, 1, 41),
+        C,
+        periods=(None, 2 * np.pi, None))
+    _check_scalar_field(ScalarField.from_expression(r**2 * sin(theta) + r * z, C), grid)
+    _check_vector_field(
+        VectorField.from_vector(Vector([r * cos(theta), r**2 * z, z * sin(theta)], C)), grid)
+
+
+def test_spherical_operators():
+    C = CoordinateSystem(CoordinateSystem.System.SPHERICAL)
+    r, theta, phi = C.coord_system.base_scalars()
+    grid = FieldGrid(np.linspace(1, 2, 41),
+        np.linspace(0, 2 * np.pi, 80, endpoint=False),
+        np.linspace(pi / 6, 5 * pi / 6, 61),
+        C,
+        periods=(None, 2 * np.pi, None))
+    _check_scalar_field(ScalarField.from_expression(r**2 * cos(phi) + r * sin(theta), C), grid)
+    _check_vector_field(
+        VectorField.from_vector(Vector([r * sin(phi), cos(theta), r * cos(phi) * sin(theta)], C)),
+        grid)
+
+
+def test_second_order_convergence():
+    C = CoordinateSystem()
+    x = C.coord_system.base_scalars()[0]
+    field = ScalarField.from_expression(sin(3 * x), C)
+    errors = []
+    for points in (21, 41):
+        grid = FieldGrid(np.linspace(0, 1, points), [0], [0], C)
+        gradient = numeric_gradient(field.evaluate_grid(*grid.axes), grid)[..., 0]
+        errors.append(np.max(np.abs(gradient - 3 * np.cos(3 * grid.axes[0][:, None, None]))))
+    # error of second-order differences is 4 times smaller when grid step is halved
+    assert errors[0] / errors[1] == approx(4, rel=0.2)
+
+
+def test_single_point_axis():
+    C = CoordinateSystem()
+    grid = FieldGrid(np.linspace(0, 1, 11), [0], [2], C)
+    values = 2 * grid.axes[0][:, None, None] * np.ones(grid.shape)
+    assert numeric_gradient(values, grid)[:, 0, 0] == approx(np.tile([2, 0, 0], (11, 1)))
+    assert numeric_laplacian(values, grid) == approx(np.zeros(grid.shape))
+
+
+def test_bad_grid():
+    C = CoordinateSystem()
+    with raises(ValueError):
+        FieldGrid([0, 1], [0], [0], C)
+    with raises(ValueError):
+        FieldGrid([0, 2, 1], [0], [0], C)
+    with raises(ValueError):
+        FieldGrid([0, 1, 2], [0], [0], C, periods=(1, None, None))
+    grid = FieldGrid([0, 1, 2], [0], [0], C)
+    with raises(ValueError):
+        numeric_gradient(np.zeros((3, 1, 2)), grid)
+    with raises(ValueError):
+        numeric_curl(np.zeros((3, 1, 1)), grid)
@@ -8,10 +8,12 @@ from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.core.coordinate_systems.coordinate_systems import CoordinateSystem
 from symplyphysics.core.fields.vector_field import VectorField
 from symplyphysics.core.fields.scalar_field import ScalarField
-from symplyphysics.core.fields.operators import curl_operator, divergence_operator, gradient_operator
+from symplyphysics.core.fields.operators import (clear_field_operator_caches, curl_operator,
+    divergence_operator, field_operator_cache_info, gradient_operator)
 from symplyphysics.core.points.cartesian_point import CartesianPoint
 from symplyphysics.core.points.cylinder_point import CylinderPoint
 from symplyphysics.core.points.sphere_point import SpherePoint
+from symplyphysics.core.vectors.vectors import Vector
 
 # Tests are mostly based on vector calculus slides: https://www.slideshare.net/garghanish/coordinate-systems-and-vector-calculus
 
@@ -187,3 +189,30 @@ def test_gravitational_field_is_conservative(test_args):
     field_rotor = curl_operator(field)
     field_rotor_applied = field_rotor.apply_to_basis().to_sympy_vector()
     assert field_rotor_applied == VectorZero.zero
+
+
+# Operator results are memoized by field expression and coordinate system
+def test_operator_cache(test_args):
+    clear_field_operator_caches()
+    x, y, z = test_args.C.coord_system.base_scalars()
+    field = ScalarField(lambda point: point.x**2 * point.y, test_args.C)
+    gradient = gradient_operator(field)
+    same_field = ScalarField.from_expression(y * x**2, test_args.C)
+    same_gradient = gradient_operator(same_field)
+    assert field_operator_cache_info()["gradient"].hits == 1
+    assert same_gradient.components == gradient.components
+    # returned vectors do not share components with the cache
+    same_gradient.components[0] = 0
+    assert gradient_operator(field).components == gradient.components
+
+    vector_field = VectorField(lambda point: [point.y * point.z, point.x], test_args.C)
+    curl = curl_operator(vector_field)
+    assert curl_operator(VectorField.from_vector(Vector([y * z, x, 0], test_args.C))) is curl
+    divergence_operator(vector_field)
+    divergence_operator(vector_field)
+    info = field_operator_cache_info()
+    assert info["curl"].hits == 1
+    assert info["divergence"].hits == 1
+
+    clear_field_operator_caches()
+    assert all(i.currsize == 0 for i in field_operator_cache_info().values())
@@ -1,5 +1,6 @@
 from collections import namedtuple
-from pytest import fixture, raises
+from pytest import approx, fixture, raises
+import numpy as np
 from sympy import atan, cos, pi, sin, sqrt, symbols, simplify
 from sympy.vector import express
 from symplyphysics.core.test_decorators import unsupported_usage
@@ -9,7 +10,8 @@ from symplyphysics.core.points.sphere_point import SpherePoint
 from symplyphysics.core.coordinate_systems.coordinate_systems import CoordinateSystem, coordinates_rotate, coordinates_transform
 from symplyphysics.core.points.cartesian_point import CartesianPoint
 from symplyphysics.core.points.point import Point
-from symplyphysics.core.fields.scalar_field import ScalarField
+from symplyphysics.core.fields.scalar_field import ScalarField, clear_rebase_cache, rebase_cache_info
+from symplyphysics import units, Quantity
 
 
 @fixture(name="test_args")
@@ -387,3 +389,76 @@ def test_cylindrical_field_create(test_args):
     point_polar = [sqrt(5), atan(2)]
     point_polar_value = field_rebased.apply(point_polar)
     assert simplify(point_polar_value) == 3
+
+
+# Rebased fields are memoized by field expression and coordinate systems
+def test_field_rebase_cache(test_args):
+    clear_rebase_cache()
+    B = coordinates_transform(test_args.C, CoordinateSystem.System.CYLINDRICAL)
+    field_rebased = ScalarField(lambda p: p.x + p.y, test_args.C).rebase(B)
+    # same field, defined with another point function
+    same_field = ScalarField.from_expression(
+        test_args.C.coord_system.y + test_args.C.coord_system.x, test_args.C)
+    assert same_field.rebase(B) is field_rebased
+    assert rebase_cache_info().hits == 1
+    assert ScalarField(lambda p: p.x - p.y, test_args.C).rebase(B) is not field_rebased
+    clear_rebase_cache()
+    assert rebase_cache_info().currsize == 0
+    assert same_field.rebase(B) is not field_rebased
+
+
+# Test ScalarField.evaluate_points() and ScalarField.evaluate_grid()
+
+
+def test_evaluate_points(test_args):
+    field = ScalarField.from_expression(
+        test_args.C.coord_system.x**2 + test_args.C.coord_system.y * test_args.C.coord_system.z,
+        test_args.C)
+    result = field.evaluate_points([[1, 2, 3], [0, 1, 0]], CartesianPoint)
+    assert result == approx([7, 0])
+    # missing coordinates are zero
+    assert field.evaluate_points([[2]]) == approx([4])
+    with raises(ValueError):
+        field.evaluate_points([[1, 2, 3, 4]])
+
+
+def test_evaluate_grid(test_args):
+
+    def field_function(p: CartesianPoint) -> ScalarValue:
+        return p.x * p.y + p.z
+
+    field = ScalarField(field_function, test_args.C)
+    xs = np.linspace(0, 1, 3)
+    ys = np.linspace(-1, 1, 4)
+    zs = np.array([0.5])
+    result = field.evaluate_grid(xs, ys, zs)
+    assert result.shape == (3, 4, 1)
+    for (i, x) in enumerate(xs):
+        for (j, y) in enumerate(ys):
+            assert result[i, j, 0] == approx(float(field(CartesianPoint(x, y, 0.5))))
+    with raises(ValueError):
+        field.evaluate_grid([[0]], ys, zs)
+
+
+def test_evaluate_constant_field():
+    field = ScalarField(2)
+    assert field.evaluate_grid([0, 1], [0], [0, 1, 2]) == approx(np.full((2, 1, 3), 2))
+    field = ScalarField.from_expression(Quantity(3 * units.kilometer))
+    assert field.evaluate_points([[1, 2, 3], [4, 5, 6]]) == approx([3000, 3000])
+    field = ScalarField(Quantity(3 * units.kilometer))
+    assert field.evaluate_points([[1, 2, 3], [4, 5, 6]]) == approx([3000, 3000])
+    field = ScalarField(units.gram)
+    assert field.evaluate_grid([0, 1], [0], [0]) == approx(np.full((2, 1, 1), 1e-3))
+
+
+def test_evaluate_wrong_coord_system():
+    field = ScalarField.from_expression(1, CoordinateSystem(CoordinateSystem.System.SPHERICAL))
+    assert field.evaluate_points([[1, 0, 0]], SpherePoint) == approx([1])
+    with raises(ValueError):
+        field.evaluate_points([[1, 2, 3]], CartesianPoint)
+    with raises(ValueError):
+        field.evaluate_grid([1], [2], [3], CylinderPoint)
+    x = symbols("x")
+    field = ScalarField(lambda p: p.x * x)
+    with raises(ValueError):
+        field.evaluate_points([[1, 2, 3]])
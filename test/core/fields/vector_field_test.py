@@ -1,6 +1,7 @@
 from collections import namedtuple
 from typing import Sequence
-from pytest import fixture, raises
+from pytest import approx, fixture, raises
+import numpy as np
 from sympy import Expr, atan, cos, sin, sqrt, symbols
 from sympy.vector import express
 from symplyphysics.core.test_decorators import unsupported_usage
@@ -10,7 +11,9 @@ from symplyphysics.core.points.cartesian_point import CartesianPoint
 from symplyphysics.core.points.point import Point
 from symplyphysics.core.coordinate_systems.coordinate_systems import CoordinateSystem, coordinates_rotate, coordinates_transform
 from symplyphysics.core.fields.vector_field import VectorField
+from symplyphysics.core.vectors.vectors import Vector
 from symplyphysics.core.fields.scalar_field import AnyPoint
+from symplyphysics import units, Quantity
 
 
 def _assert_point(field_: VectorField, point_: AnyPoint, expected_: Sequence[Expr | float]):
@@ -304,3 +307,59 @@ def test_cylindrical_field_create(test_args):
     # it is the same as original vector
     vector_rebased = point_polar_vector.rebase(test_args.C)
     assert vector_rebased.components == [1, 2, 0]
+
+
+# Test VectorField.evaluate_points(), VectorField.evaluate_grid() and
+# VectorField.evaluate_trajectory()
+
+
+def test_evaluate_points(test_args):
+
+    def field_function(p: CartesianPoint) -> Sequence[Expr]:
+        return [p.y * p.z, p.x, 1]
+
+    field = VectorField(field_function, test_args.C)
+    result = field.evaluate_points([[1, 2, 3], [4, 5, 6]], CartesianPoint)
+    assert result.shape == (2, 3)
+    assert result == approx(np.array([[6, 1, 1], [30, 4, 1]]))
+    # missing components and coordinates are zero
+    field = VectorField(lambda p: [p.x], test_args.C)
+    assert field.evaluate_points([[2]]) == approx(np.array([[2, 0, 0]]))
+    with raises(ValueError):
+        field.evaluate_points([[1, 2, 3]], CylinderPoint)
+
+
+def test_evaluate_grid(test_args):
+    x, y, z = test_args.C.coord_system.base_scalars()
+    # electric field of dipole with unit moment along z-axis
+    distance = sqrt(x**2 + y**2 + z**2)
+    dipole = VectorField.from_vector(
+        Vector(
+        [3 * x * z / distance**5, 3 * y * z / distance**5,
+        (3 * z**2 - distance**2) / distance**5], test_args.C))
+    xs = np.linspace(1, 2, 3)
+    ys = np.array([-1.0, 1.0])
+    zs = np.linspace(0.5, 1.5, 4)
+    result = dipole.evaluate_grid(xs, ys, zs)
+    assert result.shape == (3, 2, 4, 3)
+    for (i, j, k) in [(0, 0, 0), (1, 1, 2), (2, 0, 3)]:
+        expected = dipole(CartesianPoint(xs[i], ys[j], zs[k])).components
+        assert result[i, j, k] == approx([float(e) for e in expected])
+
+
+def test_evaluate_constant_field(test_args):
+    field = VectorField([1, 2], test_args.C)
+    result = field.evaluate_points([[1, 2, 3], [4, 5, 6]])
+    assert result == approx(np.array([[1, 2, 0], [1, 2, 0]]))
+    field = VectorField([Quantity(2 * units.kilometer), units.meter], test_args.C)
+    result = field.evaluate_points([[1, 2, 3]])
+    assert result == approx(np.array([[2000, 1, 0]]))
+    with raises(ValueError):
+        VectorField([1, 2, 3, 4]).evaluate_points([[1, 2, 3]])
+
+
+def test_evaluate_trajectory(test_args):
+    field = VectorField(lambda p: [p.x * p.y, p.z], test_args.C)
+    parameter = symbols("t")
+    result = field.evaluate_trajectory([parameter, 2 * parameter], parameter, [0, 1, 2])
+    assert result == approx(np.array([[0, 0, 0], [2, 0, 0], [8, 0, 0]]))
@@ -0,0 +1,66 @@
+import statistics
+import subprocess
+import sys
+from symplyphysics.core.lazy_modules import MANIFEST, build_manifest
+
+# Time spent in the modules of this package, when importing top-level package, excluding
+# SymPy and other dependencies. It takes about 0.05s on the development machine, so the
+# budget tolerates slow CI runners, but fails if laws are imported eagerly again.
+IMPORT_TIME_BUDGET_SECONDS = 0.5
+# Number of measured imports. Median of them is compared with the budget.
+IMPORT_TIME_RUNS = 5
+
+
+def _run_python(*args: str) -> str:
+    result = subprocess.run([sys.executable, *args], capture_output=True, text=True, check=True)
+    return result.stdout + result.stderr
+
+
+def test_manifest_is_up_to_date():
+    # Run 'python -m symplyphysics.core.lazy_modules' if this test fails
+    assert build_manifest() == MANIFEST
+
+
+def test_lazy_law_access():
+    code = ("import sys\n"
+        "def loaded(): return [m for m in sys.modules if m.startswith('symplyphysics.laws.')]\n"
+        "import symplyphysics\n"
+        "assert loaded() == [], loaded()\n"
+        "from symplyphysics.laws import dynamics\n"
+        "assert loaded() == ['symplyphysics.laws.dynamics'], loaded()\n"
+        "assert 'period_of_ideal_pendulum_from_length' in dir(dynamics)\n"
+        "dynamics.period_of_ideal_pendulum_from_length.print_law()\n"
+        "assert 'symplyphysics.laws.dynamics.period_of_ideal_pendulum_from_length' in loaded()\n"
+        "assert 'symplyphysics.laws.dynamics.braking_path' not in loaded()\n"
+        "assert 'symplyphysics.laws.optics' not in loaded()\n"
+        "try:\n"
+        "    dynamics.unknown_law\n"
+        "    assert False\n"
+        "except AttributeError:\n"
+        "    pass\n")
+    _run_python("-c", code)
+
+
+def test_import_loads_no_laws():
+    code = ("import sys\n"
+        "import symplyphysics\n"
+        "print('\\n'.join(m for m in sys.modules if m.startswith(('symplyphysics.laws',\n"
+        "    'symplyphysics.definitions'))))\n")
+    assert _run_python("-c", code).split() == []
+
+
+def _import_time_seconds() -> float:
+    output = _run_python("-X", "importtime", "-c", "import symplyphysics")
+    total_microseconds = 0
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        (self_time, _, module_name) = line.split("|")
+        if module_name.strip().startswith("symplyphysics"):
+            total_microseconds += int(self_time.split(":")[1])
+    return total_microseconds / 1e6
+
+
+def test_import_time_budget():
+    times = [_import_time_seconds() for _ in range(IMPORT_TIME_RUNS)]
+    assert statistics.median(times) < IMPORT_TIME_BUDGET_SECONDS
@@ -0,0 +1,185 @@
+import importlib
+import inspect
+import math
+import os
+from pytest import approx, raises
+import numpy as np
+from sympy import Eq, sin
+from symplyphysics import (errors, units, Quantity, QuantityArray, Symbol, Function, convert_to,
+    validate_input, validate_output)
+from symplyphysics.core.dimensions import angle_stripped, dimensionless, si_base_unit, si_scale_factor
+from symplyphysics.core.lazy_modules import MANIFEST, _package_path
+from symplyphysics.core.numeric import NumericFunction, numeric
+from symplyphysics.core.symbols.symbols import DimensionSymbol
+from symplyphysics.laws.chemistry import avogadro_number_from_mole_count as avogadro_law
+from symplyphysics.laws.dynamics import period_of_ideal_pendulum_from_length as pendulum_period
+from symplyphysics.laws.electricity import capacity_of_spherical_capacitor as capacitor_law
+from symplyphysics.laws.gravity import gravity_force_from_mass_and_distance as gravity_law
+
+
+def test_numeric_law():
+    assert pendulum_period.calculate_period.numeric.parameters == ("pendulum_length",)
+    period = pendulum_period.calculate_period.numeric(pendulum_length=2.0)
+    expected = pendulum_period.calculate_period(Quantity(2 * units.meter))
+    assert period == approx(float(convert_to(expected, units.second)))
+
+
+def test_numeric_array():
+    lengths = np.array([0.5, 1.0, 2.0])
+    periods = pendulum_period.calculate_period.numeric(pendulum_length=lengths)
+    assert periods.shape == (3,)
+    assert periods == approx(2 * math.pi * np.sqrt(lengths / 9.80665))
+
+
+def test_numeric_keyword_arguments():
+    numeric_function = gravity_law.calculate_force.numeric
+    assert numeric_function.parameters == ("distance_between_mass_centers", "first_object_mass",
+        "second_object_mass")
+    # Gravitational constant is converted to SI units
+    force = numeric_function(first_object_mass=1.0,
+        second_object_mass=2.0,
+        distance_between_mass_centers=3.0)
+    assert force == approx(6.6743e-11 * 1.0 * 2.0 / 9.0)
+    # order of parameters differs from calculate_force(), so they cannot be positional
+    with raises(TypeError):
+        numeric_function(1.0, 2.0, 3.0)
+
+
+def test_numeric_bad_arguments():
+    numeric_function = pendulum_period.calculate_period.numeric
+    with raises(TypeError):
+        numeric_function()
+    with raises(TypeError):
+        numeric_function(pendulum_length=1.0, unknown=1.0)
+    with raises(TypeError):
+        numeric_function(1.0, 2.0)
+
+
+def test_numeric_function_with_functions():
+    x = Symbol("x")
+    y = Symbol("y")
+    numeric_function = NumericFunction(Eq(y, sin(x)), y)
+    assert numeric_function(x=0.0) == approx(0.0)
+    f = Function("f")
+    numeric_function = NumericFunction(Eq(y, f(x)), y)
+    with raises(ValueError):
+        numeric_function(x=1.0)
+
+
+def test_batched_law():
+    lengths = QuantityArray([50, 100, 200], units.centimeter)
+    periods = pendulum_period.calculate_period(lengths)
+    assert isinstance(periods, QuantityArray)
+    assert periods.dimension == units.time
+    for (length, period) in zip([0.5, 1.0, 2.0], np.asarray(periods)):
+        expected = pendulum_period.calculate_period(Quantity(length * units.meter))
+        assert period == approx(float(convert_to(expected, units.second)))
+
+
+def test_batched_mixed_arguments():
+    masses = QuantityArray([1, 2, 3], units.kilogram)
+    forces = gravity_law.calculate_force(masses, Quantity(4 * units.gram),
+        Quantity(2 * units.meter))
+    assert np.asarray(forces) == approx(6.6743e-11 * np.array([1, 2, 3]) * 0.004 / 4)
+
+
+def test_batched_bad_dimension():
+    with raises(errors.UnitsError):
+        pendulum_period.calculate_period(QuantityArray([1, 2], units.second))
+
+
+def test_batched_output_validation():
+    x = Symbol("x", units.length)
+    y = Symbol("y", units.length)
+
+    @validate_input(x_=x)
+    @validate_output(units.time)
+    @numeric(Eq(y, 2 * x), y)
+    def calculate_y(x_: Quantity) -> Quantity:
+        return Quantity(2 * x_)
+
+    with raises(errors.UnitsError):
+        calculate_y(QuantityArray([1, 2], units.meter))
+
+
+def test_batched_unmapped_parameter():
+    x = Symbol("x", units.length)
+    y = Symbol("y", units.length)
+
+    @validate_output(y)
+    @numeric(Eq(y, 2 * x), y)
+    def calculate_y(x_: Quantity) -> Quantity:
+        return Quantity(2 * x_)
+
+    with raises(TypeError):
+        calculate_y(QuantityArray([1, 2], units.meter))
+
+
+# Function without numeric form is called for each value of the arrays
+def test_elementwise_law():
+    inner_radii = QuantityArray([[1], [3]], units.centimeter)
+    outer_radii = QuantityArray([2, 4, 6], units.centimeter)
+    capacities = capacitor_law.calculate_capacity(2, inner_radii, outer_radii)
+    assert isinstance(capacities, QuantityArray)
+    assert capacities.dimension == units.capacitance
+    values = np.asarray(capacities)
+    assert values.shape == (2, 3)
+    for (i, inner_radius) in enumerate([1, 3]):
+        for (j, outer_radius) in enumerate([2, 4, 6]):
+            # radii are ordered by the law, so that capacity is positive
+            expected = capacitor_law.calculate_capacity(2,
+                Quantity(inner_radius * units.centimeter),
+                Quantity(outer_radius * units.centimeter))
+            assert values[i, j] > 0
+            assert values[i, j] == approx(float(convert_to(expected, units.farad)))
+    counts = avogadro_law.calculate_particles_count(QuantityArray([1.5e-23, 3e-23], units.mole))
+    assert list(np.asarray(counts)) == [9, 18]
+
+
+def test_elementwise_bad_dimension():
+    with raises(errors.UnitsError):
+        capacitor_law.calculate_capacity(2, QuantityArray([1, 2], units.second),
+            Quantity(units.meter))
+
+
+def _numeric_law_functions():
+    for (package_name, names) in MANIFEST.items():
+        for name in names:
+            path = os.path.join(_package_path(package_name), f"{name}.py")
+            if not os.path.isfile(path):
+                continue
+            with open(path, encoding="utf-8") as file:
+                if "@numeric(" not in file.read():
+                    continue
+            module = importlib.import_module(f"{package_name}.{name}")
+            for function in vars(module).values():
+                if (isinstance(getattr(function, "numeric", None), NumericFunction) and
+                        function.__module__ == module.__name__):
+                    yield function
+
+
+def _law_argument(symbol: DimensionSymbol, value: float) -> Quantity | float:
+    # angles and dimensionless values are passed to laws as numbers
+    if angle_stripped(symbol.dimension) == dimensionless:
+        return value
+    return Quantity(value * si_base_unit(symbol.dimension), dimension=symbol.dimension)
+
+
+# Numeric form is the law itself, so it should give the same result as the decorated function.
+def test_numeric_laws_parity():
+    functions = list(_numeric_law_functions())
+    assert len(functions) > 100
+    rng = np.random.default_rng(0)
+    for function in functions:
+        numeric_function = function.numeric
+        arguments = {}
+        for name in inspect.signature(function).parameters:
+            symbol = numeric_function.input_symbols[name]
+            if isinstance(symbol, DimensionSymbol):
+                arguments[name] = _law_argument(symbol, rng.uniform(1.0, 2.0))
+            else:
+                arguments[name] = [_law_argument(s, rng.uniform(1.0, 2.0)) for s in symbol]
+        # some laws, eg impedance laws, have complex values
+        (expected, _) = si_scale_factor(function(**arguments))
+        result = numeric_function(**numeric_function.arguments(arguments))
+        assert complex(result) == approx(complex(expected), rel=1e-9), function.__module__
@@ -0,0 +1,92 @@
+import os
+import subprocess
+import sys
+from pytest import fixture, raises
+from symplyphysics import proofs
+
+
+@fixture(name="deferred")
+def deferred_fixture():
+    proofs.set_deferred_proofs(True)
+    yield
+    proofs.set_deferred_proofs(False)
+
+
+# Proofs registered by tests must not stay in the global registry, otherwise later verify_all()
+# calls in the same process run them.
+@fixture(autouse=True)
+def restore_registry_fixture():
+    # pylint: disable=protected-access
+    registered = {name: list(funcs) for name, funcs in proofs._proofs.items()}
+    verified = set(proofs._verified)
+    yield
+    proofs._proofs.clear()
+    proofs._proofs.update(registered)
+    proofs._verified.clear()
+    proofs._verified.update(verified)
+
+
+def test_proof_runs_immediately():
+    calls = []
+
+    @proofs.proof
+    def _derive():
+        calls.append(1)
+
+    assert len(calls) == 1
+    assert proofs.is_verified(__name__)
+
+
+def test_deferred_proof(deferred):  # pylint: disable=unused-argument
+    calls = []
+
+    @proofs.proof
+    def _derive():
+        calls.append(1)
+
+    assert len(calls) == 0
+    assert not proofs.is_verified(__name__)
+    assert proofs.verify(__name__) == __name__
+    assert len(calls) == 1
+    assert proofs.is_verified(__name__)
+
+
+def test_failed_proof(deferred):  # pylint: disable=unused-argument
+
+    @proofs.proof
+    def _derive():
+        assert False
+
+    with raises(AssertionError):
+        proofs.verify(__name__)
+    assert not proofs.is_verified(__name__)
+
+
+def test_verify_all_after_failed_proof():
+    assert __name__ not in proofs.registered_proofs()
+    proofs.verify_all()
+    assert not proofs.is_verified(__name__)
+
+
+def test_verify_law():
+    module_name = proofs.verify("dynamics.period_of_ideal_pendulum_from_length")
+    assert module_name == "symplyphysics.laws.dynamics.period_of_ideal_pendulum_from_length"
+    assert proofs.is_verified("dynamics.period_of_ideal_pendulum_from_length")
+    assert module_name in proofs.registered_proofs()
+
+
+def test_verify_module_without_proofs():
+    with raises(ValueError):
+        proofs.verify("definitions.mass_flow_rate")
+
+
+def test_deferred_proofs_from_environment():
+    code = ("from symplyphysics import proofs\n"
+        "from symplyphysics.laws.dynamics import period_of_ideal_pendulum_from_length\n"
+        "name = 'dynamics.period_of_ideal_pendulum_from_length'\n"
+        "assert proofs.deferred_proofs()\n"
+        "assert not proofs.is_verified(name)\n"
+        "proofs.verify(name)\n"
+        "assert proofs.is_verified(name)\n")
+    env = dict(os.environ, **{proofs.DEFER_PROOFS_ENV: "1"})
+    subprocess.run([sys.executable, "-c", code], env=env, check=True)
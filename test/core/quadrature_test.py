@@ -0,0 +1,70 @@
+import math
+import warnings
+from pytest import approx, raises
+from sympy import exp, sin, sqrt, symbols, Float
+from symplyphysics import units, convert_to, Quantity, SI
+from symplyphysics.core.errors import IntegrationWarning
+from symplyphysics.core.quadrature import (integrate_numeric, integrate_numeric_value,
+    integrate_unit_cube)
+
+x, y, z = symbols("x y z")
+
+
+def test_one_dimensional():
+    result = integrate_numeric(exp(-x**2), (x, 0, 1))
+    assert result.value == approx(math.sqrt(math.pi) / 2 * math.erf(1), rel=1e-12)
+    assert result.error < 1e-10
+    # smooth integrand needs a single application of the rule
+    assert result.evaluations == 15
+    # integrand with singular derivative is subdivided
+    result = integrate_numeric(sqrt(x), (x, 0, 1))
+    assert result.value == approx(2 / 3, rel=1e-8)
+    assert result.evaluations > 15
+
+
+def test_reversed_limits():
+    assert integrate_numeric(x, (x, 2, 0)).value == approx(-2)
+
+
+def test_dependent_limits():
+    # inner limit depends on the outer parameter
+    assert integrate_numeric(x * y, (x, 0, y), (y, 0, 2)).value == approx(2, rel=1e-10)
+    # volume of the ball with radius 2
+    ball = integrate_numeric(1, (z, -sqrt(4 - x**2 - y**2), sqrt(4 - x**2 - y**2)),
+        (y, -sqrt(4 - x**2), sqrt(4 - x**2)), (x, -2, 2))
+    assert ball.value == approx(32 * math.pi / 3, rel=1e-6)
+
+
+def test_tensor_rule():
+    result = integrate_numeric(sin(x * y * z) + x * y * z, (x, 0, 1), (y, 0, 2), (z, 0, 3))
+    assert result.value == approx(6.91328220891791, rel=1e-10)
+    assert result.error < 1e-7 * result.value
+
+
+def test_unit_cube_function():
+    result = integrate_unit_cube(lambda u, v: u * v, 2)
+    assert result.value == approx(0.25)
+    with raises(ValueError):
+        integrate_unit_cube(lambda: 1, 0)
+
+
+def test_free_symbols():
+    with raises(ValueError):
+        integrate_numeric(x * y, (x, 0, 1))
+
+
+def test_quantities():
+    length = Quantity(2 * units.meter)
+    force = Quantity(3 * units.newton)
+    # work of the force, that grows linearly along the path
+    result = integrate_numeric_value(force * x / length, (x, 0, length))
+    assert SI.get_dimension_system().equivalent_dims(result.dimension, units.energy)
+    assert convert_to(result, units.joule).evalf(6) == approx(3)
+    assert integrate_numeric_value(x, (x, 0, 1)) == Float(0.5)
+
+
+def test_tolerance_warning():
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        integrate_numeric_value(1 / sqrt(x), (x, 0, 1), max_evaluations=100)
+    assert any(issubclass(w.category, IntegrationWarning) for w in caught)
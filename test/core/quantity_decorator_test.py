@@ -0,0 +1,78 @@
+from pytest import raises
+from symplyphysics import errors, units, Quantity, validate_input, validate_output
+from symplyphysics.core.quantity_decorator import validate_output_same
+
+
+@validate_input(length_=units.length, time_=units.time)
+@validate_output(units.velocity)
+def _speed(length_: Quantity, time_: Quantity) -> Quantity:
+    return Quantity(length_ / time_)
+
+
+@validate_input(length_=units.length, time_=units.time)
+def _speed_with_default(length_: Quantity, time_: Quantity | None = None) -> Quantity:
+    time_ = Quantity(units.second) if time_ is None else time_
+    return Quantity(length_ / time_)
+
+
+@validate_input(lengths_=(units.length, units.time))
+def _first(lengths_: tuple[Quantity, Quantity]) -> Quantity:
+    return lengths_[0]
+
+
+@validate_output_same("value_")
+def _same(value_: Quantity, factor_: float = 2) -> Quantity:
+    return Quantity(value_ * factor_)
+
+
+def test_positional_and_keyword_arguments():
+    length = Quantity(10 * units.meter)
+    time = Quantity(2 * units.second)
+    assert _speed(length, time).scale_factor == 5
+    assert _speed(length, time_=time).scale_factor == 5
+    assert _speed(time_=time, length_=length).scale_factor == 5
+    with raises(errors.UnitsError):
+        _speed(time, length)
+    with raises(errors.UnitsError):
+        _speed(time_=length, length_=length)
+
+
+def test_missing_arguments():
+    # pylint: disable=no-value-for-parameter,too-many-function-args
+    with raises(TypeError):
+        _speed(Quantity(units.meter))
+    with raises(TypeError):
+        _speed(Quantity(units.meter), Quantity(units.second), Quantity(units.second))
+    with raises(TypeError):
+        _speed(Quantity(units.meter), time=Quantity(units.second))
+
+
+def test_default_arguments():
+    assert _speed_with_default(Quantity(3 * units.meter)).scale_factor == 3
+    with raises(errors.UnitsError):
+        _speed_with_default(Quantity(3 * units.meter), Quantity(units.meter))
+
+
+def test_tuple_arguments():
+    _first((Quantity(units.meter), Quantity(units.second)))
+    with raises(errors.UnitsError):
+        _first((Quantity(units.meter), Quantity(units.meter)))
+
+
+def test_validate_output_same():
+    assert _same(Quantity(units.meter)).scale_factor == 2
+    assert _same(value_=Quantity(units.meter), factor_=3).scale_factor == 3
+    with raises(errors.UnitsError):
+        _same(Quantity(units.meter), Quantity(units.second))
+    with raises(TypeError):
+        _same()  # pylint: disable=no-value-for-parameter
+
+
+def test_validate_output_same_bad_parameter():
+    with raises(TypeError):
+
+        @validate_output_same("unknown_")
+        def _bad(value_: Quantity) -> Quantity:
+            return value_
+
+        _bad(Quantity(units.meter))
@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+from sympy import Eq, symbols
+from symplyphysics import units, Quantity
+from symplyphysics.core.solvers import (SOLVED_CACHE_SIZE, solved_for, solved_for_cache_info,
+    clear_solved_for_cache)
+from symplyphysics.laws.dynamics import period_of_ideal_pendulum_from_length as pendulum_period
+
+
+def test_solved_for():
+    x, y = symbols("x y")
+    law = Eq(y, 2 * x + 1)
+    assert solved_for(law, x) == (y - 1) / 2
+    assert solved_for(law, y) == 2 * x + 1
+
+
+def test_solution_is_memoized():
+    x, y = symbols("x y")
+    law = Eq(y, 3 * x)
+    clear_solved_for_cache()
+    first = solved_for(law, x)
+    second = solved_for(law, x)
+    assert first is second
+    info = solved_for_cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+def test_cache_is_bounded():
+    assert solved_for_cache_info().maxsize == SOLVED_CACHE_SIZE
+
+
+def test_concurrent_solutions():
+    x, y = symbols("x y")
+    laws = [Eq(y, x * i) for i in range(1, 20)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda law: solved_for(law, x), laws * 4))
+    for (law, result) in zip(laws * 4, results):
+        assert result == law.rhs.subs(x, 1)**-1 * y
+
+
+def test_calculate_reuses_solution():
+    clear_solved_for_cache()
+    length = Quantity(1 * units.meter)
+    pendulum_period.calculate_period(length)
+    pendulum_period.calculate_period(length)
+    info = solved_for_cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
@@ -1,6 +1,8 @@
+import gc
+import weakref
 from pytest import raises
-from sympy import Derivative, cos, pi
-from symplyphysics import (units, Quantity, SI, dimensionless)
+from sympy import Derivative, Rational, cos, pi
+from symplyphysics import (units, Quantity, SI, convert_to, dimensionless, quantity_scope)
 from symplyphysics.core.symbols.quantities import scale_factor
 
 # Test Quantity constructor
@@ -134,3 +136,35 @@ def test_scale_factor():
     a_float = 1.0
     assert scale_factor(a_quantity) == 1.0
     assert scale_factor(a_float) == 1.0
+
+
+# Test quantity_scope
+
+
+def _is_registered(quantity: Quantity) -> bool:
+    # pylint: disable-next=protected-access
+    return quantity in SI._quantity_scale_factors
+
+
+def test_quantity_scope():
+    a = Quantity(10 * units.meter)
+    assert _is_registered(a)
+    with quantity_scope():
+        b = Quantity(5 * units.kilometer)
+        c = Quantity(a + b)
+        assert not _is_registered(b)
+        assert not _is_registered(c)
+        assert c.scale_factor == 5010
+        assert SI.get_dimension_system().equivalent_dims(c.dimension, units.length)
+    assert convert_to(c, units.kilometer) == Rational(501, 100)
+    d = Quantity(1 * units.meter)
+    assert _is_registered(d)
+
+
+def test_scoped_quantities_are_released():
+    with quantity_scope():
+        a = Quantity(10 * units.meter)
+        a_ref = weakref.ref(a)
+        del a
+        gc.collect()
+        assert a_ref() is None
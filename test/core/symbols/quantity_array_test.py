@@ -0,0 +1,90 @@
+from pytest import approx, raises
+import numpy as np
+from symplyphysics import (errors, units, convert_to, dimensionless, Quantity, QuantityArray,
+    QuantityVector, SI)
+
+
+def test_basic_quantity_array():
+    a = QuantityArray([1, 2, 3], units.kilometer / units.hour)
+    assert a.dimension == units.length / units.time
+    assert a.values.dtype == np.float64
+    assert np.allclose(a.values, np.array([1, 2, 3]) / 3.6)
+    assert a.shape == (3,)
+    assert len(a) == 3
+
+
+def test_dimensionless_quantity_array():
+    a = QuantityArray([0.5, 1.5])
+    assert a.dimension == dimensionless
+    assert np.array_equal(np.asarray(a), [0.5, 1.5])
+
+
+def test_quantity_array_with_dimension():
+    a = QuantityArray([1, 2], dimension=units.mass)
+    assert a.dimension == units.mass
+    assert np.array_equal(a.values, [1, 2])
+    with raises(ValueError):
+        QuantityArray([1, 2], units.gram, dimension=units.mass)
+
+
+def test_complex_quantity_array():
+    with raises(TypeError):
+        QuantityArray([1 + 1j])
+
+
+def test_quantity_array_arithmetics():
+    a = QuantityArray([1, 2, 3], units.kilometer)
+    b = QuantityArray([1, 2, 4], units.hour)
+    speed = a / b
+    assert SI.get_dimension_system().equivalent_dims(speed.dimension, units.velocity)
+    assert np.allclose(convert_to(speed, units.kilometer / units.hour), [1, 1, 0.75])
+    assert np.allclose((a + a).values, [2000, 4000, 6000])
+    assert np.allclose((a - Quantity(500 * units.meter)).values, [500, 1500, 2500])
+    assert np.allclose((2 * a * b).values, [7.2e6, 28.8e6, 86.4e6])
+    assert (a**2).dimension == units.length**2
+    assert (1 / b).dimension == 1 / units.time
+    assert np.allclose((-a).values, [-1000, -2000, -3000])
+    scaled = np.array([1, 0, 2]) * a
+    assert isinstance(scaled, QuantityArray)
+    assert np.allclose(np.asarray(scaled), [1000, 0, 6000])
+    # zero can be added to any dimension
+    assert np.allclose((a + 0).values, a.values)
+
+
+def test_invalid_quantity_array_arithmetics():
+    a = QuantityArray([1, 2], units.meter)
+    with raises(errors.UnitsError):
+        _ = a + QuantityArray([1, 2], units.second)
+    with raises(errors.UnitsError):
+        _ = a - Quantity(units.second)
+    with raises(errors.UnitsError):
+        _ = a + 1
+
+
+def test_quantity_array_convert():
+    a = QuantityArray([1.5, 2.5], units.kilogram)
+    assert np.allclose(convert_to(a, units.gram), [1500, 2500])
+    with raises(errors.UnitsError):
+        convert_to(a, units.meter)
+
+
+def test_quantity_array_quantities():
+    a = QuantityArray.from_quantities(
+        [Quantity(1 * units.meter), Quantity(2 * units.centimeter), 0])
+    assert a.dimension == units.length
+    assert np.allclose(a.values, [1, 0.02, 0])
+    assert convert_to(a[1], units.centimeter) == approx(2)
+    assert [convert_to(q, units.meter) for q in a.to_quantities()] == approx([1, 0.02, 0])
+    assert isinstance(a[1:], QuantityArray)
+    assert np.allclose(np.asarray(a[1:]), [0.02, 0])
+    with raises(errors.UnitsError):
+        QuantityArray.from_quantities([Quantity(units.meter), Quantity(units.second)])
+
+
+def test_quantity_array_vector():
+    vector = QuantityVector([Quantity(1 * units.newton), Quantity(2 * units.newton), 0])
+    a = QuantityArray.from_quantity_vector(vector)
+    assert np.allclose(a.values, [1, 2, 0])
+    result = (a * 2).to_quantity_vector()
+    assert result.dimension == units.force
+    assert [convert_to(c, units.newton) for c in result.components] == approx([2, 4, 0])
@@ -0,0 +1,88 @@
+from pytest import fixture, raises
+from symplyphysics import (errors, units, Quantity, validate_input, validate_output, validation,
+    validation_policy, set_validation_policy)
+
+
+@validate_input(length_=units.length, time_=units.time)
+@validate_output(units.velocity)
+def _speed(length_: Quantity, time_: Quantity) -> Quantity:
+    return Quantity(length_ / time_)
+
+
+@validate_output(units.length)
+def _as_length(value_: Quantity) -> Quantity:
+    return value_
+
+
+@fixture(name="stats")
+def stats_fixture():
+    validation.reset_validation_stats()
+    yield
+    set_validation_policy(validation.FULL)
+    validation.reset_validation_stats()
+
+
+def test_full_policy(stats):  # pylint: disable=unused-argument
+    _speed(Quantity(units.meter), Quantity(units.second))
+    # both input and output are checked
+    assert validation.validation_stats() == {"policy": "full", "validated": 2, "skipped": 0}
+    with raises(errors.UnitsError):
+        _speed(Quantity(units.second), Quantity(units.meter))
+
+
+def test_off_policy(stats):  # pylint: disable=unused-argument
+    with validation_policy("off"):
+        assert validation.validation_stats()["policy"] == "off"
+        _speed(Quantity(units.second), Quantity(units.second))
+        assert _as_length(Quantity(units.second)).scale_factor == 1
+    assert validation.validation_stats() == {"policy": "full", "validated": 0, "skipped": 3}
+    with raises(errors.UnitsError):
+        _as_length(Quantity(units.second))
+
+
+def test_global_policy(stats):  # pylint: disable=unused-argument
+    set_validation_policy("off")
+    _as_length(Quantity(units.second))
+    # scoped policy has priority over global one
+    with validation_policy(validation.FULL):
+        with raises(errors.UnitsError):
+            _as_length(Quantity(units.second))
+    assert validation.current_validation_policy() == validation.OFF
+
+
+def test_first_call_policy(stats):  # pylint: disable=unused-argument
+    with validation_policy("first-call"):
+        for i in range(1, 4):
+            _speed(Quantity(i * units.meter), Quantity(units.second))
+        assert validation.validation_stats()["validated"] == 2
+        assert validation.validation_stats()["skipped"] == 4
+        # new dimensions are validated
+        with raises(errors.UnitsError):
+            _speed(Quantity(units.second), Quantity(units.second))
+        # invalid dimensions are not remembered
+        with raises(errors.UnitsError):
+            _speed(Quantity(units.second), Quantity(units.second))
+        # zero can be of any dimension, so it is always validated
+        _as_length(Quantity(0))
+        with raises(errors.UnitsError):
+            _as_length(Quantity(units.second))
+
+
+def test_sampled_policy(stats):  # pylint: disable=unused-argument
+    with validation_policy(validation.sampled(0)):
+        _as_length(Quantity(units.second))
+    with validation_policy("sampled(1)"):
+        assert validation.validation_stats()["policy"] == "sampled(1.0)"
+        with raises(errors.UnitsError):
+            _as_length(Quantity(units.second))
+    assert validation.validation_stats() == {"policy": "full", "validated": 1, "skipped": 1}
+
+
+def test_bad_policy():
+    with raises(ValueError):
+        validation.parse_validation_policy("never")
+    with raises(ValueError):
+        validation.sampled(1.5)
+    with raises(ValueError):
+        set_validation_policy("sampled(-1)")
+    assert validation.current_validation_policy() == validation.FULL
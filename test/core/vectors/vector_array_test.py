@@ -0,0 +1,224 @@
+import math
+from collections import namedtuple
+from pytest import approx, fixture, raises
+import numpy as np
+from sympy import Symbol, pi
+from symplyphysics import (errors, units, Quantity, QuantityArray, QuantityVector, Vector,
+    VectorArray, CoordinateSystem, add_cartesian_vectors, cross_cartesian_vectors, dot_vectors,
+    scale_vector, vector_magnitude, vector_unit)
+from symplyphysics.core.coordinate_systems.coordinate_systems import coordinates_rotate, coordinates_transform
+from symplyphysics.core.vectors.vector_array import (VectorArraySum, vector_array_magnitude,
+    weighted_mean_vector_array)
+
+
+@fixture(name="test_args")
+def test_args_fixture():
+    C = CoordinateSystem()
+    first = VectorArray([[1, 2, 3], [4, 5, 6]], units.meter, C)
+    second = VectorArray([[1, 0, 0], [0, 0, 2]], units.meter, C)
+    Args = namedtuple("Args", ["C", "first", "second"])
+    return Args(C=C, first=first, second=second)
+
+
+def test_basic_vector_array(test_args):
+    assert test_args.first.shape == (2, 3)
+    assert test_args.first.dimension == units.length
+    assert test_args.first.coordinate_system == test_args.C
+    vector = VectorArray([1, 2], units.kilometer)
+    assert np.asarray(vector) == approx(np.array([[1000, 2000, 0]]))
+    assert np.asarray(test_args.first.component(2)) == approx([3, 6])
+    assert np.asarray(test_args.first[1]) == approx(np.array([[4, 5, 6]]))
+    empty = VectorArray([], units.meter)
+    assert empty.shape == (0, 3)
+    assert len(empty) == 0
+
+
+def test_bad_vector_array():
+    with raises(ValueError):
+        VectorArray([[1, 2, 3, 4]])
+    with raises(ValueError):
+        VectorArray(np.zeros((2, 3, 3)))
+    with raises(TypeError):
+        VectorArray([[1j, 0, 0]])
+
+
+def test_vector_conversions(test_args):
+    vectors = [Vector([1, 2], test_args.C), Vector([3, 4, 5], test_args.C)]
+    array = VectorArray.from_vectors(vectors)
+    assert array.dimension == units.Dimension(1)
+    assert np.asarray(array) == approx(np.array([[1, 2, 0], [3, 4, 5]]))
+    assert array.to_vectors()[1].components == [3, 4, 5]
+    quantity_vector = QuantityVector([1 * units.kilometer, 2 * units.meter], test_args.C)
+    array = VectorArray.from_vector(quantity_vector)
+    assert array.dimension == units.length
+    assert np.asarray(array) == approx(np.array([[1000, 2, 0]]))
+    result = array.to_quantity_vectors()[0]
+    assert result.coordinate_system == test_args.C
+    assert [float(c.scale_factor) for c in result.components] == [1000, 2, 0]
+
+
+def test_bad_vector_conversions(test_args):
+    with raises(ValueError):
+        VectorArray.from_vectors([])
+    with raises(TypeError):
+        VectorArray.from_vectors([Vector([1], test_args.C), Vector([1])])
+    with raises(ValueError):
+        VectorArray.from_vector(Vector([1, 2, 3, 4], test_args.C))
+    with raises(TypeError):
+        VectorArray.from_vector(Vector([test_args.C.coord_system.x], test_args.C))
+    with raises(errors.UnitsError):
+        VectorArray.from_vector(QuantityVector([units.meter, units.second]))
+
+
+def test_add_vector_arrays(test_args):
+    result = add_cartesian_vectors(test_args.first, test_args.second)
+    assert np.asarray(result) == approx(np.array([[2, 2, 3], [4, 5, 8]]))
+    # one vector is added to each vector of array
+    result = add_cartesian_vectors(
+        test_args.first, QuantityVector([units.meter, units.meter, units.meter], test_args.C))
+    assert np.asarray(result) == approx(np.array([[2, 3, 4], [5, 6, 7]]))
+    result = test_args.first - test_args.first
+    assert np.asarray(result) == approx(np.zeros((2, 3)))
+    with raises(errors.UnitsError):
+        add_cartesian_vectors(test_args.first, VectorArray([1, 1, 1], units.second, test_args.C))
+    with raises(TypeError):
+        add_cartesian_vectors(test_args.first, VectorArray([1, 1, 1], units.meter))
+
+
+def test_scale_vector_array(test_args):
+    result = scale_vector(2, test_args.first)
+    assert result.dimension == units.length
+    assert np.asarray(result) == approx(np.array([[2, 4, 6], [8, 10, 12]]))
+    result = scale_vector(QuantityArray([1, 2], units.kilogram), test_args.first)
+    assert result.dimension == units.length * units.mass
+    assert np.asarray(result) == approx(np.array([[1, 2, 3], [8, 10, 12]]))
+    result = test_args.first / Quantity(2 * units.second)
+    assert result.dimension == units.length / units.time
+    assert np.asarray(result) == approx(np.array([[0.5, 1, 1.5], [2, 2.5, 3]]))
+
+
+def test_dot_vector_arrays(test_args):
+    result = dot_vectors(test_args.first, test_args.second)
+    assert isinstance(result, QuantityArray)
+    assert result.dimension == units.length**2
+    assert np.asarray(result) == approx([1, 12])
+
+
+def test_cross_vector_arrays(test_args):
+    result = cross_cartesian_vectors(test_args.first, test_args.second)
+    assert np.asarray(result) == approx(np.cross(test_args.first.values, test_args.second.values))
+    assert result.dimension == units.length**2
+
+
+def test_magnitude_and_unit(test_args):
+    magnitude = vector_magnitude(test_args.first)
+    assert magnitude.dimension == units.length
+    assert np.asarray(magnitude) == approx(np.sqrt([14, 77]))
+    unit = vector_unit(test_args.first)
+    assert unit.dimension == units.Dimension(1)
+    assert np.asarray(vector_magnitude(unit)) == approx([1, 1])
+
+
+def test_non_cartesian_vector_arrays():
+    C = CoordinateSystem(CoordinateSystem.System.CYLINDRICAL)
+    vectors = VectorArray([[1, 0, 1], [2, float(pi) / 2, 0]], coordinate_system=C)
+    # the same as symbolic vectors
+    for (idx, vector_) in enumerate(vectors.to_vectors()):
+        assert float(vector_magnitude(vectors)[idx].scale_factor) == approx(
+            float(vector_magnitude(vector_)))
+        scaled = scale_vector(3, vectors)
+        assert np.asarray(scaled[idx])[0] == approx(
+            [float(c) for c in scale_vector(3, vector_).components])
+    assert np.asarray(dot_vectors(vectors, vectors[0])) == approx([2, 0], abs=1e-12)
+    with raises(ValueError):
+        add_cartesian_vectors(vectors, vectors)
+    with raises(ValueError):
+        cross_cartesian_vectors(vectors, vectors)
+
+
+def test_weighted_mean_vector_array(test_args):
+    weights = QuantityArray([1, 3], units.kilogram)
+    mean = weighted_mean_vector_array([(weights[0:1], test_args.first[0]),
+        (weights[1:2], test_args.first[1])])
+    assert mean.dimension == units.length
+    assert np.asarray(mean) == approx(np.array([[3.25, 4.25, 5.25]]))
+    with raises(ValueError):
+        weighted_mean_vector_array([])
+    with raises(ValueError):
+        weighted_mean_vector_array([(weights, test_args.first[0])])
+    with raises(errors.UnitsError):
+        weighted_mean_vector_array([(weights, test_args.first),
+            (QuantityArray([1, 3], units.second), test_args.first)])
+
+
+def test_vector_array_sum():
+    rng = np.random.default_rng(0)
+    values = rng.normal(0, 1, (200_000, 3)) * 10.0**rng.integers(-8, 8, (200_000, 1))
+    total = VectorArraySum()
+    total.add(VectorArray(values[:100_000], units.newton))
+    total.add(VectorArray(values[100_000:], units.newton))
+    result = total.result()
+    assert result.dimension == units.force
+    assert np.asarray(result)[0] == approx([math.fsum(values[:, i]) for i in range(3)], rel=1e-12)
+    with raises(errors.UnitsError):
+        total.add(VectorArray(values[:1], units.meter))
+    with raises(ValueError):
+        VectorArraySum().result()
+
+
+def test_grouped_vector_array_sum():
+    rng = np.random.default_rng(0)
+    values = rng.normal(0, 1, (1000, 3))
+    indices = rng.integers(0, 10, 1000)
+    total = VectorArraySum(10)
+    total.add(VectorArray(values), indices)
+    result = np.asarray(total.result())
+    assert result.shape == (10, 3)
+    for group in range(10):
+        assert result[group] == approx(values[indices == group].sum(axis=0))
+    total.add(VectorArray(np.zeros((0, 3))), np.zeros(0, dtype=int))
+    assert np.asarray(total.result()) == approx(result)
+    with raises(ValueError):
+        total.add(VectorArray(values))
+    with raises(ValueError):
+        VectorArraySum().add(VectorArray(values), indices)
+
+
+def test_grouped_vector_array_sum_precision():
+    # small values are lost when added one by one to the large one
+    values = np.full((60_000, 3), 1e-16)
+    values[:2] = 1.0
+    indices = np.arange(60_000) % 2
+    expected = math.fsum(values[::2, 0])
+    assert np.bincount(indices, weights=values[:, 0])[0] != approx(expected, rel=1e-15)
+    total = VectorArraySum(2)
+    total.add(VectorArray(values), indices)
+    assert np.asarray(total.result()) == approx(np.full((2, 3), expected), rel=1e-15)
+
+
+def test_rebase_vector_array(test_args):
+    C = test_args.C
+    systems = [
+        coordinates_rotate(C, pi / 3, C.coord_system.k),
+        coordinates_transform(C, CoordinateSystem.System.CYLINDRICAL),
+        coordinates_transform(C, CoordinateSystem.System.SPHERICAL),
+    ]
+    values = [[1, 2, 3], [-2, 0.5, 1], [0, -1, -2]]
+    array = VectorArray(values, coordinate_system=C)
+    for system in systems:
+        rebased = array.rebase(system)
+        assert rebased.coordinate_system == system
+        for (row, vector_values) in zip(np.asarray(rebased), values):
+            expected = Vector(vector_values, C).rebase(system).components
+            assert row == approx([float(e) for e in expected])
+        # rebased back to cartesian coordinates
+        assert np.asarray(rebased.rebase(C)) == approx(np.array(values))
+    # rotation keeps dimension of vectors
+    rotated = test_args.first.rebase(systems[0])
+    assert rotated.dimension == units.length
+    assert np.asarray(vector_array_magnitude(rotated)) == approx(
+        np.asarray(vector_array_magnitude(test_args.first)))
+    with raises(errors.UnitsError):
+        test_args.first.rebase(systems[2])
+    with raises(ValueError):
+        array.rebase(coordinates_rotate(C, Symbol("angle"), C.coord_system.k))
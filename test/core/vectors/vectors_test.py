@@ -4,6 +4,7 @@ from sympy import atan, pi, sqrt, symbols, sin, cos
 from sympy.vector import Vector as SympyVector, express
 from symplyphysics import (Quantity, dimensionless, units, QuantityVector, Vector, errors)
 from symplyphysics.core.coordinate_systems.coordinate_systems import CoordinateSystem, coordinates_rotate, coordinates_transform
+from symplyphysics.core.vectors.vectors import clear_rebase_plan_cache, rebase_plan, rebase_plan_cache_info
 
 
 @fixture(name="test_args")
@@ -232,6 +233,34 @@ def test_spherical_vector_create(test_args):
     assert vector_rebased.components == [sqrt(5), atan(2), pi / 2]
 
 
+def test_rebase_plan_cache(test_args):
+    B = coordinates_rotate(test_args.C, pi / 4, test_args.C.coord_system.k)
+    clear_rebase_plan_cache()
+    first = Vector([1, 2], test_args.C).rebase(B)
+    vector = Vector([3, test_args.C.coord_system.x], test_args.C)
+    second = vector.rebase(B)
+    assert first.components == [3 * sqrt(2) / 2, sqrt(2) / 2, 0]
+    # the same as with SymPy
+    expressed = express(vector.to_sympy_vector(), B.coord_system, None, variables=True)
+    assert second.components == Vector.from_sympy_vector(expressed, B).components
+    info = rebase_plan_cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    plan = rebase_plan(test_args.C, B)
+    assert plan.transformation is None
+    assert plan.scalar_map[test_args.C.coord_system.z] == B.coord_system.z
+    spherical_plan = rebase_plan(test_args.C,
+        coordinates_transform(test_args.C, CoordinateSystem.System.SPHERICAL))
+    assert spherical_plan.transformation is not None
+    assert spherical_plan.transformation[0] == sqrt(test_args.C.coord_system.x**2 +
+        test_args.C.coord_system.y**2 + test_args.C.coord_system.z**2)
+
+
+def test_zero_vector_rebase(test_args):
+    # zero vectors do not require connected coordinate systems
+    vector_rebased = Vector([0, 0], test_args.C).rebase(CoordinateSystem())
+    assert len(vector_rebased.components) == 0
+
+
 # Test QuantityVector constructor
 
 
@@ -271,6 +300,18 @@ def test_basic_to_quantities(test_args):
         vector.components[1].dimension] == [q1.dimension, q2.dimension]
 
 
+def test_cached_quantities():
+    q1 = Quantity(1 * units.meter)
+    q2 = Quantity(0)
+    vector = QuantityVector([q1, q2, 3 * units.meter])
+    components = vector.components
+    assert vector.components is components
+    # quantities with the same dimension are reused
+    assert vector.components[0] is q1
+    assert vector.components[1].dimension == units.length
+    assert vector.components[2].scale_factor == 3
+
+
 # Test QuantityVector.from_sympy_vector()
 
 
@@ -1,5 +1,6 @@
 from collections import namedtuple
 from pytest import approx, fixture, raises
+import numpy as np
 from sympy import cos, pi, sin
 from symplyphysics import (
     units,
@@ -9,6 +10,7 @@ from symplyphysics import (
 )
 from symplyphysics.core import errors
 from symplyphysics.core.vectors.vectors import QuantityVector
+from symplyphysics.core.vectors.vector_array import VectorArray
 from symplyphysics.definitions.vector import superposition_of_forces_is_sum as forces_law
 
 
@@ -58,3 +60,40 @@ def test_bad_force(test_args):
         forces_law.calculate_resultant_force([100, 100])
     with raises(TypeError):
         forces_law.calculate_resultant_force(test_args.F1)
+
+
+def test_array_superposition(test_args):
+    forces = VectorArray.from_vectors([test_args.F1, test_args.F2])
+    result = forces_law.calculate_resultant_force(forces)
+    assert SI.get_dimension_system().equivalent_dims(result.dimension, units.force)
+    assert result.coordinate_system == test_args.F1.coordinate_system
+    assert float(convert_to(result.components[0], units.newton)) == approx(25)
+    assert float(convert_to(result.components[1], units.newton)) == approx(8.66, 0.001)
+    with raises(errors.UnitsError):
+        forces_law.calculate_resultant_force(VectorArray([1, 0, 0], units.meter))
+
+
+def test_array_superposition_chunks():
+    # naive summation loses small forces after the large one
+    forces = [[1e16, 0, 0]] + [[1.0, 0, 0]] * 1000 + [[-1e16, 0, 0]]
+    chunks = [VectorArray(f, units.newton) for f in forces]
+    result = forces_law.superposition_array(chunks)
+    assert result.dimension == units.force
+    assert np.asarray(result) == approx(np.array([[1000, 0, 0]]))
+    with raises(ValueError):
+        forces_law.superposition_array([])
+    with raises(errors.UnitsError):
+        forces_law.superposition_array([chunks[0], VectorArray([1, 0, 0], units.meter)])
+
+
+def test_array_superposition_by_body():
+    forces = VectorArray([[1, 0, 0], [0, 2, 0], [3, 0, 0], [0, 0, 4]], units.newton)
+    result = forces_law.superposition_by_body_array([(forces[0:2], [0, 2]),
+        (forces[2:4], [0, 0])], 3)
+    assert np.asarray(result) == approx(np.array([[4, 0, 4], [0, 0, 0], [0, 2, 0]]))
+    with raises(ValueError):
+        forces_law.superposition_by_body_array([(forces, [0, 1, 2, 3])], 3)
+    with raises(ValueError):
+        forces_law.superposition_by_body_array([(forces, [0, 1])], 3)
+    with raises(ValueError):
+        forces_law.superposition_by_body_array([(forces, [0.0, 1.0, 1.0, 1.0])], 3)
@@ -67,3 +67,12 @@ def test_force_circulation_horizontal_down(test_args):
         (2 * test_args.radius_unit, 1 * test_args.radius_unit))
     result_work = convert_to(result, units.joule).evalf(2)
     assert result_work == approx(0.5, 0.01)
+
+
+def test_numeric_force_circulation(test_args):
+    trajectory = [circulation_def.parameter, circulation_def.parameter]
+    result = circulation_def.calculate_circulation(test_args.field,
+        trajectory, (1 * test_args.radius_unit, 2 * test_args.radius_unit),
+        method="numeric")
+    assert SI.get_dimension_system().equivalent_dims(result.dimension, units.energy)
+    assert convert_to(result, units.joule).evalf(6) == approx(-0.5, 1e-6)
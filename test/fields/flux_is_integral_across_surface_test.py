@@ -43,3 +43,19 @@ def test_electric_intensity_flux(test_args):
         units.force * units.area / units.charge)
     assert convert_to(result, units.newton * units.meter**2 / units.coulomb).evalf(4) == approx(
         (0.04 * pi).evalf(4), 0.001)
+
+
+def test_numeric_electric_intensity_flux(test_args):
+    intensity = 100 * units.newton / units.coulomb
+    field = VectorField([0, 2 * intensity, intensity], test_args.C)
+    surface = [
+        flux_def.parameter1 * cos(flux_def.parameter2),
+        flux_def.parameter1 * sin(flux_def.parameter2), 0
+    ]
+    result = flux_def.calculate_flux(field,
+        surface, (0, 0.02 * test_args.radius_unit), (0, 2 * pi),
+        method="numeric")
+    assert SI.get_dimension_system().equivalent_dims(result.dimension,
+        units.force * units.area / units.charge)
+    assert convert_to(result, units.newton * units.meter**2 / units.coulomb).evalf(6) == approx(
+        (0.04 * pi).evalf(6), 1e-6)
@@ -1,12 +1,15 @@
 from collections import namedtuple
 from pytest import approx, fixture, raises
+import numpy as np
 from symplyphysics import (
     errors,
     units,
     convert_to,
     Quantity,
+    QuantityArray,
     SI,
     QuantityVector,
+    VectorArray,
 )
 from symplyphysics.laws.kinematic.vector import (
     center_of_mass_for_system_of_particles as com_def,
@@ -68,6 +71,40 @@ def test_basic_law_three_particles(test_args):
         assert result_value == approx(correct_value, 1e-3)
 
 
+def test_array_three_particles(test_args):
+    masses = QuantityArray.from_quantities([test_args.m1, test_args.m2, test_args.m3])
+    positions = VectorArray.from_vectors([test_args.r1, test_args.r2, test_args.r3])
+    result = com_def.calculate_center_of_mass(masses, positions)
+    assert isinstance(result, QuantityVector)
+    assert result.coordinate_system == test_args.r1.coordinate_system
+    assert SI.get_dimension_system().equivalent_dims(result.dimension, units.length)
+    for result_component, correct_value in zip(result.components, [-0.5, 1.75, 0.0]):
+        result_value = convert_to(result_component, units.meter).evalf(3)
+        assert result_value == approx(correct_value, 1e-3)
+
+
+def test_array_chunks(test_args):
+    positions = VectorArray.from_vectors([test_args.r1, test_args.r2, test_args.r3])
+    chunks = [(np.array([1.0, 4.0]), positions[0:2]), (np.array([3.0]), positions[2:3])]
+    result = com_def.center_of_mass_array(chunks)
+    assert np.asarray(result) == approx(np.array([[-0.5, 1.75, 0.0]]))
+    with raises(ValueError):
+        com_def.center_of_mass_array([])
+    with raises(ValueError):
+        com_def.center_of_mass_array([(np.array([1.0]), positions)])
+
+
+def test_bad_arrays(test_args):
+    positions = VectorArray.from_vectors([test_args.r1])
+    with raises(errors.UnitsError):
+        com_def.calculate_center_of_mass(QuantityArray([1], units.coulomb), positions)
+    with raises(errors.UnitsError):
+        com_def.calculate_center_of_mass(QuantityArray([1], units.kilogram),
+            VectorArray([1, 1, 1], units.second))
+    with raises(TypeError):
+        com_def.calculate_center_of_mass(QuantityArray([1], units.kilogram), [test_args.r1])
+
+
 def test_bad_masses(test_args):
     mb = Quantity(1.0 * units.coulomb)
     with raises(errors.UnitsError):